@@ -0,0 +1,58 @@
+/* 20261019_0900_schema_reporting_rollups.sql */
+
+-- ----------------------------------------------------------------------------
+-- Tablas de rollup diario para dashboard y reportes de gestión.
+-- Se recalculan por día desde events/reporting_rollups.py (commit de la sesión)
+-- y se reconstruyen completas con admin_scripts/backfill_reporting_rollups.py.
+-- Todas las fechas de partición están en UTC.
+-- ----------------------------------------------------------------------------
+
+-- Minutas por día de creación × autor × cliente × proyecto × estado actual
+CREATE TABLE IF NOT EXISTS record_daily_rollups (
+  id                    BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  rollup_date           DATE NOT NULL,
+  prepared_by_user_id   CHAR(36) NOT NULL,
+  client_id             CHAR(36) NOT NULL,
+  project_id            CHAR(36) NULL,
+  status_id             SMALLINT UNSIGNED NOT NULL,
+  record_count          INT UNSIGNED NOT NULL DEFAULT 0,
+
+  PRIMARY KEY (id),
+  KEY idx_rdr_date (rollup_date),
+  KEY idx_rdr_user_date (prepared_by_user_id, rollup_date),
+  KEY idx_rdr_user_status (prepared_by_user_id, status_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Transiciones de estado por día × autor × cliente × proyecto × estado destino.
+-- record_count: minutas cuya primera transición del mes al estado cae ese día
+-- (sumar un mes da minutas distintas); se recalcula por mes completo.
+CREATE TABLE IF NOT EXISTS record_transition_daily_rollups (
+  id                    BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  rollup_date           DATE NOT NULL,
+  prepared_by_user_id   CHAR(36) NOT NULL,
+  client_id             CHAR(36) NOT NULL,
+  project_id            CHAR(36) NULL,
+  to_status_id          SMALLINT UNSIGNED NOT NULL,
+  transition_count      INT UNSIGNED NOT NULL DEFAULT 0,
+  record_count          INT UNSIGNED NOT NULL DEFAULT 0,
+
+  PRIMARY KEY (id),
+  KEY idx_rtdr_date (rollup_date),
+  KEY idx_rtdr_user_status_date (prepared_by_user_id, to_status_id, rollup_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Compromisos (acuerdos/requerimientos de la versión activa) por día de actividad
+CREATE TABLE IF NOT EXISTS commitment_daily_rollups (
+  id                    BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+  activity_date         DATE NOT NULL,
+  prepared_by_user_id   CHAR(36) NOT NULL,
+  client_id             CHAR(36) NOT NULL,
+  project_id            CHAR(36) NULL,
+  item_type             VARCHAR(20) NOT NULL,
+  status                VARCHAR(40) NOT NULL,
+  item_count            INT UNSIGNED NOT NULL DEFAULT 0,
+
+  PRIMARY KEY (id),
+  KEY idx_cdr_date (activity_date),
+  KEY idx_cdr_client_project (client_id, project_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -0,0 +1,31 @@
+/* 20261019_0930_schema_notification_tags.sql */
+
+-- ----------------------------------------------------------------------------
+-- Índice normalizado de tags por notificación.
+-- Reemplaza los filtros LIKE sobre notifications.tags_json y permite listar
+-- tags de la bandeja con conteos calculados en SQL.
+-- tag_key = LOWER(tag) para deduplicar sin distinguir mayúsculas; binaria
+-- para que acentos y demás diferencias cuenten igual que en el backend.
+-- ----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS notification_tags (
+  notification_id  CHAR(36)      NOT NULL,
+  tag_key          VARCHAR(120)  CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL,
+  tag              VARCHAR(120)  NOT NULL,
+
+  PRIMARY KEY (notification_id, tag_key),
+  CONSTRAINT fk_notification_tags_notification
+    FOREIGN KEY (notification_id) REFERENCES notifications(id)
+    ON DELETE CASCADE,
+
+  INDEX idx_notification_tags_key (tag_key, notification_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+
+-- Backfill desde el JSON histórico (idempotente)
+INSERT IGNORE INTO notification_tags (notification_id, tag_key, tag)
+SELECT n.id, RTRIM(LOWER(LEFT(TRIM(jt.tag), 120))), LEFT(TRIM(jt.tag), 120)
+FROM notifications n
+JOIN JSON_TABLE(n.tags_json, '$[*]' COLUMNS (tag VARCHAR(255) PATH '$')) jt
+WHERE n.tags_json IS NOT NULL
+  AND JSON_VALID(n.tags_json)
+  AND TRIM(COALESCE(jt.tag, '')) <> '';
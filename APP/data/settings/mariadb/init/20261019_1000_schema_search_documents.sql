@@ -0,0 +1,29 @@
+/* 20261019_1000_schema_search_documents.sql */
+
+-- ----------------------------------------------------------------------------
+-- Índice de búsqueda de listados (team members, tags, clientes, proyectos,
+-- participantes). Reemplaza los ILIKE '%term%' multi-columna, que MariaDB no
+-- puede resolver con índices.
+--   sort_key    = nombre principal normalizado (sin tildes, minúsculas):
+--                 prefijo para autocompletar por rango del índice.
+--   search_text = campos buscables normalizados: FULLTEXT en modo booleano.
+-- Se mantiene al escribir desde events/search_index.py y se reconstruye con
+-- admin_scripts/rebuild_search_index.py (el backend lo puebla al arrancar
+-- si la tabla está vacía).
+-- Sin stopwords: "com", "de", "the"... son parte de nombres y emails.
+-- ----------------------------------------------------------------------------
+SET SESSION innodb_ft_enable_stopword = 0;
+
+CREATE TABLE IF NOT EXISTS search_documents (
+  entity_type   VARCHAR(20)   NOT NULL,
+  entity_id     CHAR(36)      NOT NULL,
+  sort_key      VARCHAR(191)  NOT NULL DEFAULT '',
+  search_text   TEXT          NOT NULL,
+  updated_at    DATETIME      NOT NULL,
+
+  PRIMARY KEY (entity_type, entity_id),
+  INDEX idx_search_documents_prefix (entity_type, sort_key),
+  FULLTEXT INDEX ftx_search_documents_text (search_text)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+SET SESSION innodb_ft_enable_stopword = DEFAULT;
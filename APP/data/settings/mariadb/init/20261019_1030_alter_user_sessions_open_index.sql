@@ -0,0 +1,5 @@
+/* 20261019_1030_alter_user_sessions_open_index.sql */
+
+-- Limpieza de sesiones (worker): recorre sesiones abiertas por (created_at, id).
+-- Con logged_out_at primero el rango sobre created_at salta las sesiones cerradas.
+CREATE INDEX IF NOT EXISTS idx_us_open_created ON user_sessions (logged_out_at, created_at);
@@ -0,0 +1,51 @@
+# admin_scripts/backfill_reporting_rollups.py
+"""
+Reconstruye las tablas de rollup del dashboard y reportes de gestión
+desde records, record_status_transitions y compromisos.
+
+Uso:
+    python admin_scripts/backfill_reporting_rollups.py                      # historial completo
+    python admin_scripts/backfill_reporting_rollups.py --from 2026-01-01    # desde una fecha
+    python admin_scripts/backfill_reporting_rollups.py --from 2026-01-01 --to 2026-03-31
+"""
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+# Asegurar que el root del proyecto esté en el path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import models  # noqa: F401  (registra todos los mappers)
+from db.schema_compat import ensure_reporting_rollup_tables
+from db.session import SessionLocal, engine
+from services.reporting_rollups_service import rebuild_reporting_rollups
+
+
+def _parse_date(value: str | None) -> date | None:
+    if not value:
+        return None
+    return date.fromisoformat(value)
+
+
+def backfill_reporting_rollups(date_from: date | None, date_to: date | None) -> None:
+    ensure_reporting_rollup_tables(engine)
+
+    db = SessionLocal()
+    try:
+        days = rebuild_reporting_rollups(db, date_from=date_from, date_to=date_to)
+        print(f"✅  Rollups reconstruidos ({days} días procesados).")
+    except Exception as e:
+        db.rollback()
+        print(f"❌  Error: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill de rollups de dashboard y reportes")
+    parser.add_argument("--from", dest="date_from", default=None, help="Fecha inicial YYYY-MM-DD (inclusive)")
+    parser.add_argument("--to", dest="date_to", default=None, help="Fecha final YYYY-MM-DD (inclusive)")
+    args = parser.parse_args()
+    backfill_reporting_rollups(_parse_date(args.date_from), _parse_date(args.date_to))
@@ -0,0 +1,106 @@
+# admin_scripts/benchmark_text_sanitization.py
+"""
+Micro-benchmarks del motor de sanitización (services/text_sanitization.py).
+
+Mide transcripciones sintéticas de varios MB (limpias y con CRLF/controles),
+campos cortos del editor y payloads grandes del editor, comparando contra la
+implementación anterior por carácter / doble regex / deepcopy.
+
+Uso:
+    python admin_scripts/benchmark_text_sanitization.py
+    python admin_scripts/benchmark_text_sanitization.py --size-mb 8 --repeat 5
+"""
+import argparse
+import re
+import sys
+import timeit
+from copy import deepcopy
+from pathlib import Path
+
+# Asegurar que el root del proyecto esté en el path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services.file_sanitizer import sanitize_text_content
+from services.minutes.sanitizers import collapse_text, sanitize_editor_content
+
+_LEGACY_WHITESPACE_RE = re.compile(r"\s+")
+_LEGACY_CONTROL_RE = re.compile(r"[\x00-\x1f\x7f]")
+
+
+def _legacy_sanitize_text(content: bytes) -> bytes:
+    text = content.decode("utf-8-sig").replace("\r\n", "\n").replace("\r", "\n")
+    return "".join(char for char in text if char in {"\n", "\t"} or ord(char) >= 32).encode("utf-8")
+
+
+def _legacy_collapse_text(value) -> str:
+    text = _LEGACY_CONTROL_RE.sub(" ", str(value or ""))
+    return _LEGACY_WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _legacy_editor_content(content: dict) -> dict:
+    sanitized = deepcopy(content)
+    for participant in sanitized.get("participants", []):
+        for field in ("displayName", "fullName", "organization", "title", "email", "role"):
+            if field in participant:
+                participant[field] = _legacy_collapse_text(participant[field]) or None
+    return sanitized
+
+
+def _transcript(size_mb: int, *, dirty: bool) -> bytes:
+    line = "Juan Pérez: revisamos el acuerdo 3 y quedó pendiente la validación — OK.\t"
+    newline = "\r\n" if dirty else "\n"
+    noise = "\x07" if dirty else ""
+    block = (line + noise + newline).encode("utf-8")
+    return block * max(1, (size_mb * 1024 * 1024) // len(block))
+
+
+def _editor_payload(items: int) -> dict:
+    return {
+        "meetingInfo": {"title": "Comité de seguimiento", "location": "Sala 2", "preparedBy": "Equipo PMO"},
+        "participants": [
+            {"displayName": f"Participante {i}", "email": f"p{i}@example.com", "role": "asistente"}
+            for i in range(items)
+        ],
+        "scopeSections": [
+            {"title": f"Tema {i}", "summary": "Resumen del tema " * 20, "type": "topic", "details": ["x"] * 50}
+            for i in range(items)
+        ],
+        "agreements": [{"subject": f"Acuerdo {i}", "body": "Detalle " * 40} for i in range(items * 4)],
+    }
+
+
+def _bench(label: str, func, repeat: int, size_bytes: int | None = None) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    throughput = f"  {size_bytes / best / 1024 / 1024:8.1f} MB/s" if size_bytes else ""
+    print(f"  {label:<38} {best * 1000:9.2f} ms{throughput}")
+    return best
+
+
+def run_benchmarks(size_mb: int, repeat: int) -> None:
+    print(f"Transcripciones ({size_mb} MB)")
+    for dirty in (False, True):
+        content = _transcript(size_mb, dirty=dirty)
+        kind = "CRLF+controles" if dirty else "limpia"
+        legacy = _bench(f"legacy  {kind}", lambda: _legacy_sanitize_text(content), repeat, len(content))
+        current = _bench(f"actual  {kind}", lambda: sanitize_text_content(content, "text/plain"), repeat, len(content))
+        print(f"  {'speedup':<38} {legacy / current:9.1f}x")
+
+    print("Campos cortos (10k llamadas)")
+    fields = ["Acta de reunión semanal", "  texto\tcon \x07 ruido  \n"] * 5000
+    legacy = _bench("legacy  collapse_text", lambda: [_legacy_collapse_text(v) for v in fields], repeat)
+    current = _bench("actual  collapse_text", lambda: [collapse_text(v) for v in fields], repeat)
+    print(f"  {'speedup':<38} {legacy / current:9.1f}x")
+
+    print("Payload del editor (500 participantes/secciones)")
+    payload = _editor_payload(500)
+    legacy = _bench("legacy  deepcopy + campos", lambda: _legacy_editor_content(payload), repeat)
+    current = _bench("actual  copy-on-write", lambda: sanitize_editor_content(payload), repeat)
+    print(f"  {'speedup':<38} {legacy / current:9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks del motor de sanitización de texto")
+    parser.add_argument("--size-mb", type=int, default=4, help="Tamaño de las transcripciones sintéticas")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por caso (se reporta la mejor)")
+    args = parser.parse_args()
+    run_benchmarks(args.size_mb, args.repeat)
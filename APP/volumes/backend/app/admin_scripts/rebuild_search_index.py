@@ -0,0 +1,60 @@
+# admin_scripts/rebuild_search_index.py
+"""
+Reconstruye la tabla search_documents (búsqueda de team members, tags,
+clientes, proyectos y participantes) desde sus tablas de origen.
+
+Uso:
+    python admin_scripts/rebuild_search_index.py                        # todos los tipos
+    python admin_scripts/rebuild_search_index.py --type client --type project
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Asegurar que el root del proyecto esté en el path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import models  # noqa: F401  (registra todos los mappers)
+from db.schema_compat import ensure_search_documents_table
+from db.session import SessionLocal, engine
+from services.search_index_service import (
+    SEARCH_ENTITY_CLIENT,
+    SEARCH_ENTITY_PARTICIPANT,
+    SEARCH_ENTITY_PROJECT,
+    SEARCH_ENTITY_TAG,
+    SEARCH_ENTITY_TEAM_MEMBER,
+    rebuild_search_index,
+    search_documents_count,
+)
+
+ENTITY_TYPES = [
+    SEARCH_ENTITY_TEAM_MEMBER,
+    SEARCH_ENTITY_TAG,
+    SEARCH_ENTITY_CLIENT,
+    SEARCH_ENTITY_PROJECT,
+    SEARCH_ENTITY_PARTICIPANT,
+]
+
+
+def rebuild(entity_types: list[str]) -> None:
+    ensure_search_documents_table(engine)
+
+    db = SessionLocal()
+    try:
+        processed = rebuild_search_index(db, entity_types)
+        print(f"✅  Índice de búsqueda reconstruido ({processed} documentos procesados).")
+        for entity_type in entity_types:
+            print(f"    {entity_type}: {search_documents_count(db, entity_type)}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌  Error: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconstrucción del índice de búsqueda de listados")
+    parser.add_argument("--type", dest="types", action="append", choices=ENTITY_TYPES, help="Tipo a reconstruir (repetible)")
+    args = parser.parse_args()
+    rebuild(args.types or ENTITY_TYPES)
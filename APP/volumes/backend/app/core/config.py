@@ -50,6 +50,9 @@ class Settings(BaseSettings):
     geo_db_path: str = "/app/assets/dbGeo/dbip-city-lite.mmdb"
     geo_block_enabled: bool = True 
     geo_allowed_countries: list[str] = ["CL"]
+    # LRU por IP delante del reader (utils/geo.py)
+    geo_cache_max_entries: int = 50_000
+    geo_cache_ttl_sec: int = 6 * 60 * 60
 
     # IA runtime / prompt activo para el pipeline actual de minutas.
     openai_system_prompt: str = "system_prompt_v08.txt"
@@ -73,12 +76,29 @@ class Settings(BaseSettings):
     minio_root_user:     str = "minioadmin"
     minio_root_password: str = ""
     minio_root_password_file: str = ""
+    # LRU en memoria para avatares/logos servidos desde MinIO (bytes por proceso)
+    image_cache_max_bytes: int = 32 * 1024 * 1024
     maintenance_state_file: str = "/app/maintenance_state.json"
+    # Caché de catálogos de sistema (services/catalog_registry.py); TTL de respaldo si Redis falla
+    catalog_cache_ttl_sec: int = 300
+    # Bytecode Jinja de templates de email (services/email_template_service.py); vacío = tmp del sistema
+    email_template_bytecode_dir: str = ""
+    # Adjuntos/inline de email (services/email_blob_store.py): "minio" = por referencia, "inline" = base64 en el job
+    email_attachment_store: str = "minio"
+    email_attachment_inline_max_bytes: int = 4096
+    email_attachment_retention_days: int = 14
+    # Índice de búsqueda de listados (services/search_index_service.py)
+    # Largo mínimo de token para FULLTEXT; debe coincidir con innodb_ft_min_token_size
+    search_fulltext_min_token_chars: int = 3
+    # TTL del total cacheado que acompaña a la paginación por cursor
+    search_total_cache_ttl_sec: int = 30
 
     # Minutes config
     minutes_max_file_size_mb: int = 50
     minutes_max_files_per_request: int = 10
     minutes_rate_limit_per_day: int = 20
+    # Políticas por ruta de core/rate_limit.py (RateLimitMiddleware)
+    rate_limit_enabled: bool = True
     minutes_polling_interval_seconds: int = 3
     minutes_max_polling_attempts: int = 100
     minutes_stale_processing_minutes: int = 10
@@ -0,0 +1,163 @@
+# core/cron.py
+"""
+Motor cron compartido: coincidencia y cálculo del próximo disparo.
+
+- Expresiones de 5 campos (`minuto hora día mes día-semana`, las que valida
+  la UI) o de 6 con segundos al inicio para programaciones internas.
+- Sintaxis soportada: `*`, `n`, `a-b`, listas con coma y pasos `/k` sobre
+  cualquiera de ellas (`n/k` = desde n hasta el máximo). Día-semana 0-6 con
+  0 = domingo.
+- Día del mes y día de la semana se combinan con AND (semántica histórica de
+  los ticks de mantenimiento y respaldos).
+- Las horas son de pared en la zona dada: una hora que no existe por cambio
+  de horario no se dispara, y la repetida se dispara una sola vez.
+
+`CronExpression` se parsea una vez (sets por campo) y `next_after` salta
+campo por campo en vez de probar minuto a minuto.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+SLOT_FORMAT = "%Y%m%d%H%M"
+_SEARCH_HORIZON_DAYS = 366 * 5
+_FIELD_RANGES = ((0, 59), (0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+
+def _expand_field(expression: str, min_value: int, max_value: int) -> tuple[int, ...]:
+    values: set[int] = set()
+    for part in str(expression or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        base, _, step_raw = part.partition("/")
+        step = int(step_raw) if step_raw else 1
+        if step <= 0:
+            raise ValueError(f"Paso inválido en cron: {part!r}")
+        if base == "*":
+            start, end = min_value, max_value
+        elif "-" in base:
+            start_raw, end_raw = base.split("-", 1)
+            start, end = int(start_raw), int(end_raw)
+        else:
+            start = int(base)
+            end = max_value if step_raw else start
+        if start < min_value or end > max_value or start > end:
+            raise ValueError(f"Valor fuera de rango en cron: {part!r}")
+        values.update(range(start, end + 1, step))
+    if not values:
+        raise ValueError(f"Campo cron vacío: {expression!r}")
+    return tuple(sorted(values))
+
+
+def _next_in(values: tuple[int, ...], current: int) -> int | None:
+    index = bisect_left(values, current)
+    return values[index] if index < len(values) else None
+
+
+class CronExpression:
+    """Expresión cron parseada; inmutable y reutilizable entre hilos."""
+
+    __slots__ = ("expression", "has_seconds", "seconds", "minutes", "hours", "days", "months", "weekdays")
+
+    def __init__(self, expression: str) -> None:
+        fields = str(expression or "").split()
+        if len(fields) == 5:
+            fields = ["0", *fields]
+            self.has_seconds = False
+        elif len(fields) == 6:
+            self.has_seconds = True
+        else:
+            raise ValueError(f"La expresión cron debe tener 5 o 6 campos: {expression!r}")
+        self.expression = " ".join(fields[1:] if not self.has_seconds else fields)
+        (
+            self.seconds,
+            self.minutes,
+            self.hours,
+            self.days,
+            self.months,
+            self.weekdays,
+        ) = (_expand_field(field, *bounds) for field, bounds in zip(fields, _FIELD_RANGES))
+
+    def __repr__(self) -> str:
+        return f"<CronExpression {self.expression!r}>"
+
+    def _day_matches(self, value: datetime) -> bool:
+        return value.day in self.days and (value.weekday() + 1) % 7 in self.weekdays
+
+    def matches(self, local_dt: datetime) -> bool:
+        """¿Coincide la hora de pared `local_dt`? En 5 campos se ignoran los segundos."""
+        return (
+            local_dt.month in self.months
+            and self._day_matches(local_dt)
+            and local_dt.hour in self.hours
+            and local_dt.minute in self.minutes
+            and (not self.has_seconds or local_dt.second in self.seconds)
+        )
+
+    def next_after(self, after: datetime, tz: ZoneInfo) -> datetime | None:
+        """
+        Primer disparo estrictamente posterior a `after` (aware), como datetime
+        aware en `tz`. None si no hay ninguno en el horizonte de búsqueda
+        (p. ej. `0 0 31 2 *`).
+        """
+        after_utc = after.astimezone(UTC)
+        local = after.astimezone(tz).replace(tzinfo=None, microsecond=0) + timedelta(seconds=1)
+        limit = local + timedelta(days=_SEARCH_HORIZON_DAYS)
+
+        while local <= limit:
+            if local.month not in self.months:
+                year, month = (local.year + 1, 1) if local.month == 12 else (local.year, local.month + 1)
+                local = datetime(year, month, 1)
+                continue
+            day_start = datetime(local.year, local.month, local.day)
+            if not self._day_matches(local):
+                local = day_start + timedelta(days=1)
+                continue
+
+            hour = _next_in(self.hours, local.hour)
+            if hour is None:
+                local = day_start + timedelta(days=1)
+                continue
+            if hour != local.hour:
+                local = local.replace(hour=hour, minute=0, second=0)
+
+            minute = _next_in(self.minutes, local.minute)
+            if minute is None:
+                local = local.replace(minute=0, second=0) + timedelta(hours=1)
+                continue
+            if minute != local.minute:
+                local = local.replace(minute=minute, second=0)
+
+            second = _next_in(self.seconds, local.second)
+            if second is None:
+                local = local.replace(second=0) + timedelta(minutes=1)
+                continue
+            local = local.replace(second=second)
+
+            candidate = local.replace(tzinfo=tz)
+            candidate_utc = candidate.astimezone(UTC)
+            # Hora inexistente (salto de horario): la ida y vuelta no reproduce la hora de pared.
+            if candidate_utc.astimezone(tz).replace(tzinfo=None) != local or candidate_utc <= after_utc:
+                local += timedelta(seconds=1)
+                continue
+            return candidate
+        return None
+
+
+@lru_cache(maxsize=256)
+def parse_cron(expression: str) -> CronExpression:
+    """CronExpression cacheada por texto normalizado."""
+    return CronExpression(" ".join(str(expression or "").split()))
+
+
+def cron_matches(expression: str, local_dt: datetime) -> bool:
+    return parse_cron(expression).matches(local_dt)
+
+
+def cron_slot(local_dt: datetime) -> str:
+    """Slot de idempotencia por minuto (CHAR(12) en las tablas de runs)."""
+    return local_dt.strftime(SLOT_FORMAT)
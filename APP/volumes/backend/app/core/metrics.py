@@ -0,0 +1,151 @@
+"""
+core/metrics.py
+
+Métricas Prometheus del backend (expuestas en `GET /metrics`).
+
+- Latencia HTTP por ruta plantilla (`/v1/minutes/{record_id}`), nunca por
+  path crudo, para no explotar la cardinalidad.
+- Estado del pool SQLAlchemy leído al momento del scrape.
+- Tiempos de comandos Redis y requests a MinIO (los clientes de `db/` se
+  instrumentan en un solo punto).
+- Conexiones SSE abiertas y cierres por motivo, alimentados desde `sse_log`.
+
+El backend corre un solo proceso uvicorn por contenedor, así que se usa el
+registro por defecto de `prometheus_client` (sin modo multiproceso).
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+_FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "minuetaitor_http_request_duration_seconds",
+    "Latencia de requests HTTP hasta el inicio de la respuesta",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "minuetaitor_http_requests_in_progress",
+    "Requests HTTP en curso",
+    ["method"],
+)
+REDIS_COMMAND_SECONDS = Histogram(
+    "minuetaitor_redis_command_duration_seconds",
+    "Duración de comandos Redis emitidos por el backend",
+    ["command"],
+    buckets=_FAST_BUCKETS,
+)
+REDIS_COMMAND_ERRORS = Counter(
+    "minuetaitor_redis_command_errors_total",
+    "Comandos Redis que terminaron con excepción",
+    ["command"],
+)
+MINIO_REQUEST_SECONDS = Histogram(
+    "minuetaitor_minio_request_duration_seconds",
+    "Duración de requests HTTP a MinIO (hasta headers de respuesta)",
+    ["method", "bucket"],
+    buckets=_FAST_BUCKETS + (10.0, 30.0),
+)
+MINIO_REQUEST_ERRORS = Counter(
+    "minuetaitor_minio_request_errors_total",
+    "Requests a MinIO que terminaron con excepción",
+    ["method", "bucket"],
+)
+SSE_CONNECTIONS = Gauge(
+    "minuetaitor_sse_connections",
+    "Conexiones SSE abiertas",
+    ["endpoint"],
+)
+SSE_CLOSED_TOTAL = Counter(
+    "minuetaitor_sse_closed_total",
+    "Conexiones SSE cerradas por motivo",
+    ["endpoint", "close_reason"],
+)
+SSE_CONNECTION_SECONDS = Histogram(
+    "minuetaitor_sse_connection_duration_seconds",
+    "Duración de conexiones SSE",
+    ["endpoint"],
+    buckets=(1, 5, 15, 30, 60, 300, 900, 1800, 3600, 7200),
+)
+
+
+class _DbPoolCollector:
+    """Lee el pool del engine en cada scrape (size, checked in/out, overflow)."""
+
+    def collect(self):
+        from db.session import engine
+
+        pool = engine.pool
+        family = GaugeMetricFamily(
+            "minuetaitor_db_pool_connections",
+            "Conexiones del pool SQLAlchemy por estado",
+            labels=["state"],
+        )
+        for state, reader in (
+            ("size", "size"),
+            ("checked_in", "checkedin"),
+            ("checked_out", "checkedout"),
+            ("overflow", "overflow"),
+        ):
+            getter = getattr(pool, reader, None)
+            if callable(getter):
+                family.add_metric([state], float(getter()))
+        yield family
+
+
+REGISTRY.register(_DbPoolCollector())
+
+
+@contextmanager
+def observe_redis_command(command: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        REDIS_COMMAND_ERRORS.labels(command).inc()
+        raise
+    finally:
+        REDIS_COMMAND_SECONDS.labels(command).observe(time.perf_counter() - started)
+
+
+@contextmanager
+def observe_minio_request(method: str, bucket: str | None) -> Iterator[None]:
+    bucket_label = bucket or "-"
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        MINIO_REQUEST_ERRORS.labels(method, bucket_label).inc()
+        raise
+    finally:
+        MINIO_REQUEST_SECONDS.labels(method, bucket_label).observe(time.perf_counter() - started)
+
+
+def record_sse_event(event: str, endpoint: str | None, *, close_reason: str | None, duration_ms: int | None) -> None:
+    endpoint_label = endpoint or "unknown"
+    if event == "sse.open":
+        SSE_CONNECTIONS.labels(endpoint_label).inc()
+    elif event == "sse.close":
+        SSE_CONNECTIONS.labels(endpoint_label).dec()
+        SSE_CLOSED_TOTAL.labels(endpoint_label, close_reason or "unknown").inc()
+        if duration_ms is not None:
+            SSE_CONNECTION_SECONDS.labels(endpoint_label).observe(duration_ms / 1000)
+
+
+def render_metrics() -> bytes:
+    return generate_latest(REGISTRY)
@@ -1,5 +1,6 @@
 # core/middleware.py
 import json
+import logging
 import time
 import uuid
 from datetime import datetime, timezone
@@ -13,6 +14,8 @@ from starlette.responses import Response
 from core.config import settings
 from core.datetime_utils import normalize_datetime_strings_to_utc_z, utc_now
 from core.exceptions import AppException
+from core.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_PROGRESS
+from core.rate_limit import hit_rate_limit, match_route_policy, rate_limit_key
 from schemas.response import ErrorDetail, MetaSchema, RouteInfo, fail, ok
 from utils.geo import get_geo, _is_private_ip
 from utils.network import get_client_ip
@@ -33,6 +36,15 @@ def _json_response(status_code: int, body: dict) -> JSONResponse:
     return JSONResponse(status_code=status_code, content=normalize_datetime_strings_to_utc_z(body))
 
 
+def _rewrap_json_response(original: Response, content: dict) -> JSONResponse:
+    """Re-serializa el body conservando headers del original (Retry-After, Set-Cookie, ...)."""
+    rebuilt = JSONResponse(status_code=original.status_code, content=content)
+    for name, value in original.headers.items():
+        if name.lower() not in {"content-length", "content-type"}:
+            rebuilt.headers.append(name, value)
+    return rebuilt
+
+
 _SENSITIVE_VALIDATION_FIELDS = {
     "authorization",
     "access_token",
@@ -64,6 +76,35 @@ def _is_sensitive_validation_field(loc: object) -> bool:
     )
 
 
+# ── Métricas ──────────────────────────────────────────
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Latencia por ruta plantilla; paths sin ruta se agrupan como `unmatched`."""
+
+    EXCLUDE = {"/metrics"}
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if request.url.path in self.EXCLUDE:
+            return await call_next(request)
+
+        method = request.method.upper()
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            in_progress.dec()
+            route = request.scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_SECONDS.labels(method, route_path, str(status_code)).observe(
+                time.perf_counter() - started
+            )
+
+
 # ── GeoBlock ──────────────────────────────────────────
 
 class GeoBlockMiddleware(BaseHTTPMiddleware):
@@ -73,6 +114,7 @@ class GeoBlockMiddleware(BaseHTTPMiddleware):
         "/redoc",        "/v1/redoc",
         "/openapi.json", "/v1/openapi.json",
         "/favicon.ico",
+        "/metrics",
     }
 
     async def dispatch(self, request: Request, call_next) -> Response:
@@ -118,6 +160,47 @@ class GeoBlockMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
+# ── Rate limit ────────────────────────────────────────
+
+_rate_limit_logger = logging.getLogger("core.rate_limit")
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """Aplica `ROUTE_RATE_LIMIT_POLICIES` antes de leer el body o tocar la DB."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if not settings.rate_limit_enabled:
+            return await call_next(request)
+
+        policy = match_route_policy(request.method.upper(), request.url.path)
+        if policy is None:
+            return await call_next(request)
+
+        try:
+            decision = await hit_rate_limit(
+                rate_limit_key(policy.scope, policy.identity(request)),
+                limit=policy.limit,
+                window_seconds=policy.window_seconds,
+            )
+        except Exception as exc:
+            # Fail-open: los servicios mantienen sus propios límites por clave.
+            _rate_limit_logger.warning("rate_limit: política %s no evaluada: %s", policy.scope, exc)
+            return await call_next(request)
+
+        if not decision.allowed:
+            body = fail(
+                message=policy.message,
+                code="RATE_LIMITED",
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                meta=_build_meta(request, 0),
+            ).model_dump()
+            response = _json_response(status.HTTP_429_TOO_MANY_REQUESTS, body)
+            response.headers["Retry-After"] = str(decision.retry_after)
+            return response
+
+        return await call_next(request)
+
+
 # ── Contract ──────────────────────────────────────────
 
 class RequestDateTimeNormalizationMiddleware(BaseHTTPMiddleware):
@@ -181,13 +264,10 @@ class ResponseContractMiddleware(BaseHTTPMiddleware):
 
         # Si ya viene con el contrato (errores del handler), no re-envolver
         if isinstance(payload, dict) and "success" in payload:
-            return JSONResponse(status_code=response.status_code, content=payload)
+            return _rewrap_json_response(response, payload)
 
         wrapped = ok(result=payload, meta=meta, status=response.status_code)
-        return JSONResponse(
-            status_code=response.status_code,
-            content=normalize_datetime_strings_to_utc_z(wrapped.model_dump()),
-        )
+        return _rewrap_json_response(response, normalize_datetime_strings_to_utc_z(wrapped.model_dump()))
 
 
 # ── Exception handlers ────────────────────────────────
@@ -0,0 +1,151 @@
+# core/pagination.py
+"""
+Paginación por cursor (keyset) y total cacheado para los listados.
+
+- `keyset_page` ordena por las columnas dadas (la última debe ser única,
+  típicamente el id) y, si viene `cursor`, filtra "después de" la última
+  fila vista en vez de usar OFFSET: cada página cuesta lo mismo sin importar
+  cuán profunda sea. Sin cursor conserva `skip` para compatibilidad.
+- El cursor es opaco para el cliente: base64url del JSON con los valores de
+  orden de la última fila.
+- `cached_total` evita el COUNT en cada página: la primera (sin cursor) lo
+  calcula y lo deja en un LRU por proceso por `search_total_cache_ttl_sec`;
+  las siguientes lo reutilizan. Es un total aproximado si hubo escrituras
+  entre páginas, suficiente para "N resultados" en la UI.
+"""
+from __future__ import annotations
+
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, and_, or_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.config import settings
+
+# (expresión de orden, descendente)
+KeysetColumn = tuple[ColumnElement, bool]
+
+_TOTAL_CACHE_MAX_ENTRIES = 2048
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[KeysetColumn]) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("largo inválido")
+        return [
+            datetime.fromisoformat(value) if isinstance(column.type, DateTime) and value is not None else value
+            for (column, _), value in zip(columns, values)
+        ]
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(status_code=422, detail="INVALID_CURSOR")
+
+
+def _after(columns: Sequence[KeysetColumn], values: Sequence[Any]) -> ColumnElement:
+    """(c0, c1, ...) > (v0, v1, ...) respetando la dirección de cada columna, sin row-constructor."""
+    branches = []
+    for index, (column, descending) in enumerate(columns):
+        equal_prefix = [columns[i][0] == values[i] for i in range(index)]
+        step = column < values[index] if descending else column > values[index]
+        branches.append(and_(*equal_prefix, step))
+    return or_(*branches)
+
+
+def keyset_page(
+    query: Query,
+    columns: Sequence[KeysetColumn],
+    *,
+    cursor: str | None,
+    skip: int,
+    limit: int,
+    key: Callable[[Any], Sequence[Any]],
+) -> tuple[list[Any], str | None]:
+    """
+    Retorna (filas, next_cursor). `key(fila)` da los valores de orden de una
+    fila en el mismo orden que `columns`.
+    """
+    if cursor:
+        query = query.filter(_after(columns, decode_cursor(cursor, columns)))
+    elif skip:
+        query = query.offset(skip)
+
+    ordering = [column.desc() if descending else column.asc() for column, descending in columns]
+    rows = query.order_by(*ordering).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(key(rows[-1]))
+
+
+class _TotalCache:
+    """LRU de totales con TTL; seguro entre threads."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._items: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> int | None:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            expires_at, total = entry
+            if time.monotonic() >= expires_at:
+                self._items.pop(key, None)
+                return None
+            self._items.move_to_end(key)
+            return total
+
+    def put(self, key: str, total: int, ttl_sec: float) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic() + ttl_sec, total)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+
+_total_cache = _TotalCache(_TOTAL_CACHE_MAX_ENTRIES)
+
+
+def total_cache_key(listing: str, filters: Any, *, scope: str | None = None) -> str:
+    """Clave del total: listado + filtros (sin paginación) + alcance del usuario si aplica."""
+    data = filters.model_dump(exclude={"skip", "limit", "cursor", "include_total"}, mode="json")
+    return json.dumps([listing, scope, data], sort_keys=True, separators=(",", ":"))
+
+
+def cached_total(
+    cache_key: str,
+    compute: Callable[[], int],
+    *,
+    cursor: str | None,
+    include_total: bool,
+) -> int | None:
+    """
+    None si el cliente no pidió total. En páginas con cursor se reutiliza el
+    total cacheado; la primera página siempre lo recalcula.
+    """
+    if not include_total:
+        return None
+    if cursor:
+        total = _total_cache.get(cache_key)
+        if total is not None:
+            return total
+    total = int(compute() or 0)
+    _total_cache.put(cache_key, total, max(1, int(settings.search_total_cache_ttl_sec)))
+    return total
@@ -1,16 +1,132 @@
+"""
+core/rate_limit.py
+
+Motor único de rate limiting.
+
+- Ventana deslizante exacta en Redis: un script Lua (ZSET por clave) limpia,
+  cuenta, registra y fija el TTL en un solo round-trip atómico. La hora sale
+  de `TIME` del servidor, así todas las réplicas del backend comparten reloj.
+- Antes de ir a Redis se consulta un token bucket local por proceso con el
+  doble de capacidad que el límite: solo descarta ráfagas evidentes, nunca
+  rechaza algo que Redis aceptaría en uso normal.
+- `ROUTE_RATE_LIMIT_POLICIES` declara los límites gruesos por ruta (IP o
+  usuario del bearer) que aplica `RateLimitMiddleware`; los servicios siguen
+  usando `enforce_rate_limit` para claves finas (credencial, email, minuta).
+"""
 from __future__ import annotations
 
 import hashlib
+import math
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
 
 from fastapi import HTTPException, status
+from starlette.requests import Request
 
+from core.config import settings
 from db.redis import get_redis
 
+RATE_LIMIT_KEY_PREFIX = "rate-limit:sliding"
+_LOCAL_BURST_FACTOR = 2
+_LOCAL_MAX_BUCKETS = 10_000
+
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local window_ms = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window_ms)
+local count = redis.call('ZCARD', key)
+if count < limit then
+  redis.call('ZADD', key, now, clock[1] .. clock[2] .. ':' .. ARGV[3])
+  redis.call('PEXPIRE', key, window_ms)
+  return {1, limit - count - 1, 0}
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+local retry_ms = window_ms
+if oldest[2] then
+  retry_ms = tonumber(oldest[2]) + window_ms - now
+end
+return {0, 0, retry_ms}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    remaining: int
+    retry_after: int
+
 
 def rate_limit_key(scope: str, *parts: object) -> str:
     raw = "|".join(str(part or "").strip().lower() for part in parts)
     digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
-    return f"rate-limit:{scope}:{digest}"
+    return f"{RATE_LIMIT_KEY_PREFIX}:{scope}:{digest}"
+
+
+class _LocalTokenBuckets:
+    """Token buckets en memoria por clave (LRU acotado); seguro entre threads."""
+
+    def __init__(self, max_buckets: int) -> None:
+        self.max_buckets = max_buckets
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, *, limit: int, window_seconds: int) -> int:
+        """Consume un token; retorna 0 si pasó o los segundos hasta el próximo token."""
+        capacity = float(limit * _LOCAL_BURST_FACTOR)
+        refill_per_sec = limit / float(window_seconds)
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_per_sec)
+            if tokens < 1.0:
+                self._buckets[key] = (tokens, now)
+                self._buckets.move_to_end(key)
+                return max(1, math.ceil((1.0 - tokens) / refill_per_sec))
+            self._buckets[key] = (tokens - 1.0, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+            return 0
+
+
+_local_buckets = _LocalTokenBuckets(_LOCAL_MAX_BUCKETS)
+_scripts: dict[int, object] = {}
+
+
+def _sliding_window_script(redis):
+    # register_script solo calcula el SHA; EVALSHA recarga el script si Redis lo perdió.
+    script = _scripts.get(id(redis))
+    if script is None:
+        _scripts.clear()
+        script = redis.register_script(_SLIDING_WINDOW_LUA)
+        _scripts[id(redis)] = script
+    return script
+
+
+async def hit_rate_limit(key: str, *, limit: int, window_seconds: int) -> RateLimitDecision:
+    """Registra un intento contra el límite y retorna la decisión."""
+    local_retry = _local_buckets.take(key, limit=int(limit), window_seconds=int(window_seconds))
+    if local_retry:
+        return RateLimitDecision(allowed=False, remaining=0, retry_after=local_retry)
+
+    redis = get_redis()
+    allowed, remaining, retry_ms = await _sliding_window_script(redis)(
+        keys=[key],
+        args=[int(window_seconds) * 1000, int(limit), uuid.uuid4().hex[:12]],
+    )
+    return RateLimitDecision(
+        allowed=bool(int(allowed)),
+        remaining=int(remaining),
+        retry_after=max(1, math.ceil(int(retry_ms) / 1000)) if not int(allowed) else 0,
+    )
 
 
 async def enforce_rate_limit(
@@ -20,13 +136,100 @@ async def enforce_rate_limit(
     window_seconds: int,
     message: str = "Demasiados intentos. Intenta nuevamente más tarde.",
 ) -> None:
-    redis = get_redis()
-    count = await redis.incr(key)
-    if int(count) == 1:
-        await redis.expire(key, int(window_seconds))
-    if int(count) > int(limit):
+    decision = await hit_rate_limit(key, limit=limit, window_seconds=window_seconds)
+    if not decision.allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=message,
-            headers={"Retry-After": str(int(window_seconds))},
+            headers={"Retry-After": str(decision.retry_after)},
         )
+
+
+# ── Políticas por ruta ────────────────────────────────
+
+def _client_ip_identity(request: Request) -> str:
+    from utils.network import get_client_ip
+
+    ip_v4, ip_v6 = get_client_ip(request)
+    return ip_v4 or ip_v6 or "unknown"
+
+
+def _bearer_subject_or_ip(request: Request) -> str:
+    authorization = request.headers.get("Authorization") or ""
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token.strip():
+        from core.security import decode_access_token
+
+        try:
+            subject = decode_access_token(token.strip()).get("sub")
+        except Exception:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+    return f"ip:{_client_ip_identity(request)}"
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    scope: str
+    method: str
+    path_pattern: str
+    limit: int
+    window_seconds: int
+    message: str
+    identity: Callable[[Request], str] = _client_ip_identity
+
+    def matches(self, method: str, path: str) -> bool:
+        return method == self.method and re.fullmatch(self.path_pattern, path) is not None
+
+
+ROUTE_RATE_LIMIT_POLICIES: tuple[RateLimitPolicy, ...] = (
+    RateLimitPolicy(
+        scope="route-auth-login",
+        method="POST",
+        path_pattern=r"/v1/auth/login",
+        limit=30,
+        window_seconds=15 * 60,
+        message="Demasiados intentos de inicio de sesión. Intenta nuevamente más tarde.",
+    ),
+    RateLimitPolicy(
+        scope="route-auth-password-recovery",
+        method="POST",
+        path_pattern=r"/v1/auth/(forgot|reset)-password",
+        limit=20,
+        window_seconds=60 * 60,
+        message="Demasiadas solicitudes de recuperación. Intenta nuevamente más tarde.",
+    ),
+    RateLimitPolicy(
+        scope="route-minute-view-otp-request",
+        method="POST",
+        path_pattern=r"/v1/minutes/public/access/request-otp",
+        limit=20,
+        window_seconds=60 * 60,
+        message="Demasiadas solicitudes de acceso. Intenta nuevamente más tarde.",
+    ),
+    RateLimitPolicy(
+        scope="route-minute-view-otp-verify",
+        method="POST",
+        path_pattern=r"/v1/minutes/public/access/verify-otp",
+        limit=60,
+        window_seconds=30 * 60,
+        message="Demasiados intentos de validación. Intenta nuevamente más tarde.",
+    ),
+    RateLimitPolicy(
+        scope="route-minutes-generate",
+        method="POST",
+        path_pattern=r"/v1/minutes/generate",
+        limit=settings.minutes_rate_limit_per_day,
+        window_seconds=24 * 60 * 60,
+        message="Se alcanzó el límite diario de generación de minutas.",
+        identity=_bearer_subject_or_ip,
+    ),
+)
+
+
+def match_route_policy(method: str, path: str) -> RateLimitPolicy | None:
+    for policy in ROUTE_RATE_LIMIT_POLICIES:
+        if policy.matches(method, path):
+            return policy
+    return None
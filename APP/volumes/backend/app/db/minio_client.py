@@ -17,6 +17,7 @@ from minio import Minio
 from minio.error import S3Error
 
 from core.config import settings
+from core.metrics import observe_minio_request
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +27,25 @@ REQUIRED_MINIO_BUCKETS = (
     "minuetaitor-published",
     "minuetaitor-attach",
     "minuetaitor-draft",
+    "minuetaitor-exports",
 )
 
 
+class _InstrumentedMinio(Minio):
+    """Todas las operaciones de minio-py pasan por `_url_open`; se mide ahí."""
+
+    def _url_open(self, method, region, bucket_name=None, *args, **kwargs):
+        with observe_minio_request(method, bucket_name):
+            return super()._url_open(method, region, bucket_name, *args, **kwargs)
+
+
 @lru_cache(maxsize=1)
 def get_minio_client() -> Minio:
     """
     Retorna un cliente MinIO singleton.
     lru_cache garantiza que solo se crea una instancia por proceso.
     """
-    client = Minio(
+    client = _InstrumentedMinio(
         endpoint   = f"{settings.minio_host}:{settings.minio_port}",
         access_key = settings.minio_root_user,
         secret_key = settings.minio_root_password,
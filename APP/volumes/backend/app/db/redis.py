@@ -1,14 +1,24 @@
 # db/redis.py
 import redis.asyncio as aioredis
 from core.config import settings
+from core.metrics import observe_redis_command
 
 _redis_client: aioredis.Redis | None = None
 
 
+class _InstrumentedRedis(aioredis.Redis):
+    """Cliente async que registra la duración de cada comando en métricas."""
+
+    async def execute_command(self, *args, **options):
+        command = str(args[0]).upper() if args else "UNKNOWN"
+        with observe_redis_command(command):
+            return await super().execute_command(*args, **options)
+
+
 def get_redis() -> aioredis.Redis:
     global _redis_client
     if _redis_client is None:
-        _redis_client = aioredis.Redis(
+        _redis_client = _InstrumentedRedis(
             host=settings.redis_host,
             port=settings.redis_port,
             decode_responses=True,
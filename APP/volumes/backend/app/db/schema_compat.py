@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 from sqlalchemy.engine import Engine
 
 
@@ -27,3 +27,101 @@ def ensure_projects_auto_send_columns(engine: Engine) -> None:
             conn.execute(text(statement))
 
     logger.info("Schema compatibility check completed for projects auto-send flags")
+
+
+def ensure_reporting_rollup_tables(engine: Engine) -> None:
+    """Create dashboard/report rollup tables on volumes initialized before they existed."""
+    from models.reporting_rollups import (
+        CommitmentDailyRollup,
+        RecordDailyRollup,
+        RecordTransitionDailyRollup,
+    )
+
+    tables = [
+        RecordDailyRollup.__table__,
+        RecordTransitionDailyRollup.__table__,
+        CommitmentDailyRollup.__table__,
+    ]
+    for table in tables:
+        table.create(bind=engine, checkfirst=True)
+
+    logger.info("Schema compatibility check completed for reporting rollup tables")
+
+
+def ensure_notification_tags_table(engine: Engine) -> None:
+    """Create the notification tag index and backfill it from tags_json on first run."""
+    from models.notification_tags import NotificationTag
+
+    if inspect(engine).has_table(NotificationTag.__tablename__):
+        _ensure_notification_tag_key_collation(engine)
+        return
+
+    NotificationTag.__table__.create(bind=engine, checkfirst=True)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT IGNORE INTO notification_tags (notification_id, tag_key, tag)
+                SELECT n.id, RTRIM(LOWER(LEFT(TRIM(jt.tag), 120))), LEFT(TRIM(jt.tag), 120)
+                FROM notifications n
+                JOIN JSON_TABLE(n.tags_json, '$[*]' COLUMNS (tag VARCHAR(255) PATH '$')) jt
+                WHERE n.tags_json IS NOT NULL
+                  AND JSON_VALID(n.tags_json)
+                  AND TRIM(COALESCE(jt.tag, '')) <> ''
+                """
+            )
+        )
+
+    logger.info("Schema compatibility check completed for notification tags")
+
+
+def _ensure_notification_tag_key_collation(engine: Engine) -> None:
+    """Tablas creadas antes de fijar utf8mb4_bin en tag_key: corregir la collation."""
+    with engine.begin() as conn:
+        collation = conn.execute(
+            text(
+                """
+                SELECT COLLATION_NAME FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                  AND TABLE_NAME = 'notification_tags'
+                  AND COLUMN_NAME = 'tag_key'
+                """
+            )
+        ).scalar()
+        if collation is None or collation == "utf8mb4_bin":
+            return
+        conn.execute(
+            text(
+                "ALTER TABLE notification_tags "
+                "MODIFY tag_key VARCHAR(120) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL"
+            )
+        )
+    logger.info("notification_tags.tag_key migrated to utf8mb4_bin")
+
+
+def ensure_search_documents_table(engine: Engine) -> None:
+    """Create the listing search index; it is populated by ensure_search_index_seeded."""
+    from models.search_documents import SearchDocument
+
+    if inspect(engine).has_table(SearchDocument.__tablename__):
+        return
+
+    with engine.begin() as conn:
+        # Sin stopwords: el FULLTEXT fija la lista al crearse y "de", "com"... son parte de nombres y emails.
+        conn.execute(text("SET SESSION innodb_ft_enable_stopword = 0"))
+        try:
+            SearchDocument.__table__.create(bind=conn, checkfirst=True)
+        finally:
+            conn.execute(text("SET SESSION innodb_ft_enable_stopword = DEFAULT"))
+
+    logger.info("Schema compatibility check completed for search documents")
+
+
+def ensure_user_sessions_open_index(engine: Engine) -> None:
+    """Index used by the worker session cleanup to walk open sessions by creation date."""
+    with engine.begin() as conn:
+        conn.execute(
+            text("CREATE INDEX IF NOT EXISTS idx_us_open_created ON user_sessions (logged_out_at, created_at)")
+        )
+
+    logger.info("Schema compatibility check completed for user_sessions cleanup index")
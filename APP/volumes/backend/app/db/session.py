@@ -29,6 +29,14 @@ def set_utc_timezone(dbapi_connection, connection_record):
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+MARIADB_ER_LOCK_DEADLOCK = 1213
+
+
+def is_deadlock_error(exc: BaseException) -> bool:
+    """True si el error DBAPI es un deadlock: MariaDB revirtió la transacción completa."""
+    args = getattr(getattr(exc, "orig", None), "args", None) or ()
+    return bool(args) and args[0] == MARIADB_ER_LOCK_DEADLOCK
+
 
 @event.listens_for(Session, "before_flush")
 def normalize_datetime_columns_to_utc(session, flush_context, instances):
@@ -143,6 +143,7 @@ def _enqueue(envelope: dict) -> None:
     """Serializa el envelope y lo empuja a queue:pdf en Redis."""
     import redis as redis_sync
     from core.config import settings
+    from services.queue_telemetry import stamp_job_envelope
 
     client = redis_sync.Redis(
         host=settings.redis_host,
@@ -151,6 +152,6 @@ def _enqueue(envelope: dict) -> None:
         decode_responses=False,
     )
     try:
-        client.rpush("queue:pdf", json.dumps(envelope))
+        client.rpush("queue:pdf", json.dumps(stamp_job_envelope(envelope)))
     finally:
         client.close()
@@ -0,0 +1,213 @@
+"""
+events/reporting_rollups.py
+
+Hooks SQLAlchemy que mantienen las tablas de rollup del dashboard y de los
+reportes de gestión. Durante el flush se anotan los días afectados por
+cambios en minutas, transiciones de estado, versiones y compromisos;
+al hacer commit se recalculan solo esas particiones diarias dentro de la
+misma transacción. Si ese recálculo falla, las particiones quedan anotadas
+en Redis y las recalcula `reporting:rollups_reconcile`.
+
+Registro en main.py:
+    from events.reporting_rollups import register_listeners
+    register_listeners()
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+
+from core.datetime_utils import utc_now
+from db.session import is_deadlock_error
+from models.record_status_transitions import RecordStatusTransition
+from models.record_version_agreements import RecordVersionAgreement
+from models.record_version_requirements import RecordVersionRequirement
+from models.record_versions import RecordVersion
+from models.records import Record
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "reporting_rollups_pending"
+_RECORD_DIMENSION_FIELDS = (
+    "status_id",
+    "client_id",
+    "project_id",
+    "prepared_by_user_id",
+    "deleted_at",
+    "active_version_id",
+    "document_date",
+    "created_at",
+)
+# Columnas de Record que también forman parte de las filas de transiciones.
+_TRANSITION_DIMENSION_FIELDS = ("client_id", "project_id", "prepared_by_user_id", "deleted_at")
+
+_HISTORY_FIELDS = (
+    (Record, _RECORD_DIMENSION_FIELDS),
+    (RecordStatusTransition, ("changed_at",)),
+    (RecordVersion, ("record_id", "published_at")),
+    (RecordVersionAgreement, ("record_id",)),
+    (RecordVersionRequirement, ("record_id",)),
+)
+
+_registered = False
+
+
+def _noop_set(target, value, oldvalue, initiator):
+    return value
+
+
+def register_listeners() -> None:
+    """
+    Registra los listeners before_flush/before_commit sobre Session.
+    Llamar UNA sola vez desde main.py al iniciar la aplicación.
+    """
+    global _registered
+    if _registered:
+        return
+    # active_history: al asignar un atributo expirado se carga el valor previo,
+    # así el día/clave viejo queda en el historial y su partición se recalcula.
+    for model, fields in _HISTORY_FIELDS:
+        for field in fields:
+            event.listen(getattr(model, field), "set", _noop_set, active_history=True)
+    event.listen(Session, "before_flush", _collect_pending_days)
+    event.listen(Session, "before_commit", _refresh_pending_days)
+    event.listen(Session, "after_rollback", _discard_pending_days)
+    _registered = True
+    logger.info("reporting_rollups: listeners registrados en Session")
+
+
+# ---------------------------------------------------------------------------
+# Listeners
+# ---------------------------------------------------------------------------
+
+def _pending(session: Session) -> dict:
+    pending = session.info.get(_PENDING_KEY)
+    if pending is None:
+        pending = {
+            "record_days": set(),
+            "transition_days": set(),
+            "activity_days": set(),
+            "record_ids": set(),
+            "transition_record_ids": set(),
+        }
+        session.info[_PENDING_KEY] = pending
+    return pending
+
+
+def _as_date(value) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def _record_changed(target: Record) -> bool:
+    return any(get_history(target, field).has_changes() for field in _RECORD_DIMENSION_FIELDS)
+
+
+def _history_values(target, field: str) -> list:
+    """Valor actual y valores previos del atributo (claves viejas y nuevas)."""
+    history = get_history(target, field)
+    values = [*(history.added or ()), *(history.unchanged or ()), *(history.deleted or ())]
+    if not values:
+        values = [getattr(target, field, None)]
+    return [value for value in values if value is not None]
+
+
+def _history_days(target, field: str) -> set[date]:
+    return {day for day in (_as_date(value) for value in _history_values(target, field)) if day}
+
+
+def _collect_pending_days(session: Session, flush_context, instances) -> None:
+    today = utc_now().date()
+    pending = None
+
+    # Cada partición se reconstruye completa para todas las claves de alcance,
+    # así que basta con anotar el día viejo y el nuevo de cada cambio.
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        is_dirty = obj in session.dirty
+        if isinstance(obj, Record):
+            if is_dirty and not _record_changed(obj):
+                continue
+            pending = pending or _pending(session)
+            pending["record_days"].update(_history_days(obj, "created_at") or {today})
+            pending["record_ids"].add(str(obj.id))
+            pending["activity_days"].update(_history_days(obj, "document_date"))
+            if not is_dirty or any(
+                get_history(obj, field).has_changes() for field in _TRANSITION_DIMENSION_FIELDS
+            ):
+                # Las transiciones históricas de la minuta quedan con otro autor/cliente/proyecto.
+                pending["transition_record_ids"].add(str(obj.id))
+        elif isinstance(obj, RecordStatusTransition):
+            pending = pending or _pending(session)
+            pending["transition_days"].update(_history_days(obj, "changed_at") or {today})
+        elif isinstance(obj, RecordVersion):
+            pending = pending or _pending(session)
+            pending["record_ids"].update(str(value) for value in _history_values(obj, "record_id"))
+            pending["activity_days"].update(_history_days(obj, "published_at"))
+        elif isinstance(obj, (RecordVersionAgreement, RecordVersionRequirement)):
+            pending = pending or _pending(session)
+            pending["record_ids"].update(str(value) for value in _history_values(obj, "record_id"))
+
+
+def _refresh_pending_days(session: Session) -> None:
+    # before_commit corre antes del flush final: forzarlo para que los días
+    # afectados queden anotados y los recálculos vean las filas nuevas.
+    session.flush()
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    from services.reporting_rollups_service import (
+        mark_reporting_rollups_stale,
+        refresh_reporting_rollup_days,
+        resolve_record_activity_days,
+        resolve_record_transition_days,
+    )
+
+    try:
+        with session.begin_nested():
+            activity_days = pending["activity_days"] | resolve_record_activity_days(session, pending["record_ids"])
+            transition_days = pending["transition_days"] | resolve_record_transition_days(
+                session, pending["transition_record_ids"]
+            )
+            refresh_reporting_rollup_days(
+                session,
+                record_days=pending["record_days"],
+                transition_days=transition_days,
+                activity_days=activity_days,
+            )
+    except SQLAlchemyError as exc:
+        if is_deadlock_error(exc):
+            # MariaDB ya revirtió la transacción completa: no hay commit de
+            # negocio que salvar. Un lock wait timeout solo revierte la
+            # sentencia y cae en la rama de abajo.
+            raise
+        # El savepoint se revirtió y el commit de negocio sigue: dejar las
+        # particiones anotadas para la reconciliación programada.
+        logger.error("reporting_rollups: error al recalcular rollups: %s", exc, exc_info=True)
+        try:
+            mark_reporting_rollups_stale(
+                record_days=pending["record_days"],
+                transition_days=pending["transition_days"],
+                activity_days=pending["activity_days"],
+                transition_record_ids=pending["transition_record_ids"],
+                activity_record_ids=pending["record_ids"],
+            )
+        except RedisError as redis_exc:
+            logger.error(
+                "reporting_rollups: no se pudieron anotar particiones pendientes, requiere rebuild: %s",
+                redis_exc,
+            )
+
+
+def _discard_pending_days(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,162 @@
+"""
+events/search_index.py
+
+Hooks SQLAlchemy que mantienen la tabla `search_documents`. Durante el flush
+se anotan las entidades cuyos campos buscables cambiaron (team members y su
+perfil, tags, clientes, proyectos, participantes y sus emails); al hacer
+commit se recalculan solo esos documentos dentro de la misma transacción.
+Si ese recálculo falla, quedan anotados en Redis y los recalcula
+`search:index_reconcile`.
+
+Registro en main.py:
+    from events.search_index import register_listeners
+    register_listeners()
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+
+from db.session import is_deadlock_error
+from models.clients import Client
+from models.participant import Participant
+from models.participant_email import ParticipantEmail
+from models.projects import Project
+from models.tags import Tag
+from models.user import User
+from models.user_profiles import UserProfile
+from services.search_index_service import (
+    SEARCH_ENTITY_CLIENT,
+    SEARCH_ENTITY_PARTICIPANT,
+    SEARCH_ENTITY_PROJECT,
+    SEARCH_ENTITY_TAG,
+    SEARCH_ENTITY_TEAM_MEMBER,
+)
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "search_index_pending"
+
+# modelo → (tipo de documento, atributo con el id de la entidad, campos que lo afectan)
+_TRACKED: dict[type, tuple[str, str, tuple[str, ...]]] = {
+    User: (SEARCH_ENTITY_TEAM_MEMBER, "id", ("full_name", "username", "email", "deleted_at")),
+    UserProfile: (SEARCH_ENTITY_TEAM_MEMBER, "user_id", ("position",)),
+    Tag: (SEARCH_ENTITY_TAG, "id", ("name", "deleted_at")),
+    Client: (
+        SEARCH_ENTITY_CLIENT,
+        "id",
+        (
+            "name",
+            "legal_name",
+            "description",
+            "industry",
+            "email",
+            "phone",
+            "contact_name",
+            "contact_email",
+            "contact_phone",
+            "contact_position",
+            "contact_department",
+            "notes",
+            "tags",
+            "deleted_at",
+        ),
+    ),
+    Project: (SEARCH_ENTITY_PROJECT, "id", ("name", "code", "tags", "deleted_at")),
+    Participant: (
+        SEARCH_ENTITY_PARTICIPANT,
+        "id",
+        ("display_name", "normalized_name", "organization", "deleted_at"),
+    ),
+    ParticipantEmail: (SEARCH_ENTITY_PARTICIPANT, "participant_id", ("email", "participant_id", "deleted_at")),
+}
+
+_registered = False
+
+
+def register_listeners() -> None:
+    """
+    Registra los listeners after_flush/before_commit sobre Session.
+    Llamar UNA sola vez desde main.py al iniciar la aplicación.
+    """
+    global _registered
+    if _registered:
+        return
+    event.listen(Session, "after_flush", _collect_pending_documents)
+    event.listen(Session, "before_commit", _refresh_pending_documents)
+    event.listen(Session, "after_rollback", _discard_pending_documents)
+    _registered = True
+    logger.info("search_index: listeners registrados en Session")
+
+
+# ---------------------------------------------------------------------------
+# Listeners
+# ---------------------------------------------------------------------------
+
+def _pending(session: Session) -> dict[str, set[str]]:
+    pending = session.info.get(_PENDING_KEY)
+    if pending is None:
+        pending = {}
+        session.info[_PENDING_KEY] = pending
+    return pending
+
+
+def _entity_ids(obj: Any, id_attr: str) -> set[str]:
+    # Incluye el valor previo: un email que cambia de participante afecta a ambos.
+    ids = {getattr(obj, id_attr, None)}
+    ids.update(get_history(obj, id_attr).deleted or ())
+    return {str(value) for value in ids if value}
+
+
+def _collect_pending_documents(session: Session, flush_context) -> None:
+    # after_flush: los ids autogenerados ya existen y new/dirty/deleted
+    # todavía reflejan lo que se acaba de escribir.
+    for bucket, check_fields in ((session.new, False), (session.dirty, True), (session.deleted, False)):
+        for obj in bucket:
+            tracked = _TRACKED.get(type(obj))
+            if tracked is None:
+                continue
+            entity_type, id_attr, fields = tracked
+            if check_fields and not any(get_history(obj, name).has_changes() for name in fields):
+                continue
+            ids = _entity_ids(obj, id_attr)
+            if ids:
+                _pending(session).setdefault(entity_type, set()).update(ids)
+
+
+def _refresh_pending_documents(session: Session) -> None:
+    # before_commit corre antes del flush final: forzarlo para anotar sus cambios.
+    session.flush()
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    from services.search_index_service import mark_search_documents_stale, refresh_search_documents
+
+    try:
+        with session.begin_nested():
+            for entity_type, entity_ids in pending.items():
+                refresh_search_documents(session, entity_type, entity_ids)
+    except SQLAlchemyError as exc:
+        if is_deadlock_error(exc):
+            # MariaDB ya revirtió la transacción completa; un lock wait
+            # timeout solo revierte la sentencia y sigue por abajo.
+            raise
+        # El savepoint se revirtió y el commit de negocio sigue: dejar los
+        # documentos anotados para la reconciliación programada.
+        logger.error("search_index: error al actualizar documentos: %s", exc, exc_info=True)
+        try:
+            mark_search_documents_stale(pending)
+        except RedisError as redis_exc:
+            logger.error("search_index: no se pudieron anotar documentos pendientes, requiere rebuild: %s", redis_exc)
+
+
+def _discard_pending_documents(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,6 +1,7 @@
 import json
 import logging
 import time
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -8,18 +9,27 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from fastapi.openapi.docs import get_swagger_ui_html
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from sqlalchemy import text
 
 from core.config import settings
+from core.metrics import METRICS_CONTENT_TYPE, render_metrics
 from core.middleware import (
     GeoBlockMiddleware,
+    MetricsMiddleware,
+    RateLimitMiddleware,
     RequestDateTimeNormalizationMiddleware,
     ResponseContractMiddleware,
     register_exception_handlers,
 )
 from core.security import decode_access_token
-from db.schema_compat import ensure_projects_auto_send_columns
+from db.schema_compat import (
+    ensure_notification_tags_table,
+    ensure_projects_auto_send_columns,
+    ensure_reporting_rollup_tables,
+    ensure_search_documents_table,
+    ensure_user_sessions_open_index,
+)
 from db.session import SessionLocal, engine
 from db.redis import close_redis
 
@@ -39,6 +49,10 @@ _last_operation_state_db_error_log_at = 0.0
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     ensure_projects_auto_send_columns(engine)
+    ensure_reporting_rollup_tables(engine)
+    ensure_notification_tags_table(engine)
+    ensure_search_documents_table(engine)
+    ensure_user_sessions_open_index(engine)
     try:
         from services.system_maintenance_service import ensure_initial_commissioning_state
 
@@ -51,7 +65,56 @@ async def lifespan(app: FastAPI):
         logger.warning("No se pudo asegurar el estado inicial de puesta en marcha: %s", exc)
     from events.pdf_dispatch import register_listeners
     register_listeners()
+    from events.reporting_rollups import register_listeners as register_reporting_rollup_listeners
+    register_reporting_rollup_listeners()
+    try:
+        from services.reporting_rollups_service import ensure_reporting_rollups_seeded
+
+        db = SessionLocal()
+        try:
+            ensure_reporting_rollups_seeded(db)
+        finally:
+            db.close()
+    except Exception as exc:
+        logger.warning("No se pudo completar el backfill inicial de rollups de reportes: %s", exc)
+    from events.search_index import register_listeners as register_search_index_listeners
+    register_search_index_listeners()
+    try:
+        from services.search_index_service import ensure_search_index_seeded
+
+        db = SessionLocal()
+        try:
+            ensure_search_index_seeded(db)
+        finally:
+            db.close()
+    except Exception as exc:
+        logger.warning("No se pudo construir el índice de búsqueda inicial: %s", exc)
+    from services.schedule_registry_service import resync_schedules_quietly
+    db = SessionLocal()
+    try:
+        resync_schedules_quietly(db)
+    finally:
+        db.close()
+    from services.output_validator import warm_up_schema_validators
+    warm_up_schema_validators()
+    from services.email_template_service import warm_up_email_templates
+    warm_up_email_templates()
+    from services.catalog_registry import run_catalog_invalidation_listener, warm_up_catalogs
+    try:
+        db = SessionLocal()
+        try:
+            warm_up_catalogs(db)
+        finally:
+            db.close()
+    except Exception as exc:
+        logger.warning("No se pudieron precargar los catálogos de sistema: %s", exc)
+    catalog_listener = asyncio.create_task(run_catalog_invalidation_listener())
     yield
+    catalog_listener.cancel()
+    try:
+        await catalog_listener
+    except asyncio.CancelledError:
+        pass
     await close_redis()
 
 
@@ -74,8 +137,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(GeoBlockMiddleware)
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(RequestDateTimeNormalizationMiddleware)
 app.add_middleware(ResponseContractMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 
 @app.middleware("http")
@@ -142,7 +207,7 @@ def _is_request_method_safe(request: Request) -> bool:
 
 
 def _is_maintenance_bypass_path(path: str) -> bool:
-    if path in {"/", "/health", "/v1/docs", "/v1/openapi.json", "/v1/redoc"}:
+    if path in {"/", "/health", "/metrics", "/v1/docs", "/v1/openapi.json", "/v1/redoc"}:
         return True
     return (
         path.startswith("/internal/")
@@ -634,6 +699,8 @@ from routers.internal.notifications import router as internal_notifications_rout
 app.include_router(internal_notifications_router)
 from routers.internal.backups import router as internal_backups_router
 app.include_router(internal_backups_router)
+from routers.internal.schedules import router as internal_schedules_router
+app.include_router(internal_schedules_router)
 
 
 # ── System endpoints ──────────────────────────────────────────────────────────
@@ -646,6 +713,32 @@ def root():
 def health():
     return {"env": settings.env_name, "status": "running"}
 
+
+_METRICS_FORWARDING_HEADERS = (
+    "forwarded",
+    "x-forwarded-for",
+    "x-real-ip",
+    "x-client-ip",
+    "true-client-ip",
+    "cf-connecting-ip",
+)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    # Solo para el scraper dentro de la red Docker. Se evalúa el peer TCP directo
+    # (nunca headers de proxy) y se rechaza todo lo que llegue reenviado por nginx.
+    from utils.geo import _is_private_ip
+
+    peer_ip = request.client.host if request.client else None
+    if (
+        not peer_ip
+        or not _is_private_ip(peer_ip)
+        or any(header in request.headers for header in _METRICS_FORWARDING_HEADERS)
+    ):
+        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
 @app.get("/v1/docs", include_in_schema=False)
 async def custom_swagger_ui():
     if settings.env_name == "prod":
@@ -28,6 +28,8 @@ from models.ai_model_pricing import AiModelPricing
 from models.ai_usage_events import AiUsageEvent
 from models.notifications import Notification
 from models.notification_recipients import NotificationRecipient
+from models.notification_tags import NotificationTag
+from models.search_documents import SearchDocument
 from models.access_requests import AccessRequest
 from models.email_delivery_events import EmailDeliveryEvent
 from models.organization_settings import OrganizationSetting
@@ -75,6 +77,11 @@ from models.record_version_participant import RecordVersionParticipant
 from models.visitor_access_request import VisitorAccessRequest
 from models.visitor_session import VisitorSession
 from models.record_version_observation import RecordVersionObservation
+from models.reporting_rollups import (
+    CommitmentDailyRollup,
+    RecordDailyRollup,
+    RecordTransitionDailyRollup,
+)
 
 # ── Tablas relacionales ───────────────────────────────────────────────────────
 from models.artifact_type_mime_types import ArtifactTypeMimeType   # ← verificar nombre clase
@@ -94,7 +101,7 @@ __all__ = [
     "RecordType", "RecordStatus", "VersionStatus",
     "DashboardWidget", "AiProfileCategory",
     "AiProviderConfig", "AiModelPricing", "AiUsageEvent",
-    "Notification", "NotificationRecipient", "AccessRequest", "EmailDeliveryEvent",
+    "Notification", "NotificationRecipient", "NotificationTag", "AccessRequest", "EmailDeliveryEvent",
     "OrganizationSetting",
     "SmtpConfig",
     "SystemMaintenanceSetting", "SystemMaintenanceRun",
@@ -109,6 +116,8 @@ __all__ = [
     "RecordVersionAgreement", "RecordVersionRequirement",
     "RecordVersionParticipant", "VisitorAccessRequest", "VisitorSession",
     "RecordVersionObservation",
+    "RecordDailyRollup", "RecordTransitionDailyRollup", "CommitmentDailyRollup",
+    "SearchDocument",
     # Relacionales
     "ArtifactTypeMimeType", "RecordTypeArtifactType",
     "UserClient", "UserClientAcl", "UserProjectACL", "UserDashboardWidget",
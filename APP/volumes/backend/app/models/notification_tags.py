@@ -0,0 +1,28 @@
+# models/notification_tags.py
+from __future__ import annotations
+
+from sqlalchemy import Column, ForeignKey, Index, String
+
+from db.base import Base
+
+
+class NotificationTag(Base):
+    """Tag normalizado de una notificación (índice de `notifications.tags_json`)."""
+
+    __tablename__ = "notification_tags"
+    __table_args__ = (
+        Index("idx_notification_tags_key", "tag_key", "notification_id"),
+    )
+
+    notification_id = Column(
+        String(36),
+        ForeignKey("notifications.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Binaria: la PK compara igual que la deduplicación en Python
+    # (la collation por defecto trataría "café" y "cafe" como el mismo tag).
+    tag_key = Column(String(120, collation="utf8mb4_bin"), primary_key=True)
+    tag = Column(String(120), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<NotificationTag notification_id={self.notification_id} tag={self.tag!r}>"
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, Date, Index, Integer, SmallInteger, String
+
+from db.base import Base
+
+
+class RecordDailyRollup(Base):
+    """Minutas por día de creación (UTC) y estado actual."""
+
+    __tablename__ = "record_daily_rollups"
+    __table_args__ = (
+        Index("idx_rdr_date", "rollup_date"),
+        Index("idx_rdr_user_date", "prepared_by_user_id", "rollup_date"),
+        Index("idx_rdr_user_status", "prepared_by_user_id", "status_id"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    rollup_date = Column(Date, nullable=False)
+    prepared_by_user_id = Column(String(36), nullable=False)
+    client_id = Column(String(36), nullable=False)
+    project_id = Column(String(36), nullable=True)
+    status_id = Column(SmallInteger, nullable=False)
+    record_count = Column(Integer, nullable=False, default=0)
+
+
+class RecordTransitionDailyRollup(Base):
+    """Transiciones de estado por día (UTC) y estado destino.
+
+    `record_count` cuenta cada minuta en el día de su primera transición del
+    mes a ese estado: la suma de un mes son minutas distintas del mes.
+    """
+
+    __tablename__ = "record_transition_daily_rollups"
+    __table_args__ = (
+        Index("idx_rtdr_date", "rollup_date"),
+        Index("idx_rtdr_user_status_date", "prepared_by_user_id", "to_status_id", "rollup_date"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    rollup_date = Column(Date, nullable=False)
+    prepared_by_user_id = Column(String(36), nullable=False)
+    client_id = Column(String(36), nullable=False)
+    project_id = Column(String(36), nullable=True)
+    to_status_id = Column(SmallInteger, nullable=False)
+    transition_count = Column(Integer, nullable=False, default=0)
+    record_count = Column(Integer, nullable=False, default=0)
+
+
+class CommitmentDailyRollup(Base):
+    """Acuerdos/requerimientos de la versión activa por día de actividad."""
+
+    __tablename__ = "commitment_daily_rollups"
+    __table_args__ = (
+        Index("idx_cdr_date", "activity_date"),
+        Index("idx_cdr_client_project", "client_id", "project_id"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    activity_date = Column(Date, nullable=False)
+    prepared_by_user_id = Column(String(36), nullable=False)
+    client_id = Column(String(36), nullable=False)
+    project_id = Column(String(36), nullable=True)
+    item_type = Column(String(20), nullable=False)
+    status = Column(String(40), nullable=False)
+    item_count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,31 @@
+# models/search_documents.py
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, Index, String, Text
+
+from db.base import Base
+
+
+class SearchDocument(Base):
+    """
+    Documento de búsqueda desnormalizado por entidad (team member, tag,
+    cliente, proyecto, participante). Lo mantiene events/search_index.py.
+
+    - sort_key:    nombre principal normalizado; prefijo para autocompletar.
+    - search_text: todos los campos buscables normalizados; índice FULLTEXT.
+    """
+
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        Index("idx_search_documents_prefix", "entity_type", "sort_key"),
+        Index("ftx_search_documents_text", "search_text", mysql_prefix="FULLTEXT"),
+    )
+
+    entity_type = Column(String(20), primary_key=True)
+    entity_id = Column(String(36), primary_key=True)
+    sort_key = Column(String(191), nullable=False, default="")
+    search_text = Column(Text, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SearchDocument {self.entity_type}:{self.entity_id} sort_key={self.sort_key!r}>"
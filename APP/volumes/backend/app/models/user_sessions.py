@@ -1,7 +1,7 @@
 # models/user_sessions.py
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 
 from db.base import Base
@@ -9,6 +9,9 @@ from db.base import Base
 
 class UserSession(Base):
     __tablename__ = "user_sessions"
+    __table_args__ = (
+        Index("idx_us_open_created", "logged_out_at", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True)
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
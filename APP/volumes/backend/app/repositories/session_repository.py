@@ -30,6 +30,26 @@ def create_session(db: Session, *, user_id: str, jti: str, ip_v4: str | None,
     return session
 
 
+def update_session_geo(db: Session, jti: str, *, country_code: str | None,
+                       country_name: str | None, city: str | None,
+                       location: str | None) -> bool:
+    updated = (
+        db.query(UserSession)
+        .filter(UserSession.jti == jti)
+        .update(
+            {
+                UserSession.country_code: country_code,
+                UserSession.country_name: country_name,
+                UserSession.city:         city,
+                UserSession.location:     location,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return bool(updated)
+
+
 def get_session_by_jti(db: Session, jti: str) -> UserSession | None:
     return db.query(UserSession).filter(UserSession.jti == jti).first()
 
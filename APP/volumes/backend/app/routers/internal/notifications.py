@@ -7,12 +7,16 @@ from sqlalchemy.orm import Session
 
 from core.internal_auth import verify_internal_secret
 from db.session import get_db
-from schemas.internal_notifications import TriggerPendingPublicationRemindersResponse
+from schemas.internal_notifications import (
+    ReconcileUnreadCountersResponse,
+    TriggerPendingPublicationRemindersResponse,
+)
 from schemas.notifications import InternalNotificationIngestRequest, InternalNotificationIngestResponse
 from services.email_branding_service import build_email_branding_bundle
 from services.email_queue import queue_templated_email
 from services.notification_service import enqueue_pending_publication_reminders
 from services.notification_center_service import create_in_app_notification
+from services.notification_unread_counters_service import reconcile_unread_counters
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +39,18 @@ async def pending_publication_reminders_endpoint(
     return TriggerPendingPublicationRemindersResponse(sent=sent)
 
 
+@router.post(
+    "/unread-counters/reconcile",
+    response_model=ReconcileUnreadCountersResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def reconcile_unread_counters_endpoint(
+    db: Session = Depends(get_db),
+) -> ReconcileUnreadCountersResponse:
+    result = await reconcile_unread_counters(db)
+    return ReconcileUnreadCountersResponse(**result)
+
+
 @router.post(
     "/ingest",
     response_model=InternalNotificationIngestResponse,
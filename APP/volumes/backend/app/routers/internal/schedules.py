@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+
+from core.internal_auth import verify_internal_secret
+from db.session import get_db
+from schemas.internal_schedules import (
+    ScheduleFireRequest,
+    ScheduleFireResponse,
+    ScheduleSyncResponse,
+)
+from services.schedule_registry_service import fire_schedule, sync_schedules
+
+router = APIRouter(
+    prefix="/internal/v1/schedules",
+    tags=["Internal - Schedules"],
+    dependencies=[Depends(verify_internal_secret)],
+)
+
+
+@router.post(
+    "/sync",
+    response_model=ScheduleSyncResponse,
+    status_code=status.HTTP_200_OK,
+)
+def sync_schedules_endpoint(
+    db: Session = Depends(get_db),
+) -> ScheduleSyncResponse:
+    return sync_schedules(db)
+
+
+@router.post(
+    "/fire",
+    response_model=ScheduleFireResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def fire_schedule_endpoint(
+    body: ScheduleFireRequest,
+    db: Session = Depends(get_db),
+) -> ScheduleFireResponse:
+    return await fire_schedule(db, key=body.key, scheduled_for=body.scheduled_for)
@@ -1,5 +1,5 @@
 # routers/v1/auth.py
-from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
 from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
@@ -28,8 +28,8 @@ from services.auth_service import (
     list_active_sessions, logout_session_by_jti, logout_all_other_sessions,
 )
 from services.session_events_service import auth_sse_headers, stream_session_events
-from services.avatar_service import read_user_avatar, remove_user_avatar, save_user_avatar
-from services.upload_validation import safe_content_disposition
+from services.avatar_service import read_user_avatar_image, remove_user_avatar, save_user_avatar
+from services.image_delivery_service import build_image_response
 from services.user_personalization_service import (
     get_user_personalization,
     update_user_personalization,
@@ -189,17 +189,14 @@ async def delete_my_avatar_endpoint(
 
 
 @router.get("/users/{user_id}/avatar", status_code=status.HTTP_200_OK)
-def user_avatar_endpoint(user_id: str, size: str = "thumb", db: Session = Depends(get_db)):
-    content, content_type = read_user_avatar(db, user_id, size=size)
-    return Response(
-        content=content,
-        media_type=content_type,
-        headers={
-            "Cache-Control": "public, max-age=300",
-            "Content-Disposition": safe_content_disposition("avatar", disposition="inline"),
-            "X-Content-Type-Options": "nosniff",
-        },
-    )
+def user_avatar_endpoint(
+    request: Request,
+    user_id: str,
+    size: str = "thumb",
+    db: Session = Depends(get_db),
+):
+    image = read_user_avatar_image(db, user_id, size=size)
+    return build_image_response(request, image, filename="avatar")
 
 
 # ── Token ─────────────────────────────────────────────
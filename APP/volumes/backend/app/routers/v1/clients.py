@@ -1,13 +1,13 @@
 # routers/v1/clients.py
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, File, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, Request, UploadFile, status
 from sqlalchemy.orm import Session
 
 from core.authz import current_user_dep
 from db.session import get_db
 from schemas.auth import UserSession
-from services.upload_validation import safe_content_disposition
+from services.image_delivery_service import build_image_response
 from schemas.clients import (
     ClientCreateRequest,
     ClientFilterRequest,
@@ -23,7 +23,7 @@ from services.clients_service import (
     delete_client,
     get_client,
     list_clients,
-    read_client_logo_content,
+    read_client_logo_image,
     upload_client_logo,
     update_client,
 )
@@ -45,19 +45,12 @@ def industries_endpoint(
 
 @router.get("/{id}/logo", status_code=status.HTTP_200_OK)
 def logo_endpoint(
+    request: Request,
     id: str,
     db: Session = Depends(get_db),
 ):
-    content, content_type = read_client_logo_content(db, id)
-    return Response(
-        content=content,
-        media_type=content_type,
-        headers={
-            "Cache-Control": "public, max-age=300",
-            "Content-Disposition": safe_content_disposition("client-logo", disposition="inline"),
-            "X-Content-Type-Options": "nosniff",
-        },
-    )
+    image = read_client_logo_image(db, id)
+    return build_image_response(request, image, filename="client-logo")
 
 @router.get("/{id}", response_model=ClientResponse, status_code=status.HTTP_200_OK)
 def get_endpoint(
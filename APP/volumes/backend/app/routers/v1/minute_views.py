@@ -21,7 +21,7 @@ from services.minute_views_service import (
     delete_minute_view_observation,
     get_current_visitor_session,
     get_minute_view_detail,
-    get_minute_view_pdf_bytes,
+    get_minute_view_pdf_object,
     logout_current_visitor_session,
     minute_view_sse_headers,
     request_minute_view_otp,
@@ -29,7 +29,7 @@ from services.minute_views_service import (
     update_minute_view_observation,
     verify_minute_view_otp,
 )
-from services.upload_validation import safe_content_disposition
+from services.object_delivery_service import stream_stored_object
 
 router = APIRouter(prefix="/minutes/public", tags=["MinuteViews"])
 sse_bearer = HTTPBearer(auto_error=False)
@@ -109,18 +109,12 @@ async def detail_endpoint(
 )
 async def pdf_endpoint(
     record_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     visitor_session=Depends(current_visitor_dep),
 ):
-    pdf_bytes, filename = get_minute_view_pdf_bytes(db, record_id=record_id)
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": safe_content_disposition(filename, disposition="inline"),
-            "X-Content-Type-Options": "nosniff",
-        },
-    )
+    pdf = get_minute_view_pdf_object(db, record_id=record_id)
+    return stream_stored_object(request, pdf, disposition="inline")
 
 
 @router.get(
@@ -10,6 +10,7 @@ from typing import AsyncGenerator
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile, status
 from fastapi.responses import Response, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.background import BackgroundTask
 from sqlalchemy.orm import Session
 
 from core.authz import require_permissions
@@ -41,9 +42,10 @@ from schemas.minute_observations import (
 from services.auth_service import get_current_user
 from services.minutes_service import (
     generate_minute,
-    get_minute_attachment_blob,
+    get_minute_attachment_object,
+    discard_minute_pdf_preview_job_result,
     generate_minute_pdf_preview,
-    get_minute_pdf_preview_job_result,
+    get_minute_pdf_preview_job_object,
     get_minute_pdf_preview_record_id,
     get_minute_pdf_preview_job_status,
     get_minute_detail,
@@ -67,6 +69,7 @@ from services.minute_views_service import (
     stream_editor_minute_observation_events,
 )
 from services.access_control_service import ensure_record_read_access, ensure_record_write_access
+from services.object_delivery_service import StoredObjectRef, stream_stored_object
 from services.upload_validation import safe_content_disposition
 from services.sse_instrumentation import new_sse_connection_id, sse_duration_ms, sse_log
 
@@ -211,19 +214,22 @@ async def pdf_preview_job_status_endpoint(
 )
 async def pdf_preview_job_result_endpoint(
     preview_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     session: UserSession = Depends(current_user_dep),
 ):
     record_id = await get_minute_pdf_preview_record_id(preview_id)
     ensure_record_read_access(db, session, record_id)
-    pdf_bytes = await get_minute_pdf_preview_job_result(preview_id)
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": safe_content_disposition("minute-preview.pdf", disposition="inline"),
-            "X-Content-Type-Options": "nosniff",
-        },
+    preview = await get_minute_pdf_preview_job_object(preview_id)
+    # La vista previa es de un solo uso: se entrega completa y se borra al terminar.
+    return stream_stored_object(
+        request,
+        preview,
+        disposition="inline",
+        cache_control="no-store",
+        allow_ranges=False,
+        conditional=False,
+        background=BackgroundTask(discard_minute_pdf_preview_job_result, preview_id),
     )
 
 
@@ -351,26 +357,20 @@ async def pdf_preview_endpoint(
 )
 def attachment_query_endpoint(
     record_id: str,
+    request: Request,
     sha256: str | None = Query(None),
     file_name: str | None = Query(None, alias="fileName"),
     db: Session = Depends(get_db),
     session: UserSession = Depends(current_user_dep),
 ):
     ensure_record_read_access(db, session, record_id)
-    file_bytes, mime_type, filename = get_minute_attachment_blob(
+    attachment = get_minute_attachment_object(
         db=db,
         record_id=record_id,
         sha256=sha256,
         file_name=file_name,
     )
-    return Response(
-        content=file_bytes,
-        media_type=mime_type,
-        headers={
-            "Content-Disposition": safe_content_disposition(filename),
-            "X-Content-Type-Options": "nosniff",
-        },
-    )
+    return stream_stored_object(request, attachment)
 
 
 @router.get(
@@ -380,25 +380,19 @@ def attachment_query_endpoint(
 )
 def attachment_endpoint(
     record_id: str,
+    request:   Request,
     sha256:    str,
     db:        Session = Depends(get_db),
     session:   UserSession = Depends(current_user_dep),
 ):
     ensure_record_read_access(db, session, record_id)
-    file_bytes, mime_type, filename = get_minute_attachment_blob(
+    attachment = get_minute_attachment_object(
         db=db,
         record_id=record_id,
         sha256=sha256,
         file_name=None,
     )
-    return Response(
-        content=file_bytes,
-        media_type=mime_type,
-        headers={
-            "Content-Disposition": safe_content_disposition(filename),
-            "X-Content-Type-Options": "nosniff",
-        },
-    )
+    return stream_stored_object(request, attachment)
 
 
 @router.get(
@@ -657,6 +651,7 @@ async def events_endpoint(
 )
 def pdf_endpoint(
     record_id: str,
+    request:   Request,
     type:      str     = Query("draft", description="'draft' para borrador, 'published' para versión final"),
     db:        Session = Depends(get_db),
     session:   UserSession = Depends(current_user_dep),
@@ -664,13 +659,13 @@ def pdf_endpoint(
     """
     Actúa como proxy entre el frontend y MinIO para servir el PDF generado.
     El JWT viaja en el header Authorization normal; MinIO permanece interno.
+    Se entrega en streaming con soporte de Range e If-None-Match.
 
     Paths en MinIO:
       draft     → minuetaitor-draft/drafts/{record_id}/draft_current.pdf
       published → minuetaitor-published/published/{record_id}/final.pdf
     """
     ensure_record_read_access(db, session, record_id)
-    from db.minio_client import get_minio_client
 
     if type == "published":
         bucket = "minuetaitor-published"
@@ -679,32 +674,18 @@ def pdf_endpoint(
         bucket = "minuetaitor-draft"
         key    = f"drafts/{record_id}/draft_current.pdf"
 
-    minio = get_minio_client()
-    try:
-        obj       = minio.get_object(bucket, key)
-        pdf_bytes = obj.read()
-        obj.close()
-        obj.release_conn()
-    except Exception:
-        raise HTTPException(
-            status_code = 404,
-            detail = {
-                "error":   "pdf_not_found",
-                "message": "El PDF aún no ha sido generado. Guarda la minuta para generarlo.",
-            },
-        )
-
-    return Response(
-        content    = pdf_bytes,
-        media_type = "application/pdf",
-        headers    = {
-            "Content-Disposition": "inline",
-            "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-            "Pragma": "no-cache",
-            "Expires": "0",
-            "X-Content-Type-Options": "nosniff",
+    pdf = StoredObjectRef(
+        bucket         = bucket,
+        key            = key,
+        filename       = f"minute-{record_id}.pdf",
+        media_type     = "application/pdf",
+        missing_detail = {
+            "error":   "pdf_not_found",
+            "message": "El PDF aún no ha sido generado. Guarda la minuta para generarlo.",
         },
     )
+    # El borrador se regenera en la misma key: se revalida siempre por ETag.
+    return stream_stored_object(request, pdf, disposition="inline")
 
 
 # ─── GET /{record_id}/versions ───────────────────────────────────────────────
@@ -31,7 +31,7 @@ from services.notification_center_service import (
     clear_notifications,
     get_notification_detail,
     list_notification_tags,
-    get_unread_notifications_count,
+    get_cached_unread_notifications_count,
     hide_notification,
     list_notifications,
     mark_all_notifications_as_read,
@@ -67,7 +67,7 @@ async def current_user_or_token_dep(
     response_model=NotificationListResponse,
     status_code=status.HTTP_200_OK,
 )
-def list_notifications_endpoint(
+async def list_notifications_endpoint(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     unread_only: bool = Query(False, alias="unreadOnly"),
@@ -75,7 +75,7 @@ def list_notifications_endpoint(
     db: Session = Depends(get_db),
     session: UserSession = Depends(current_user_dep),
 ):
-    return list_notifications(
+    return await list_notifications(
         db,
         session,
         skip=skip,
@@ -102,11 +102,11 @@ def notification_tags_endpoint(
     response_model=NotificationUnreadCountResponse,
     status_code=status.HTTP_200_OK,
 )
-def unread_count_endpoint(
+async def unread_count_endpoint(
     db: Session = Depends(get_db),
     session: UserSession = Depends(current_user_dep),
 ):
-    return {"count": get_unread_notifications_count(db, session.user_id)}
+    return {"count": await get_cached_unread_notifications_count(db, session.user_id)}
 
 
 @router.get(
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, File, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, Request, UploadFile, status
 from sqlalchemy.orm import Session
 
 from core.authz import require_roles
 from db.session import get_db
 from schemas.auth import UserSession
 from schemas.organization_settings import OrganizationSettingsRequest, OrganizationSettingsResponse
-from services.upload_validation import safe_content_disposition
+from services.image_delivery_service import build_image_response
 from services.organization_settings_service import (
     delete_organization_banner,
     delete_organization_logo,
     get_organization_settings,
-    read_organization_banner_content,
-    read_organization_logo_content,
+    read_organization_banner_image_content,
+    read_organization_logo_image_content,
     update_organization_settings,
     upload_organization_banner,
     upload_organization_logo,
@@ -24,18 +24,11 @@ router = APIRouter(prefix="/system/organization", tags=["System Organization"])
 
 @router.get("/logo", status_code=status.HTTP_200_OK)
 def organization_logo_endpoint(
+    request: Request,
     db: Session = Depends(get_db),
 ):
-    content, content_type = read_organization_logo_content(db)
-    return Response(
-        content=content,
-        media_type=content_type,
-        headers={
-            "Cache-Control": "public, max-age=300",
-            "Content-Disposition": safe_content_disposition("organization-logo", disposition="inline"),
-            "X-Content-Type-Options": "nosniff",
-        },
-    )
+    image = read_organization_logo_image_content(db)
+    return build_image_response(request, image, filename="organization-logo")
 
 
 @router.post("/logo", status_code=status.HTTP_200_OK)
@@ -57,18 +50,11 @@ def delete_organization_logo_endpoint(
 
 @router.get("/banner", status_code=status.HTTP_200_OK)
 def organization_banner_endpoint(
+    request: Request,
     db: Session = Depends(get_db),
 ):
-    content, content_type = read_organization_banner_content(db)
-    return Response(
-        content=content,
-        media_type=content_type,
-        headers={
-            "Cache-Control": "public, max-age=300",
-            "Content-Disposition": safe_content_disposition("organization-banner", disposition="inline"),
-            "X-Content-Type-Options": "nosniff",
-        },
-    )
+    image = read_organization_banner_image_content(db)
+    return build_image_response(request, image, filename="organization-banner")
 
 
 @router.post("/banner", status_code=status.HTTP_200_OK)
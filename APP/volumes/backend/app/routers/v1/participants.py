@@ -1,13 +1,13 @@
 # routers/v1/participants.py
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, File, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, Request, UploadFile, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from db.session import get_db
 from schemas.auth import UserSession
-from services.upload_validation import safe_content_disposition
+from services.image_delivery_service import build_image_response
 from schemas.participants import (
     ParticipantCreateRequest,
     ParticipantEmailLookupRequest,
@@ -27,7 +27,7 @@ from services.participants_service import (
     get_participant,
     lookup_participant_emails,
     list_participants,
-    read_participant_logo_content,
+    read_participant_logo_image,
     resolve_participant,
     soft_delete_participant,
     upload_participant_logo,
@@ -46,19 +46,12 @@ async def current_user_dep(
 
 @router.get("/{id}/logo", status_code=status.HTTP_200_OK)
 def logo_endpoint(
+    request: Request,
     id: str,
     db: Session = Depends(get_db),
 ):
-    content, content_type = read_participant_logo_content(db, id)
-    return Response(
-        content=content,
-        media_type=content_type,
-        headers={
-            "Cache-Control": "public, max-age=300",
-            "Content-Disposition": safe_content_disposition("participant-logo", disposition="inline"),
-            "X-Content-Type-Options": "nosniff",
-        },
-    )
+    image = read_participant_logo_image(db, id)
+    return build_image_response(request, image, filename="participant-logo")
 
 
 @router.get("/{id}", response_model=ParticipantResponse, status_code=status.HTTP_200_OK)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from core.authz import require_permissions
@@ -26,8 +27,24 @@ from schemas.audit_reports import (
     AuditReportRequest,
     AuditReportResponse,
 )
-from schemas.report_exports import ReportPdfPreviewRequest
+from schemas.report_exports import (
+    AuditReportExportRequest,
+    ManagementCommitmentReportExportRequest,
+    ManagementEmailDeliveryReportExportRequest,
+    ManagementReviewObservationExportRequest,
+    ReportPdfPreviewRequest,
+)
 from services.management_topic_reports_service import list_management_topic_report
+from services.report_exports_service import (
+    get_report_export_job_status,
+    get_report_export_source,
+    iter_report_export_chunks,
+    open_report_export_job_result,
+    report_export_filename,
+    report_export_media_type,
+    run_report_export_job,
+    start_report_export_job,
+)
 from services.reports_service import (
     generate_report_pdf_preview,
     get_report_pdf_preview_job_result,
@@ -39,6 +56,28 @@ from services.upload_validation import safe_content_disposition
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
 
+async def _report_export_response(
+    source_key: str,
+    body,
+    session: UserSession,
+    background_tasks: BackgroundTasks,
+):
+    if body.delivery == "background":
+        job = await start_report_export_job(session, source_key, body)
+        background_tasks.add_task(run_report_export_job, job["export_id"], session, source_key, body)
+        return job
+
+    source = get_report_export_source(source_key)
+    return StreamingResponse(
+        iter_report_export_chunks(source, session, body),
+        media_type=report_export_media_type(body.format),
+        headers={
+            "Content-Disposition": safe_content_disposition(report_export_filename(source, body.format)),
+            "X-Content-Type-Options": "nosniff",
+        },
+    )
+
+
 @router.post(
     "/audit/events",
     response_model=AuditReportResponse,
@@ -55,6 +94,19 @@ def audit_events_endpoint(
     return list_audit_report(db, session, body)
 
 
+@router.post(
+    "/audit/events/export",
+    status_code=status.HTTP_200_OK,
+    summary="Exportar reporte de auditoría en CSV/XLSX sin límite de filas",
+)
+async def audit_events_export_endpoint(
+    body: AuditReportExportRequest,
+    background_tasks: BackgroundTasks,
+    session: UserSession = Depends(require_permissions("audit.read")),
+):
+    return await _report_export_response("audit", body, session, background_tasks)
+
+
 @router.post(
     "/management/commitment-items",
     response_model=ManagementCommitmentReportResponse,
@@ -103,6 +155,79 @@ def management_review_observations_endpoint(
     return list_management_review_observations(db, session, body)
 
 
+@router.post(
+    "/management/commitment-items/export",
+    status_code=status.HTTP_200_OK,
+    summary="Exportar acuerdos y requerimientos en CSV/XLSX",
+)
+async def management_commitment_items_export_endpoint(
+    body: ManagementCommitmentReportExportRequest,
+    background_tasks: BackgroundTasks,
+    session: UserSession = Depends(require_permissions("records.read")),
+):
+    return await _report_export_response("commitment-items", body, session, background_tasks)
+
+
+@router.post(
+    "/management/email-deliveries/export",
+    status_code=status.HTTP_200_OK,
+    summary="Exportar eventos históricos de correos en CSV/XLSX",
+)
+async def management_email_deliveries_export_endpoint(
+    body: ManagementEmailDeliveryReportExportRequest,
+    background_tasks: BackgroundTasks,
+    session: UserSession = Depends(require_permissions("records.read")),
+):
+    return await _report_export_response("email-deliveries", body, session, background_tasks)
+
+
+@router.post(
+    "/management/review-observations/export",
+    status_code=status.HTTP_200_OK,
+    summary="Exportar observaciones externas en CSV/XLSX",
+)
+async def management_review_observations_export_endpoint(
+    body: ManagementReviewObservationExportRequest,
+    background_tasks: BackgroundTasks,
+    session: UserSession = Depends(require_permissions("records.read")),
+):
+    return await _report_export_response("review-observations", body, session, background_tasks)
+
+
+@router.get(
+    "/exports/{export_id}/status",
+    status_code=status.HTTP_200_OK,
+    summary="Consultar estado de una exportación generada en segundo plano",
+)
+async def report_export_job_status_endpoint(
+    export_id: str,
+    # El permiso específico (records.read / audit.read) depende del reporte exportado y lo valida el servicio.
+    session: UserSession = Depends(require_permissions("records.read", "audit.read", require_all=False)),
+):
+    return await get_report_export_job_status(export_id, session)
+
+
+@router.get(
+    "/exports/{export_id}/result",
+    status_code=status.HTTP_200_OK,
+    summary="Descargar una exportación generada en segundo plano",
+)
+async def report_export_job_result_endpoint(
+    export_id: str,
+    # El permiso específico (records.read / audit.read) depende del reporte exportado y lo valida el servicio.
+    session: UserSession = Depends(require_permissions("records.read", "audit.read", require_all=False)),
+):
+    chunks, meta = await open_report_export_job_result(export_id, session)
+    return StreamingResponse(
+        chunks,
+        media_type=report_export_media_type(meta.get("format") or "csv"),
+        headers={
+            "Content-Disposition": safe_content_disposition(meta.get("filename") or "reporte"),
+            "X-Content-Type-Options": "nosniff",
+        },
+    )
+
+
 @router.post(
     "/management/topic-analytics",
     response_model=ManagementTopicReportResponse,
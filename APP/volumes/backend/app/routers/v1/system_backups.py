@@ -4,7 +4,7 @@ from pathlib import Path
 import uuid
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
@@ -26,6 +26,7 @@ from schemas.system_backups import (
     SystemBackupsStatusResponse,
 )
 from services.auth_service import get_current_user
+from services.object_delivery_service import etag_matches
 from services.system_backup_events_service import backup_sse_headers, stream_system_backup_events
 from services.system_backups_service import (
     BACKUP_IMPORT_MAX_BYTES,
@@ -229,15 +230,23 @@ def inspect_backup_artifact_endpoint(
 )
 def download_backup_artifact_endpoint(
     artifact_id: str,
+    request: Request,
     session: UserSession = Depends(require_roles("ADMIN")),
     db: Session = Depends(get_db),
 ):
     download = get_system_backup_artifact_download(db, artifact_id=artifact_id)
+    # FileResponse lee el paquete en bloques desde disco y atiende Range;
+    # el checksum del catálogo sirve como ETag fuerte para revalidar.
+    headers = {"X-Content-Type-Options": "nosniff"}
+    if download["etag"]:
+        headers["ETag"] = download["etag"]
+        if etag_matches(request.headers.get("if-none-match"), download["etag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
     return FileResponse(
         path=download["path"],
         filename=download["filename"],
         media_type="application/gzip",
-        headers={"X-Content-Type-Options": "nosniff"},
+        headers=headers,
     )
 
 
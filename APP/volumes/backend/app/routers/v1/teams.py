@@ -6,6 +6,8 @@ from core.authz import require_roles
 from db.session import get_db
 from schemas.auth import UserSession
 from schemas.teams import (
+    TeamAclBatchRequest,
+    TeamAclBatchResponse,
     TeamCreateRequest,
     TeamFilterRequest,
     TeamListResponse,
@@ -15,6 +17,7 @@ from schemas.teams import (
 )
 from services.notification_center_service import create_in_app_notification
 from services.teams_service import (
+    bulk_update_team_acl,
     change_team_status,
     create_team_member,
     delete_team_member,
@@ -61,6 +64,41 @@ async def list_teams_endpoint(
     return list_team_members(db, filters)
 
 
+# ── POST /teams/acl/batch ─────────────────────────────
+
+@router.post(
+    "/acl/batch",
+    response_model=TeamAclBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Asignar o quitar clientes/proyectos a muchos team members en una transacción",
+)
+async def bulk_team_acl_endpoint(
+    payload: TeamAclBatchRequest,
+    session: UserSession = Depends(require_roles("ADMIN")),
+    db: Session = Depends(get_db),
+):
+    result = bulk_update_team_acl(db, payload, updated_by_id=session.user_id)
+    # Una sola notificación para todo el lote (no una por usuario).
+    if result["affected_user_ids"]:
+        await create_in_app_notification(
+            db,
+            notification_type="access.assignment.updated",
+            title="Permisos de alcance actualizados",
+            message="Se actualizó el alcance de clientes o proyectos de tu cuenta.",
+            level="info",
+            tags=["access", "assignment", "permission", "access.assignment.updated"],
+            recipient_user_ids=result["affected_user_ids"],
+            action_url="/settings/userProfile",
+            actor_user_id=session.user_id,
+            metadata={
+                "batch": True,
+                "clients": result["clients"],
+                "projects": result["projects"],
+            },
+        )
+    return result
+
+
 # ── POST /teams ───────────────────────────────────────
 
 @router.post(
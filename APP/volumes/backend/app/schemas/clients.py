@@ -106,6 +106,10 @@ class ClientFilterRequest(BaseModel):
     is_confidential:  Optional[bool] = None
     is_active:        Optional[bool] = None
 
+    # Paginación por cursor: nextCursor de la respuesta anterior (ignora skip)
+    cursor:        Optional[str] = Field(None, max_length=512)
+    include_total: bool          = Field(True, alias="includeTotal")
+
     model_config = {"populate_by_name": True}
 
 
@@ -159,8 +163,9 @@ class ClientResponse(BaseModel):
 
 class ClientListResponse(BaseModel):
     items: list[ClientResponse]
-    total: int
+    total: Optional[int]
     skip:  int
     limit: int
+    next_cursor: Optional[str] = Field(None, serialization_alias="nextCursor")
 
     model_config = {"populate_by_name": True}
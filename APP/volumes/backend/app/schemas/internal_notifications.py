@@ -6,3 +6,8 @@ from pydantic import BaseModel
 class TriggerPendingPublicationRemindersResponse(BaseModel):
     sent: int
     message: str = "Reminder batch processed"
+
+
+class ReconcileUnreadCountersResponse(BaseModel):
+    scanned: int
+    corrected: int
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class ScheduleEntryResponse(BaseModel):
+    key: str
+    cron: str
+    timezone: str
+    next_fire_at: str = Field(..., serialization_alias="nextFireAt")
+
+    model_config = {"populate_by_name": True}
+
+
+class ScheduleSyncResponse(BaseModel):
+    scheduled: list[ScheduleEntryResponse]
+    removed: list[str]
+
+
+class ScheduleFireRequest(BaseModel):
+    key: str = Field(..., min_length=1, max_length=120)
+    # Epoch (segundos) o ISO-8601: el score con que el scheduler reclamó la programación.
+    scheduled_for: datetime = Field(..., alias="scheduledFor")
+
+    model_config = {"populate_by_name": True}
+
+
+class ScheduleFireResponse(BaseModel):
+    key: str
+    scheduled_for: str = Field(..., serialization_alias="scheduledFor")
+    next_fire_at: str | None = Field(None, serialization_alias="nextFireAt")
+    outcome: dict[str, Any]
+
+    model_config = {"populate_by_name": True}
@@ -47,12 +47,14 @@ class NotificationUnreadCountResponse(BaseModel):
 class NotificationTagsResponse(BaseModel):
     items: list[str]
     total: int
+    counts: dict[str, int] = {}
 
 
 class NotificationMarkReadResponse(BaseModel):
     notification_id: str = Field(..., serialization_alias="notificationId")
     is_read: bool = Field(..., serialization_alias="isRead")
     read_at: str | None = Field(None, serialization_alias="readAt")
+    unread_count: int | None = Field(None, serialization_alias="unreadCount")
 
     model_config = {"populate_by_name": True}
 
@@ -60,6 +62,9 @@ class NotificationMarkReadResponse(BaseModel):
 class NotificationMarkAllReadResponse(BaseModel):
     updated: int
     message: str
+    unread_count: int | None = Field(None, serialization_alias="unreadCount")
+
+    model_config = {"populate_by_name": True}
 
 
 class NotificationBulkReadStateRequest(BaseModel):
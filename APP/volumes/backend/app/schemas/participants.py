@@ -24,6 +24,10 @@ class ParticipantFilterRequest(BaseModel):
     search: str | None = None
     is_active: bool | None = Field(True, alias="isActive")
 
+    # Paginación por cursor: nextCursor de la respuesta anterior (ignora skip)
+    cursor: str | None = Field(None, max_length=512)
+    include_total: bool = Field(True, alias="includeTotal")
+
     model_config = {"populate_by_name": True}
 
 
@@ -116,9 +120,10 @@ class ParticipantResponse(BaseModel):
 
 class ParticipantListResponse(BaseModel):
     items: list[ParticipantResponse]
-    total: int
+    total: int | None
     skip: int
     limit: int
+    next_cursor: str | None = Field(None, serialization_alias="nextCursor")
 
     model_config = {"populate_by_name": True}
 
@@ -73,6 +73,10 @@ class ProjectFilterRequest(BaseModel):
     is_confidential: bool | None = None
     is_active: bool | None = None
 
+    # Paginación por cursor: nextCursor de la respuesta anterior (ignora skip)
+    cursor: str | None = Field(None, max_length=512)
+    include_total: bool = Field(True, alias="includeTotal")
+
     model_config = {"populate_by_name": True}
 
 
@@ -109,8 +113,9 @@ class ProjectResponse(BaseModel):
 
 class ProjectListResponse(BaseModel):
     items: list[ProjectResponse]
-    total: int
+    total: int | None
     skip: int
     limit: int
+    next_cursor: str | None = Field(None, serialization_alias="nextCursor")
 
     model_config = {"populate_by_name": True}
@@ -4,6 +4,11 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+from schemas.audit_reports import AuditReportRequest
+from schemas.management_commitment_reports import ManagementCommitmentReportRequest
+from schemas.management_email_delivery_reports import ManagementEmailDeliveryReportRequest
+from schemas.management_review_reports import ManagementReviewObservationRequest
+
 
 class ReportFilterItem(BaseModel):
     label: str
@@ -66,3 +71,37 @@ class ReportPdfPreviewRequest(BaseModel):
     table_range_label: str | None = None
     table_columns: list[ReportTableColumn] = Field(default_factory=list)
     table_rows: list[dict[str, Any]] = Field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Exportaciones CSV/XLSX
+# ---------------------------------------------------------------------------
+# Reutilizan los filtros de cada reporte; `limit` pasa a ser opcional porque
+# la exportación recorre el rango completo con cursor del lado del servidor.
+
+ReportExportFormat = Literal["csv", "xlsx"]
+ReportExportDelivery = Literal["stream", "background"]
+
+
+class AuditReportExportRequest(AuditReportRequest):
+    format: ReportExportFormat = "csv"
+    delivery: ReportExportDelivery = "stream"
+    limit: int | None = Field(None, ge=1)
+
+
+class ManagementCommitmentReportExportRequest(ManagementCommitmentReportRequest):
+    format: ReportExportFormat = "csv"
+    delivery: ReportExportDelivery = "stream"
+    limit: int | None = Field(None, ge=1)
+
+
+class ManagementEmailDeliveryReportExportRequest(ManagementEmailDeliveryReportRequest):
+    format: ReportExportFormat = "csv"
+    delivery: ReportExportDelivery = "stream"
+    limit: int | None = Field(None, ge=1)
+
+
+class ManagementReviewObservationExportRequest(ManagementReviewObservationRequest):
+    format: ReportExportFormat = "csv"
+    delivery: ReportExportDelivery = "stream"
+    limit: int | None = Field(None, ge=1)
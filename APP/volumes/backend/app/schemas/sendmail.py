@@ -145,6 +145,7 @@ class QueueJobItem(BaseModel):
     template_id: str | None = None
     inline_assets: int = Field(default=0, serialization_alias="inlineAssets")
     attachments: int = 0
+    enqueued_at: str | None = Field(default=None, serialization_alias="enqueuedAt")
 
 
 class QueueStatusResponse(BaseModel):
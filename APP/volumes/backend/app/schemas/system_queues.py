@@ -7,6 +7,8 @@ class SystemQueueAlertStateResponse(BaseModel):
     alert_active: bool = Field(False, serialization_alias="alertActive")
     last_alert_at: str | None = Field(None, serialization_alias="lastAlertAt")
     last_alert_size: int | None = Field(None, serialization_alias="lastAlertSize")
+    last_alert_reason: str | None = Field(None, serialization_alias="lastAlertReason")
+    last_alert_wait_p95_ms: int | None = Field(None, serialization_alias="lastAlertWaitP95Ms")
     last_alert_mail_sent_at: str | None = Field(None, serialization_alias="lastAlertMailSentAt")
     last_recovered_at: str | None = Field(None, serialization_alias="lastRecoveredAt")
     last_recovered_size: int | None = Field(None, serialization_alias="lastRecoveredSize")
@@ -15,6 +17,25 @@ class SystemQueueAlertStateResponse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class SystemQueueTypeTelemetryResponse(BaseModel):
+    jobs: int = 0
+    failed: int = 0
+    jobs_per_minute: float = Field(0.0, serialization_alias="jobsPerMinute")
+    wait_samples: int = Field(0, serialization_alias="waitSamples")
+    wait_p50_ms: int | None = Field(None, serialization_alias="waitP50Ms")
+    wait_p95_ms: int | None = Field(None, serialization_alias="waitP95Ms")
+    run_p50_ms: int | None = Field(None, serialization_alias="runP50Ms")
+    run_p95_ms: int | None = Field(None, serialization_alias="runP95Ms")
+
+    model_config = {"populate_by_name": True}
+
+
+class SystemQueueTelemetryResponse(SystemQueueTypeTelemetryResponse):
+    window_minutes: int = Field(0, serialization_alias="windowMinutes")
+    head_job_age_ms: int | None = Field(None, serialization_alias="headJobAgeMs")
+    by_type: dict[str, SystemQueueTypeTelemetryResponse] = Field(default_factory=dict, serialization_alias="byType")
+
+
 class SystemQueueItemResponse(BaseModel):
     queue: str
     label: str
@@ -31,6 +52,8 @@ class SystemQueueItemResponse(BaseModel):
     status_tone: str = Field(..., serialization_alias="statusTone")
     is_warning: bool = Field(..., serialization_alias="isWarning")
     job_types: list[str] = Field(..., serialization_alias="jobTypes")
+    wait_warning_seconds: int | None = Field(None, serialization_alias="waitWarningSeconds")
+    telemetry: SystemQueueTelemetryResponse = Field(default_factory=SystemQueueTelemetryResponse)
     alert_state: SystemQueueAlertStateResponse = Field(..., serialization_alias="alertState")
 
     model_config = {"populate_by_name": True}
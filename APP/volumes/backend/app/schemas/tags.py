@@ -57,6 +57,10 @@ class TagFilterRequest(BaseModel):
     status: str | None = None
     name: str | None = None
 
+    # Paginación por cursor: nextCursor de la respuesta anterior (ignora skip)
+    cursor: str | None = Field(None, max_length=512)
+    include_total: bool = Field(True, alias="includeTotal")
+
     model_config = {"populate_by_name": True}
 
 
@@ -83,8 +87,9 @@ class TagResponse(BaseModel):
 
 class TagListResponse(BaseModel):
     items: list[TagResponse]
-    total: int
+    total: int | None
     skip: int
     limit: int
+    next_cursor: str | None = Field(None, serialization_alias="nextCursor")
 
     model_config = {"populate_by_name": True}
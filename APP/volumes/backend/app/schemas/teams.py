@@ -119,12 +119,56 @@ class TeamFilterRequest(BaseModel):
     status:      TeamStatus | None     = None
     skip:        int                   = Field(0, ge=0)
     limit:       int                   = Field(50, ge=1, le=200)
+    # Paginación por cursor: nextCursor de la respuesta anterior (ignora skip)
+    cursor:        str | None          = Field(None, max_length=512)
+    include_total: bool                = Field(True, alias="includeTotal")
+
+    model_config = {"populate_by_name": True}
+
+
+class TeamAclPermission(str, Enum):
+    """Mapea a UserProjectPermission en user_project_acl."""
+    read  = "read"
+    edit  = "edit"
+    owner = "owner"
+
+
+class TeamAclBatchRequest(BaseModel):
+    """
+    Un mismo cambio de alcance aplicado a muchos team members en una transacción.
+    `addProjectsOfClientIds` expande a todos los proyectos activos de esos clientes.
+    """
+    user_ids:                   list[str] = Field(..., min_length=1, max_length=500, alias="userIds")
+    add_client_ids:             list[str] = Field(default_factory=list, max_length=500, alias="addClientIds")
+    remove_client_ids:          list[str] = Field(default_factory=list, max_length=500, alias="removeClientIds")
+    add_project_ids:            list[str] = Field(default_factory=list, max_length=2000, alias="addProjectIds")
+    remove_project_ids:         list[str] = Field(default_factory=list, max_length=2000, alias="removeProjectIds")
+    add_projects_of_client_ids: list[str] = Field(default_factory=list, max_length=100, alias="addProjectsOfClientIds")
+    project_permission:         TeamAclPermission = Field(TeamAclPermission.read, alias="projectPermission")
 
     model_config = {"populate_by_name": True}
 
 
 # ── Response schemas ──────────────────────────────────
 
+class TeamAclDiffResponse(BaseModel):
+    added:       int
+    reactivated: int
+    removed:     int
+    unchanged:   int
+
+
+class TeamAclBatchResponse(BaseModel):
+    users:             int
+    clients:           TeamAclDiffResponse
+    projects:          TeamAclDiffResponse
+    affected_user_ids: list[str] = Field(default_factory=list, serialization_alias="affectedUserIds")
+    # assignmentMode = "all": el acceso no depende de relaciones, no se tocan
+    skipped_user_ids:  list[str] = Field(default_factory=list, serialization_alias="skippedUserIds")
+
+    model_config = {"populate_by_name": True}
+
+
 class TeamResponse(BaseModel):
     """Shape que espera el frontend. Construido desde User + UserProfile + Role."""
     id:              str
@@ -152,6 +196,7 @@ class TeamResponse(BaseModel):
 
 class TeamListResponse(BaseModel):
     teams: list[TeamResponse]
-    total: int
+    total: int | None
     skip:  int
     limit: int
+    next_cursor: str | None = Field(None, serialization_alias="nextCursor")
@@ -16,6 +16,7 @@ from schemas.artifact_states import (
     ArtifactStateFilterRequest,
     ArtifactStateUpdateRequest,
 )
+from services.catalog_registry import notify_catalog_changed
 
 
 def _user_ref(u) -> dict | None:
@@ -123,6 +124,7 @@ def create_artifact_state(db: Session, body: ArtifactStateCreateRequest, created
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("artifact_states")
     db.refresh(obj)
 
     obj = _get_or_404(db, int(obj.id))
@@ -148,6 +150,7 @@ def update_artifact_state(db: Session, id: int, body: ArtifactStateUpdateRequest
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("artifact_states")
     db.refresh(obj)
 
     obj = _get_or_404(db, id)
@@ -160,6 +163,7 @@ def change_artifact_state_status(db: Session, id: int, is_active: bool, updated_
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("artifact_states")
     db.refresh(obj)
 
     obj = _get_or_404(db, id)
@@ -173,3 +177,4 @@ def delete_artifact_state(db: Session, id: int, deleted_by_id: str | None) -> No
     obj.is_active = False
 
     db.commit()
+    notify_catalog_changed("artifact_states")
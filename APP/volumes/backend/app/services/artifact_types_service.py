@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session, joinedload
 from core.datetime_utils import utc_now_db
 from models.artifact_types import ArtifactType
 from schemas.artifact_types import ArtifactTypeCreateRequest, ArtifactTypeFilterRequest, ArtifactTypeUpdateRequest
+from services.catalog_registry import notify_catalog_changed
 
 
 def _user_ref(u) -> dict | None:
@@ -124,6 +125,7 @@ def create_artifact_type(db: Session, body: ArtifactTypeCreateRequest, created_b
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("artifact_types")
     db.refresh(obj)
 
     obj = _get_or_404(db, int(obj.id))
@@ -149,6 +151,7 @@ def update_artifact_type(db: Session, id: int, body: ArtifactTypeUpdateRequest,
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("artifact_types")
     db.refresh(obj)
 
     obj = _get_or_404(db, id)
@@ -162,6 +165,7 @@ def change_artifact_type_status(db: Session, id: int, is_active: bool, updated_b
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("artifact_types")
     db.refresh(obj)
 
     obj = _get_or_404(db, id)
@@ -177,3 +181,4 @@ def delete_artifact_type(db: Session, id: int, deleted_by_id: str) -> None:
     obj.updated_by = deleted_by_id
 
     db.commit()
+    notify_catalog_changed("artifact_types")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, time
-from typing import Any
+from typing import Any, Iterator
 
 from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
@@ -22,6 +22,8 @@ from schemas.auth import UserSession
 from schemas.audit_reports import AuditReportRequest, AuditReportResponse, AuditReportRow
 from services.access_control_service import apply_record_scope_filter, is_admin
 
+STREAM_BATCH_SIZE = 500
+
 
 ACTION_LABELS = {
     "LOGIN_SESSION": "Inicio de sesión",
@@ -51,35 +53,54 @@ ENTITY_LABELS = {
 
 
 def list_audit_report(db: Session, session: UserSession, payload: AuditReportRequest) -> AuditReportResponse:
+    items = list(iter_audit_report_rows(db, session, payload, limit=payload.limit))
+    return AuditReportResponse(items=items, total=len(items))
+
+
+def iter_audit_report_rows(
+    db: Session,
+    session: UserSession,
+    payload: AuditReportRequest,
+    *,
+    limit: int | None,
+) -> Iterator[AuditReportRow]:
+    """Genera las filas del reporte sin materializar el resultado completo.
+
+    Con `limit=None` recorre todo el rango filtrado usando un cursor del lado
+    del servidor; es la ruta que usan las exportaciones CSV/XLSX.
+    """
     report_type = payload.report_type
     if report_type == "user-sessions":
-        items = _user_sessions(db, session, payload)
-    elif report_type == "remote-session-closes":
-        items = _audit_logs(db, session, payload, actions={"LOGOUT_SESSION", "LOGOUT_ALL_OTHER_SESSIONS"})
-    elif report_type == "password-changes":
-        items = _audit_logs(db, session, payload, actions={"CHANGE_PASSWORD_BY_ADMIN"})
-    elif report_type == "available-audit-activity":
-        items = _audit_logs(db, session, payload)
-    elif report_type == "changes-by-entity":
-        items = _audit_grouped(db, session, payload, "entity")
-    elif report_type == "changes-by-actor":
-        items = _audit_grouped(db, session, payload, "actor")
-    elif report_type == "changes-by-period":
-        items = _audit_grouped(db, session, payload, "period")
-    elif report_type == "system-sendmail":
-        items = _email_events(db, session, payload)
-    elif report_type == "minute-otp-requests":
-        items = _visitor_access_requests(db, session, payload)
-    elif report_type == "guest-sessions":
-        items = _visitor_sessions(db, session, payload)
-    elif report_type == "external-observations-evidence":
-        items = _external_observations(db, session, payload)
-    elif report_type == "external-access-by-minute":
-        items = _external_access_by_minute(db, session, payload)
-    else:
-        items = []
-
-    return AuditReportResponse(items=items, total=len(items))
+        return _user_sessions(db, session, payload, limit)
+    if report_type == "remote-session-closes":
+        return _audit_logs(db, session, payload, limit, actions={"LOGOUT_SESSION", "LOGOUT_ALL_OTHER_SESSIONS"})
+    if report_type == "password-changes":
+        return _audit_logs(db, session, payload, limit, actions={"CHANGE_PASSWORD_BY_ADMIN"})
+    if report_type == "available-audit-activity":
+        return _audit_logs(db, session, payload, limit)
+    if report_type == "changes-by-entity":
+        return _audit_grouped(db, session, payload, limit, "entity")
+    if report_type == "changes-by-actor":
+        return _audit_grouped(db, session, payload, limit, "actor")
+    if report_type == "changes-by-period":
+        return _audit_grouped(db, session, payload, limit, "period")
+    if report_type == "system-sendmail":
+        return _email_events(db, session, payload, limit)
+    if report_type == "minute-otp-requests":
+        return _visitor_access_requests(db, session, payload, limit)
+    if report_type == "guest-sessions":
+        return _visitor_sessions(db, session, payload, limit)
+    if report_type == "external-observations-evidence":
+        return _external_observations(db, session, payload, limit)
+    if report_type == "external-access-by-minute":
+        return _external_access_by_minute(db, session, payload, limit)
+    return iter(())
+
+
+def _stream(query, limit: int | None):
+    if limit:
+        return query.limit(limit).all()
+    return query.execution_options(stream_results=True, yield_per=STREAM_BATCH_SIZE)
 
 
 def _range(column, payload: AuditReportRequest):
@@ -183,7 +204,7 @@ def _audit_detail(action: str, details: dict[str, Any], entity_id: str | None) -
     return " · ".join(readable) or "Evento auditado"
 
 
-def _user_sessions(db: Session, session: UserSession, payload: AuditReportRequest) -> list[AuditReportRow]:
+def _user_sessions(db: Session, session: UserSession, payload: AuditReportRequest, limit: int | None) -> Iterator[AuditReportRow]:
     query = (
         db.query(UserSessionModel, User)
         .join(User, User.id == UserSessionModel.user_id)
@@ -199,12 +220,11 @@ def _user_sessions(db: Session, session: UserSession, payload: AuditReportReques
     elif payload.status == "closed":
         query = query.filter(UserSessionModel.logged_out_at.is_not(None))
 
-    rows = query.order_by(UserSessionModel.created_at.desc()).limit(payload.limit).all()
-    items = []
+    rows = _stream(query.order_by(UserSessionModel.created_at.desc()), limit)
     for session, user in rows:
         status = "active" if session.logged_out_at is None else "closed"
         ended = f"Cierre: {session.logged_out_at}" if session.logged_out_at else "Sesión activa"
-        items.append(AuditReportRow(
+        yield AuditReportRow(
             id=session.id,
             date=session.created_at,
             actor=_user_label(user),
@@ -218,11 +238,16 @@ def _user_sessions(db: Session, session: UserSession, payload: AuditReportReques
             device=session.device,
             location=session.location,
             user_agent=session.user_agent,
-        ))
-    return items
+        )
 
 
-def _audit_logs(db: Session, session: UserSession, payload: AuditReportRequest, actions: set[str] | None = None) -> list[AuditReportRow]:
+def _audit_logs(
+    db: Session,
+    session: UserSession,
+    payload: AuditReportRequest,
+    limit: int | None,
+    actions: set[str] | None = None,
+) -> Iterator[AuditReportRow]:
     query = (
         db.query(AuditLog, User)
         .join(User, User.id == AuditLog.actor_user_id)
@@ -238,11 +263,10 @@ def _audit_logs(db: Session, session: UserSession, payload: AuditReportRequest,
     if actor:
         query = query.filter(or_(User.username.ilike(actor), User.full_name.ilike(actor), User.email.ilike(actor)))
 
-    rows = query.order_by(AuditLog.event_at.desc()).limit(payload.limit).all()
-    items = []
+    rows = _stream(query.order_by(AuditLog.event_at.desc()), limit)
     for audit, user in rows:
         details = _details(audit.details_json)
-        items.append(AuditReportRow(
+        yield AuditReportRow(
             id=str(audit.id),
             date=audit.event_at,
             actor=_user_label(user),
@@ -252,11 +276,16 @@ def _audit_logs(db: Session, session: UserSession, payload: AuditReportRequest,
             status="audited",
             subject=_audit_subject(audit.action, details, audit.entity_type, audit.entity_id),
             detail=_audit_detail(audit.action, details, audit.entity_id),
-        ))
-    return items
+        )
 
 
-def _audit_grouped(db: Session, session: UserSession, payload: AuditReportRequest, group_by: str) -> list[AuditReportRow]:
+def _audit_grouped(
+    db: Session,
+    session: UserSession,
+    payload: AuditReportRequest,
+    limit: int | None,
+    group_by: str,
+) -> Iterator[AuditReportRow]:
     filters = _range(AuditLog.event_at, payload)
     if payload.entity_type:
         filters.append(AuditLog.entity_type == payload.entity_type)
@@ -269,10 +298,9 @@ def _audit_grouped(db: Session, session: UserSession, payload: AuditReportReques
             .filter(*filters)
             .group_by(AuditLog.entity_type)
             .order_by(func.count(AuditLog.id).desc())
-            .limit(payload.limit)
-            .all()
+            .limit(limit)
         )
-        return [
+        yield from (
             AuditReportRow(
                 id=f"entity:{entity}",
                 date=last_at,
@@ -285,7 +313,8 @@ def _audit_grouped(db: Session, session: UserSession, payload: AuditReportReques
                 count=int(total or 0),
             )
             for entity, total, last_at in rows
-        ]
+        )
+        return
 
     if group_by == "actor":
         rows = (
@@ -294,13 +323,12 @@ def _audit_grouped(db: Session, session: UserSession, payload: AuditReportReques
             .filter(*filters)
             .group_by(User.id, User.username, User.full_name, User.email)
             .order_by(func.count(AuditLog.id).desc())
-            .limit(payload.limit)
-            .all()
+            .limit(limit)
         )
         actor = _like(payload.actor)
         if actor:
             rows = [row for row in rows if actor.strip("%").casefold() in _clean(row[1], "").casefold() or actor.strip("%").casefold() in _clean(row[2], "").casefold()]
-        return [
+        yield from (
             AuditReportRow(
                 id=f"actor:{user_id}",
                 date=last_at,
@@ -314,7 +342,8 @@ def _audit_grouped(db: Session, session: UserSession, payload: AuditReportReques
                 count=int(total or 0),
             )
             for user_id, username, full_name, email, total, last_at in rows
-        ]
+        )
+        return
 
     period = func.date(AuditLog.event_at)
     rows = (
@@ -322,10 +351,9 @@ def _audit_grouped(db: Session, session: UserSession, payload: AuditReportReques
         .filter(*filters)
         .group_by(period)
         .order_by(period.desc())
-        .limit(payload.limit)
-        .all()
+        .limit(limit)
     )
-    return [
+    yield from (
         AuditReportRow(
             id=f"period:{period_value}",
             date=last_at,
@@ -338,10 +366,10 @@ def _audit_grouped(db: Session, session: UserSession, payload: AuditReportReques
             count=int(total or 0),
         )
         for period_value, total, last_at in rows
-    ]
+    )
 
 
-def _email_events(db: Session, session: UserSession, payload: AuditReportRequest) -> list[AuditReportRow]:
+def _email_events(db: Session, session: UserSession, payload: AuditReportRequest, limit: int | None) -> Iterator[AuditReportRow]:
     query = (
         db.query(EmailDeliveryEvent, Record)
         .outerjoin(Record, Record.id == EmailDeliveryEvent.record_id)
@@ -351,11 +379,10 @@ def _email_events(db: Session, session: UserSession, payload: AuditReportRequest
         query = apply_record_scope_filter(query, db, session, Record)
     if payload.status:
         query = query.filter(EmailDeliveryEvent.status == payload.status)
-    rows = query.order_by(EmailDeliveryEvent.event_at.desc()).limit(payload.limit).all()
-    items = []
+    rows = _stream(query.order_by(EmailDeliveryEvent.event_at.desc()), limit)
     for event, record in rows:
         recipients = ", ".join(_json_list(event.to_json)[:3])
-        items.append(AuditReportRow(
+        yield AuditReportRow(
             id=event.id,
             date=event.event_at,
             actor=event.actor_user_id or "Sistema",
@@ -367,11 +394,10 @@ def _email_events(db: Session, session: UserSession, payload: AuditReportRequest
             detail=f"{event.email_kind} · {event.recipient_count} destinatario(s) · {event.attachment_count} adjunto(s) · {recipients}",
             record_id=event.record_id,
             count=event.recipient_count,
-        ))
-    return items
+        )
 
 
-def _visitor_access_requests(db: Session, session: UserSession, payload: AuditReportRequest) -> list[AuditReportRow]:
+def _visitor_access_requests(db: Session, session: UserSession, payload: AuditReportRequest, limit: int | None) -> Iterator[AuditReportRow]:
     query = (
         db.query(VisitorAccessRequest, Record, Client, Project)
         .join(Record, Record.id == VisitorAccessRequest.record_id)
@@ -383,8 +409,8 @@ def _visitor_access_requests(db: Session, session: UserSession, payload: AuditRe
     query = _record_filters(query, payload, Client, Project)
     if payload.status:
         query = query.filter(VisitorAccessRequest.delivery_status == payload.status)
-    rows = query.order_by(VisitorAccessRequest.created_at.desc()).limit(payload.limit).all()
-    return [
+    rows = _stream(query.order_by(VisitorAccessRequest.created_at.desc()), limit)
+    yield from (
         AuditReportRow(
             id=req.id,
             date=req.created_at,
@@ -403,10 +429,10 @@ def _visitor_access_requests(db: Session, session: UserSession, payload: AuditRe
             record_title=record.title,
         )
         for req, record, client, project in rows
-    ]
+    )
 
 
-def _visitor_sessions(db: Session, session: UserSession, payload: AuditReportRequest) -> list[AuditReportRow]:
+def _visitor_sessions(db: Session, session: UserSession, payload: AuditReportRequest, limit: int | None) -> Iterator[AuditReportRow]:
     query = (
         db.query(VisitorSession, Record, Client, Project)
         .join(Record, Record.id == VisitorSession.record_id)
@@ -420,11 +446,10 @@ def _visitor_sessions(db: Session, session: UserSession, payload: AuditReportReq
         query = query.filter(VisitorSession.revoked_at.is_(None), VisitorSession.expires_at >= utc_now_db())
     elif payload.status == "revoked":
         query = query.filter(VisitorSession.revoked_at.is_not(None))
-    rows = query.order_by(VisitorSession.created_at.desc()).limit(payload.limit).all()
-    items = []
+    rows = _stream(query.order_by(VisitorSession.created_at.desc()), limit)
     for session, record, client, project in rows:
         status = "revoked" if session.revoked_at else "active"
-        items.append(AuditReportRow(
+        yield AuditReportRow(
             id=session.id,
             date=session.created_at,
             actor=session.email,
@@ -441,11 +466,10 @@ def _visitor_sessions(db: Session, session: UserSession, payload: AuditReportReq
             project=project.name if project else None,
             record_id=record.id,
             record_title=record.title,
-        ))
-    return items
+        )
 
 
-def _external_observations(db: Session, session: UserSession, payload: AuditReportRequest) -> list[AuditReportRow]:
+def _external_observations(db: Session, session: UserSession, payload: AuditReportRequest, limit: int | None) -> Iterator[AuditReportRow]:
     query = (
         db.query(RecordVersionObservation, Record, Client, Project)
         .join(Record, Record.id == RecordVersionObservation.record_id)
@@ -457,8 +481,8 @@ def _external_observations(db: Session, session: UserSession, payload: AuditRepo
     query = _record_filters(query, payload, Client, Project)
     if payload.status:
         query = query.filter(RecordVersionObservation.status == payload.status)
-    rows = query.order_by(RecordVersionObservation.created_at.desc()).limit(payload.limit).all()
-    return [
+    rows = _stream(query.order_by(RecordVersionObservation.created_at.desc()), limit)
+    yield from (
         AuditReportRow(
             id=str(obs.id),
             date=obs.created_at,
@@ -475,10 +499,10 @@ def _external_observations(db: Session, session: UserSession, payload: AuditRepo
             record_title=record.title,
         )
         for obs, record, client, project in rows
-    ]
+    )
 
 
-def _external_access_by_minute(db: Session, session: UserSession, payload: AuditReportRequest) -> list[AuditReportRow]:
+def _external_access_by_minute(db: Session, session: UserSession, payload: AuditReportRequest, limit: int | None) -> Iterator[AuditReportRow]:
     activity_at = func.coalesce(
         VisitorSession.created_at,
         VisitorAccessRequest.created_at,
@@ -517,10 +541,9 @@ def _external_access_by_minute(db: Session, session: UserSession, payload: Audit
         grouped = grouped.having(last_activity_at <= datetime.combine(payload.date_to, time.max))
     rows = (
         grouped.order_by(func.count(func.distinct(VisitorSession.id)).desc())
-        .limit(payload.limit)
-        .all()
+        .limit(limit)
     )
-    return [
+    yield from (
         AuditReportRow(
             id=record_id,
             date=last_at,
@@ -538,7 +561,7 @@ def _external_access_by_minute(db: Session, session: UserSession, payload: Audit
             count=int((session_count or 0) + (observation_count or 0)),
         )
         for record_id, title, client_name, project_name, otp_count, session_count, observation_count, last_at in rows
-    ]
+    )
 
 
 def _record_filters(query, payload: AuditReportRequest, client_model, project_model):
@@ -1,6 +1,8 @@
 # services/auth_service.py
+import asyncio
 import hashlib
 import json
+import logging
 import uuid
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -17,7 +19,7 @@ from db.session import SessionLocal
 from db.redis import get_redis
 from models.user import User
 from repositories.auth_repository import get_user_by_credential, get_user_with_roles_permissions, get_user_full, get_user_by_id
-from repositories.session_repository import create_session, mark_logout, get_user_sessions, get_session_by_jti, get_active_sessions, revoke_all_sessions
+from repositories.session_repository import create_session, mark_logout, get_user_sessions, get_session_by_jti, get_active_sessions, revoke_all_sessions, update_session_geo
 from schemas.auth import (
     TokenResponse,
     UserSession,
@@ -53,6 +55,10 @@ from utils.network import get_client_ip
 from jose import jwt as jose_jwt
 from repositories.audit_repository import write_audit
 
+logger = logging.getLogger(__name__)
+
+_session_geo_tasks: set[asyncio.Task] = set()
+
 
 def _audit_identifier(value: str | None) -> str | None:
     clean = str(value or "").strip().lower()
@@ -137,6 +143,38 @@ def _resolve_session_identity(user_id: str, username: str | None, full_name: str
         db.close()
 
 
+def _enrich_session_geo(jti: str, ip: str) -> None:
+    geo = get_geo(ip)
+    db = SessionLocal()
+    try:
+        update_session_geo(
+            db,
+            jti,
+            country_code = geo.get("country_code"),
+            country_name = geo.get("country_name"),
+            city         = geo.get("city"),
+            location     = geo.get("location"),
+        )
+    finally:
+        db.close()
+
+
+async def _run_session_geo_enrichment(jti: str, ip: str) -> None:
+    try:
+        await asyncio.to_thread(_enrich_session_geo, jti, ip)
+    except Exception as exc:
+        logger.warning("session_geo: no se pudo enriquecer sesión jti=%s: %s", jti, exc)
+
+
+def _schedule_session_geo_enrichment(jti: str, ip: str | None) -> None:
+    """La geo de la sesión se resuelve fuera del request; la fila se crea sin ella."""
+    if not ip:
+        return
+    task = asyncio.create_task(_run_session_geo_enrichment(jti, ip))
+    _session_geo_tasks.add(task)
+    task.add_done_callback(_session_geo_tasks.discard)
+
+
 async def login(db: Session, credential: str, password: str, request: Request) -> TokenResponse:
     ip_v4, ip_v6 = get_client_ip(request)
     ip = ip_v4 or ip_v6 or "unknown"
@@ -168,9 +206,8 @@ async def login(db: Session, credential: str, password: str, request: Request) -
     if not user.is_active:
         raise ForbiddenException("Cuenta desactivada")
 
-    # ── Geo + Device ──────────────────────────────────
+    # ── Device (la geo se completa en segundo plano) ──
     requester_ip = ip_v4 or ip_v6
-    geo = get_geo(requester_ip) if requester_ip else {}
     user_agent_str = request.headers.get("User-Agent")
     device = get_device_string(user_agent_str)
 
@@ -204,11 +241,12 @@ async def login(db: Session, credential: str, password: str, request: Request) -
         ip_v6        = ip_v6,
         user_agent   = user_agent_str,
         device       = device,
-        country_code = geo.get("country_code"),
-        country_name = geo.get("country_name"),
-        city         = geo.get("city"),
-        location     = geo.get("location"),
+        country_code = None,
+        country_name = None,
+        city         = None,
+        location     = None,
     )
+    _schedule_session_geo_enrichment(session.jti, requester_ip)
 
     # ── Actualizar last_login_at ──────────────────────
     user.last_login_at = utc_now_db()
@@ -483,7 +521,6 @@ async def refresh_token(token: str, db: Session, request: Request) -> TokenRespo
     # Captura datos de conexión para la nueva sesión
     ip_v4, ip_v6 = get_client_ip(request)
     ip = ip_v4 or ip_v6
-    geo = get_geo(ip) if ip else {}
     user_agent_str = request.headers.get("User-Agent")
     device = get_device_string(user_agent_str)
 
@@ -505,11 +542,12 @@ async def refresh_token(token: str, db: Session, request: Request) -> TokenRespo
         ip_v6        = ip_v6,
         user_agent   = user_agent_str,
         device       = device,
-        country_code = geo.get("country_code"),
-        country_name = geo.get("country_name"),
-        city         = geo.get("city"),
-        location     = geo.get("location"),
+        country_code = None,
+        country_name = None,
+        city         = None,
+        location     = None,
     )
+    _schedule_session_geo_enrichment(session.jti, ip)
 
     return TokenResponse(access_token=new_token, expires_in=ttl)
 
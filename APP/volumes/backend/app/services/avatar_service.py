@@ -4,7 +4,6 @@ import uuid
 from io import BytesIO
 
 from fastapi import HTTPException, UploadFile, status
-from minio.error import S3Error
 from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
@@ -12,7 +11,14 @@ from db.minio_client import get_minio_client
 from models.buckets import Bucket
 from models.objects import Object
 from models.user import User
-from services.upload_validation import build_image_derivative, sanitize_uploaded_image_content
+from services.image_delivery_service import (
+    ORIGINAL_VARIANT,
+    StoredImage,
+    load_stored_image,
+    remove_stored_image,
+    store_image_derivative,
+)
+from services.upload_validation import sanitize_uploaded_image_content
 
 AVATAR_BUCKET = "minuetaitor-attach"
 AVATAR_PREFIX = "avatars"
@@ -21,6 +27,7 @@ MAX_AVATAR_BYTES = 2 * 1024 * 1024
 ALLOWED_AVATAR_TYPES = {"image/jpeg", "image/png", "image/webp", "image/gif"}
 AVATAR_FULL_SIZE = (512, 512)
 AVATAR_THUMB_SIZE = (128, 128)
+AVATAR_THUMB_VARIANT = "thumb"
 
 def build_avatar_key(user_id: str, object_id: str, file_ext: str) -> str:
     return f"{AVATAR_PREFIX}/{user_id}/{object_id}.{file_ext}"
@@ -100,6 +107,14 @@ async def save_user_avatar(
         length=len(content),
         content_type=content_type,
     )
+    store_image_derivative(
+        AVATAR_BUCKET,
+        object_key,
+        content,
+        variant=AVATAR_THUMB_VARIANT,
+        size=AVATAR_THUMB_SIZE,
+        content_type=content_type,
+    )
 
     object_row = Object(
         id=object_id,
@@ -118,11 +133,12 @@ async def save_user_avatar(
     if previous_object and not getattr(previous_object, "deleted_at", None):
         previous_object.deleted_at = now
         previous_object.deleted_by = actor_user_id
-        try:
-            minio.remove_object(AVATAR_BUCKET, previous_object.object_key)
-        except S3Error as exc:
-            if exc.code not in {"NoSuchKey", "NoSuchObject"}:
-                raise
+        remove_stored_image(
+            AVATAR_BUCKET,
+            str(previous_object.id),
+            previous_object.object_key,
+            variants=(AVATAR_THUMB_VARIANT,),
+        )
 
     user.avatar_object_id = object_id
     user.updated_by = actor_user_id
@@ -135,7 +151,6 @@ def remove_user_avatar(db: Session, user_id: str, *, actor_user_id: str | None)
     user = _get_user_with_avatar(db, user_id)
     avatar_object = getattr(user, "avatar_object", None)
     now = utc_now_db()
-    minio = get_minio_client()
 
     if not avatar_object or getattr(avatar_object, "deleted_at", None):
         user.avatar_object_id = None
@@ -144,11 +159,12 @@ def remove_user_avatar(db: Session, user_id: str, *, actor_user_id: str | None)
         db.refresh(user)
         return
 
-    try:
-        minio.remove_object(AVATAR_BUCKET, avatar_object.object_key)
-    except S3Error as exc:
-        if exc.code not in {"NoSuchKey", "NoSuchObject"}:
-            raise
+    remove_stored_image(
+        AVATAR_BUCKET,
+        str(avatar_object.id),
+        avatar_object.object_key,
+        variants=(AVATAR_THUMB_VARIANT,),
+    )
 
     avatar_object.deleted_at = now
     avatar_object.deleted_by = actor_user_id
@@ -158,31 +174,23 @@ def remove_user_avatar(db: Session, user_id: str, *, actor_user_id: str | None)
     db.refresh(user)
 
 
-def read_user_avatar(db: Session, user_id: str, *, size: str = "thumb") -> tuple[bytes, str]:
+def read_user_avatar_image(db: Session, user_id: str, *, size: str = "thumb") -> StoredImage:
     user = _get_user_with_avatar(db, user_id)
     avatar_object = getattr(user, "avatar_object", None)
     if not avatar_object or getattr(avatar_object, "deleted_at", None):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Avatar no encontrado.")
 
-    minio = get_minio_client()
-    try:
-        stat = minio.stat_object(AVATAR_BUCKET, avatar_object.object_key)
-        response = minio.get_object(AVATAR_BUCKET, avatar_object.object_key)
-        try:
-            content = response.read()
-            content_type = stat.content_type or "application/octet-stream"
-            if str(size or "thumb").lower() == "full":
-                return content, content_type
-            return build_image_derivative(
-                content,
-                size=AVATAR_THUMB_SIZE,
-                content_type=content_type,
-                square=True,
-            )
-        finally:
-            response.close()
-            response.release_conn()
-    except S3Error as exc:
-        if exc.code in {"NoSuchKey", "NoSuchObject"}:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Avatar no encontrado.")
-        raise
+    full = str(size or "thumb").lower() == "full"
+    return load_stored_image(
+        AVATAR_BUCKET,
+        str(avatar_object.id),
+        avatar_object.object_key,
+        not_found_detail="Avatar no encontrado.",
+        variant=ORIGINAL_VARIANT if full else AVATAR_THUMB_VARIANT,
+        size=AVATAR_THUMB_SIZE,
+    )
+
+
+def read_user_avatar(db: Session, user_id: str, *, size: str = "thumb") -> tuple[bytes, str]:
+    image = read_user_avatar_image(db, user_id, size=size)
+    return image.content, image.content_type
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
 from models.buckets import Bucket
+from services.catalog_registry import notify_catalog_changed
 
 
 def _user_ref(u) -> dict | None:
@@ -130,6 +131,7 @@ def create_bucket(db: Session, body, created_by_id: str | None) -> dict[str, Any
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("buckets")
     db.refresh(obj)
 
     obj = _get_or_404(db, obj.id)
@@ -156,6 +158,7 @@ def update_bucket(db: Session, id: int, body, updated_by_id: str | None) -> dict
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("buckets")
     db.refresh(obj)
 
     obj = _get_or_404(db, obj.id)
@@ -169,6 +172,7 @@ def change_bucket_status(db: Session, id: int, is_active: bool, updated_by_id: s
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("buckets")
     db.refresh(obj)
 
     obj = _get_or_404(db, obj.id)
@@ -183,3 +187,4 @@ def delete_bucket(db: Session, id: int, deleted_by_id: str | None) -> None:
     obj.is_active = False
 
     db.commit()
+    notify_catalog_changed("buckets")
@@ -0,0 +1,288 @@
+# services/catalog_registry.py
+"""
+Caché de proceso para catálogos de sistema (seeds que casi nunca cambian).
+
+- Cada catálogo se carga completo con un solo SELECT y queda indexado por
+  code e id (`CatalogEntry` inmutable, con `code`/`name` como las filas ORM).
+- Los servicios admin de catálogos llaman `notify_catalog_changed` después
+  del commit: se invalida el proceso local, se incrementa la versión en
+  Redis y se publica en `events:catalogs` para el resto de workers uvicorn.
+- La versión protege contra la carrera "cargo mientras otro proceso escribe":
+  un snapshot cargado con una versión ya superada se usa para la consulta
+  en curso pero no se guarda.
+- Si Redis no está disponible, un TTL acota cuánto puede quedar obsoleto.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models.artifact_states import ArtifactState
+from models.artifact_types import ArtifactType
+from models.buckets import Bucket
+from models.mime_types import MimeType
+from models.record_statuses import RecordStatus
+from models.record_types import RecordType
+from models.version_statuses import VersionStatus
+
+logger = logging.getLogger(__name__)
+
+CATALOG_EVENTS_CHANNEL = "events:catalogs"
+CATALOG_VERSION_KEY_PREFIX = "catalogs:version:"
+# Un code/id desconocido fuerza recarga, pero como máximo una vez por intervalo.
+_MISS_RELOAD_MIN_INTERVAL_SEC = 5.0
+_LISTENER_RETRY_SEC = 5.0
+
+_PROCESS_ORIGIN = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@dataclass(frozen=True)
+class CatalogSpec:
+    name: str
+    model: Any
+    code_attr: str = "code"
+    name_attr: str | None = "name"
+
+
+CATALOG_SPECS: tuple[CatalogSpec, ...] = (
+    CatalogSpec("record_statuses", RecordStatus),
+    CatalogSpec("artifact_types", ArtifactType),
+    CatalogSpec("artifact_states", ArtifactState),
+    CatalogSpec("buckets", Bucket),
+    CatalogSpec("record_types", RecordType),
+    CatalogSpec("version_statuses", VersionStatus),
+    CatalogSpec("mime_types", MimeType, code_attr="mime", name_attr="description"),
+)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    id: int
+    code: str
+    name: str | None
+    is_active: bool
+    is_deleted: bool
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    loaded_at: float
+    by_code: dict[str, CatalogEntry] = field(default_factory=dict)
+    by_id: dict[int, CatalogEntry] = field(default_factory=dict)
+
+
+class CatalogRegistry:
+    """Mapas code↔id por catálogo, compartidos por todos los threads del proceso."""
+
+    def __init__(self, specs: tuple[CatalogSpec, ...] = CATALOG_SPECS, ttl_sec: float = 300.0) -> None:
+        self._specs = {spec.name: spec for spec in specs}
+        self._spec_by_table = {spec.model.__tablename__: spec for spec in specs}
+        self._ttl_sec = ttl_sec
+        self._snapshots: dict[str, CatalogSnapshot] = {}
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    # ── Carga ────────────────────────────────────────────────────────────────
+
+    def spec_for(self, model_or_name: Any) -> CatalogSpec:
+        if isinstance(model_or_name, str):
+            spec = self._specs.get(model_or_name)
+        else:
+            spec = self._spec_by_table.get(getattr(model_or_name, "__tablename__", ""))
+        if spec is None:
+            raise KeyError(f"Catálogo no registrado en caché: {model_or_name!r}")
+        return spec
+
+    def _load(self, db: Session, spec: CatalogSpec) -> CatalogSnapshot:
+        with self._lock:
+            version = self._versions.get(spec.name, 0)
+
+        model = spec.model
+        columns = [model.id, getattr(model, spec.code_attr), model.is_active, model.deleted_at]
+        if spec.name_attr:
+            columns.append(getattr(model, spec.name_attr))
+        rows = db.query(*columns).order_by(model.id.asc()).all()
+
+        by_code: dict[str, CatalogEntry] = {}
+        by_id: dict[int, CatalogEntry] = {}
+        for row in rows:
+            entry = CatalogEntry(
+                id=int(row[0]),
+                code=row[1],
+                name=row[4] if spec.name_attr else None,
+                is_active=bool(row[2]),
+                is_deleted=row[3] is not None,
+            )
+            by_id[entry.id] = entry
+            # Igual que filter_by(code=...).first(): gana el id menor.
+            by_code.setdefault(entry.code, entry)
+
+        snapshot = CatalogSnapshot(version=version, loaded_at=time.monotonic(), by_code=by_code, by_id=by_id)
+        with self._lock:
+            if self._versions.get(spec.name, 0) == version:
+                self._snapshots[spec.name] = snapshot
+        return snapshot
+
+    def _snapshot(self, db: Session, spec: CatalogSpec) -> CatalogSnapshot:
+        snapshot = self._snapshots.get(spec.name)
+        if snapshot is not None and time.monotonic() - snapshot.loaded_at < self._ttl_sec:
+            return snapshot
+        return self._load(db, spec)
+
+    def _reload_on_miss(self, db: Session, spec: CatalogSpec, snapshot: CatalogSnapshot) -> CatalogSnapshot | None:
+        if time.monotonic() - snapshot.loaded_at < _MISS_RELOAD_MIN_INTERVAL_SEC:
+            return None
+        return self._load(db, spec)
+
+    def load_all(self, db: Session) -> list[str]:
+        """Precarga todos los catálogos; pensado para el arranque."""
+        for spec in self._specs.values():
+            self._load(db, spec)
+        return sorted(self._specs)
+
+    # ── Consultas ────────────────────────────────────────────────────────────
+
+    def find_by_code(self, db: Session, model: Any, code: str) -> CatalogEntry | None:
+        spec = self.spec_for(model)
+        snapshot = self._snapshot(db, spec)
+        entry = snapshot.by_code.get(code)
+        if entry is None:
+            reloaded = self._reload_on_miss(db, spec, snapshot)
+            entry = reloaded.by_code.get(code) if reloaded else None
+        return entry
+
+    def find_by_id(self, db: Session, model: Any, id: Any) -> CatalogEntry | None:
+        if id is None:
+            return None
+        try:
+            key = int(id)
+        except (TypeError, ValueError):
+            return None
+        spec = self.spec_for(model)
+        snapshot = self._snapshot(db, spec)
+        entry = snapshot.by_id.get(key)
+        if entry is None:
+            reloaded = self._reload_on_miss(db, spec, snapshot)
+            entry = reloaded.by_id.get(key) if reloaded else None
+        return entry
+
+    def get_id(self, db: Session, model: Any, code: str) -> int:
+        entry = self.find_by_code(db, model, code)
+        if entry is None:
+            raise RuntimeError(
+                f"Catálogo '{model.__tablename__}' con code='{code}' no encontrado. "
+                "Verifica los seeds."
+            )
+        return entry.id
+
+    # ── Invalidación ─────────────────────────────────────────────────────────
+
+    def invalidate(self, name: str, version: int | None = None) -> None:
+        with self._lock:
+            current = self._versions.get(name, 0)
+            self._versions[name] = max(current + 1, version or 0)
+            self._snapshots.pop(name, None)
+
+    def invalidate_all(self) -> None:
+        for name in list(self._specs):
+            self.invalidate(name)
+
+
+catalog_registry = CatalogRegistry(ttl_sec=float(settings.catalog_cache_ttl_sec))
+
+
+def _redis_client():
+    import redis as redis_sync
+
+    return redis_sync.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=getattr(settings, "redis_db", 0),
+        decode_responses=True,
+        socket_connect_timeout=settings.redis_socket_connect_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+    )
+
+
+def notify_catalog_changed(name: str) -> None:
+    """
+    Invalida el catálogo en este proceso y avisa al resto por Redis.
+
+    Llamar después del commit. Nunca propaga errores de Redis: el TTL del
+    registro acota la ventana en que otro proceso puede ver datos viejos.
+    """
+    catalog_registry.invalidate(name)
+    try:
+        client = _redis_client()
+        try:
+            version = int(client.incr(f"{CATALOG_VERSION_KEY_PREFIX}{name}"))
+            client.publish(
+                CATALOG_EVENTS_CHANNEL,
+                json.dumps({"catalog": name, "version": version, "origin": _PROCESS_ORIGIN}),
+            )
+        finally:
+            client.close()
+    except Exception as exc:
+        logger.warning("catalogs: no se pudo publicar invalidación de '%s': %s", name, exc)
+
+
+def warm_up_catalogs(db: Session) -> list[str]:
+    return catalog_registry.load_all(db)
+
+
+def _apply_invalidation_message(raw: Any) -> None:
+    try:
+        payload = json.loads(raw)
+    except (TypeError, ValueError):
+        return
+    if not isinstance(payload, dict) or payload.get("origin") == _PROCESS_ORIGIN:
+        return
+    name = str(payload.get("catalog") or "")
+    try:
+        catalog_registry.spec_for(name)
+    except KeyError:
+        return
+    version = payload.get("version")
+    catalog_registry.invalidate(name, int(version) if isinstance(version, int) else None)
+    logger.info("catalogs: '%s' invalidado por evento (version=%s)", name, version)
+
+
+async def run_catalog_invalidation_listener() -> None:
+    """
+    Escucha `events:catalogs` durante toda la vida del proceso.
+
+    Tras cada (re)suscripción se invalida todo, porque los mensajes emitidos
+    mientras no había conexión se pierden.
+    """
+    from db.redis import get_redis
+
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.subscribe(CATALOG_EVENTS_CHANNEL)
+            catalog_registry.invalidate_all()
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message.get("type") == "message":
+                    _apply_invalidation_message(message.get("data"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("catalogs: listener de invalidación desconectado: %s", exc)
+            await asyncio.sleep(_LISTENER_RETRY_SEC)
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
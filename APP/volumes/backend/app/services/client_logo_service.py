@@ -5,7 +5,6 @@ import uuid
 from io import BytesIO
 
 from fastapi import HTTPException, UploadFile, status
-from minio.error import S3Error
 from sqlalchemy.orm import Session
 
 from core.datetime_utils import utc_now_db
@@ -13,6 +12,7 @@ from db.minio_client import get_minio_client
 from models.buckets import Bucket
 from models.clients import Client
 from models.objects import Object
+from services.image_delivery_service import StoredImage, load_stored_image, remove_stored_image
 from services.upload_validation import sanitize_uploaded_image_content
 
 CLIENT_LOGO_BUCKET = "minuetaitor-attach"
@@ -106,11 +106,7 @@ async def save_client_logo(
     if previous_object and not getattr(previous_object, "deleted_at", None):
         previous_object.deleted_at = now
         previous_object.deleted_by = actor_user_id
-        try:
-            minio.remove_object(CLIENT_LOGO_BUCKET, previous_object.object_key)
-        except S3Error as exc:
-            if exc.code not in {"NoSuchKey", "NoSuchObject"}:
-                raise
+        remove_stored_image(CLIENT_LOGO_BUCKET, str(previous_object.id), previous_object.object_key)
 
     client.avatar_object_id = object_id
     client.updated_by = actor_user_id
@@ -130,12 +126,7 @@ def remove_client_logo(db: Session, client: Client, *, actor_user_id: str | None
         db.refresh(client)
         return
 
-    minio = get_minio_client()
-    try:
-        minio.remove_object(CLIENT_LOGO_BUCKET, avatar_object.object_key)
-    except S3Error as exc:
-        if exc.code not in {"NoSuchKey", "NoSuchObject"}:
-            raise
+    remove_stored_image(CLIENT_LOGO_BUCKET, str(avatar_object.id), avatar_object.object_key)
 
     avatar_object.deleted_at = now
     avatar_object.deleted_by = actor_user_id
@@ -145,23 +136,19 @@ def remove_client_logo(db: Session, client: Client, *, actor_user_id: str | None
     db.refresh(client)
 
 
-def read_client_logo(db: Session, client: Client) -> tuple[bytes, str]:
+def read_client_logo_image(db: Session, client: Client) -> StoredImage:
     avatar_object = getattr(client, "avatar_object", None)
     if not avatar_object or getattr(avatar_object, "deleted_at", None):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Logo no encontrado.")
 
-    minio = get_minio_client()
-    key = avatar_object.object_key
-
-    try:
-        stat = minio.stat_object(CLIENT_LOGO_BUCKET, key)
-        response = minio.get_object(CLIENT_LOGO_BUCKET, key)
-        try:
-            return response.read(), stat.content_type or "application/octet-stream"
-        finally:
-            response.close()
-            response.release_conn()
-    except S3Error as exc:
-        if exc.code in {"NoSuchKey", "NoSuchObject"}:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Logo no encontrado.")
-        raise
+    return load_stored_image(
+        CLIENT_LOGO_BUCKET,
+        str(avatar_object.id),
+        avatar_object.object_key,
+        not_found_detail="Logo no encontrado.",
+    )
+
+
+def read_client_logo(db: Session, client: Client) -> tuple[bytes, str]:
+    image = read_client_logo_image(db, client)
+    return image.content, image.content_type
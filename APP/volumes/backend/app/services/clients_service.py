@@ -6,10 +6,11 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import HTTPException, UploadFile
-from sqlalchemy import func, or_
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
+from core.pagination import cached_total, keyset_page, total_cache_key
 from core.exceptions import ConflictException, ForbiddenException
 from models.clients import Client
 from models.projects import Project
@@ -23,10 +24,13 @@ from services.access_control_service import (
 from services.client_logo_service import (
     get_client_logo_url_if_exists,
     read_client_logo,
+    read_client_logo_image as _read_client_logo_image,
     remove_client_logo,
     save_client_logo,
 )
+from services.image_delivery_service import StoredImage
 from services.pdf_template_resolver import normalize_pdf_template
+from services.search_index_service import SEARCH_ENTITY_CLIENT, search_match_clause
 
 from utils.text import title_case_es
 
@@ -132,22 +136,9 @@ def list_clients(db: Session, filters: ClientFilterRequest, session: UserSession
     if filters.is_confidential is not None:
         q = q.filter(Client.is_confidential == bool(filters.is_confidential))
     if filters.search:
-        like = f"%{filters.search.strip()}%"
-        q = q.filter(or_(
-            Client.name.ilike(like),
-            Client.legal_name.ilike(like),
-            Client.description.ilike(like),
-            Client.industry.ilike(like),
-            Client.email.ilike(like),
-            Client.phone.ilike(like),
-            Client.contact_name.ilike(like),
-            Client.contact_email.ilike(like),
-            Client.contact_phone.ilike(like),
-            Client.contact_position.ilike(like),
-            Client.contact_department.ilike(like),
-            Client.notes.ilike(like),
-            Client.tags.ilike(like),
-        ))
+        match = search_match_clause(SEARCH_ENTITY_CLIENT, filters.search, Client.id)
+        if match is not None:
+            q = q.filter(match)
     if filters.name:
         q = q.filter(Client.name.ilike(f"%{filters.name}%"))
     if filters.industry:
@@ -157,26 +148,33 @@ def list_clients(db: Session, filters: ClientFilterRequest, session: UserSession
     if filters.priority:
         q = q.filter(Client.priority == filters.priority)
 
-    total = q.with_entities(func.count(Client.id)).scalar() or 0
+    total = cached_total(
+        total_cache_key("clients", filters, scope=session.user_id),
+        lambda: q.with_entities(func.count(Client.id)).scalar(),
+        cursor=filters.cursor,
+        include_total=filters.include_total,
+    )
 
-    items = (
+    items, next_cursor = keyset_page(
         q.options(
             joinedload(Client.created_by_user),
             joinedload(Client.updated_by_user),
             joinedload(Client.deleted_by_user),
             joinedload(Client.avatar_object),
-        )
-        .order_by(Client.name.asc())
-        .offset(filters.skip)
-        .limit(filters.limit)
-        .all()
+        ),
+        [(Client.name, False), (Client.id, False)],
+        cursor=filters.cursor,
+        skip=filters.skip,
+        limit=filters.limit,
+        key=lambda x: (x.name, x.id),
     )
 
     return {
         "items": [_build_response_dict(x) for x in items],
-        "total": int(total),
+        "total": total,
         "skip":  int(filters.skip),
         "limit": int(filters.limit),
+        "next_cursor": next_cursor,
     }
 
 
@@ -341,6 +339,11 @@ def read_client_logo_content(db: Session, client_id: str) -> tuple[bytes, str]:
     return read_client_logo(db, obj)
 
 
+def read_client_logo_image(db: Session, client_id: str) -> StoredImage:
+    obj = _get_or_404(db, client_id)
+    return _read_client_logo_image(db, obj)
+
+
 def list_industries(db: Session) -> list[str]:
     """
     Devuelve todas las industrias distintas presentes en clients,
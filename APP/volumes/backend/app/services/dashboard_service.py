@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -8,9 +8,8 @@ from sqlalchemy.orm import Session
 from core.datetime_utils import utc_now
 from models.clients import Client
 from models.projects import Project
-from models.records import Record
-from models.record_status_transitions import RecordStatusTransition
 from models.record_statuses import RecordStatus
+from models.reporting_rollups import RecordDailyRollup, RecordTransitionDailyRollup
 from schemas.auth import UserSession
 from services.access_control_service import apply_client_scope_filter, apply_project_scope_filter
 from services.minutes.constants import RECORD_STATUS_COMPLETED
@@ -57,6 +56,19 @@ def _date_format_month(column):
     return func.date_format(column, "%Y-%m")
 
 
+def _created_minutes_count(db: Session, session: UserSession, start: datetime, end: datetime) -> int:
+    return int(
+        db.query(func.coalesce(func.sum(RecordDailyRollup.record_count), 0))
+        .filter(
+            RecordDailyRollup.prepared_by_user_id == session.user_id,
+            RecordDailyRollup.rollup_date >= start.date(),
+            RecordDailyRollup.rollup_date <= end.date(),
+        )
+        .scalar()
+        or 0
+    )
+
+
 def _minute_trend(db: Session, session: UserSession, current_start: datetime, now: datetime) -> list[dict]:
     start = _add_months(current_start, -5)
     month_keys = [_month_key(_add_months(start, index)) for index in range(6)]
@@ -65,14 +77,13 @@ def _minute_trend(db: Session, session: UserSession, current_start: datetime, no
         for month in month_keys
     }
 
-    created_month = _date_format_month(Record.created_at).label("month")
+    created_month = _date_format_month(RecordDailyRollup.rollup_date).label("month")
     created_rows = (
-        db.query(created_month, func.count(Record.id))
+        db.query(created_month, func.sum(RecordDailyRollup.record_count))
         .filter(
-            Record.deleted_at.is_(None),
-            Record.prepared_by_user_id == session.user_id,
-            Record.created_at >= start,
-            Record.created_at < now,
+            RecordDailyRollup.prepared_by_user_id == session.user_id,
+            RecordDailyRollup.rollup_date >= start.date(),
+            RecordDailyRollup.rollup_date <= now.date(),
         )
         .group_by(created_month)
         .all()
@@ -81,17 +92,16 @@ def _minute_trend(db: Session, session: UserSession, current_start: datetime, no
         if month in trend_by_month:
             trend_by_month[month]["created"] = int(total or 0)
 
-    completed_month = _date_format_month(RecordStatusTransition.changed_at).label("month")
+    # record_count del rollup ya es distinto por minuta dentro del mes.
+    completed_month = _date_format_month(RecordTransitionDailyRollup.rollup_date).label("month")
     completed_rows = (
-        db.query(completed_month, func.count(func.distinct(RecordStatusTransition.record_id)))
-        .join(Record, Record.id == RecordStatusTransition.record_id)
-        .join(RecordStatus, RecordStatus.id == RecordStatusTransition.to_status_id)
+        db.query(completed_month, func.sum(RecordTransitionDailyRollup.record_count))
+        .join(RecordStatus, RecordStatus.id == RecordTransitionDailyRollup.to_status_id)
         .filter(
-            Record.deleted_at.is_(None),
-            Record.prepared_by_user_id == session.user_id,
+            RecordTransitionDailyRollup.prepared_by_user_id == session.user_id,
             RecordStatus.code == RECORD_STATUS_COMPLETED,
-            RecordStatusTransition.changed_at >= start,
-            RecordStatusTransition.changed_at < now,
+            RecordTransitionDailyRollup.rollup_date >= start.date(),
+            RecordTransitionDailyRollup.rollup_date <= now.date(),
         )
         .group_by(completed_month)
         .all()
@@ -104,19 +114,18 @@ def _minute_trend(db: Session, session: UserSession, current_start: datetime, no
 
 
 def _status_distribution(db: Session, session: UserSession) -> list[dict]:
+    total = func.sum(RecordDailyRollup.record_count)
     rows = (
         db.query(
             RecordStatus.code,
             RecordStatus.name,
-            func.count(Record.id),
-        )
-        .join(RecordStatus, RecordStatus.id == Record.status_id)
-        .filter(
-            Record.deleted_at.is_(None),
-            Record.prepared_by_user_id == session.user_id,
+            total,
         )
+        .join(RecordStatus, RecordStatus.id == RecordDailyRollup.status_id)
+        .filter(RecordDailyRollup.prepared_by_user_id == session.user_id)
         .group_by(RecordStatus.code, RecordStatus.name)
-        .order_by(func.count(Record.id).desc(), RecordStatus.name.asc())
+        .having(total > 0)
+        .order_by(total.desc(), RecordStatus.name.asc())
         .all()
     )
 
@@ -133,27 +142,12 @@ def _status_distribution(db: Session, session: UserSession) -> list[dict]:
 def get_dashboard_stats(db: Session, session: UserSession) -> dict:
     previous_start, current_start, now = _month_bounds(utc_now())
 
-    minutes_current = (
-        db.query(func.count(Record.id))
-        .filter(
-            Record.deleted_at.is_(None),
-            Record.prepared_by_user_id == session.user_id,
-            Record.created_at >= current_start,
-            Record.created_at < now,
-        )
-        .scalar()
-        or 0
-    )
-    minutes_previous = (
-        db.query(func.count(Record.id))
-        .filter(
-            Record.deleted_at.is_(None),
-            Record.prepared_by_user_id == session.user_id,
-            Record.created_at >= previous_start,
-            Record.created_at < current_start,
-        )
-        .scalar()
-        or 0
+    minutes_current = _created_minutes_count(db, session, current_start, now)
+    minutes_previous = _created_minutes_count(
+        db,
+        session,
+        previous_start,
+        current_start - timedelta(days=1),
     )
 
     projects_query = db.query(Project).filter(Project.deleted_at.is_(None), Project.is_active.is_(True))
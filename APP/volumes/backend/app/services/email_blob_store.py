@@ -0,0 +1,220 @@
+# services/email_blob_store.py
+"""
+Adjuntos e inline assets de email por referencia en vez de base64 en Redis.
+
+- Con `email_attachment_store = "minio"` el contenido se guarda una sola vez
+  en `minuetaitor-attach/email/sha256/<aa>/<sha256>` (direccionado por
+  contenido) y el job lleva solo `{bucket, object_key, sha256, size_bytes}`
+  más filename/cid y mime. El worker lo lee de MinIO al enviar.
+- Bytes idénticos (el PDF de una minuta a varios destinatarios, el logo de
+  la organización en cada correo) se suben una vez: un set LRU de hashes ya
+  confirmados evita incluso el `stat_object` dentro del proceso.
+- Una regla de lifecycle del bucket expira los blobs a los
+  `email_attachment_retention_days`; si el blob existente es más viejo que
+  la mitad de ese plazo se vuelve a subir para que no expire con jobs
+  (reintentos, DLQ) que aún lo referencian.
+- Contenidos bajo `email_attachment_inline_max_bytes` siguen en base64: un
+  GET extra a MinIO cuesta más que unos pocos KB en la cola.
+- Si MinIO falla se vuelve al base64 con warning: nunca se pierde un correo
+  por el almacén.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EMAIL_BLOB_BUCKET = "minuetaitor-attach"
+EMAIL_BLOB_PREFIX = "email/sha256/"
+EMAIL_BLOB_LIFECYCLE_RULE_ID = "email-blob-expiry"
+_KNOWN_BLOBS_MAX = 1024
+
+
+class _KnownBlobs:
+    """Hashes ya presentes en MinIO (con la hora de subida conocida); LRU acotado."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._items: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fresh(self, sha256: str, max_age_sec: float) -> bool:
+        with self._lock:
+            stored_at = self._items.get(sha256)
+            if stored_at is None or time.time() - stored_at >= max_age_sec:
+                return False
+            self._items.move_to_end(sha256)
+            return True
+
+    def remember(self, sha256: str, stored_at: float) -> None:
+        with self._lock:
+            self._items[sha256] = stored_at
+            self._items.move_to_end(sha256)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+
+_known_blobs = _KnownBlobs(_KNOWN_BLOBS_MAX)
+_lifecycle_lock = threading.Lock()
+_lifecycle_ready = False
+
+
+def email_blob_store_enabled() -> bool:
+    return str(settings.email_attachment_store or "").strip().lower() == "minio"
+
+
+def email_blob_object_key(sha256: str) -> str:
+    return f"{EMAIL_BLOB_PREFIX}{sha256[:2]}/{sha256}"
+
+
+def _refresh_after_sec() -> float:
+    return max(1, int(settings.email_attachment_retention_days)) * 86400 / 2
+
+
+def _ensure_lifecycle(client) -> None:
+    global _lifecycle_ready
+    if _lifecycle_ready:
+        return
+    from minio.commonconfig import ENABLED, Filter
+    from minio.lifecycleconfig import Expiration, LifecycleConfig, Rule
+
+    with _lifecycle_lock:
+        if _lifecycle_ready:
+            return
+        existing = client.get_bucket_lifecycle(EMAIL_BLOB_BUCKET)
+        rules = [rule for rule in (existing.rules if existing else []) if rule.rule_id != EMAIL_BLOB_LIFECYCLE_RULE_ID]
+        rules.append(
+            Rule(
+                ENABLED,
+                rule_filter=Filter(prefix=EMAIL_BLOB_PREFIX),
+                rule_id=EMAIL_BLOB_LIFECYCLE_RULE_ID,
+                expiration=Expiration(days=max(1, int(settings.email_attachment_retention_days))),
+            )
+        )
+        client.set_bucket_lifecycle(EMAIL_BLOB_BUCKET, LifecycleConfig(rules))
+        _lifecycle_ready = True
+
+
+def store_email_blob(content: bytes, mime_type: str | None = None) -> dict[str, Any]:
+    """Sube `content` al prefijo direccionado por contenido (si hace falta) y retorna la referencia."""
+    from minio.error import S3Error
+
+    from db.minio_client import get_minio_client
+
+    sha256 = hashlib.sha256(content).hexdigest()
+    object_key = email_blob_object_key(sha256)
+    reference = {
+        "bucket": EMAIL_BLOB_BUCKET,
+        "object_key": object_key,
+        "sha256": sha256,
+        "size_bytes": len(content),
+    }
+    refresh_after = _refresh_after_sec()
+    if _known_blobs.fresh(sha256, refresh_after):
+        return reference
+
+    client = get_minio_client()
+    try:
+        _ensure_lifecycle(client)
+    except Exception as exc:
+        logger.warning("email blobs: no se pudo fijar lifecycle en %s: %s", EMAIL_BLOB_BUCKET, exc)
+
+    try:
+        stat = client.stat_object(EMAIL_BLOB_BUCKET, object_key)
+        last_modified = stat.last_modified or datetime.now(timezone.utc)
+        if datetime.now(timezone.utc) - last_modified < timedelta(seconds=refresh_after):
+            _known_blobs.remember(sha256, last_modified.timestamp())
+            return reference
+    except S3Error as exc:
+        if exc.code not in {"NoSuchKey", "NoSuchObject"}:
+            raise
+
+    client.put_object(
+        EMAIL_BLOB_BUCKET,
+        object_key,
+        io.BytesIO(content),
+        length=len(content),
+        content_type=mime_type or "application/octet-stream",
+    )
+    _known_blobs.remember(sha256, time.time())
+    return reference
+
+
+def _offload(content: bytes, mime_type: str | None) -> dict[str, Any] | None:
+    if not email_blob_store_enabled() or len(content) < int(settings.email_attachment_inline_max_bytes):
+        return None
+    try:
+        return store_email_blob(content, mime_type)
+    except Exception as exc:
+        logger.warning("email blobs: se mantiene base64 por error de MinIO (%d bytes): %s", len(content), exc)
+        return None
+
+
+def email_attachment_from_bytes(filename: str, content: bytes, mime_type: str | None) -> dict[str, Any]:
+    """Adjunto listo para el job: referencia a MinIO o base64 según el modo."""
+    reference = _offload(content, mime_type)
+    payload = {"filename": filename, "mime_type": mime_type}
+    if reference is None:
+        payload["content_base64"] = base64.b64encode(content).decode("ascii")
+        payload["sha256"] = hashlib.sha256(content).hexdigest()
+        payload["size_bytes"] = len(content)
+        return payload
+    return {**payload, **reference}
+
+
+def inline_asset_from_bytes(cid: str, content: bytes, mime_type: str | None) -> dict[str, Any]:
+    reference = _offload(content, mime_type)
+    payload = {"cid": cid, "mime_type": mime_type}
+    if reference is None:
+        payload["content_base64"] = base64.b64encode(content).decode("ascii")
+        return payload
+    return {**payload, **reference}
+
+
+def offload_base64_item(item: dict[str, Any]) -> dict[str, Any]:
+    """Reemplaza `content_base64` por una referencia si el modo lo permite (adjuntos de la API, logos)."""
+    content_base64 = item.get("content_base64")
+    if not content_base64 or not email_blob_store_enabled():
+        return item
+    try:
+        content = base64.b64decode(content_base64)
+    except Exception:
+        return item
+    reference = _offload(content, item.get("mime_type"))
+    if reference is None:
+        return item
+    offloaded = {key: value for key, value in item.items() if key != "content_base64"}
+    offloaded.update(reference)
+    return offloaded
+
+
+def is_email_blob_reference(item: Any) -> bool:
+    return isinstance(item, dict) and bool(item.get("object_key"))
+
+
+def normalize_email_blob_reference(item: dict[str, Any], *, name_field: str) -> dict[str, Any]:
+    """Valida una referencia armada por el backend; solo se aceptan blobs del prefijo de email."""
+    bucket = str(item.get("bucket") or "").strip()
+    object_key = str(item.get("object_key") or "").strip()
+    sha256 = str(item.get("sha256") or "").strip().lower()
+    name = str(item.get(name_field) or "").strip()
+    if bucket != EMAIL_BLOB_BUCKET or object_key != email_blob_object_key(sha256) or not name:
+        raise ValueError(f"Referencia de blob de email inválida: {bucket}/{object_key}")
+    return {
+        name_field: name,
+        "mime_type": str(item.get("mime_type") or "").strip() or None,
+        "bucket": bucket,
+        "object_key": object_key,
+        "sha256": sha256,
+        "size_bytes": int(item.get("size_bytes") or 0),
+    }
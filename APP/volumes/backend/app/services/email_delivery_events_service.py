@@ -24,6 +24,21 @@ def record_email_queued_from_job(job: dict[str, Any]) -> None:
         db.close()
 
 
+def record_email_enqueue_failed_from_jobs(jobs: list[dict[str, Any]], error_message: str) -> None:
+    """Cierra como `failed` los eventos `queued` de jobs que nunca llegaron a Redis."""
+    db = SessionLocal()
+    try:
+        occurred_at = utc_now_db()
+        for job in jobs:
+            upsert_email_delivery_event(db, job, status="failed", occurred_at=occurred_at, error_message=error_message)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def upsert_email_delivery_event(
     db: Session,
     job: dict[str, Any],
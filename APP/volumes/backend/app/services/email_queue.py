@@ -7,11 +7,23 @@ No envía directamente — delega al worker vía Redis.
 import json
 import logging
 import uuid
+from dataclasses import dataclass
 from typing import Any, Optional
 
 from db.redis import get_redis
 from schemas.sendmail import EmailAttachment, InlineAsset
-from services.email_template_service import get_inline_assets_for_html, render_email_template
+from services.email_blob_store import (
+    is_email_blob_reference,
+    normalize_email_blob_reference,
+    offload_base64_item,
+)
+from services.email_template_service import (
+    RenderedEmailTemplate,
+    get_inline_assets_for_html,
+    render_email_template,
+    render_email_template_batch,
+)
+from services.queue_telemetry import stamp_job_envelope
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +36,15 @@ def _record_email_queued(job: dict[str, Any]) -> None:
     record_email_queued_from_job(job)
 
 
+def _record_email_enqueue_failed(jobs: list[dict[str, Any]], error: Exception) -> None:
+    from services.email_delivery_events_service import record_email_enqueue_failed_from_jobs
+
+    try:
+        record_email_enqueue_failed_from_jobs(jobs, f"enqueue_failed: {error}")
+    except Exception as exc:
+        logger.warning("No se pudieron cerrar eventos de correo no encolados | count=%d err=%s", len(jobs), exc)
+
+
 async def queue_email(
     to: list[str],
     subject: str,
@@ -69,7 +90,7 @@ async def queue_email(
 
     redis = get_redis()
     _record_email_queued(job)
-    await redis.rpush(QUEUE_EMAIL, json.dumps(job))
+    await redis.rpush(QUEUE_EMAIL, json.dumps(stamp_job_envelope(job)))
     logger.info("Email encolado | subject=%s | to=%s", subject, to)
 
 
@@ -91,33 +112,102 @@ async def queue_templated_email(
         template_context,
         subject_override=subject,
     )
-    job = {
+    job = _build_templated_job(
+        rendered,
+        TemplatedEmailMessage(
+            to=to,
+            context=template_context,
+            cc=cc,
+            bcc=bcc,
+            reply_to=reply_to,
+            inline_assets=inline_assets,
+            attachments=attachments,
+            notification_context=notification_context,
+        ),
+    )
+
+    redis = get_redis()
+    _record_email_queued(job)
+    await redis.rpush(QUEUE_EMAIL, json.dumps(stamp_job_envelope(job)))
+    logger.info("Email template encolado | template_id=%s | to=%s", template_id, to)
+
+
+@dataclass
+class TemplatedEmailMessage:
+    to: list[str]
+    context: dict[str, Any]
+    cc: Optional[list[str]] = None
+    bcc: Optional[list[str]] = None
+    reply_to: Optional[str] = None
+    inline_assets: Optional[list[InlineAsset | dict[str, Any]]] = None
+    attachments: Optional[list[EmailAttachment | dict[str, Any]]] = None
+    notification_context: Optional[dict[str, Any]] = None
+
+
+def _build_templated_job(rendered: RenderedEmailTemplate, message: TemplatedEmailMessage) -> dict[str, Any]:
+    return {
         "job_id": str(uuid.uuid4()),
         "type": "email",
         "queue": QUEUE_EMAIL,
         "attempt": 1,
         "payload": {
-            "to": to,
+            "to": message.to,
             "subject": rendered.subject,
             "body": rendered.html,
-            "cc": cc,
-            "bcc": bcc,
+            "cc": message.cc,
+            "bcc": message.bcc,
             "email_type": "html",
-            "reply_to": reply_to,
-            "template_id": template_id,
+            "reply_to": message.reply_to,
+            "template_id": rendered.template_id,
             "inline_assets": _merge_inline_assets(
-                _serialize_inline_assets(inline_assets),
+                _serialize_inline_assets(message.inline_assets),
                 [asset.model_dump(by_alias=False) for asset in get_inline_assets_for_html(rendered.html)],
             ),
-            "attachments": _serialize_attachments(attachments),
-            "notification_context": notification_context or None,
+            "attachments": _serialize_attachments(message.attachments),
+            "notification_context": message.notification_context or None,
         },
     }
 
+
+async def queue_templated_email_batch(
+    template_id: str,
+    messages: list[TemplatedEmailMessage],
+    *,
+    subject: str | None = None,
+) -> int:
+    """
+    Encola un mismo template para muchos destinatarios (recordatorios, cambios
+    de acceso, publicación): un render por lote y un solo round-trip a Redis.
+    Todo o nada: si algo falla no queda ningún job del lote encolado y los
+    eventos `queued` ya registrados pasan a `failed`, así el llamador puede
+    reintentar mensaje a mensaje sin duplicar.
+    """
+    if not messages:
+        return 0
+    rendered_items = render_email_template_batch(
+        template_id,
+        [message.context for message in messages],
+        subject_override=subject,
+    )
+    jobs = [_build_templated_job(rendered, message) for rendered, message in zip(rendered_items, messages)]
+
     redis = get_redis()
-    _record_email_queued(job)
-    await redis.rpush(QUEUE_EMAIL, json.dumps(job))
-    logger.info("Email template encolado | template_id=%s | to=%s", template_id, to)
+    pipe = redis.pipeline(transaction=True)
+    # El evento `queued` va antes del push: después, el worker podría marcar
+    # `sent` primero y el upsert lo pisaría.
+    recorded: list[dict[str, Any]] = []
+    try:
+        for job in jobs:
+            _record_email_queued(job)
+            recorded.append(job)
+            pipe.rpush(QUEUE_EMAIL, json.dumps(stamp_job_envelope(job)))
+        await pipe.execute()
+    except Exception as exc:
+        if recorded:
+            _record_email_enqueue_failed(recorded, exc)
+        raise
+    logger.info("Emails template encolados en lote | template_id=%s | count=%d", template_id, len(jobs))
+    return len(jobs)
 
 
 def _serialize_inline_assets(
@@ -127,10 +217,12 @@ def _serialize_inline_assets(
         return []
     serialized: list[dict[str, Any]] = []
     for asset in inline_assets:
-        if isinstance(asset, InlineAsset):
-            serialized.append(asset.model_dump(by_alias=False))
+        if is_email_blob_reference(asset):
+            serialized.append(normalize_email_blob_reference(asset, name_field="cid"))
+        elif isinstance(asset, InlineAsset):
+            serialized.append(offload_base64_item(asset.model_dump(by_alias=False)))
         else:
-            serialized.append(InlineAsset.model_validate(asset).model_dump(by_alias=False))
+            serialized.append(offload_base64_item(InlineAsset.model_validate(asset).model_dump(by_alias=False)))
     return serialized
 
 
@@ -151,8 +243,10 @@ def _serialize_attachments(
         return []
     serialized: list[dict[str, Any]] = []
     for attachment in attachments:
-        if isinstance(attachment, EmailAttachment):
-            serialized.append(attachment.model_dump(by_alias=False))
+        if is_email_blob_reference(attachment):
+            serialized.append(normalize_email_blob_reference(attachment, name_field="filename"))
+        elif isinstance(attachment, EmailAttachment):
+            serialized.append(offload_base64_item(attachment.model_dump(by_alias=False)))
         else:
-            serialized.append(EmailAttachment.model_validate(attachment).model_dump(by_alias=False))
+            serialized.append(offload_base64_item(EmailAttachment.model_validate(attachment).model_dump(by_alias=False)))
     return serialized
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 import html
+import logging
 import os
 import re
+import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, meta, select_autoescape
+from typing import Any, Iterable
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+    meta,
+    select_autoescape,
+)
 
+from core.config import settings
 from schemas.sendmail import InlineAsset, MailTemplateInfo
 
+logger = logging.getLogger(__name__)
+
 EMAIL_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "assets" / "email_templates"
 TAG_RE = re.compile(r"<[^>]+>")
 UUID_RE = re.compile(
@@ -350,7 +364,6 @@ EMAIL_TEMPLATE_PRESENTATION: dict[str, dict[str, str]] = {
     },
 }
 
-_env: Environment | None = None
 DEFAULT_LOGO_CID = "minuetaitor-logo"
 
 
@@ -368,21 +381,118 @@ def resolve_default_logo_path() -> str:
     return "/app/assets/images/chinchinAItor_64.jpg"
 
 
-def _build_env() -> Environment:
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    directory = Path(settings.email_template_bytecode_dir or Path(tempfile.gettempdir()) / "minuetaitor-email-jinja")
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        logger.warning("Bytecode cache de templates de email deshabilitado (%s): %s", directory, exc)
+        return None
+    return FileSystemBytecodeCache(str(directory))
+
+
+def _build_env(*, auto_reload: bool) -> Environment:
     return Environment(
         loader=FileSystemLoader(str(EMAIL_TEMPLATES_DIR)),
         autoescape=select_autoescape(["html", "xml"]),
         undefined=StrictUndefined,
         trim_blocks=True,
         lstrip_blocks=True,
+        auto_reload=auto_reload,
+        bytecode_cache=_bytecode_cache(),
     )
 
 
-def _get_env() -> Environment:
-    global _env
-    if _env is None:
-        _env = _build_env()
-    return _env
+@dataclass(frozen=True)
+class CompiledEmailTemplate:
+    definition: EmailTemplateDefinition
+    body: Template
+    subject: Template
+    placeholders: tuple[str, ...]
+    source_mtime: float
+
+
+class EmailTemplateRegistry:
+    """
+    Templates de email compilados una vez por proceso.
+
+    Body y subject quedan como `Template` listos para render y los
+    placeholders (variables no declaradas de ambos) se calculan al compilar.
+    Con `auto_reload` (dev) se recompila si cambia el mtime del archivo; en
+    el resto de entornos los templates viven lo que vive el proceso.
+    """
+
+    def __init__(self, *, auto_reload: bool) -> None:
+        self.auto_reload = auto_reload
+        self._env: Environment | None = None
+        self._compiled: dict[str, CompiledEmailTemplate] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def env(self) -> Environment:
+        if self._env is None:
+            self._env = _build_env(auto_reload=self.auto_reload)
+        return self._env
+
+    def _compile(self, definition: EmailTemplateDefinition) -> CompiledEmailTemplate:
+        path = EMAIL_TEMPLATES_DIR / definition.filename
+        try:
+            source_mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            raise ValueError(f"Template no encontrado en disco: {definition.filename}") from None
+        env = self.env
+        source = path.read_text(encoding="utf-8")
+        names = set(meta.find_undeclared_variables(env.parse(source)))
+        names.update(meta.find_undeclared_variables(env.parse(definition.default_subject)))
+        return CompiledEmailTemplate(
+            definition=definition,
+            body=env.get_template(definition.filename),
+            subject=env.from_string(definition.default_subject),
+            placeholders=tuple(sorted(names)),
+            source_mtime=source_mtime,
+        )
+
+    def _is_stale(self, compiled: CompiledEmailTemplate) -> bool:
+        if not self.auto_reload:
+            return False
+        try:
+            return (EMAIL_TEMPLATES_DIR / compiled.definition.filename).stat().st_mtime != compiled.source_mtime
+        except OSError:
+            return True
+
+    def get(self, template_id: str) -> CompiledEmailTemplate:
+        compiled = self._compiled.get(template_id)
+        if compiled is not None and not self._is_stale(compiled):
+            return compiled
+        definition = get_template_definition(template_id)
+        with self._lock:
+            compiled = self._compiled.get(template_id)
+            if compiled is None or self._is_stale(compiled):
+                compiled = self._compile(definition)
+                self._compiled[template_id] = compiled
+        return compiled
+
+    def load_all(self) -> list[str]:
+        loaded: list[str] = []
+        for template_id in TEMPLATE_DEFINITIONS:
+            try:
+                self.get(template_id)
+                loaded.append(template_id)
+            except Exception as exc:
+                logger.warning("No se pudo compilar el template de email '%s': %s", template_id, exc)
+        return loaded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._compiled.clear()
+            self._env = None
+
+
+email_template_registry = EmailTemplateRegistry(auto_reload=settings.env_name == "dev")
+
+
+def warm_up_email_templates() -> list[str]:
+    return email_template_registry.load_all()
 
 
 def _default_context() -> dict[str, Any]:
@@ -457,7 +567,7 @@ def get_template_definition(template_id: str) -> EmailTemplateDefinition:
 def list_email_templates() -> list[MailTemplateInfo]:
     templates: list[MailTemplateInfo] = []
     for definition in TEMPLATE_DEFINITIONS.values():
-        placeholders = extract_placeholders(definition.template_id)
+        placeholders = list(email_template_registry.get(definition.template_id).placeholders)
         templates.append(
             MailTemplateInfo(
                 template_id=definition.template_id,
@@ -480,24 +590,10 @@ def load_template_source(template_id: str) -> str:
 
 
 def extract_placeholders(template_id: str) -> list[str]:
-    definition = get_template_definition(template_id)
-    env = _get_env()
-    template_source = load_template_source(template_id)
-    template_ast = env.parse(template_source)
-    names = set(meta.find_undeclared_variables(template_ast))
-    subject_ast = env.parse(definition.default_subject)
-    names.update(meta.find_undeclared_variables(subject_ast))
-    return sorted(names)
+    return list(email_template_registry.get(template_id).placeholders)
 
 
-def render_email_template(
-    template_id: str,
-    context: dict[str, Any] | None = None,
-    *,
-    subject_override: str | None = None,
-) -> RenderedEmailTemplate:
-    definition = get_template_definition(template_id)
-    env = _get_env()
+def _base_render_context(template_id: str) -> dict[str, Any]:
     merged_context = _default_context()
     presentation = EMAIL_TEMPLATE_PRESENTATION.get(template_id, {})
     merged_context.update(
@@ -518,6 +614,17 @@ def render_email_template(
             ),
         }
     )
+    return merged_context
+
+
+def _render_compiled(
+    compiled: CompiledEmailTemplate,
+    base_context: dict[str, Any],
+    context: dict[str, Any] | None,
+    subject_override: str | None,
+) -> RenderedEmailTemplate:
+    template_id = compiled.definition.template_id
+    merged_context = dict(base_context)
     if context:
         merged_context.update({str(key): value for key, value in context.items()})
     raw_audit_event = (
@@ -532,15 +639,10 @@ def render_email_template(
         merged_context["EMAIL_BADGE_TEXT"] = f"Acceso: {merged_context['ACCESS_ACTION']}"
 
     try:
-        html_body = env.get_template(definition.filename).render(**merged_context)
-        if subject_override is not None:
-            subject = str(subject_override).strip()
-            if not subject:
-                subject_template = env.from_string(definition.default_subject)
-                subject = subject_template.render(**merged_context)
-        else:
-            subject_template = env.from_string(definition.default_subject)
-            subject = subject_template.render(**merged_context)
+        html_body = compiled.body.render(**merged_context)
+        subject = str(subject_override).strip() if subject_override is not None else ""
+        if not subject:
+            subject = compiled.subject.render(**merged_context)
     except Exception as exc:
         raise ValueError(f"No se pudo renderizar el template '{template_id}': {exc}") from exc
 
@@ -548,10 +650,37 @@ def render_email_template(
         template_id=template_id,
         subject=subject,
         html=html_body,
-        placeholders=extract_placeholders(template_id),
+        placeholders=list(compiled.placeholders),
     )
 
 
+def render_email_template(
+    template_id: str,
+    context: dict[str, Any] | None = None,
+    *,
+    subject_override: str | None = None,
+) -> RenderedEmailTemplate:
+    compiled = email_template_registry.get(template_id)
+    return _render_compiled(compiled, _base_render_context(template_id), context, subject_override)
+
+
+def render_email_template_batch(
+    template_id: str,
+    contexts: Iterable[dict[str, Any] | None],
+    *,
+    subject_override: str | None = None,
+) -> list[RenderedEmailTemplate]:
+    """
+    Renderiza un template contra muchos contextos de destinatario.
+
+    El template compilado y el contexto base (entorno + presentación) se
+    resuelven una sola vez para todo el lote.
+    """
+    compiled = email_template_registry.get(template_id)
+    base_context = _base_render_context(template_id)
+    return [_render_compiled(compiled, base_context, context, subject_override) for context in contexts]
+
+
 def get_inline_assets_for_html(raw_html: str) -> list[InlineAsset]:
     assets: list[InlineAsset] = []
     if f"cid:{DEFAULT_LOGO_CID}" in raw_html:
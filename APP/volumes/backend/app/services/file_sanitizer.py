@@ -3,10 +3,13 @@
 Valida archivos de usuario SIN modificar su contenido.
 Verifica tipo permitido, tamano, hash, firmas basicas y texto UTF-8.
 """
+import codecs
 import hashlib
 import json
 import logging
 
+from services.text_sanitization import sanitize_text_bytes, strip_control_bytes
+
 logger = logging.getLogger(__name__)
 
 ALLOWED_MIME_TYPES = {
@@ -16,7 +19,11 @@ ALLOWED_MIME_TYPES = {
     "application/msword",
 }
 
+TEXT_MIME_TYPES = {"text/plain", "text/html", "text/csv", "application/json"}
+BINARY_SAFE_EXTENSIONS = {".pdf", ".docx", ".doc"}
+
 MAX_FILE_SIZE_BYTES = 50 * 1024 * 1024  # 50MB default, sobreescribir desde config
+SIGNATURE_WINDOW_BYTES = 65536
 
 
 class FileSanitizationError(Exception):
@@ -37,10 +44,7 @@ def verify_not_binary(content: bytes, filename: str) -> None:
     Detecta si el archivo es binario comprobando bytes nulos.
     PDFs y DOCX son binarios válidos — se eximen por extensión.
     """
-    binary_safe_extensions = {".pdf", ".docx", ".doc"}
-    ext = "." + filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
-    
-    if ext in binary_safe_extensions:
+    if _file_ext(filename) in BINARY_SAFE_EXTENSIONS:
         return  # Formatos binarios permitidos explícitamente
 
     # Para texto plano: no debe contener bytes nulos
@@ -52,8 +56,7 @@ def verify_not_binary(content: bytes, filename: str) -> None:
 
 def verify_utf8_for_text(content: bytes, mime_type: str, filename: str) -> None:
     """Verifica encoding UTF-8 para archivos de texto plano."""
-    text_mimes = {"text/plain", "text/html", "text/csv", "application/json"}
-    if mime_type in text_mimes:
+    if mime_type in TEXT_MIME_TYPES:
         try:
             content.decode("utf-8")
         except UnicodeDecodeError:
@@ -64,18 +67,13 @@ def verify_utf8_for_text(content: bytes, mime_type: str, filename: str) -> None:
 
 def sanitize_text_content(content: bytes, mime_type: str) -> bytes:
     """Normaliza texto UTF-8 y elimina controles no imprimibles peligrosos."""
-    text_mimes = {"text/plain", "text/html", "text/csv", "application/json"}
-    if mime_type not in text_mimes:
+    if mime_type not in TEXT_MIME_TYPES:
         return content
+    return sanitize_text_bytes(content)
 
-    text = content.decode("utf-8-sig")
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    cleaned = "".join(
-        char
-        for char in text
-        if char in {"\n", "\t"} or ord(char) >= 32
-    )
-    return cleaned.encode("utf-8")
+
+def _file_ext(filename: str) -> str:
+    return "." + filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
 
 
 def verify_content_signature(content: bytes, mime_type: str, filename: str) -> None:
@@ -131,3 +129,98 @@ def sanitize_file(
 
     logger.info(f"Archivo validado: {filename} ({len(sanitized)} bytes)")
     return sanitized
+
+
+class StreamingFileSanitizer:
+    """
+    Versión incremental de `sanitize_file` para archivos que se suben por
+    bloques: aplica las mismas reglas sin tener el contenido completo en memoria.
+
+    - tamaño y bytes nulos se verifican por bloque;
+    - las firmas se validan sobre los primeros `SIGNATURE_WINDOW_BYTES`;
+    - el texto se decodifica con un decoder UTF-8 incremental y los saltos de
+      línea se normalizan aunque un `\r\n` quede partido entre bloques;
+    - el SHA-256 se calcula sobre la salida ya normalizada.
+
+    Uso: `feed(chunk)` por cada bloque leído y `finish()` al final; ambos
+    retornan los bytes sanitizados a escribir.
+    """
+
+    def __init__(self, filename: str, mime_type: str, max_bytes: int = MAX_FILE_SIZE_BYTES) -> None:
+        if mime_type not in ALLOWED_MIME_TYPES:
+            raise FileSanitizationError(f"Tipo MIME no permitido: {mime_type}")
+        self.filename = filename
+        self.mime_type = mime_type
+        self.max_bytes = max_bytes
+        self.input_size = 0
+        self.output_size = 0
+        self._sha256 = hashlib.sha256()
+        self._head = bytearray()
+        self._signature_checked = False
+        self._check_nulls = _file_ext(filename) not in BINARY_SAFE_EXTENSIONS
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")() if mime_type in TEXT_MIME_TYPES else None
+        self._pending_cr = False
+        self._json_raw: bytearray | None = bytearray() if mime_type == "application/json" else None
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+    def feed(self, chunk: bytes) -> bytes:
+        self.input_size += len(chunk)
+        if self.input_size > self.max_bytes:
+            raise FileSanitizationError(
+                f"Archivo '{self.filename}' excede el límite de {self.max_bytes // 1024 // 1024}MB"
+            )
+        if self._check_nulls and b"\x00" in chunk:
+            raise FileSanitizationError(
+                f"Archivo '{self.filename}' contiene bytes nulos — posible archivo binario"
+            )
+        if not self._signature_checked:
+            self._head += chunk[: SIGNATURE_WINDOW_BYTES - len(self._head)]
+            if len(self._head) >= SIGNATURE_WINDOW_BYTES:
+                self._check_signature()
+        if self._json_raw is not None:
+            self._json_raw += chunk
+        return self._emit(self._decode(chunk, final=False))
+
+    def finish(self) -> bytes:
+        if not self._signature_checked:
+            self._check_signature()
+        tail = self._emit(self._decode(b"", final=True))
+        if self._json_raw is not None:
+            try:
+                json.loads(self._json_raw.decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                raise FileSanitizationError(f"Archivo '{self.filename}' no es JSON valido")
+        logger.info(f"Archivo validado: {self.filename} ({self.output_size} bytes)")
+        return tail
+
+    def _check_signature(self) -> None:
+        self._signature_checked = True
+        if self._json_raw is not None:
+            return  # JSON se valida completo en finish()
+        verify_content_signature(bytes(self._head), self.mime_type, self.filename)
+        self._head = bytearray()
+
+    def _decode(self, chunk: bytes, *, final: bool) -> bytes:
+        if self._decoder is None:
+            return chunk
+        try:
+            text = self._decoder.decode(chunk, final=final)
+        except UnicodeDecodeError:
+            raise FileSanitizationError(f"Archivo '{self.filename}' no es UTF-8 válido")
+
+        if self._pending_cr:
+            text = "\r" + text
+        self._pending_cr = not final and text.endswith("\r")
+        if self._pending_cr:
+            text = text[:-1]
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return strip_control_bytes(text.encode("utf-8"))
+
+    def _emit(self, data: bytes) -> bytes:
+        if data:
+            self._sha256.update(data)
+            self.output_size += len(data)
+        return data
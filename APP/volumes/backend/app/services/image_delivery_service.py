@@ -0,0 +1,210 @@
+"""
+services/image_delivery_service.py
+
+Entrega de imágenes pequeñas (avatares, logos, banner) almacenadas en MinIO.
+
+- Las derivadas (miniaturas) se generan al subir la imagen y se guardan junto
+  al original como `<object_key>.<variant>`; las imágenes antiguas sin
+  derivada se completan la primera vez que se piden.
+- Un LRU en memoria acotado por bytes, con clave (object_id, variante),
+  evita el stat/get a MinIO en cada request.
+- Como cada subida crea un `Object` nuevo, el par (object_id, variante)
+  identifica bytes inmutables: sirve como ETag fuerte y permite
+  `Cache-Control: immutable` en las URLs versionadas `?v=<object_id>`.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
+
+from fastapi import HTTPException, Request, Response, status
+from minio.error import S3Error
+
+from core.config import settings
+from db.minio_client import get_minio_client
+from services.object_delivery_service import etag_matches
+from services.upload_validation import build_image_derivative, safe_content_disposition
+
+logger = logging.getLogger(__name__)
+
+ORIGINAL_VARIANT = "original"
+VERSIONED_CACHE_CONTROL = "public, max-age=31536000, immutable"
+UNVERSIONED_CACHE_CONTROL = "public, max-age=300"
+
+
+@dataclass(frozen=True)
+class StoredImage:
+    object_id: str
+    variant: str
+    content: bytes
+    content_type: str
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.object_id}-{self.variant}"'
+
+
+class _ImageLRU:
+    """LRU de bytes con límite total; seguro entre hilos del threadpool."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._items: OrderedDict[tuple[str, str], StoredImage] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> StoredImage | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+            return item
+
+    def put(self, item: StoredImage) -> None:
+        size = len(item.content)
+        if size > self.max_bytes:
+            return
+        key = (item.object_id, item.variant)
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._items[key] = item
+            self._size += size
+            while self._size > self.max_bytes and self._items:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def discard_object(self, object_id: str) -> None:
+        with self._lock:
+            for key in [key for key in self._items if key[0] == object_id]:
+                self._size -= len(self._items.pop(key).content)
+
+
+_image_cache = _ImageLRU(settings.image_cache_max_bytes)
+
+
+def derivative_object_key(object_key: str, variant: str) -> str:
+    return f"{object_key}.{variant}"
+
+
+def _get_object_bytes(bucket: str, object_key: str) -> tuple[bytes, str]:
+    response = get_minio_client().get_object(bucket, object_key)
+    try:
+        content_type = response.headers.get("Content-Type") or "application/octet-stream"
+        return response.read(), content_type
+    finally:
+        response.close()
+        response.release_conn()
+
+
+def store_image_derivative(
+    bucket: str,
+    object_key: str,
+    content: bytes,
+    *,
+    variant: str,
+    size: tuple[int, int],
+    content_type: str | None,
+    square: bool = True,
+) -> tuple[bytes, str]:
+    """Genera la derivada con Pillow y la guarda junto al original."""
+    derivative, derivative_type = build_image_derivative(
+        content,
+        size=size,
+        content_type=content_type,
+        square=square,
+    )
+    get_minio_client().put_object(
+        bucket_name=bucket,
+        object_name=derivative_object_key(object_key, variant),
+        data=BytesIO(derivative),
+        length=len(derivative),
+        content_type=derivative_type,
+    )
+    return derivative, derivative_type
+
+
+def load_stored_image(
+    bucket: str,
+    object_id: str,
+    object_key: str,
+    *,
+    not_found_detail: str,
+    variant: str = ORIGINAL_VARIANT,
+    size: tuple[int, int] | None = None,
+    square: bool = True,
+) -> StoredImage:
+    """Retorna la imagen (o su derivada) desde el LRU o MinIO.
+
+    `size` solo se usa para regenerar derivadas ausentes de imágenes subidas
+    antes de que existieran.
+    """
+    cache_key = (str(object_id), variant)
+    cached = _image_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        if variant == ORIGINAL_VARIANT:
+            content, content_type = _get_object_bytes(bucket, object_key)
+        else:
+            try:
+                content, content_type = _get_object_bytes(bucket, derivative_object_key(object_key, variant))
+            except S3Error as exc:
+                if exc.code not in {"NoSuchKey", "NoSuchObject"} or size is None:
+                    raise
+                original, original_type = _get_object_bytes(bucket, object_key)
+                content, content_type = store_image_derivative(
+                    bucket,
+                    object_key,
+                    original,
+                    variant=variant,
+                    size=size,
+                    content_type=original_type,
+                    square=square,
+                )
+                logger.info("image_delivery: derivada %s generada para objeto %s", variant, object_id)
+    except S3Error as exc:
+        if exc.code in {"NoSuchKey", "NoSuchObject"}:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail)
+        raise
+
+    image = StoredImage(
+        object_id=str(object_id),
+        variant=variant,
+        content=content,
+        content_type=content_type,
+    )
+    _image_cache.put(image)
+    return image
+
+
+def remove_stored_image(bucket: str, object_id: str, object_key: str, *, variants: tuple[str, ...] = ()) -> None:
+    """Elimina el original y sus derivadas de MinIO y del LRU."""
+    minio = get_minio_client()
+    for key in (object_key, *(derivative_object_key(object_key, variant) for variant in variants)):
+        try:
+            minio.remove_object(bucket, key)
+        except S3Error as exc:
+            if exc.code not in {"NoSuchKey", "NoSuchObject"}:
+                raise
+    _image_cache.discard_object(str(object_id))
+
+
+def build_image_response(request: Request, image: StoredImage, *, filename: str) -> Response:
+    """Respuesta inline con ETag fuerte, 304 condicional y caché inmutable si la URL está versionada."""
+    versioned = request.query_params.get("v") == image.object_id
+    headers = {
+        "Cache-Control": VERSIONED_CACHE_CONTROL if versioned else UNVERSIONED_CACHE_CONTROL,
+        "ETag": image.etag,
+        "X-Content-Type-Options": "nosniff",
+    }
+    if etag_matches(request.headers.get("if-none-match"), image.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    headers["Content-Disposition"] = safe_content_disposition(filename, disposition="inline")
+    return Response(content=image.content, media_type=image.content_type, headers=headers)
@@ -54,6 +54,7 @@ from services.minute_participants_service import (
     persist_record_version_participants,
 )
 from services.ai_usage_events_service import record_ai_usage_event
+from services.catalog_registry import catalog_registry
 from services.minutes.status_transitions import append_record_status_transition
 from services.notification_center_service import create_in_app_notification
 from services.notification_service import enqueue_ai_processed_ready_email, enqueue_minute_officialized_email
@@ -93,21 +94,15 @@ def _sha256_bytes(data: bytes) -> str:
 
 
 def _get_catalog_id(db: Session, model, code: str) -> int:
-    """Resuelve el ID de un catálogo por su code. Lanza 500 si no existe."""
-    obj = db.query(model).filter_by(code=code).first()
-    if not obj:
-        raise RuntimeError(
-            f"Catálogo '{model.__tablename__}' con code='{code}' no encontrado. "
-            "Verifica los seeds."
-        )
-    return obj.id
+    """Resuelve el ID de un catálogo por su code (caché de proceso). Lanza 500 si no existe."""
+    return catalog_registry.get_id(db, model, code)
 
 
 def _get_status_id(db: Session, code: str) -> int:
-    obj = db.query(RecordStatus).filter_by(code=code).first()
-    if not obj:
+    entry = catalog_registry.find_by_code(db, RecordStatus, code)
+    if not entry:
         raise RuntimeError(f"RecordStatus '{code}' no encontrado en catálogo.")
-    return obj.id
+    return entry.id
 
 
 def _build_canonical_ai_output(
@@ -0,0 +1,98 @@
+# services/json_schema_engine.py
+"""
+Motor de validación JSON-schema compartido por backend y worker.
+
+- Cada `*.json` de `assets/schemas` se compila una sola vez: se elige la
+  clase de validador según `$schema`, se verifica el schema y se guarda la
+  instancia (con su resolver y `FORMAT_CHECKER` cacheados) para reutilizarla.
+- `find_injection` recorre el árbol ya parseado (claves y strings) con un
+  único patrón combinado, sin volver a serializar el documento.
+
+Solo depende de la stdlib y `jsonschema`: el worker lo carga por ruta desde
+el código del backend montado en solo lectura.
+"""
+from __future__ import annotations
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+
+from jsonschema import ValidationError, validators
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+
+DEFAULT_SCHEMA_DIR = Path(__file__).resolve().parent.parent / "assets" / "schemas"
+
+INJECTION_PATTERNS = ("<script", "javascript:", "onerror=", "onload=")
+_INJECTION_RE = re.compile("|".join(re.escape(pattern) for pattern in INJECTION_PATTERNS), re.IGNORECASE)
+
+
+class SchemaRegistry:
+    """Validadores compilados por nombre de archivo (sin extensión)."""
+
+    def __init__(self, schema_dir: Path | str = DEFAULT_SCHEMA_DIR) -> None:
+        self.schema_dir = Path(schema_dir)
+        self._validators: dict[str, Validator] = {}
+        self._lock = threading.Lock()
+
+    def _compile(self, path: Path) -> Validator:
+        schema = json.loads(path.read_text(encoding="utf-8"))
+        validator_cls = validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        return validator_cls(schema, format_checker=validator_cls.FORMAT_CHECKER)
+
+    def load_all(self) -> list[str]:
+        """Compila todos los schemas del directorio; pensado para el arranque."""
+        with self._lock:
+            for path in sorted(self.schema_dir.glob("*.json")):
+                if path.stem not in self._validators:
+                    self._validators[path.stem] = self._compile(path)
+            return sorted(self._validators)
+
+    def get(self, name: str) -> Validator:
+        validator = self._validators.get(name)
+        if validator is not None:
+            return validator
+        with self._lock:
+            validator = self._validators.get(name)
+            if validator is None:
+                validator = self._compile(self.schema_dir / f"{name}.json")
+                self._validators[name] = validator
+            return validator
+
+    def first_error(self, name: str, instance: Any) -> ValidationError | None:
+        """Retorna el error más relevante o None si el documento es válido."""
+        validator = self.get(name)
+        if validator.is_valid(instance):
+            return None
+        return best_match(validator.iter_errors(instance))
+
+
+def _iter_strings(node: Any) -> Iterator[str]:
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            yield current
+        elif isinstance(current, dict):
+            for key, value in current.items():
+                if isinstance(key, str):
+                    yield key
+                stack.append(value)
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def find_injection(data: Any) -> str | None:
+    """Retorna el patrón de inyección encontrado en claves o strings, o None."""
+    for text in _iter_strings(data):
+        match = _INJECTION_RE.search(text)
+        if match:
+            return match.group(0).lower()
+    return None
+
+
+def format_error_path(error: ValidationError) -> str:
+    return " → ".join(str(part) for part in error.absolute_path)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Iterator
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -11,9 +11,12 @@ from models.projects import Project
 from models.record_version_agreements import RecordVersionAgreement
 from models.record_version_requirements import RecordVersionRequirement
 from models.records import Record
+from models.reporting_rollups import CommitmentDailyRollup
 from models.record_versions import RecordVersion
 from schemas.auth import UserSession
-from services.access_control_service import apply_record_scope_filter
+from services.access_control_service import apply_record_scope_filter, can_access_all_clients
+
+STREAM_BATCH_SIZE = 500
 
 
 def _activity_date_expr():
@@ -52,7 +55,67 @@ def _clean_text(value: str | None, fallback: str) -> str:
     return raw or fallback
 
 
-def list_management_commitment_items(db: Session, session: UserSession, filters) -> dict:
+def _commitment_total_from_rollups(db: Session, filters) -> int:
+    q = (
+        db.query(func.coalesce(func.sum(CommitmentDailyRollup.item_count), 0))
+        .join(Client, Client.id == CommitmentDailyRollup.client_id)
+        .outerjoin(Project, Project.id == CommitmentDailyRollup.project_id)
+    )
+    if filters.date_from:
+        q = q.filter(CommitmentDailyRollup.activity_date >= filters.date_from)
+    if filters.date_to:
+        q = q.filter(CommitmentDailyRollup.activity_date <= filters.date_to)
+    if filters.client:
+        q = q.filter(Client.name == filters.client)
+    if filters.project:
+        q = q.filter(Project.name == filters.project)
+    return int(q.scalar() or 0)
+
+
+def _commitment_total(db: Session, session: UserSession, filters, agreement_q, requirement_q) -> int:
+    # Los rollups solo guardan el autor de la minuta; el alcance de una sesión
+    # restringida también admite created_by/updated_by, así que se cuenta en las tablas base.
+    if can_access_all_clients(db, session):
+        return _commitment_total_from_rollups(db, filters)
+    return int((agreement_q.order_by(None).count() or 0) + (requirement_q.order_by(None).count() or 0))
+
+
+def _agreement_row(agreement, record, client, project, version) -> dict:
+    return {
+        **_base_row(record, client, project, version),
+        "id": f"{agreement.record_version_id}-agreement-{agreement.id}",
+        "item_type": "agreement",
+        "item_code": agreement.agreement_code,
+        "title": _clean_text(agreement.subject, "Acuerdo sin asunto"),
+        "body": _clean_text(agreement.body, ""),
+        "responsible": _clean_text(agreement.responsible, "Sin responsable"),
+        "status": _clean_text(agreement.status, "pending"),
+        "priority": None,
+        "due_date": agreement.due_date,
+        "entity": None,
+        "source_index": agreement.source_index,
+    }
+
+
+def _requirement_row(requirement, record, client, project, version) -> dict:
+    body = _clean_text(requirement.body, "Requerimiento sin detalle")
+    return {
+        **_base_row(record, client, project, version),
+        "id": f"{requirement.record_version_id}-requirement-{requirement.id}",
+        "item_type": "requirement",
+        "item_code": requirement.requirement_code,
+        "title": body[:120],
+        "body": body,
+        "responsible": _clean_text(requirement.responsible, "Sin responsable"),
+        "status": _clean_text(requirement.status, "open"),
+        "priority": _clean_text(requirement.priority, "medium"),
+        "due_date": None,
+        "entity": (requirement.entity or "").strip() or None,
+        "source_index": requirement.source_index,
+    }
+
+
+def _commitment_queries(db: Session, session: UserSession, filters):
     date_expr = _activity_date_expr()
 
     agreement_q = (
@@ -90,63 +153,38 @@ def list_management_commitment_items(db: Session, session: UserSession, filters)
         agreement_q = agreement_q.filter(Project.name == filters.project)
         requirement_q = requirement_q.filter(Project.name == filters.project)
 
-    total = int((agreement_q.count() or 0) + (requirement_q.count() or 0))
-    row_limit = max(1, int(filters.limit or 1))
     order_columns = (
         date_expr.desc(),
         Record.title.asc(),
     )
+    agreement_q = agreement_q.order_by(*order_columns, RecordVersionAgreement.source_index.asc())
+    requirement_q = requirement_q.order_by(*order_columns, RecordVersionRequirement.source_index.asc())
+    return agreement_q, requirement_q
 
-    items: list[dict] = []
-
-    for agreement, record, client, project, version in (
-        agreement_q
-        .order_by(*order_columns, RecordVersionAgreement.source_index.asc())
-        .limit(row_limit)
-        .all()
-    ):
-        base = _base_row(record, client, project, version)
-        items.append(
-            {
-                **base,
-                "id": f"{agreement.record_version_id}-agreement-{agreement.id}",
-                "item_type": "agreement",
-                "item_code": agreement.agreement_code,
-                "title": _clean_text(agreement.subject, "Acuerdo sin asunto"),
-                "body": _clean_text(agreement.body, ""),
-                "responsible": _clean_text(agreement.responsible, "Sin responsable"),
-                "status": _clean_text(agreement.status, "pending"),
-                "priority": None,
-                "due_date": agreement.due_date,
-                "entity": None,
-                "source_index": agreement.source_index,
-            }
-        )
 
-    for requirement, record, client, project, version in (
-        requirement_q
-        .order_by(*order_columns, RecordVersionRequirement.source_index.asc())
-        .limit(row_limit)
-        .all()
-    ):
-        base = _base_row(record, client, project, version)
-        body = _clean_text(requirement.body, "Requerimiento sin detalle")
-        items.append(
-            {
-                **base,
-                "id": f"{requirement.record_version_id}-requirement-{requirement.id}",
-                "item_type": "requirement",
-                "item_code": requirement.requirement_code,
-                "title": body[:120],
-                "body": body,
-                "responsible": _clean_text(requirement.responsible, "Sin responsable"),
-                "status": _clean_text(requirement.status, "open"),
-                "priority": _clean_text(requirement.priority, "medium"),
-                "due_date": None,
-                "entity": (requirement.entity or "").strip() or None,
-                "source_index": requirement.source_index,
-            }
-        )
+def iter_management_commitment_items(db: Session, session: UserSession, filters) -> Iterator[dict]:
+    """Recorre todos los compromisos filtrados con cursor del lado del servidor.
+
+    Emite primero los acuerdos y luego los requerimientos, cada bloque en el
+    orden del reporte; pensado para exportaciones sin límite de filas.
+    """
+    agreement_q, requirement_q = _commitment_queries(db, session, filters)
+    for query, build_row in ((agreement_q, _agreement_row), (requirement_q, _requirement_row)):
+        for row in query.execution_options(stream_results=True, yield_per=STREAM_BATCH_SIZE):
+            item = build_row(*row)
+            item.pop("source_index", None)
+            yield item
+
+
+def list_management_commitment_items(db: Session, session: UserSession, filters) -> dict:
+    agreement_q, requirement_q = _commitment_queries(db, session, filters)
+    total = _commitment_total(db, session, filters, agreement_q, requirement_q)
+    row_limit = max(1, int(filters.limit or 1))
+
+    items: list[dict] = [
+        _agreement_row(*row) for row in agreement_q.limit(row_limit).all()
+    ]
+    items.extend(_requirement_row(*row) for row in requirement_q.limit(row_limit).all())
 
     items.sort(
         key=lambda row: (
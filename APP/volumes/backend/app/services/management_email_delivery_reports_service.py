@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, time
-from typing import Any
+from typing import Any, Iterator
 
 from sqlalchemy.orm import Session
 
@@ -13,6 +13,8 @@ from models.records import Record
 from schemas.auth import UserSession
 from services.access_control_service import apply_record_scope_filter, is_admin
 
+STREAM_BATCH_SIZE = 500
+
 
 def _json_list(value: Any) -> list[str]:
     if not value:
@@ -33,9 +35,47 @@ def _clean(value: Any, fallback: str = "") -> str:
     return raw or fallback
 
 
-def list_management_email_deliveries(db: Session, session: UserSession, filters) -> dict:
+def _email_delivery_row(event: EmailDeliveryEvent, record: Record | None, client: Client | None, project: Project | None) -> dict:
+    return {
+        "id": str(event.id),
+        "job_id": str(event.job_id),
+        "status": event.status,
+        "email_kind": event.email_kind,
+        "notification_type": event.notification_type,
+        "template_id": event.template_id,
+        "subject": event.subject,
+        "recipient_count": int(event.recipient_count or 0),
+        "attachment_count": int(event.attachment_count or 0),
+        "inline_asset_count": int(event.inline_asset_count or 0),
+        "to": _json_list(event.to_json),
+        "cc": _json_list(event.cc_json),
+        "bcc": _json_list(event.bcc_json),
+        "scope_type": event.scope_type,
+        "scope_id": event.scope_id,
+        "record_id": str(event.record_id) if event.record_id else None,
+        "minute_title": getattr(record, "title", None) or "Sin minuta asociada",
+        "client": getattr(client, "name", None) or "Sin cliente",
+        "project": getattr(project, "name", None) or "Sin proyecto",
+        "actor_user_id": str(event.actor_user_id) if event.actor_user_id else None,
+        "tags": _json_list(event.tags_json),
+        "attempt": int(event.attempt or 1),
+        "error_message": _clean(event.error_message, "") or None,
+        "queued_at": event.queued_at,
+        "sent_at": event.sent_at,
+        "failed_at": event.failed_at,
+        "date": event.event_at,
+    }
+
+
+def iter_management_email_deliveries(
+    db: Session,
+    session: UserSession,
+    filters,
+    *,
+    limit: int | None,
+) -> Iterator[dict]:
     q = (
-        db.query(EmailDeliveryEvent)
+        db.query(EmailDeliveryEvent, Record, Client, Project)
         .outerjoin(Record, Record.id == EmailDeliveryEvent.record_id)
         .outerjoin(Client, Client.id == Record.client_id)
         .outerjoin(Project, Project.id == Record.project_id)
@@ -56,53 +96,15 @@ def list_management_email_deliveries(db: Session, session: UserSession, filters)
     if filters.email_kinds:
         q = q.filter(EmailDeliveryEvent.email_kind.in_(filters.email_kinds))
 
-    events = q.order_by(EmailDeliveryEvent.event_at.desc()).limit(filters.limit).all()
-    record_ids = [str(event.record_id) for event in events if event.record_id]
-    record_context = {}
-    if record_ids:
-        context_rows = (
-            db.query(Record, Client, Project)
-            .outerjoin(Client, Client.id == Record.client_id)
-            .outerjoin(Project, Project.id == Record.project_id)
-            .filter(Record.id.in_(record_ids))
-            .all()
-        )
-        record_context = {str(record.id): (record, client, project) for record, client, project in context_rows}
-
-    items = []
-    for event in events:
-        record, client, project = record_context.get(str(event.record_id), (None, None, None))
-
-        items.append(
-            {
-                "id": str(event.id),
-                "job_id": str(event.job_id),
-                "status": event.status,
-                "email_kind": event.email_kind,
-                "notification_type": event.notification_type,
-                "template_id": event.template_id,
-                "subject": event.subject,
-                "recipient_count": int(event.recipient_count or 0),
-                "attachment_count": int(event.attachment_count or 0),
-                "inline_asset_count": int(event.inline_asset_count or 0),
-                "to": _json_list(event.to_json),
-                "cc": _json_list(event.cc_json),
-                "bcc": _json_list(event.bcc_json),
-                "scope_type": event.scope_type,
-                "scope_id": event.scope_id,
-                "record_id": str(event.record_id) if event.record_id else None,
-                "minute_title": getattr(record, "title", None) or "Sin minuta asociada",
-                "client": getattr(client, "name", None) or "Sin cliente",
-                "project": getattr(project, "name", None) or "Sin proyecto",
-                "actor_user_id": str(event.actor_user_id) if event.actor_user_id else None,
-                "tags": _json_list(event.tags_json),
-                "attempt": int(event.attempt or 1),
-                "error_message": _clean(event.error_message, "") or None,
-                "queued_at": event.queued_at,
-                "sent_at": event.sent_at,
-                "failed_at": event.failed_at,
-                "date": event.event_at,
-            }
-        )
+    q = q.order_by(EmailDeliveryEvent.event_at.desc())
+    if limit:
+        rows = q.limit(limit).all()
+    else:
+        rows = q.execution_options(stream_results=True, yield_per=STREAM_BATCH_SIZE)
+    for event, record, client, project in rows:
+        yield _email_delivery_row(event, record, client, project)
+
 
+def list_management_email_deliveries(db: Session, session: UserSession, filters) -> dict:
+    items = list(iter_management_email_deliveries(db, session, filters, limit=filters.limit))
     return {"items": items, "total": len(items)}
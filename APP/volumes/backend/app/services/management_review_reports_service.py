@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, time
+from typing import Iterator
 
 from sqlalchemy.orm import Session
 
@@ -12,6 +13,8 @@ from models.records import Record
 from schemas.auth import UserSession
 from services.access_control_service import apply_record_scope_filter
 
+STREAM_BATCH_SIZE = 500
+
 
 def _date_start(value):
     if not value:
@@ -25,7 +28,13 @@ def _date_end(value):
     return datetime.combine(value, time.max)
 
 
-def list_management_review_observations(db: Session, session: UserSession, filters) -> dict:
+def iter_management_review_observations(
+    db: Session,
+    session: UserSession,
+    filters,
+    *,
+    limit: int | None,
+) -> Iterator[dict]:
     q = (
         db.query(RecordVersionObservation, Record, RecordVersion, Client, Project)
         .join(Record, Record.id == RecordVersionObservation.record_id)
@@ -47,38 +56,38 @@ def list_management_review_observations(db: Session, session: UserSession, filte
     if filters.status:
         q = q.filter(RecordVersionObservation.status == filters.status)
 
-    rows = (
-        q.order_by(
-            RecordVersionObservation.created_at.desc(),
-            RecordVersionObservation.id.desc(),
-        )
-        .limit(filters.limit)
-        .all()
+    q = q.order_by(
+        RecordVersionObservation.created_at.desc(),
+        RecordVersionObservation.id.desc(),
     )
+    if limit:
+        rows = q.limit(limit).all()
+    else:
+        rows = q.execution_options(stream_results=True, yield_per=STREAM_BATCH_SIZE)
 
-    items = []
     for observation, record, version, client, project in rows:
-        items.append(
-            {
-                "id": f"observation-{int(observation.id)}",
-                "observation_id": int(observation.id),
-                "record_id": str(record.id),
-                "record_version_id": str(version.id),
-                "version_num": int(version.version_num) if version.version_num is not None else None,
-                "title": record.title or "Minuta sin título",
-                "client": client.name if client else "Sin cliente",
-                "project": project.name if project else "Sin proyecto",
-                "author_email": observation.author_email,
-                "author_name": observation.author_name,
-                "status": observation.status,
-                "resolution_type": observation.resolution_type,
-                "body": observation.body,
-                "editor_comment": observation.editor_comment,
-                "created_at": observation.created_at,
-                "resolved_at": observation.resolved_at,
-            }
-        )
+        yield {
+            "id": f"observation-{int(observation.id)}",
+            "observation_id": int(observation.id),
+            "record_id": str(record.id),
+            "record_version_id": str(version.id),
+            "version_num": int(version.version_num) if version.version_num is not None else None,
+            "title": record.title or "Minuta sin título",
+            "client": client.name if client else "Sin cliente",
+            "project": project.name if project else "Sin proyecto",
+            "author_email": observation.author_email,
+            "author_name": observation.author_name,
+            "status": observation.status,
+            "resolution_type": observation.resolution_type,
+            "body": observation.body,
+            "editor_comment": observation.editor_comment,
+            "created_at": observation.created_at,
+            "resolved_at": observation.resolved_at,
+        }
 
+
+def list_management_review_observations(db: Session, session: UserSession, filters) -> dict:
+    items = list(iter_management_review_observations(db, session, filters, limit=filters.limit))
     return {
         "items": items,
         "total": len(items),
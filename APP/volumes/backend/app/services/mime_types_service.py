@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
 from models.mime_types import MimeType
+from services.catalog_registry import notify_catalog_changed
 
 
 def _user_ref(u) -> dict | None:
@@ -115,6 +116,7 @@ def create_mime_type(db: Session, body, created_by_id: str) -> dict:
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("mime_types")
     db.refresh(obj)
 
     obj = _get_or_404(db, obj.id)
@@ -138,6 +140,7 @@ def update_mime_type(db: Session, id: int, body, updated_by_id: str) -> dict:
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("mime_types")
     db.refresh(obj)
 
     obj = _get_or_404(db, obj.id)
@@ -152,6 +155,7 @@ def change_mime_type_status(db: Session, id: int, is_active: bool, updated_by_id
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("mime_types")
     db.refresh(obj)
 
     obj = _get_or_404(db, obj.id)
@@ -168,3 +172,4 @@ def delete_mime_type(db: Session, id: int, deleted_by_id: str) -> None:
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("mime_types")
@@ -18,7 +18,6 @@ from core.datetime_utils import normalize_datetime_strings_to_utc_z, utc_isoform
 from core.exceptions import UnauthorizedException
 from core.rate_limit import enforce_rate_limit, rate_limit_key
 from core.security import create_access_token, decode_access_token
-from db.minio_client import get_minio_client
 from db.redis import get_redis
 from db.session import SessionLocal
 from models.record_version_observation import RecordVersionObservation
@@ -47,8 +46,10 @@ from schemas.minute_observations import (
 from services.notification_center_service import create_in_app_notification
 from services.email_queue import queue_templated_email
 from services.email_branding_service import build_email_branding_bundle
+from services.minutes import catalogs as minute_catalogs
 from services.minutes_service import get_minute_detail, get_minute_versions
 from services.notification_service import enqueue_minute_guest_observation_email
+from services.object_delivery_service import StoredObjectRef
 from services.sse_instrumentation import new_sse_connection_id, sse_duration_ms, sse_log
 from utils.device import get_device_string
 from utils.network import get_client_ip
@@ -1126,12 +1127,12 @@ def get_minute_view_detail(
     )
 
 
-def get_minute_view_pdf_bytes(db: Session, *, record_id: str) -> tuple[bytes, str]:
+def get_minute_view_pdf_object(db: Session, *, record_id: str) -> StoredObjectRef:
     record = _resolve_record_or_404(db, record_id)
     if not record.active_version_id:
         raise HTTPException(status_code=404, detail="La minuta no tiene una versión activa con PDF")
 
-    status_row = db.query(RecordStatus).filter(RecordStatus.id == record.status_id).first()
+    status_row = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     status_code = str(getattr(status_row, "code", "") or "").strip().lower()
     if status_code == "completed":
         bucket = "minuetaitor-published"
@@ -1142,18 +1143,13 @@ def get_minute_view_pdf_bytes(db: Session, *, record_id: str) -> tuple[bytes, st
         key = f"drafts/{record_id}/draft_current.pdf"
         missing_message = "El PDF de revisión aún no está disponible para esta minuta"
 
-    minio = get_minio_client()
-    try:
-        obj = minio.get_object(bucket, key)
-        pdf_bytes = obj.read()
-        obj.close()
-        obj.release_conn()
-    except Exception as exc:
-        raise HTTPException(status_code=404, detail=missing_message) from exc
-
-    if not pdf_bytes:
-        raise HTTPException(status_code=404, detail=missing_message)
-    return pdf_bytes, f"minute-{record_id}.pdf"
+    return StoredObjectRef(
+        bucket=bucket,
+        key=key,
+        filename=f"minute-{record_id}.pdf",
+        media_type="application/pdf",
+        missing_detail=missing_message,
+    )
 
 
 async def create_minute_view_observation(
@@ -1166,7 +1162,7 @@ async def create_minute_view_observation(
     record = _resolve_record_or_404(db, record_id)
     if not record.active_version_id:
         raise HTTPException(status_code=409, detail="La minuta no tiene una versión activa para registrar observaciones")
-    status_row = db.query(RecordStatus).filter(RecordStatus.id == record.status_id).first()
+    status_row = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     status_code = str(getattr(status_row, "code", "") or "").strip().lower()
     if status_code != "preview":
         raise HTTPException(
@@ -1290,7 +1286,7 @@ def _ensure_public_observation_mutable(
     visitor_session: VisitorSession,
 ) -> tuple[Record, RecordVersionObservation]:
     record = _resolve_record_or_404(db, record_id)
-    status_row = db.query(RecordStatus).filter(RecordStatus.id == record.status_id).first()
+    status_row = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     status_code = str(getattr(status_row, "code", "") or "").strip().lower()
     if status_code != "preview":
         raise HTTPException(
@@ -7,22 +7,23 @@ from typing import Optional
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
-from db.minio_client import get_minio_client
 from models.objects import Object
 from models.record_artifacts import RecordArtifact
 
 from services.minutes.constants import BUCKET_INPUTS
+from services.object_delivery_service import StoredObjectRef
 from services.minutes.sanitizers import detect_input_file_type
 
 logger = logging.getLogger(__name__)
 
 
-def get_minute_attachment_blob(
+def get_minute_attachment_object(
     db: Session,
     record_id: str,
     sha256: str | None = None,
     file_name: str | None = None,
-) -> tuple[bytes, str, str]:
+) -> StoredObjectRef:
+    """Resuelve el adjunto en MinIO; el contenido se entrega en streaming desde el router."""
     obj = _resolve_attachment_object(
         db=db,
         record_id=record_id,
@@ -39,30 +40,16 @@ def get_minute_attachment_blob(
             },
         )
 
-    minio = get_minio_client()
-    try:
-        response = minio.get_object(BUCKET_INPUTS, obj.object_key)
-        file_bytes = response.read()
-        response.close()
-        response.release_conn()
-    except Exception as exc:
-        logger.error(
-            "[minutes] No se pudo leer adjunto desde MinIO | record=%s sha=%s err=%s",
-            record_id,
-            sha256,
-            exc,
-        )
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "attachment_unavailable",
-                "message": "El archivo adjunto no esta disponible en almacenamiento.",
-            },
-        )
-
-    filename = Path(obj.object_key).name or f"{sha256}.bin"
-    mime_type = obj.content_type or "application/octet-stream"
-    return file_bytes, mime_type, filename
+    return StoredObjectRef(
+        bucket=BUCKET_INPUTS,
+        key=obj.object_key,
+        filename=Path(obj.object_key).name or f"{sha256}.bin",
+        media_type=obj.content_type or "application/octet-stream",
+        missing_detail={
+            "error": "attachment_unavailable",
+            "message": "El archivo adjunto no esta disponible en almacenamiento.",
+        },
+    )
 
 
 def _resolve_attachment_object(
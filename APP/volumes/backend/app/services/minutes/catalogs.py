@@ -2,12 +2,17 @@ from __future__ import annotations
 
 from sqlalchemy.orm import Session
 
+from services.catalog_registry import CatalogEntry, catalog_registry
+
 
 def get_catalog_id(db: Session, model, code: str):
-    obj = db.query(model).filter_by(code=code).first()
-    if not obj:
-        raise RuntimeError(
-            f"Catalog '{model.__tablename__}' with code='{code}' not found. Verify seeds."
-        )
-    return obj.id
+    return catalog_registry.get_id(db, model, code)
+
+
+def get_catalog_entry(db: Session, model, id) -> CatalogEntry | None:
+    """Fila de catálogo por id desde la caché de proceso (expone `code` y `name`)."""
+    return catalog_registry.find_by_id(db, model, id)
+
 
+def find_catalog_entry_by_code(db: Session, model, code: str) -> CatalogEntry | None:
+    return catalog_registry.find_by_code(db, model, code)
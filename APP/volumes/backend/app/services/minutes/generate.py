@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 import logging
 import uuid
 from pathlib import Path
@@ -10,13 +9,13 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from core.config import settings
-from db.minio_client import get_minio_client
 from models.ai_profiles import AiProfile
 from models.minute_transaction import MinuteTransaction
 from models.records import Record
 from schemas.minutes import MinuteGenerateRequest, MinuteGenerateResponse
 from services.minutes import catalogs as minute_catalogs
 from services.minutes import constants as minute_constants
+from services.minutes import ingest as minute_ingest
 from services.minutes import queue as minute_queue
 from services.minutes import sanitizers as minute_sanitizers
 from services.minutes.status_transitions import append_record_status_transition
@@ -91,7 +90,6 @@ async def generate_minute(
     from models.record_types import RecordType
 
     request = minute_sanitizers.sanitize_generate_request(request)
-    minio = get_minio_client()
 
     bucket_inputs_id = minute_catalogs.get_catalog_id(
         db,
@@ -127,39 +125,34 @@ async def generate_minute(
     record_id = str(uuid.uuid4())
     transaction_id = str(uuid.uuid4())
 
+    # Validación, normalización y subida en streaming, en paralelo por archivo.
+    ingested_uploads = await minute_ingest.ingest_upload_files(
+        files,
+        bucket=minute_constants.BUCKET_INPUTS,
+        key_prefix=f"{record_id}/inputs",
+        max_bytes=settings.minutes_max_file_size_mb * 1024 * 1024,
+    )
+
     input_objects_meta = []
     summary_candidates: list[bytes] = []
-    for upload in files:
-        raw, safe_name, mime, sha = await minute_sanitizers.sanitize_upload_file(
-            upload,
-            max_bytes=settings.minutes_max_file_size_mb * 1024 * 1024,
-        )
-        obj_key = f"{record_id}/inputs/{safe_name}"
+    for ingested in ingested_uploads:
         obj_id = str(uuid.uuid4())
-        ext = Path(safe_name).suffix.lstrip(".")
-
-        minio.put_object(
-            bucket_name=minute_constants.BUCKET_INPUTS,
-            object_name=obj_key,
-            data=io.BytesIO(raw),
-            length=len(raw),
-            content_type=mime,
-        )
+        ext = Path(ingested.filename).suffix.lstrip(".")
 
-        is_transcript = minute_sanitizers.detect_input_file_type(safe_name) == "transcript"
+        is_transcript = minute_sanitizers.detect_input_file_type(ingested.filename) == "transcript"
         art_type_id = art_transcript_id if is_transcript else art_summary_id
         if not is_transcript:
-            summary_candidates.append(raw)
+            summary_candidates.append(ingested.head)
 
         db.add(
             minute_storage.build_object_row(
                 obj_id,
                 bucket_inputs_id,
-                obj_key,
-                mime,
+                ingested.object_key,
+                ingested.mime_type,
                 ext,
-                len(raw),
-                sha,
+                ingested.size_bytes,
+                ingested.sha256,
                 requested_by_id,
             )
         )
@@ -167,13 +160,13 @@ async def generate_minute(
         input_objects_meta.append(
             {
                 "obj_id": obj_id,
-                "obj_key": obj_key,
-                "sha256": sha,
-                "size_bytes": len(raw),
-                "mime": mime,
+                "obj_key": ingested.object_key,
+                "sha256": ingested.sha256,
+                "size_bytes": ingested.size_bytes,
+                "mime": ingested.mime_type,
                 "art_type_id": art_type_id,
                 "art_state_id": art_state_ready_id,
-                "filename": safe_name,
+                "filename": ingested.filename,
             }
         )
 
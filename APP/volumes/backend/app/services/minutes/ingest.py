@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from fastapi import HTTPException, UploadFile
+
+from db.minio_client import get_minio_client
+from services.file_sanitizer import FileSanitizationError, StreamingFileSanitizer
+from services.minutes.sanitizers import sanitize_filename
+
+logger = logging.getLogger(__name__)
+
+INGEST_CHUNK_SIZE = 1024 * 1024
+# MinIO exige partes de al menos 5 MiB; los archivos menores van en un solo PUT.
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+INTRO_HEAD_BYTES = 8 * 1024
+
+
+@dataclass(frozen=True)
+class IngestedUpload:
+    filename: str
+    object_key: str
+    mime_type: str
+    size_bytes: int
+    sha256: str
+    head: bytes
+
+
+class _SanitizingReader:
+    """Lector con `read(size)` que MinIO consume por partes.
+
+    Cada lectura tira bloques del archivo original a través del sanitizador,
+    así validación, normalización, hash y subida avanzan juntos.
+    """
+
+    def __init__(self, source: BinaryIO, sanitizer: StreamingFileSanitizer) -> None:
+        self._source = source
+        self._sanitizer = sanitizer
+        self._buffer = bytearray()
+        self._eof = False
+        self.head = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self._source.read(INGEST_CHUNK_SIZE)
+            if chunk:
+                self._push(self._sanitizer.feed(chunk))
+            else:
+                self._push(self._sanitizer.finish())
+                self._eof = True
+
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+    def _push(self, data: bytes) -> None:
+        if not data:
+            return
+        if len(self.head) < INTRO_HEAD_BYTES:
+            self.head += data[: INTRO_HEAD_BYTES - len(self.head)]
+        self._buffer += data
+
+
+def _trim_utf8_tail(data: bytes) -> bytes:
+    """Evita cortar un carácter multibyte al recortar el inicio del archivo."""
+    for cut in range(min(4, len(data)) + 1):
+        candidate = data[: len(data) - cut]
+        try:
+            candidate.decode("utf-8")
+            return candidate
+        except UnicodeDecodeError:
+            continue
+    return data
+
+
+def ingest_upload_file(
+    upload: UploadFile,
+    *,
+    bucket: str,
+    object_key: str,
+    filename: str,
+    max_bytes: int,
+) -> IngestedUpload:
+    """Valida, normaliza y sube un adjunto a MinIO en streaming (bloqueante)."""
+    mime_type = upload.content_type or "application/octet-stream"
+    try:
+        sanitizer = StreamingFileSanitizer(filename, mime_type, max_bytes)
+        reader = _SanitizingReader(upload.file, sanitizer)
+        get_minio_client().put_object(
+            bucket_name=bucket,
+            object_name=object_key,
+            data=reader,
+            length=-1,
+            part_size=MULTIPART_PART_SIZE,
+            content_type=mime_type,
+        )
+    except FileSanitizationError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "invalid_attachment",
+                "message": f"Adjunto invalido: {exc}",
+            },
+        )
+
+    return IngestedUpload(
+        filename=filename,
+        object_key=object_key,
+        mime_type=mime_type,
+        size_bytes=sanitizer.output_size,
+        sha256=sanitizer.sha256,
+        head=_trim_utf8_tail(bytes(reader.head)),
+    )
+
+
+def _unique_filenames(filenames: list[str]) -> list[str]:
+    """Sufija `-2`, `-3`... a nombres repetidos: cada adjunto necesita su propia clave en MinIO."""
+    used: set[str] = set()
+    unique: list[str] = []
+    for filename in filenames:
+        candidate = filename
+        stem, ext = os.path.splitext(filename)
+        counter = 2
+        while candidate in used:
+            candidate = f"{stem}-{counter}{ext}"
+            counter += 1
+        used.add(candidate)
+        unique.append(candidate)
+    return unique
+
+
+async def ingest_upload_files(
+    uploads: list[UploadFile],
+    *,
+    bucket: str,
+    key_prefix: str,
+    max_bytes: int,
+) -> list[IngestedUpload]:
+    """
+    Sube en paralelo (fuera del event loop) todos los adjuntos de una solicitud.
+
+    Si alguno falla se eliminan los objetos ya subidos y se propaga el primer error.
+    """
+    # Las subidas corren en paralelo: dos nombres iguales competirían por el mismo objeto.
+    filenames = _unique_filenames([sanitize_filename(upload.filename) for upload in uploads])
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                ingest_upload_file,
+                upload,
+                bucket=bucket,
+                object_key=f"{key_prefix}/{filename}",
+                filename=filename,
+                max_bytes=max_bytes,
+            )
+            for upload, filename in zip(uploads, filenames)
+        ),
+        return_exceptions=True,
+    )
+
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if not errors:
+        return list(results)
+
+    uploaded_keys = [result.object_key for result in results if isinstance(result, IngestedUpload)]
+    if uploaded_keys:
+        await asyncio.to_thread(_remove_uploaded_objects, bucket, uploaded_keys)
+    raise errors[0]
+
+
+def _remove_uploaded_objects(bucket: str, object_keys: list[str]) -> None:
+    minio = get_minio_client()
+    for object_key in object_keys:
+        try:
+            minio.remove_object(bucket, object_key)
+        except Exception as cleanup_err:
+            logger.warning("[minutes] No se pudo limpiar adjunto %s: %s", object_key, cleanup_err)
@@ -27,6 +27,7 @@ from schemas.minutes import (
     MinuteVersionsResponse,
 )
 from services.access_control_service import apply_record_scope_filter
+from services.minutes import catalogs as minute_catalogs
 from services.minutes.attachments import list_minute_input_attachments
 from services.minutes.constants import (
     BUCKET_DRAFT,
@@ -117,7 +118,7 @@ def get_minute_detail(db: Session, record_id: str) -> MinuteDetailResponse:
             detail={"error": "record_not_found", "message": f"Minuta '{record_id}' no encontrada."},
         )
 
-    status_row = getattr(record, "status", None) or db.query(RecordStatus).filter_by(id=record.status_id).first()
+    status_row = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     status_code = status_row.code if status_row else "unknown"
 
     client_name = getattr(getattr(record, "client", None), "name", None)
@@ -233,7 +234,7 @@ def list_minutes(
         )
 
     if status_filter:
-        status_obj = db.query(RecordStatus).filter_by(code=status_filter).first()
+        status_obj = minute_catalogs.find_catalog_entry_by_code(db, RecordStatus, status_filter)
         if status_obj:
             query = query.filter(Record.status_id == status_obj.id)
 
@@ -314,7 +315,7 @@ def list_minutes(
 
     items = []
     for rec in records:
-        status_row = getattr(rec, "status", None) or db.query(RecordStatus).filter_by(id=rec.status_id).first()
+        status_row = minute_catalogs.get_catalog_entry(db, RecordStatus, rec.status_id)
         status_code = status_row.code if status_row else "unknown"
 
         client_name = getattr(getattr(rec, "client", None), "name", None)
@@ -441,7 +442,7 @@ def list_minute_reprocess_history(
         if not record_status_id:
             return None
         if record_status_id not in status_cache:
-            row = db.query(RecordStatus).filter_by(id=record_status_id).first()
+            row = minute_catalogs.get_catalog_entry(db, RecordStatus, record_status_id)
             status_cache[record_status_id] = row.code if row else "unknown"
         return status_cache.get(record_status_id)
 
@@ -4,12 +4,17 @@ import json
 import logging
 
 from db.redis import get_redis
+from services.queue_telemetry import stamp_job_envelope
 
 logger = logging.getLogger(__name__)
 
 
 async def enqueue_job(queue: str, job: dict) -> None:
     redis = get_redis()
+    stamp_job_envelope(job)
     await redis.rpush(queue, json.dumps(job))
-    logger.info("[minutes] Job queued | queue=%s type=%s", queue, job.get("type"))
+    logger.info(
+        "[minutes] Job queued | queue=%s type=%s trace_id=%s",
+        queue, job.get("type"), job["trace_id"],
+    )
 
@@ -267,7 +267,7 @@ async def reprocess_minute(
             },
         )
 
-    status_row = db.query(RecordStatus).filter_by(id=record.status_id).first()
+    status_row = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     record_status_code = status_row.code if status_row else "unknown"
     latest_tx = get_latest_minute_transaction(db, record_id)
     can_reprocess, reprocess_reason = get_reprocess_eligibility(record_status_code, latest_tx)
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 import re
-from copy import deepcopy
 from datetime import datetime, time as dt_time
 from pathlib import Path
 from typing import Any, Optional
@@ -11,22 +10,25 @@ from fastapi import HTTPException, UploadFile
 
 from schemas.minutes import MinuteGenerateRequest
 from services.file_sanitizer import FileSanitizationError, sanitize_file
+from services.text_sanitization import (
+    clean_optional_text,
+    collapse_text,
+    sanitize_dict_list,
+    sanitize_fields,
+)
 
-WHITESPACE_RE = re.compile(r"\s+")
 CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
 
-
-def collapse_text(value: Any, *, limit: int | None = None) -> str:
-    text = CONTROL_CHARS_RE.sub(" ", str(value or ""))
-    text = WHITESPACE_RE.sub(" ", text).strip()
-    if limit is not None:
-        return text[:limit]
-    return text
-
-
-def clean_optional_text(value: Any, *, limit: int | None = None) -> str | None:
-    text = collapse_text(value, limit=limit)
-    return text or None
+MEETING_INFO_LIMITS = {"title": 250, "location": 200, "preparedBy": 220}
+PARTICIPANT_LIMITS = {
+    "displayName": 220,
+    "fullName": 220,
+    "organization": 220,
+    "title": 160,
+    "email": 200,
+    "role": 80,
+}
+SCOPE_SECTION_LIMITS = {"title": 180, "summary": 2000, "type": 80}
 
 
 def clean_string_list(values: list[str] | None, *, unique: bool = True, limit: int | None = None) -> list[str]:
@@ -145,47 +147,25 @@ async def sanitize_upload_file(upload: UploadFile, *, max_bytes: int) -> tuple[b
 
 
 def sanitize_editor_content(content: dict[str, Any]) -> dict[str, Any]:
-    sanitized = deepcopy(content)
+    """
+    Limpia los campos de texto libre del editor.
+
+    Copy-on-write: el resultado comparte con `content` todo subárbol que no
+    cambió; no se debe mutar después asumiendo que es una copia profunda.
+    """
+    sanitized = dict(content)
 
     if isinstance(sanitized.get("meetingInfo"), dict):
-        meeting_info = sanitized["meetingInfo"]
-        for field, limit in (("title", 250), ("location", 200), ("preparedBy", 220)):
-            if field in meeting_info:
-                meeting_info[field] = clean_optional_text(meeting_info.get(field), limit=limit)
+        sanitized["meetingInfo"] = sanitize_fields(sanitized["meetingInfo"], MEETING_INFO_LIMITS)
 
     if isinstance(sanitized.get("additionalNote"), str):
         sanitized["additionalNote"] = clean_optional_text(sanitized.get("additionalNote"), limit=4000)
 
     if isinstance(sanitized.get("participants"), list):
-        cleaned_participants = []
-        for item in sanitized["participants"]:
-            if not isinstance(item, dict):
-                continue
-            current = dict(item)
-            for field, limit in (
-                ("displayName", 220),
-                ("fullName", 220),
-                ("organization", 220),
-                ("title", 160),
-                ("email", 200),
-                ("role", 80),
-            ):
-                if field in current:
-                    current[field] = clean_optional_text(current.get(field), limit=limit)
-            cleaned_participants.append(current)
-        sanitized["participants"] = cleaned_participants
+        sanitized["participants"] = sanitize_dict_list(sanitized["participants"], PARTICIPANT_LIMITS)
 
     if isinstance(sanitized.get("scopeSections"), list):
-        cleaned_sections = []
-        for section in sanitized["scopeSections"]:
-            if not isinstance(section, dict):
-                continue
-            current = dict(section)
-            for field, limit in (("title", 180), ("summary", 2000), ("type", 80)):
-                if field in current:
-                    current[field] = clean_optional_text(current.get(field), limit=limit)
-            cleaned_sections.append(current)
-        sanitized["scopeSections"] = cleaned_sections
+        sanitized["scopeSections"] = sanitize_dict_list(sanitized["scopeSections"], SCOPE_SECTION_LIMITS)
 
     return sanitized
 
@@ -59,10 +59,11 @@ from services.minutes.status_transitions import append_record_status_transition
 from services.minutes import storage as minute_storage
 from services.notification_center_service import create_in_app_notification
 from services.minutes.attachments import (
-    get_minute_attachment_blob as get_minute_attachment_blob_use_case,
+    get_minute_attachment_object as get_minute_attachment_object_use_case,
     list_minute_input_attachments as list_minute_input_attachments_use_case,
 )
 from services.notification_service import enqueue_minute_review_email
+from services.object_delivery_service import StoredObjectRef
 logger = logging.getLogger(__name__)
 
 # ─── Constantes de catálogo ───────────────────────────────────────────────────
@@ -137,13 +138,7 @@ PROMPT_FILE = getattr(settings, "openai_system_prompt", "system_prompt_v08.txt")
 # ─── Helpers de catálogo ──────────────────────────────────────────────────────
 
 def _get_catalog_id(db: Session, model, code: str):
-    obj = db.query(model).filter_by(code=code).first()
-    if not obj:
-        raise RuntimeError(
-            f"Catálogo '{model.__tablename__}' con code='{code}' no encontrado. "
-            "Verifica los seeds."
-        )
-    return obj.id
+    return minute_catalogs.get_catalog_id(db, model, code)
 
 
 def _calculate_prompt_sha() -> str:
@@ -233,73 +228,25 @@ def _load_minute_list_summary(minio, record_id: str, status_code: str, version_n
     return None
 
 
-def get_minute_attachment_blob(
+def get_minute_attachment_object(
     db: Session,
     record_id: str,
     sha256: str | None = None,
     file_name: str | None = None,
-) -> tuple[bytes, str, str]:
-    return get_minute_attachment_blob_use_case(
-        db=db,
-        record_id=record_id,
-        sha256=sha256,
-        file_name=file_name,
-    )
-
+) -> StoredObjectRef:
     """
-    Retorna el binario real de un adjunto de entrada asociado a una minuta.
+    Ubica en MinIO un adjunto de entrada asociado a una minuta.
 
-    La resolución se hace por record_id + sha256 del objeto persistido en MinIO.
+    La resolución se hace por record_id + sha256 (o nombre de archivo).
     Solo permite archivos de input ubicados bajo {record_id}/inputs/.
     """
-    obj = (
-        db.query(Object)
-        .join(RecordArtifact, RecordArtifact.object_id == Object.id)
-        .filter(
-            RecordArtifact.record_id == record_id,
-            RecordArtifact.deleted_at.is_(None),
-            Object.deleted_at.is_(None),
-            Object.sha256 == sha256,
-            Object.object_key.like(f"{record_id}/inputs/%"),
-        )
-        .order_by(RecordArtifact.created_at.desc())
-        .first()
+    return get_minute_attachment_object_use_case(
+        db=db,
+        record_id=record_id,
+        sha256=sha256,
+        file_name=file_name,
     )
 
-    if not obj:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "attachment_not_found",
-                "message": "No se encontró el adjunto solicitado para esta minuta.",
-            },
-        )
-
-    minio = get_minio_client()
-    try:
-        response = minio.get_object(BUCKET_INPUTS, obj.object_key)
-        file_bytes = response.read()
-        response.close()
-        response.release_conn()
-    except Exception as exc:
-        logger.error(
-            "[minutes] No se pudo leer adjunto desde MinIO | record=%s sha=%s err=%s",
-            record_id,
-            sha256,
-            exc,
-        )
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "attachment_unavailable",
-                "message": "El archivo adjunto no está disponible en almacenamiento.",
-            },
-        )
-
-    filename = Path(obj.object_key).name or f"{sha256}.bin"
-    mime_type = obj.content_type or "application/octet-stream"
-    return file_bytes, mime_type, filename
-
 
 def list_minute_input_attachments(db: Session, record_id: str) -> list[dict[str, str]]:
     return list_minute_input_attachments_use_case(db=db, record_id=record_id)
@@ -645,7 +592,7 @@ def get_minute_detail(db: Session, record_id: str) -> MinuteDetailResponse:
         raise HTTPException(status_code=404,
             detail={"error": "record_not_found", "message": f"Minuta '{record_id}' no encontrada."})
 
-    status_row  = db.query(RecordStatus).filter_by(id=record.status_id).first()
+    status_row  = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     status_code = status_row.code if status_row else "unknown"
 
     client_name      = getattr(getattr(record, "client",  None), "name", None)
@@ -751,7 +698,7 @@ async def save_minute_draft(db: Session, record_id: str, content: dict) -> None:
         raise HTTPException(status_code=404,
             detail={"error": "record_not_found", "message": f"Minuta '{record_id}' no encontrada."})
 
-    status_row  = db.query(RecordStatus).filter_by(id=record.status_id).first()
+    status_row  = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     status_code = status_row.code if status_row else "unknown"
 
     if status_code != RECORD_STATUS_PENDING:
@@ -1006,7 +953,7 @@ async def save_minute_review_content(db: Session, record_id: str, content: dict[
             detail={"error": "record_not_found", "message": f"Minuta '{record_id}' no encontrada."},
         )
 
-    status_row = db.query(RecordStatus).filter_by(id=record.status_id).first()
+    status_row = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     status_code = str(getattr(status_row, "code", "") or "").strip().lower()
     if status_code != RECORD_STATUS_PREVIEW:
         raise HTTPException(
@@ -1188,7 +1135,7 @@ async def get_minute_pdf_preview_record_id(preview_id: str) -> str:
     return str(meta.get("record_id") or "")
 
 
-async def get_minute_pdf_preview_job_result(preview_id: str) -> bytes:
+async def get_minute_pdf_preview_job_object(preview_id: str) -> StoredObjectRef:
     redis = get_redis()
     raw_meta = await redis.get(_pdf_preview_meta_key(preview_id))
     if not raw_meta:
@@ -1198,24 +1145,28 @@ async def get_minute_pdf_preview_job_result(preview_id: str) -> bytes:
         )
 
     meta = json.loads(raw_meta)
-    minio = get_minio_client()
-    try:
-        obj = minio.get_object(meta["bucket"], meta["key"])
-        pdf_bytes = obj.read()
-        obj.close()
-        obj.release_conn()
-    except Exception:
-        raise HTTPException(
-            status_code=409,
-            detail={"error": "pdf_preview_not_ready", "message": "La vista previa aún se está generando."},
-        )
+    return StoredObjectRef(
+        bucket=meta["bucket"],
+        key=meta["key"],
+        filename="minute-preview.pdf",
+        media_type="application/pdf",
+        missing_status=409,
+        missing_detail={"error": "pdf_preview_not_ready", "message": "La vista previa aún se está generando."},
+    )
+
 
+async def discard_minute_pdf_preview_job_result(preview_id: str) -> None:
+    """Borra el PDF temporal y su metadata una vez entregado (es de un solo uso)."""
+    redis = get_redis()
+    raw_meta = await redis.get(_pdf_preview_meta_key(preview_id))
+    if not raw_meta:
+        return
+    meta = json.loads(raw_meta)
     try:
-        minio.remove_object(meta["bucket"], meta["key"])
+        get_minio_client().remove_object(meta["bucket"], meta["key"])
     except Exception as cleanup_err:
         logger.warning("[minutes] No se pudo borrar preview temporal %s: %s", meta.get("key"), cleanup_err)
     await redis.delete(_pdf_preview_meta_key(preview_id))
-    return pdf_bytes
 
 
 # ─── transition_minute ────────────────────────────────────────────────────────
@@ -1261,7 +1212,7 @@ async def transition_minute(
         raise HTTPException(status_code=404,
             detail={"error": "record_not_found", "message": f"Minuta '{record_id}' no encontrada."})
 
-    current_status_row  = db.query(RecordStatus).filter_by(id=record.status_id).first()
+    current_status_row  = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     current_status_code = current_status_row.code if current_status_row else "unknown"
     previous_status_id = record.status_id
 
@@ -1273,7 +1224,7 @@ async def transition_minute(
                                f"Válidas: {sorted(allowed) or 'ninguna (estado terminal)'}."})
 
     target_status_id = minute_catalogs.get_catalog_id(db, RecordStatus, target_status)
-    target_status_row = db.query(RecordStatus).filter_by(id=target_status_id).first()
+    target_status_row = minute_catalogs.get_catalog_entry(db, RecordStatus, target_status_id)
     snapshot_status_id = minute_catalogs.get_catalog_id(
         db,
         VersionStatus,
@@ -1617,7 +1568,7 @@ async def send_minute_email(
             detail={"error": "record_not_found", "message": f"Minuta '{record_id}' no encontrada."},
         )
 
-    current_status_row = db.query(RecordStatus).filter_by(id=record.status_id).first()
+    current_status_row = minute_catalogs.get_catalog_entry(db, RecordStatus, record.status_id)
     current_status_code = current_status_row.code if current_status_row else "unknown"
     allowed_statuses = {RECORD_STATUS_PREVIEW, RECORD_STATUS_COMPLETED}
     if current_status_code not in allowed_statuses:
@@ -1788,7 +1739,7 @@ def list_minute_cycle_times(
         )
 
     if status_filter:
-        status_obj = db.query(RecordStatus).filter_by(code=status_filter).first()
+        status_obj = minute_catalogs.find_catalog_entry_by_code(db, RecordStatus, status_filter)
         if status_obj:
             query = query.filter(Record.status_id == status_obj.id)
 
@@ -1828,7 +1779,7 @@ def list_minute_cycle_times(
 
     items = []
     for rec in records:
-        status_row   = db.query(RecordStatus).filter_by(id=rec.status_id).first()
+        status_row   = minute_catalogs.get_catalog_entry(db, RecordStatus, rec.status_id)
         status_code  = status_row.code if status_row else "unknown"
 
         client_name  = getattr(getattr(rec, "client",  None), "name", None)
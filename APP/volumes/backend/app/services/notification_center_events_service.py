@@ -12,7 +12,9 @@ from fastapi import Request
 
 from core.datetime_utils import normalize_datetime_strings_to_utc_z, utc_isoformat_z, utc_now
 from db.redis import get_redis
+from db.session import SessionLocal
 from schemas.auth import UserSession
+from services.notification_unread_counters_service import get_unread_count
 from services.sse_instrumentation import new_sse_connection_id, sse_duration_ms, sse_log
 
 logger = logging.getLogger(__name__)
@@ -38,15 +40,44 @@ def _sse_event(event: str, data: dict) -> str:
     return f"event: {event}\ndata: {json.dumps(normalize_datetime_strings_to_utc_z(data))}\n\n"
 
 
-async def publish_notification_event(user_id: str, event: str, payload: dict) -> None:
-    redis = get_redis()
+def _notification_event_body(user_id: str, event: str, payload: dict, ts: str) -> str:
     body = {
         "event": event,
         "user_id": user_id,
-        "ts": utc_isoformat_z(utc_now()),
+        "ts": ts,
         **(payload or {}),
     }
-    await redis.publish(get_notification_events_channel(user_id), json.dumps(normalize_datetime_strings_to_utc_z(body)))
+    return json.dumps(normalize_datetime_strings_to_utc_z(body))
+
+
+async def publish_notification_event(user_id: str, event: str, payload: dict) -> None:
+    redis = get_redis()
+    body = _notification_event_body(user_id, event, payload, utc_isoformat_z(utc_now()))
+    await redis.publish(get_notification_events_channel(user_id), body)
+
+
+async def publish_notification_events(events: list[tuple[str, str, dict]]) -> None:
+    """Publica varios eventos en un solo round-trip (pipeline sin MULTI)."""
+    if not events:
+        return
+    redis = get_redis()
+    ts = utc_isoformat_z(utc_now())
+    async with redis.pipeline(transaction=False) as pipe:
+        for user_id, event, payload in events:
+            pipe.publish(get_notification_events_channel(user_id), _notification_event_body(user_id, event, payload, ts))
+        await pipe.execute()
+
+
+async def _initial_unread_count(user_id: str) -> int | None:
+    # Solo toca la BD si el contador aún no existe en Redis.
+    db = SessionLocal()
+    try:
+        return await get_unread_count(db, user_id)
+    except Exception as exc:
+        logger.warning("[notifications-sse] No se pudo obtener contador inicial | user=%s err=%s", user_id, exc)
+        return None
+    finally:
+        db.close()
 
 
 async def stream_user_notifications(session: UserSession, request: Request) -> AsyncGenerator[str, None]:
@@ -126,6 +157,12 @@ async def stream_user_notifications(session: UserSession, request: Request) -> A
     try:
         last_ping_at = started_at
 
+        # El contador viaja en el stream: al conectar y en cada evento posterior.
+        unread_count = await _initial_unread_count(session.user_id)
+        if unread_count is not None:
+            event_count += 1
+            yield _sse_event("unread_count", {"unread_count": unread_count})
+
         while True:
             now = time.monotonic()
             if await request.is_disconnected():
@@ -1,28 +1,48 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import HTTPException
-from sqlalchemy import func
+from sqlalchemy import exists, func, insert
 from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now
 from core.datetime_utils import utc_now_db
+from db.session import SessionLocal
 from models.notification_recipients import NotificationRecipient
+from models.notification_tags import NotificationTag
 from models.notifications import Notification
 from models.roles import Role
 from models.user_roles import UserRole
 from schemas.auth import UserSession
-from services.notification_center_events_service import publish_notification_event
+from services.notification_center_events_service import publish_notification_event, publish_notification_events
+from services.notification_unread_counters_service import (
+    adjust_unread_counters,
+    count_unread_from_db,
+    get_unread_count,
+)
 from services.notification_preferences_service import (
     apply_notification_preferences_filter,
     expand_always_included_recipients,
 )
 
 
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_TAG_MAX_LENGTH = 120
+NOTIFICATION_RECIPIENT_INSERT_BATCH = 1000
+NOTIFICATION_FANOUT_BATCH = 500
+# Audiencias más grandes se notifican en vivo fuera de la request.
+NOTIFICATION_FANOUT_INLINE_LIMIT = 200
+
+_background_fanouts: set[asyncio.Task] = set()
+
+
 def _utcnow() -> datetime:
     return utc_now()
 
@@ -65,6 +85,24 @@ def _clean_tags(tags: list[str] | None) -> list[str]:
     return clean
 
 
+def _tag_key(tag: str) -> str:
+    # rstrip: utf8mb4_bin es PAD SPACE, un espacio final del recorte no distingue claves.
+    return tag[:NOTIFICATION_TAG_MAX_LENGTH].lower().rstrip()
+
+
+def _tag_rows(notification_id: str, tags: list[str]) -> list[NotificationTag]:
+    rows: dict[str, NotificationTag] = {}
+    for tag in tags:
+        key = _tag_key(tag)
+        if key not in rows:
+            rows[key] = NotificationTag(
+                notification_id=notification_id,
+                tag_key=key,
+                tag=tag[:NOTIFICATION_TAG_MAX_LENGTH],
+            )
+    return list(rows.values())
+
+
 def _dedupe_user_ids(user_ids: list[str] | None) -> list[str]:
     seen: set[str] = set()
     clean: list[str] = []
@@ -100,7 +138,10 @@ def _actor_ref(user_obj) -> dict | None:
 
 
 def _build_item_response(obj: NotificationRecipient) -> dict:
-    notification = obj.notification
+    return _build_notification_payload(obj.notification, is_read=bool(obj.is_read), read_at=obj.read_at)
+
+
+def _build_notification_payload(notification: Notification, *, is_read: bool, read_at: datetime | None) -> dict:
     return {
         "id": str(notification.id),
         "notification_type": notification.notification_type,
@@ -114,8 +155,8 @@ def _build_item_response(obj: NotificationRecipient) -> dict:
         "actor": _actor_ref(getattr(notification, "actor_user", None)),
         "metadata": _json_loads(notification.metadata_json, {}),
         "created_at": _iso(notification.created_at),
-        "is_read": bool(obj.is_read),
-        "read_at": _iso(obj.read_at),
+        "is_read": bool(is_read),
+        "read_at": _iso(read_at),
     }
 
 
@@ -138,7 +179,12 @@ def _apply_list_filters(query, *, user_id: str, unread_only: bool, tag: str | No
         query = query.filter(NotificationRecipient.is_read.is_(False))
     normalized_tag = str(tag or "").strip()
     if normalized_tag:
-        query = query.filter(Notification.tags_json.like(f'%"{normalized_tag}"%'))
+        query = query.filter(
+            exists().where(
+                NotificationTag.notification_id == NotificationRecipient.notification_id,
+                NotificationTag.tag_key == _tag_key(normalized_tag),
+            )
+        )
     return query
 
 
@@ -147,51 +193,42 @@ def _normalized_tag(tag: str | None) -> str:
 
 
 def get_unread_notifications_count(db: Session, user_id: str) -> int:
-    count = (
-        db.query(func.count(NotificationRecipient.id))
-        .filter(
-            NotificationRecipient.user_id == user_id,
-            NotificationRecipient.is_hidden.is_(False),
-            NotificationRecipient.is_read.is_(False),
-        )
-        .scalar()
-        or 0
-    )
-    return int(count)
+    """COUNT directo en BD; la ruta normal usa el contador de Redis."""
+    return count_unread_from_db(db, [user_id]).get(str(user_id), 0)
+
+
+async def get_cached_unread_notifications_count(db: Session, user_id: str) -> int:
+    return await get_unread_count(db, user_id)
+
+
+async def _apply_unread_delta(db: Session, user_id: str, delta: int) -> int:
+    counts = await adjust_unread_counters(db, {str(user_id): delta})
+    return counts.get(str(user_id), 0)
 
 
 def list_notification_tags(db: Session, session: UserSession) -> dict:
+    count_expr = func.count(NotificationRecipient.id)
     rows = (
-        db.query(Notification.tags_json)
-        .join(NotificationRecipient, NotificationRecipient.notification_id == Notification.id)
+        db.query(func.min(NotificationTag.tag).label("tag"), count_expr.label("total"))
+        .join(NotificationRecipient, NotificationRecipient.notification_id == NotificationTag.notification_id)
         .filter(
             NotificationRecipient.user_id == session.user_id,
             NotificationRecipient.is_hidden.is_(False),
         )
+        .group_by(NotificationTag.tag_key)
+        .order_by(count_expr.desc(), NotificationTag.tag_key.asc())
         .all()
     )
 
-    seen: set[str] = set()
-    items: list[str] = []
-
-    for row in rows:
-        for tag in _json_loads(getattr(row, "tags_json", None), []):
-            value = str(tag or "").strip()
-            if not value:
-                continue
-            key = value.casefold()
-            if key in seen:
-                continue
-            seen.add(key)
-            items.append(value)
-
+    items = [str(row.tag) for row in rows]
     return {
         "items": items,
         "total": len(items),
+        "counts": {str(row.tag): int(row.total or 0) for row in rows},
     }
 
 
-def list_notifications(
+async def list_notifications(
     db: Session,
     session: UserSession,
     *,
@@ -209,8 +246,6 @@ def list_notifications(
     )
 
     total_query = db.query(func.count(NotificationRecipient.id))
-    if normalized_tag:
-        total_query = total_query.join(Notification, Notification.id == NotificationRecipient.notification_id)
     total = (
         _apply_list_filters(
             total_query,
@@ -231,7 +266,7 @@ def list_notifications(
     return {
         "items": [_build_item_response(item) for item in items],
         "total": int(total),
-        "unread_count": get_unread_notifications_count(db, session.user_id),
+        "unread_count": await get_unread_count(db, session.user_id),
         "skip": max(0, int(skip)),
         "limit": max(1, int(limit)),
     }
@@ -269,6 +304,7 @@ async def mark_notification_as_read(db: Session, session: UserSession, notificat
         obj.is_read = True
         obj.read_at = utc_now_db()
         db.commit()
+        unread_count = await _apply_unread_delta(db, session.user_id, -1)
 
         await publish_notification_event(
             session.user_id,
@@ -277,13 +313,17 @@ async def mark_notification_as_read(db: Session, session: UserSession, notificat
                 "notification_id": notification_id,
                 "is_read": True,
                 "read_at": _iso(obj.read_at),
+                "unread_count": unread_count,
             },
         )
+    else:
+        unread_count = await get_unread_count(db, session.user_id)
 
     return {
         "notification_id": notification_id,
         "is_read": True,
         "read_at": _iso(obj.read_at),
+        "unread_count": unread_count,
     }
 
 
@@ -299,7 +339,7 @@ async def update_notifications_read_state(
         return {
             "updated": 0,
             "message": "No se recibieron notificaciones para actualizar.",
-            "unread_count": get_unread_notifications_count(db, session.user_id),
+            "unread_count": await get_unread_count(db, session.user_id),
             "notification_ids": [],
             "is_read": bool(is_read),
         }
@@ -331,8 +371,10 @@ async def update_notifications_read_state(
 
     if updated:
         db.commit()
+        unread_count = await _apply_unread_delta(db, session.user_id, -updated if is_read else updated)
+    else:
+        unread_count = await get_unread_count(db, session.user_id)
 
-    unread_count = get_unread_notifications_count(db, session.user_id)
     event_name = "notifications_read_state_updated"
     if updated_ids:
         await publish_notification_event(
@@ -376,18 +418,23 @@ async def mark_all_notifications_as_read(db: Session, session: UserSession) -> d
 
     if updated:
         db.commit()
+        unread_count = await _apply_unread_delta(db, session.user_id, -updated)
         await publish_notification_event(
             session.user_id,
             "notifications_read_all",
             {
                 "updated": updated,
                 "read_at": _iso(now),
+                "unread_count": unread_count,
             },
         )
+    else:
+        unread_count = await get_unread_count(db, session.user_id)
 
     return {
         "updated": updated,
         "message": "Notificaciones marcadas como leídas.",
+        "unread_count": unread_count,
     }
 
 
@@ -404,10 +451,14 @@ async def hide_notification(db: Session, session: UserSession, notification_id:
     if not obj:
         raise HTTPException(status_code=404, detail="NOTIFICATION_NOT_FOUND")
 
+    was_unread = not obj.is_read
     obj.is_hidden = True
     obj.hidden_at = utc_now_db()
     db.commit()
-    unread_count = get_unread_notifications_count(db, session.user_id)
+    if was_unread:
+        unread_count = await _apply_unread_delta(db, session.user_id, -1)
+    else:
+        unread_count = await get_unread_count(db, session.user_id)
 
     await publish_notification_event(
         session.user_id,
@@ -439,7 +490,7 @@ async def clear_notifications(
         return {
             "hidden": 0,
             "message": "No se recibieron notificaciones visibles para limpiar.",
-            "unread_count": get_unread_notifications_count(db, session.user_id),
+            "unread_count": await get_unread_count(db, session.user_id),
             "notification_ids": [],
         }
 
@@ -454,18 +505,19 @@ async def clear_notifications(
     )
 
     hidden = 0
+    hidden_unread = 0
     hidden_ids: list[str] = []
     for row in rows:
+        if not row.is_read:
+            hidden_unread += 1
         row.is_hidden = True
         row.hidden_at = now
         hidden += 1
         hidden_ids.append(str(row.notification_id))
 
-    unread_count = get_unread_notifications_count(db, session.user_id) if not hidden else 0
-
     if hidden:
         db.commit()
-        unread_count = get_unread_notifications_count(db, session.user_id)
+        unread_count = await _apply_unread_delta(db, session.user_id, -hidden_unread)
         await publish_notification_event(
             session.user_id,
             "notifications_cleared",
@@ -476,6 +528,8 @@ async def clear_notifications(
                 "unread_count": unread_count,
             },
         )
+    else:
+        unread_count = await get_unread_count(db, session.user_id)
 
     return {
         "hidden": hidden,
@@ -504,6 +558,72 @@ def _resolve_role_recipient_ids(db: Session, role_codes: list[str] | None) -> li
     return [str(row.user_id) for row in rows]
 
 
+def _bulk_insert_recipients(db: Session, notification_id: str, user_ids: list[str], now: datetime) -> None:
+    """INSERT multi-fila por lotes en lugar de un objeto ORM por destinatario."""
+    for start in range(0, len(user_ids), NOTIFICATION_RECIPIENT_INSERT_BATCH):
+        chunk = user_ids[start:start + NOTIFICATION_RECIPIENT_INSERT_BATCH]
+        db.execute(
+            insert(NotificationRecipient),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "notification_id": notification_id,
+                    "user_id": user_id,
+                    "is_read": False,
+                    "read_at": None,
+                    "is_hidden": False,
+                    "hidden_at": None,
+                    "delivered_at": now,
+                    "created_at": now,
+                }
+                for user_id in chunk
+            ],
+        )
+
+
+async def _fan_out_notification(db: Session, payload: dict, user_ids: list[str]) -> None:
+    """Ajusta contadores y publica `notification_created` en pipeline, por lotes."""
+    for start in range(0, len(user_ids), NOTIFICATION_FANOUT_BATCH):
+        chunk = user_ids[start:start + NOTIFICATION_FANOUT_BATCH]
+        unread_counts = await adjust_unread_counters(db, {user_id: 1 for user_id in chunk})
+        await publish_notification_events(
+            [
+                (
+                    user_id,
+                    "notification_created",
+                    {
+                        "notification": payload,
+                        "unread_count": unread_counts.get(user_id, 0),
+                    },
+                )
+                for user_id in chunk
+            ]
+        )
+
+
+async def _run_background_fanout(payload: dict, user_ids: list[str]) -> None:
+    db = SessionLocal()
+    try:
+        await _fan_out_notification(db, payload, user_ids)
+    except Exception as exc:
+        # Las filas ya están persistidas; la reconciliación corrige los contadores.
+        logger.error(
+            "notification_fanout: fallo en segundo plano | notification=%s recipients=%s err=%s",
+            payload.get("id"),
+            len(user_ids),
+            exc,
+            exc_info=True,
+        )
+    finally:
+        db.close()
+
+
+def _schedule_background_fanout(payload: dict, user_ids: list[str]) -> None:
+    task = asyncio.create_task(_run_background_fanout(payload, list(user_ids)))
+    _background_fanouts.add(task)
+    task.add_done_callback(_background_fanouts.discard)
+
+
 async def create_in_app_notification(
     db: Session,
     *,
@@ -547,13 +667,14 @@ async def create_in_app_notification(
         }
 
     now = utc_now_db()
+    clean_tags = _clean_tags(tags)
     notification = Notification(
         id=str(uuid.uuid4()),
         notification_type=str(notification_type or "general.notice").strip()[:80],
         level=str(level or "info").strip()[:20] or "info",
         title=str(title or "Notificación").strip()[:200],
         message=str(message or "").strip()[:2000],
-        tags_json=_json_dumps(_clean_tags(tags)),
+        tags_json=_json_dumps(clean_tags),
         scope_type=str(scope_type or "").strip()[:80] or None,
         scope_id=str(scope_id or "").strip()[:64] or None,
         action_url=str(action_url or "").strip()[:255] or None,
@@ -563,61 +684,18 @@ async def create_in_app_notification(
     )
     db.add(notification)
     db.flush()
+    db.add_all(_tag_rows(notification.id, clean_tags))
 
-    for user_id in resolved_user_ids:
-        db.add(
-            NotificationRecipient(
-                id=str(uuid.uuid4()),
-                notification_id=notification.id,
-                user_id=user_id,
-                is_read=False,
-                read_at=None,
-                delivered_at=now,
-                created_at=now,
-            )
-        )
-
+    _bulk_insert_recipients(db, notification.id, resolved_user_ids, now)
     db.commit()
 
-    persisted = (
-        _base_recipient_query(db)
-        .filter(
-            NotificationRecipient.notification_id == notification.id,
-            NotificationRecipient.user_id.in_(resolved_user_ids),
-        )
-        .all()
-    )
-
-    items_by_user = {
-        str(item.user_id): _build_item_response(item)
-        for item in persisted
-    }
-    unread_counts = {
-        str(user_id): int(count or 0)
-        for user_id, count in (
-            db.query(NotificationRecipient.user_id, func.count(NotificationRecipient.id))
-            .filter(
-                NotificationRecipient.user_id.in_(resolved_user_ids),
-                NotificationRecipient.is_hidden.is_(False),
-                NotificationRecipient.is_read.is_(False),
-            )
-            .group_by(NotificationRecipient.user_id)
-            .all()
-        )
-    }
-
-    for user_id in resolved_user_ids:
-        payload = items_by_user.get(user_id)
-        if not payload:
-            continue
-        await publish_notification_event(
-            user_id,
-            "notification_created",
-            {
-                "notification": payload,
-                "unread_count": unread_counts.get(user_id, 0),
-            },
-        )
+    # Todos los destinatarios reciben el mismo payload (no leída), así que
+    # se arma una vez en lugar de releer N filas de notification_recipients.
+    payload = _build_notification_payload(notification, is_read=False, read_at=None)
+    if len(resolved_user_ids) > NOTIFICATION_FANOUT_INLINE_LIMIT:
+        _schedule_background_fanout(payload, resolved_user_ids)
+    else:
+        await _fan_out_notification(db, payload, resolved_user_ids)
 
     return {
         "created_notifications": 1,
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import base64
-import hashlib
 import json
 import logging
 import os
@@ -28,8 +26,9 @@ from models.user import User
 from models.user_client_acl import UserClientAcl, UserClientAclPermission
 from models.user_project_acl import UserProjectACL, UserProjectPermission
 from schemas.sendmail import InlineAsset
+from services.email_blob_store import email_attachment_from_bytes
 from services.email_branding_service import build_email_branding_bundle
-from services.email_queue import queue_templated_email
+from services.email_queue import TemplatedEmailMessage, queue_templated_email, queue_templated_email_batch
 from services.public_url_service import build_public_url
 
 logger = logging.getLogger(__name__)
@@ -663,13 +662,12 @@ def _minute_pdf_attachment(record_id: str, *, published: bool = False) -> dict[s
     if not pdf_bytes:
         return None
 
-    return {
-        "filename": f"minute-{record_id}-official.pdf" if published else f"minute-{record_id}.pdf",
-        "mime_type": "application/pdf",
-        "content_base64": base64.b64encode(pdf_bytes).decode("ascii"),
-        "size_bytes": len(pdf_bytes),
-        "sha256": hashlib.sha256(pdf_bytes).hexdigest(),
-    }
+    # Se copia al almacén por contenido: draft_current.pdf puede cambiar antes del envío.
+    return email_attachment_from_bytes(
+        f"minute-{record_id}-official.pdf" if published else f"minute-{record_id}.pdf",
+        pdf_bytes,
+        "application/pdf",
+    )
 
 
 async def _safe_queue_template(
@@ -1079,7 +1077,7 @@ async def enqueue_minute_review_email(
         "KEY_POINT_3": points[2] if len(points) > 2 else "Responder dentro del plazo definido.",
         "ATTACHMENT_NAME": attachment["filename"] if attachment else "Documento disponible en plataforma",
         "ATTACHMENT_TYPE": "PDF" if attachment else "Enlace",
-        "ATTACHMENT_SIZE": _human_size(len(base64.b64decode(attachment["content_base64"]))) if attachment else "-",
+        "ATTACHMENT_SIZE": _human_size(attachment.get("size_bytes")) if attachment else "-",
         "MINUTE_ID": record.id,
         "MINUTE_VERSION": getattr(version, "version_num", record.latest_version_num or 1),
         "APPROVAL_DAYS": _approval_days(),
@@ -1658,7 +1656,7 @@ async def enqueue_pending_publication_reminders(db: Session) -> int:
         .all()
     )
 
-    sent = 0
+    messages: list[TemplatedEmailMessage] = []
     for record in records:
         owner_email = _safe_email(getattr(record.prepared_by_user, "email", None)) or _safe_email(getattr(record.created_by_user, "email", None))
         if not owner_email:
@@ -1680,12 +1678,28 @@ async def enqueue_pending_publication_reminders(db: Session) -> int:
             "REQUEST_ID": str(uuid.uuid4()),
             "REMINDER_RULE": f"stale-minute>{DEFAULT_REMINDER_HOURS}h",
         }
+        messages.append(
+            TemplatedEmailMessage(to=[owner_email], context=context, inline_assets=branding.inline_assets)
+        )
+
+    try:
+        return await queue_templated_email_batch("reminder_processed_not_published", messages)
+    except Exception as exc:
+        logger.warning(
+            "Notification batch enqueue failed, retrying per message | template=reminder_processed_not_published recipients=%d err=%s",
+            len(messages),
+            exc,
+        )
+
+    # El lote no dejó nada encolado: reintentar uno a uno para que un
+    # contexto que no renderiza no se lleve al resto.
+    sent = 0
+    for message in messages:
         if await _safe_queue_template(
-            to=[owner_email],
+            to=message.to,
             template_id="reminder_processed_not_published",
-            context=context,
-            inline_assets=branding.inline_assets,
+            context=message.context,
+            inline_assets=message.inline_assets,
         ):
             sent += 1
-
     return sent
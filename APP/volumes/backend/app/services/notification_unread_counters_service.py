@@ -0,0 +1,167 @@
+"""
+services/notification_unread_counters_service.py
+
+Contadores de notificaciones no leídas por usuario en Redis.
+
+MariaDB sigue siendo la fuente de verdad; Redis guarda un entero por usuario
+(`notifications:unread:<user_id>`) que se ajusta con deltas atómicos en cada
+operación de la bandeja. Reglas:
+
+- Los deltas solo se aplican si la clave existe; si no existe (o quedaría
+  negativa) se siembra con un COUNT real después del commit.
+- Cualquier error de Redis cae al COUNT en BD: el contador nunca bloquea la
+  operación de negocio.
+- `reconcile_unread_counters` corrige desvíos periódicamente con un
+  compare-and-set, sin pisar deltas concurrentes.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Iterable
+
+from redis.exceptions import RedisError
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from db.redis import get_redis
+from models.notification_recipients import NotificationRecipient
+
+logger = logging.getLogger(__name__)
+
+UNREAD_COUNTER_PREFIX = "notifications:unread:"
+UNREAD_COUNTER_TTL_SECONDS = 7 * 24 * 60 * 60
+RECONCILE_SCAN_BATCH = 500
+
+# Aplica el delta solo si el contador ya existe; retorna nil si hay que sembrarlo.
+_INCR_IF_EXISTS_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return nil
+end
+return redis.call('INCRBY', KEYS[1], ARGV[1])
+"""
+
+# Reemplaza el valor solo si nadie lo modificó desde que se leyó.
+_COMPARE_AND_SET_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  redis.call('SET', KEYS[1], ARGV[2], 'KEEPTTL')
+  return 1
+end
+return 0
+"""
+
+
+def unread_counter_key(user_id: str) -> str:
+    return f"{UNREAD_COUNTER_PREFIX}{user_id}"
+
+
+def count_unread_from_db(db: Session, user_ids: Iterable[str]) -> dict[str, int]:
+    ids = [str(user_id) for user_id in user_ids if user_id]
+    if not ids:
+        return {}
+    rows = (
+        db.query(NotificationRecipient.user_id, func.count(NotificationRecipient.id))
+        .filter(
+            NotificationRecipient.user_id.in_(ids),
+            NotificationRecipient.is_hidden.is_(False),
+            NotificationRecipient.is_read.is_(False),
+        )
+        .group_by(NotificationRecipient.user_id)
+        .all()
+    )
+    counts = {user_id: 0 for user_id in ids}
+    counts.update({str(user_id): int(count or 0) for user_id, count in rows})
+    return counts
+
+
+async def _seed_counters(db: Session, user_ids: list[str]) -> dict[str, int]:
+    counts = count_unread_from_db(db, user_ids)
+    redis = get_redis()
+    async with redis.pipeline(transaction=False) as pipe:
+        for user_id, count in counts.items():
+            pipe.set(unread_counter_key(user_id), count, ex=UNREAD_COUNTER_TTL_SECONDS)
+        await pipe.execute()
+    return counts
+
+
+async def get_unread_count(db: Session, user_id: str) -> int:
+    try:
+        cached = await get_redis().get(unread_counter_key(user_id))
+        if cached is not None and int(cached) >= 0:
+            return int(cached)
+        return (await _seed_counters(db, [user_id]))[str(user_id)]
+    except (RedisError, ValueError) as exc:
+        logger.warning("notification_unread: fallback a BD | user=%s err=%s", user_id, exc)
+        return count_unread_from_db(db, [user_id])[str(user_id)]
+
+
+async def adjust_unread_counters(db: Session, deltas: dict[str, int]) -> dict[str, int]:
+    """Aplica deltas ya confirmados en BD y retorna el contador resultante por usuario.
+
+    Debe llamarse después del commit: las claves ausentes o negativas se
+    siembran con un COUNT que ya incluye el cambio.
+    """
+    user_ids = [str(user_id) for user_id in deltas if user_id]
+    if not user_ids:
+        return {}
+
+    try:
+        redis = get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.eval(_INCR_IF_EXISTS_LUA, 1, unread_counter_key(user_id), int(deltas[user_id] or 0))
+            results = await pipe.execute()
+
+        counts: dict[str, int] = {}
+        missing: list[str] = []
+        for user_id, value in zip(user_ids, results):
+            if value is None or int(value) < 0:
+                missing.append(user_id)
+            else:
+                counts[user_id] = int(value)
+        if missing:
+            counts.update(await _seed_counters(db, missing))
+        return counts
+    except RedisError as exc:
+        logger.warning("notification_unread: fallback a BD | users=%s err=%s", len(user_ids), exc)
+        return count_unread_from_db(db, user_ids)
+
+
+async def reconcile_unread_counters(db: Session) -> dict[str, int]:
+    """Recorre los contadores existentes y corrige los que difieren de MariaDB."""
+    redis = get_redis()
+    scanned = 0
+    corrected = 0
+    batch: list[str] = []
+
+    async def _flush(keys: list[str]) -> int:
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key)
+            observed = await pipe.execute()
+
+        user_ids = [key[len(UNREAD_COUNTER_PREFIX):] for key in keys]
+        expected = count_unread_from_db(db, user_ids)
+        fixed = 0
+        async with redis.pipeline(transaction=False) as pipe:
+            pending = 0
+            for key, user_id, current in zip(keys, user_ids, observed):
+                if current is None or str(current) == str(expected[user_id]):
+                    continue
+                pipe.eval(_COMPARE_AND_SET_LUA, 1, key, str(current), expected[user_id])
+                pending += 1
+            if pending:
+                fixed = sum(int(value or 0) for value in await pipe.execute())
+        return fixed
+
+    async for key in redis.scan_iter(match=f"{UNREAD_COUNTER_PREFIX}*", count=RECONCILE_SCAN_BATCH):
+        batch.append(key)
+        scanned += 1
+        if len(batch) >= RECONCILE_SCAN_BATCH:
+            corrected += await _flush(batch)
+            batch = []
+    if batch:
+        corrected += await _flush(batch)
+
+    if corrected:
+        logger.info("notification_unread: reconciliación corrigió %s/%s contadores", corrected, scanned)
+    return {"scanned": scanned, "corrected": corrected}
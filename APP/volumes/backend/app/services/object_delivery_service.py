@@ -0,0 +1,175 @@
+"""
+services/object_delivery_service.py
+
+Entrega de PDFs y adjuntos almacenados en MinIO sin cargarlos en memoria.
+
+MinIO es interno (no expuesto al navegador), por lo que en vez de URLs
+prefirmadas el backend actúa como proxy en streaming:
+
+- `stat_object` entrega tamaño y ETag sin descargar el cuerpo.
+- `If-None-Match` responde 304 sin tocar el objeto.
+- `Range: bytes=...` (un solo rango) responde 206 pidiendo a MinIO solo ese
+  tramo; los visores PDF lo usan para abrir documentos grandes por partes.
+- El cuerpo se copia en bloques de `STREAM_CHUNK_SIZE`, así la RSS del
+  backend no depende del tamaño del archivo ni de cuántas descargas haya.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from minio.error import S3Error
+from starlette.background import BackgroundTask
+
+from db.minio_client import get_minio_client
+from services.upload_validation import safe_content_disposition
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+PRIVATE_REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class StoredObjectRef:
+    """Ubicación de un objeto en MinIO y cómo responder si no existe."""
+
+    bucket: str
+    key: str
+    filename: str
+    media_type: str = "application/octet-stream"
+    missing_status: int = status.HTTP_404_NOT_FOUND
+    missing_detail: Any = "El archivo solicitado no existe"
+
+
+def _missing(ref: StoredObjectRef) -> HTTPException:
+    return HTTPException(status_code=ref.missing_status, detail=ref.missing_detail)
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def parse_byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Retorna (inicio, fin) inclusivos para un único rango `bytes=`.
+
+    Retorna None si no hay rango o si tiene varios tramos (se sirve completo);
+    lanza 416 si el rango no se puede satisfacer.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start_raw, sep, end_raw = spec.strip().partition("-")
+    try:
+        if not sep:
+            raise ValueError(spec)
+        if start_raw == "":
+            suffix = int(end_raw)
+            if suffix <= 0:
+                raise ValueError(spec)
+            start, end = max(0, size - suffix), size - 1
+        else:
+            start = int(start_raw)
+            end = int(end_raw) if end_raw else size - 1
+            end = min(end, size - 1)
+    except ValueError:
+        start, end = size, -1
+
+    if start < 0 or start > end or start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail={"error": "range_not_satisfiable", "message": "El rango solicitado no es válido."},
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+def _iter_object(bucket: str, key: str, offset: int, length: int) -> Iterator[bytes]:
+    response = get_minio_client().get_object(bucket, key, offset=offset, length=length)
+    try:
+        yield from response.stream(STREAM_CHUNK_SIZE)
+    finally:
+        response.close()
+        response.release_conn()
+
+
+def stream_stored_object(
+    request: Request,
+    ref: StoredObjectRef,
+    *,
+    disposition: str = "attachment",
+    cache_control: str = PRIVATE_REVALIDATE_CACHE_CONTROL,
+    allow_ranges: bool = True,
+    conditional: bool = True,
+    background: BackgroundTask | None = None,
+) -> Response:
+    """Sirve un objeto de MinIO con ETag, 304 condicional y rangos de bytes.
+
+    `background` se ejecuta al terminar de enviar el cuerpo (p.ej. borrar
+    objetos temporales de un solo uso); con `allow_ranges=False` se ignora
+    `Range` para que el objeto siempre se entregue completo y con
+    `conditional=False` no se emite ETag ni se responde 304 (un objeto de un
+    solo uso no debe quedar sin consumir por una revalidación).
+    """
+    try:
+        stat = get_minio_client().stat_object(ref.bucket, ref.key)
+    except S3Error as exc:
+        if exc.code in {"NoSuchKey", "NoSuchObject", "NoSuchBucket"}:
+            raise _missing(ref) from exc
+        raise
+
+    size = max(int(stat.size or 0), 0)
+    etag = f'"{str(stat.etag or "").strip(chr(34))}"'
+    headers = {
+        "Cache-Control": cache_control,
+        "X-Content-Type-Options": "nosniff",
+    }
+    if conditional:
+        headers["ETag"] = etag
+    if allow_ranges:
+        headers["Accept-Ranges"] = "bytes"
+
+    if conditional and etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers, background=background)
+
+    headers["Content-Disposition"] = safe_content_disposition(ref.filename, disposition=disposition)
+    if size == 0:
+        # Objeto vacío: sin rangos que servir ni cuerpo que pedir a MinIO.
+        return Response(
+            content=b"",
+            status_code=status.HTTP_200_OK,
+            media_type=ref.media_type,
+            headers=headers,
+            background=background,
+        )
+
+    byte_range = None
+    if allow_ranges:
+        if_range = request.headers.get("if-range")
+        if not if_range or if_range.strip() == etag:
+            byte_range = parse_byte_range(request.headers.get("range"), size)
+
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        _iter_object(ref.bucket, ref.key, start, end - start + 1),
+        status_code=status_code,
+        media_type=ref.media_type,
+        headers=headers,
+        background=background,
+    )
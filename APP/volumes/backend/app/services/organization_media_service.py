@@ -5,7 +5,6 @@ import warnings
 import uuid
 
 from fastapi import HTTPException, UploadFile, status
-from minio.error import S3Error
 from PIL import Image, ImageOps, UnidentifiedImageError
 from sqlalchemy.orm import Session
 
@@ -14,6 +13,7 @@ from db.minio_client import get_minio_client
 from models.buckets import Bucket
 from models.objects import Object
 from models.organization_settings import OrganizationSetting
+from services.image_delivery_service import StoredImage, load_stored_image, remove_stored_image
 from services.upload_validation import validate_uploaded_image
 
 ORGANIZATION_MEDIA_BUCKET = "minuetaitor-attach"
@@ -248,11 +248,7 @@ async def _save_media(
     if previous_object and not getattr(previous_object, "deleted_at", None):
         previous_object.deleted_at = now
         previous_object.deleted_by = actor_user_id
-        try:
-            minio.remove_object(ORGANIZATION_MEDIA_BUCKET, previous_object.object_key)
-        except S3Error as exc:
-            if exc.code not in {"NoSuchKey", "NoSuchObject"}:
-                raise
+        remove_stored_image(ORGANIZATION_MEDIA_BUCKET, str(previous_object.id), previous_object.object_key)
 
     setattr(obj, object_attr, object_id)
     obj.updated_by = actor_user_id
@@ -279,12 +275,7 @@ def _remove_media(
         db.refresh(obj)
         return
 
-    minio = get_minio_client()
-    try:
-        minio.remove_object(ORGANIZATION_MEDIA_BUCKET, media_object.object_key)
-    except S3Error as exc:
-        if exc.code not in {"NoSuchKey", "NoSuchObject"}:
-            raise
+    remove_stored_image(ORGANIZATION_MEDIA_BUCKET, str(media_object.id), media_object.object_key)
 
     media_object.deleted_at = now
     media_object.deleted_by = actor_user_id
@@ -294,26 +285,17 @@ def _remove_media(
     db.refresh(obj)
 
 
-def _read_media(obj: OrganizationSetting, relationship_attr: str) -> tuple[bytes, str]:
+def _read_media(obj: OrganizationSetting, relationship_attr: str) -> StoredImage:
     media_object = getattr(obj, relationship_attr, None)
     if not media_object or getattr(media_object, "deleted_at", None):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Imagen no encontrada.")
 
-    minio = get_minio_client()
-    key = media_object.object_key
-
-    try:
-        stat = minio.stat_object(ORGANIZATION_MEDIA_BUCKET, key)
-        response = minio.get_object(ORGANIZATION_MEDIA_BUCKET, key)
-        try:
-            return response.read(), stat.content_type or "application/octet-stream"
-        finally:
-            response.close()
-            response.release_conn()
-    except S3Error as exc:
-        if exc.code in {"NoSuchKey", "NoSuchObject"}:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Imagen no encontrada.")
-        raise
+    return load_stored_image(
+        ORGANIZATION_MEDIA_BUCKET,
+        str(media_object.id),
+        media_object.object_key,
+        not_found_detail="Imagen no encontrada.",
+    )
 
 
 async def save_organization_logo(
@@ -352,10 +334,15 @@ def remove_organization_logo(
     )
 
 
-def read_organization_logo(obj: OrganizationSetting) -> tuple[bytes, str]:
+def read_organization_logo_image(obj: OrganizationSetting) -> StoredImage:
     return _read_media(obj, "avatar_object")
 
 
+def read_organization_logo(obj: OrganizationSetting) -> tuple[bytes, str]:
+    image = _read_media(obj, "avatar_object")
+    return image.content, image.content_type
+
+
 async def save_organization_banner(
     db: Session,
     obj: OrganizationSetting,
@@ -392,5 +379,10 @@ def remove_organization_banner(
     )
 
 
-def read_organization_banner(obj: OrganizationSetting) -> tuple[bytes, str]:
+def read_organization_banner_image(obj: OrganizationSetting) -> StoredImage:
     return _read_media(obj, "banner_object")
+
+
+def read_organization_banner(obj: OrganizationSetting) -> tuple[bytes, str]:
+    image = _read_media(obj, "banner_object")
+    return image.content, image.content_type
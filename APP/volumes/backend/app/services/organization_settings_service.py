@@ -13,11 +13,14 @@ from core.datetime_utils import utc_now_db
 from core.exceptions import BadRequestException
 from models.organization_settings import OrganizationSetting
 from schemas.organization_settings import OrganizationSettingsRequest
+from services.image_delivery_service import StoredImage
 from services.organization_media_service import (
     get_organization_banner_url_if_exists,
     get_organization_logo_url_if_exists,
     read_organization_banner,
+    read_organization_banner_image,
     read_organization_logo,
+    read_organization_logo_image,
     remove_organization_banner,
     remove_organization_logo,
     save_organization_banner,
@@ -301,6 +304,11 @@ def read_organization_logo_content(db: Session) -> tuple[bytes, str]:
     return read_organization_logo(obj)
 
 
+def read_organization_logo_image_content(db: Session) -> StoredImage:
+    obj = _get_singleton(db)
+    return read_organization_logo_image(obj)
+
+
 async def upload_organization_banner(
     db: Session,
     file: UploadFile,
@@ -327,6 +335,11 @@ def read_organization_banner_content(db: Session) -> tuple[bytes, str]:
     return read_organization_banner(obj)
 
 
+def read_organization_banner_image_content(db: Session) -> StoredImage:
+    obj = _get_singleton(db)
+    return read_organization_banner_image(obj)
+
+
 def get_organization_public_base_url(db: Session | None) -> str | None:
     if db is None:
         return None
@@ -2,32 +2,25 @@
 import json
 import re
 import logging
-from pathlib import Path
-import jsonschema
 
-logger = logging.getLogger(__name__)
+from services.json_schema_engine import SchemaRegistry, find_injection, format_error_path
 
-# Rutas a los schemas
-_BASE = Path(__file__).parent.parent / "assets" / "schemas"
-INPUT_SCHEMA_PATH  = _BASE / "AI_input_Schema.json"
-OUTPUT_SCHEMA_PATH = _BASE / "AI_output_Schema.json"
+logger = logging.getLogger(__name__)
 
-_input_schema  = None
-_output_schema = None
+# Validadores compilados una vez por proceso (ver warm_up_schema_validators)
+INPUT_SCHEMA_NAME  = "AI_input_Schema"
+OUTPUT_SCHEMA_NAME = "AI_output_Schema"
 
+schema_registry = SchemaRegistry()
 
-def _get_input_schema() -> dict:
-    global _input_schema
-    if _input_schema is None:
-        _input_schema = json.loads(INPUT_SCHEMA_PATH.read_text(encoding="utf-8"))
-    return _input_schema
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
 
 
-def _get_output_schema() -> dict:
-    global _output_schema
-    if _output_schema is None:
-        _output_schema = json.loads(OUTPUT_SCHEMA_PATH.read_text(encoding="utf-8"))
-    return _output_schema
+def warm_up_schema_validators() -> list[str]:
+    """Compila todos los schemas de assets/schemas; se llama en el arranque."""
+    names = schema_registry.load_all()
+    logger.info("Schemas JSON compilados: %s", ", ".join(names))
+    return names
 
 
 # ── VALIDACIÓN DE INPUT ──────────────────────────────────────────────────────
@@ -37,11 +30,10 @@ def validate_input(data: dict) -> None:
     Valida el JSON recibido del frontend contra AI_input_Schema.json.
     Lanza ValueError con mensaje descriptivo si no cumple.
     """
-    try:
-        jsonschema.validate(instance=data, schema=_get_input_schema())
-    except jsonschema.ValidationError as e:
-        raise ValueError(f"Input inválido: {e.message} (ruta: {' → '.join(str(p) for p in e.path)})")
-    
+    error = schema_registry.first_error(INPUT_SCHEMA_NAME, data)
+    if error is not None:
+        raise ValueError(f"Input inválido: {error.message} (ruta: {format_error_path(error)})")
+
     logger.info("✅ Input validado contra schema correctamente")
 
 
@@ -49,7 +41,7 @@ def validate_input(data: dict) -> None:
 
 def extract_json_from_response(text: str) -> dict:
     """Extrae el JSON de la respuesta aunque venga con markdown fences."""
-    match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
+    match = _JSON_FENCE_RE.search(text)
     if match:
         text = match.group(1)
     text = text.strip()
@@ -61,19 +53,17 @@ def extract_json_from_response(text: str) -> dict:
 
 def check_no_injection(data: dict) -> None:
     """Verifica que el JSON no contenga scripts HTML inyectados."""
-    dumped = json.dumps(data)
-    for pattern in [r"<script", r"javascript:", r"onerror=", r"onload="]:
-        if re.search(pattern, dumped, re.IGNORECASE):
-            raise ValueError(f"Posible inyección detectada en output: '{pattern}'")
+    pattern = find_injection(data)
+    if pattern:
+        raise ValueError(f"Posible inyección detectada en output: '{pattern}'")
 
 
 def validate_output(raw_text: str) -> dict:
     """Extrae, valida contra schema y verifica seguridad del output de la IA."""
     data = extract_json_from_response(raw_text)
     check_no_injection(data)
-    try:
-        jsonschema.validate(instance=data, schema=_get_output_schema())
-    except jsonschema.ValidationError as e:
-        raise ValueError(f"Output no cumple el schema: {e.message}")
+    error = schema_registry.first_error(OUTPUT_SCHEMA_NAME, data)
+    if error is not None:
+        raise ValueError(f"Output no cumple el schema: {error.message}")
     logger.info("✅ Output de IA validado correctamente")
-    return data
\ No newline at end of file
+    return data
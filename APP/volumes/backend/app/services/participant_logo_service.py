@@ -4,7 +4,6 @@ import uuid
 from io import BytesIO
 
 from fastapi import HTTPException, UploadFile, status
-from minio.error import S3Error
 from sqlalchemy.orm import Session
 
 from core.datetime_utils import utc_now_db
@@ -12,6 +11,7 @@ from db.minio_client import get_minio_client
 from models.buckets import Bucket
 from models.objects import Object
 from models.participant import Participant
+from services.image_delivery_service import StoredImage, load_stored_image, remove_stored_image
 from services.upload_validation import sanitize_uploaded_image_content
 
 PARTICIPANT_LOGO_BUCKET = "minuetaitor-attach"
@@ -104,11 +104,7 @@ async def save_participant_logo(
     if previous_object and not getattr(previous_object, "deleted_at", None):
         previous_object.deleted_at = now
         previous_object.deleted_by = actor_user_id
-        try:
-            minio.remove_object(PARTICIPANT_LOGO_BUCKET, previous_object.object_key)
-        except S3Error as exc:
-            if exc.code not in {"NoSuchKey", "NoSuchObject"}:
-                raise
+        remove_stored_image(PARTICIPANT_LOGO_BUCKET, str(previous_object.id), previous_object.object_key)
 
     participant.avatar_object_id = object_id
     participant.updated_by = actor_user_id
@@ -128,12 +124,7 @@ def remove_participant_logo(db: Session, participant: Participant, *, actor_user
         db.refresh(participant)
         return
 
-    minio = get_minio_client()
-    try:
-        minio.remove_object(PARTICIPANT_LOGO_BUCKET, avatar_object.object_key)
-    except S3Error as exc:
-        if exc.code not in {"NoSuchKey", "NoSuchObject"}:
-            raise
+    remove_stored_image(PARTICIPANT_LOGO_BUCKET, str(avatar_object.id), avatar_object.object_key)
 
     avatar_object.deleted_at = now
     avatar_object.deleted_by = actor_user_id
@@ -143,23 +134,19 @@ def remove_participant_logo(db: Session, participant: Participant, *, actor_user
     db.refresh(participant)
 
 
-def read_participant_logo(db: Session, participant: Participant) -> tuple[bytes, str]:
+def read_participant_logo_image(db: Session, participant: Participant) -> StoredImage:
     avatar_object = getattr(participant, "avatar_object", None)
     if not avatar_object or getattr(avatar_object, "deleted_at", None):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Logo no encontrado.")
 
-    minio = get_minio_client()
-    key = avatar_object.object_key
-
-    try:
-        stat = minio.stat_object(PARTICIPANT_LOGO_BUCKET, key)
-        response = minio.get_object(PARTICIPANT_LOGO_BUCKET, key)
-        try:
-            return response.read(), stat.content_type or "application/octet-stream"
-        finally:
-            response.close()
-            response.release_conn()
-    except S3Error as exc:
-        if exc.code in {"NoSuchKey", "NoSuchObject"}:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Logo no encontrado.")
-        raise
+    return load_stored_image(
+        PARTICIPANT_LOGO_BUCKET,
+        str(avatar_object.id),
+        avatar_object.object_key,
+        not_found_detail="Logo no encontrado.",
+    )
+
+
+def read_participant_logo(db: Session, participant: Participant) -> tuple[bytes, str]:
+    image = read_participant_logo_image(db, participant)
+    return image.content, image.content_type
@@ -7,10 +7,11 @@ import uuid
 from datetime import datetime
 
 from fastapi import HTTPException, UploadFile
-from sqlalchemy import func, or_
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
+from core.pagination import cached_total, keyset_page, total_cache_key
 from models.participant import Participant
 from models.participant_email import ParticipantEmail
 from models.user import User
@@ -22,12 +23,15 @@ from schemas.participants import (
     ParticipantStatusRequest,
     ParticipantUpdateRequest,
 )
+from services.image_delivery_service import StoredImage
 from services.participant_logo_service import (
     get_participant_logo_url_if_exists,
     read_participant_logo,
+    read_participant_logo_image as _read_participant_logo_image,
     remove_participant_logo,
     save_participant_logo,
 )
+from services.search_index_service import SEARCH_ENTITY_PARTICIPANT, search_match_clause
 
 
 def _normalize_name(value: str) -> str:
@@ -302,49 +306,49 @@ def list_participants(db: Session, filters: ParticipantFilterRequest) -> dict:
         q = q.filter(Participant.is_active == bool(filters.is_active))
 
     if filters.search:
-        term = f"%{filters.search.strip()}%"
-        normalized_term = f"%{_normalize_name(filters.search)}%"
-        q = (
-            q.outerjoin(ParticipantEmail, ParticipantEmail.participant_id == Participant.id)
-            .filter(
-                or_(
-                    Participant.display_name.ilike(term),
-                    Participant.normalized_name.ilike(normalized_term),
-                    Participant.organization.ilike(term),
-                    ParticipantEmail.email.ilike(term),
-                )
-            )
-            .distinct()
-        )
-
-    total = q.with_entities(func.count(func.distinct(Participant.id))).scalar() or 0
+        match = search_match_clause(SEARCH_ENTITY_PARTICIPANT, filters.search, Participant.id)
+        if match is not None:
+            q = q.filter(match)
+
+    total = cached_total(
+        total_cache_key("participants", filters),
+        lambda: q.with_entities(func.count(Participant.id)).scalar(),
+        cursor=filters.cursor,
+        include_total=filters.include_total,
+    )
 
-    ids = [
-        row[0]
-        for row in (
-            q.with_entities(Participant.id)
-            .order_by(Participant.display_name.asc())
-            .offset(filters.skip)
-            .limit(filters.limit)
-            .all()
-        )
-    ]
+    rows, next_cursor = keyset_page(
+        q.with_entities(Participant.id, Participant.display_name),
+        [(Participant.display_name, False), (Participant.id, False)],
+        cursor=filters.cursor,
+        skip=filters.skip,
+        limit=filters.limit,
+        key=lambda row: (row.display_name, row.id),
+    )
+    ids = [row.id for row in rows]
 
     if not ids:
-        return {"items": [], "total": int(total), "skip": int(filters.skip), "limit": int(filters.limit)}
+        return {
+            "items": [],
+            "total": total,
+            "skip": int(filters.skip),
+            "limit": int(filters.limit),
+            "next_cursor": None,
+        }
 
     items = (
         _participant_query(db)
         .filter(Participant.id.in_(ids))
-        .order_by(Participant.display_name.asc())
+        .order_by(Participant.display_name.asc(), Participant.id.asc())
         .all()
     )
 
     return {
         "items": [_participant_to_dict(x) for x in items],
-        "total": int(total),
+        "total": total,
         "skip": int(filters.skip),
         "limit": int(filters.limit),
+        "next_cursor": next_cursor,
     }
 
 
@@ -555,3 +559,8 @@ def delete_participant_logo(
 def read_participant_logo_content(db: Session, participant_id: str) -> tuple[bytes, str]:
     participant = _get_or_404(db, participant_id)
     return read_participant_logo(db, participant)
+
+
+def read_participant_logo_image(db: Session, participant_id: str) -> StoredImage:
+    participant = _get_or_404(db, participant_id)
+    return _read_participant_logo_image(db, participant)
@@ -5,10 +5,11 @@ import uuid
 from datetime import datetime
 
 from fastapi import HTTPException, UploadFile
-from sqlalchemy import func, or_
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
+from core.pagination import cached_total, keyset_page, total_cache_key
 from core.exceptions import ConflictException, ForbiddenException
 from models.records import Record
 from models.projects import Project
@@ -20,13 +21,16 @@ from services.access_control_service import (
     ensure_client_read_access,
     ensure_project_read_access,
 )
+from services.image_delivery_service import StoredImage
 from services.project_logo_service import (
     get_project_logo_url_if_exists,
     read_project_logo,
+    read_project_logo_image as _read_project_logo_image,
     remove_project_logo,
     save_project_logo,
 )
 from services.pdf_template_resolver import resolve_pdf_template_for_project
+from services.search_index_service import SEARCH_ENTITY_PROJECT, search_match_clause
 
 
 def _user_ref(u) -> dict | None:
@@ -134,30 +138,38 @@ def list_projects(db: Session, filters: ProjectFilterRequest, session: UserSessi
         q = q.filter(Project.is_confidential.is_(bool(filters.is_confidential)))
 
     if filters.q:
-        like = f"%{filters.q.strip()}%"
-        q = q.filter(or_(Project.name.ilike(like), Project.code.ilike(like), Project.tags.ilike(like)))
-
-    total = q.with_entities(func.count(Project.id)).scalar() or 0
+        match = search_match_clause(SEARCH_ENTITY_PROJECT, filters.q, Project.id)
+        if match is not None:
+            q = q.filter(match)
+
+    total = cached_total(
+        total_cache_key("projects", filters, scope=session.user_id),
+        lambda: q.with_entities(func.count(Project.id)).scalar(),
+        cursor=filters.cursor,
+        include_total=filters.include_total,
+    )
 
-    items = (
+    items, next_cursor = keyset_page(
         q.options(
             joinedload(Project.client),
             joinedload(Project.avatar_object),
             joinedload(Project.created_by_user),
             joinedload(Project.updated_by_user),
             joinedload(Project.deleted_by_user),
-        )
-        .order_by(Project.created_at.desc())
-        .offset(filters.skip)
-        .limit(filters.limit)
-        .all()
+        ),
+        [(Project.created_at, True), (Project.id, True)],
+        cursor=filters.cursor,
+        skip=filters.skip,
+        limit=filters.limit,
+        key=lambda x: (x.created_at, x.id),
     )
 
     return {
         "items": [_build_response_dict(x) for x in items],
-        "total": int(total),
+        "total": total,
         "skip": int(filters.skip),
         "limit": int(filters.limit),
+        "next_cursor": next_cursor,
     }
 
 
@@ -337,3 +349,8 @@ def delete_project_logo(
 def read_project_logo_content(db: Session, project_id: str) -> tuple[bytes, str]:
     obj = _get_or_404(db, project_id)
     return read_project_logo(db, obj)
+
+
+def read_project_logo_image(db: Session, project_id: str) -> StoredImage:
+    obj = _get_or_404(db, project_id)
+    return _read_project_logo_image(db, obj)
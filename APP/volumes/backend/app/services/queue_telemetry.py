@@ -0,0 +1,195 @@
+# services/queue_telemetry.py
+"""
+Telemetría de colas: tiempo de espera y de servicio por cola y tipo de job.
+
+Contrato compartido con los workers (`core/queue_telemetry.py` en worker,
+pdf-worker y backup-worker):
+
+- Cada envelope lleva `enqueued_at` (ISO UTC) y `trace_id`, estampados por
+  el productor con `stamp_job_envelope` justo antes del RPUSH.
+- Al terminar un job, el worker incrementa un histograma por minuto en el
+  hash `telemetry:queue:<cola>:<minuto epoch>` con campos
+  `<tipo>|count`, `<tipo>|failed`, `<tipo>|wait|<bucket>` y
+  `<tipo>|run|<bucket>`. El hash expira a las 2 h.
+- Los buckets son límites superiores fijos en ms (`LATENCY_BUCKETS_MS`); el
+  índice `len(LATENCY_BUCKETS_MS)` es el desborde. Los percentiles se
+  estiman como el límite superior del bucket que contiene el rango pedido.
+"""
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from core.datetime_utils import utc_isoformat_z, utc_now
+
+TELEMETRY_KEY_PREFIX = "telemetry:queue"
+TELEMETRY_TTL_SECONDS = 2 * 60 * 60
+DEFAULT_WINDOW_MINUTES = 15
+ALERT_WINDOW_MINUTES = 5
+# Con menos muestras el p95 es ruido; la antigüedad del primer job sigue aplicando.
+ALERT_MIN_WAIT_SAMPLES = 3
+# Debe coincidir con los workers: cambiarlo invalida los buckets ya escritos.
+LATENCY_BUCKETS_MS: tuple[int, ...] = (
+    50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000,
+    60_000, 120_000, 300_000, 600_000, 1_800_000, 3_600_000,
+)
+
+
+def stamp_job_envelope(job: dict[str, Any], *, trace_id: str | None = None) -> dict[str, Any]:
+    """Agrega `enqueued_at` y `trace_id` al envelope (respeta un trace_id ya presente)."""
+    job["enqueued_at"] = utc_isoformat_z(utc_now())
+    job["trace_id"] = str(job.get("trace_id") or trace_id or uuid.uuid4().hex)
+    return job
+
+
+def telemetry_key(queue: str, minute: int) -> str:
+    return f"{TELEMETRY_KEY_PREFIX}:{queue}:{minute}"
+
+
+@dataclass
+class _Histogram:
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def add(self, index: int, count: int) -> None:
+        if 0 <= index < len(self.counts):
+            self.counts[index] += count
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def percentile_ms(self, quantile: float) -> int | None:
+        total = self.total
+        if total <= 0:
+            return None
+        rank = max(1, int(round(quantile * total)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return LATENCY_BUCKETS_MS[min(index, len(LATENCY_BUCKETS_MS) - 1)]
+        return LATENCY_BUCKETS_MS[-1]
+
+
+@dataclass
+class _TypeStats:
+    jobs: int = 0
+    failed: int = 0
+    wait: _Histogram = field(default_factory=_Histogram)
+    run: _Histogram = field(default_factory=_Histogram)
+
+    def merge(self, other: "_TypeStats") -> None:
+        self.jobs += other.jobs
+        self.failed += other.failed
+        for index, count in enumerate(other.wait.counts):
+            self.wait.add(index, count)
+        for index, count in enumerate(other.run.counts):
+            self.run.add(index, count)
+
+    def as_dict(self, window_minutes: int) -> dict:
+        return {
+            "jobs": self.jobs,
+            "failed": self.failed,
+            "jobs_per_minute": round(self.jobs / window_minutes, 2) if window_minutes > 0 else 0.0,
+            "wait_samples": self.wait.total,
+            "wait_p50_ms": self.wait.percentile_ms(0.50),
+            "wait_p95_ms": self.wait.percentile_ms(0.95),
+            "run_p50_ms": self.run.percentile_ms(0.50),
+            "run_p95_ms": self.run.percentile_ms(0.95),
+        }
+
+
+def _accumulate(stats_by_type: dict[str, _TypeStats], raw_hash: dict) -> None:
+    for raw_field, raw_value in (raw_hash or {}).items():
+        field_name = raw_field.decode() if isinstance(raw_field, bytes) else str(raw_field)
+        try:
+            value = int(raw_value)
+        except (TypeError, ValueError):
+            continue
+        parts = field_name.split("|")
+        stats = stats_by_type.setdefault(parts[0], _TypeStats())
+        if len(parts) == 2 and parts[1] == "count":
+            stats.jobs += value
+        elif len(parts) == 2 and parts[1] == "failed":
+            stats.failed += value
+        elif len(parts) == 3 and parts[1] in {"wait", "run"} and parts[2].isdigit():
+            getattr(stats, parts[1]).add(int(parts[2]), value)
+
+
+async def read_queue_telemetry(redis, queues: list[str], *, window_minutes: int = DEFAULT_WINDOW_MINUTES) -> dict[str, dict]:
+    """
+    Agrega los últimos `window_minutes` minutos por cola.
+
+    Retorna `{cola: {jobs, failed, jobs_per_minute, wait_p50_ms, ..., by_type}}`
+    con un solo pipeline de HGETALL para todas las colas.
+    """
+    window = max(1, int(window_minutes))
+    current_minute = int(time.time() // 60)
+    minutes = range(current_minute - window + 1, current_minute + 1)
+
+    pipe = redis.pipeline(transaction=False)
+    for queue in queues:
+        for minute in minutes:
+            pipe.hgetall(telemetry_key(queue, minute))
+    raw_hashes = await pipe.execute()
+
+    result: dict[str, dict] = {}
+    for position, queue in enumerate(queues):
+        stats_by_type: dict[str, _TypeStats] = {}
+        for raw_hash in raw_hashes[position * window:(position + 1) * window]:
+            _accumulate(stats_by_type, raw_hash)
+        totals = _TypeStats()
+        for stats in stats_by_type.values():
+            totals.merge(stats)
+        result[queue] = {
+            "window_minutes": window,
+            **totals.as_dict(window),
+            "by_type": {job_type: stats.as_dict(window) for job_type, stats in sorted(stats_by_type.items())},
+        }
+    return result
+
+
+def head_job_age_ms(raw_job: Any) -> int | None:
+    """Antigüedad del job en la cabeza de la cola según su `enqueued_at` (None si no lo trae)."""
+    if raw_job is None:
+        return None
+    try:
+        data = json.loads(raw_job)
+        enqueued_at = datetime.fromisoformat(str(data["enqueued_at"]).replace("Z", "+00:00"))
+    except (TypeError, ValueError, KeyError):
+        return None
+    if enqueued_at.tzinfo is None:
+        return None
+    return max(0, int((utc_now() - enqueued_at).total_seconds() * 1000))
+
+
+def wait_threshold_exceeded(telemetry: dict, wait_warning_seconds: int | None) -> bool:
+    """True si el p95 de espera o el job más antiguo en cola superan el umbral."""
+    if not wait_warning_seconds:
+        return False
+    limit_ms = int(wait_warning_seconds) * 1000
+    head_age = telemetry.get("head_job_age_ms")
+    if head_age is not None and head_age >= limit_ms:
+        return True
+    wait_p95 = telemetry.get("wait_p95_ms")
+    return (
+        wait_p95 is not None
+        and int(telemetry.get("wait_samples") or 0) >= ALERT_MIN_WAIT_SAMPLES
+        and wait_p95 >= limit_ms
+    )
+
+
+async def read_queue_observability(redis, queues: list[str], *, window_minutes: int = DEFAULT_WINDOW_MINUTES) -> dict[str, dict]:
+    """`read_queue_telemetry` más la antigüedad del primer job de cada cola (LINDEX 0)."""
+    telemetry = await read_queue_telemetry(redis, queues, window_minutes=window_minutes)
+    pipe = redis.pipeline(transaction=False)
+    for queue in queues:
+        pipe.lindex(queue, 0)
+    heads = await pipe.execute()
+    for queue, raw_head in zip(queues, heads):
+        telemetry[queue]["head_job_age_ms"] = head_job_age_ms(raw_head)
+    return telemetry
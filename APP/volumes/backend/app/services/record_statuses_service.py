@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
 from models.record_statuses import RecordStatus
+from services.catalog_registry import notify_catalog_changed
 
 
 def _user_ref(u) -> dict | None:
@@ -119,6 +120,7 @@ def create_record_status(db: Session, body, created_by_id: str | None) -> dict:
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("record_statuses")
     db.refresh(obj)
 
     obj = _get_or_404(db, int(obj.id))
@@ -144,6 +146,7 @@ def update_record_status(db: Session, id: int, body, updated_by_id: str | None)
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("record_statuses")
     db.refresh(obj)
 
     obj = _get_or_404(db, id)
@@ -156,6 +159,7 @@ def change_record_status_status(db: Session, id: int, is_active: bool, updated_b
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("record_statuses")
     db.refresh(obj)
 
     obj = _get_or_404(db, id)
@@ -171,3 +175,4 @@ def delete_record_status(db: Session, id: int, deleted_by_id: str | None) -> Non
     obj.updated_by = deleted_by_id
 
     db.commit()
+    notify_catalog_changed("record_statuses")
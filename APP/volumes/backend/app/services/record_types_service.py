@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session, joinedload
 from core.datetime_utils import utc_now_db
 from models.record_types import RecordType
 from schemas.record_types import RecordTypeCreateRequest, RecordTypeFilterRequest, RecordTypeUpdateRequest
+from services.catalog_registry import notify_catalog_changed
 
 
 def _user_ref(u) -> dict | None:
@@ -125,6 +126,7 @@ def create_record_type(db: Session, body: RecordTypeCreateRequest, created_by_id
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("record_types")
     db.refresh(obj)
 
     fresh = _get_or_404(db, obj.id)
@@ -152,6 +154,7 @@ def update_record_type(db: Session, id: int, body: RecordTypeUpdateRequest, upda
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("record_types")
     db.refresh(obj)
 
     fresh = _get_or_404(db, obj.id)
@@ -165,6 +168,7 @@ def change_record_type_status(db: Session, id: int, is_active: bool, updated_by_
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("record_types")
     db.refresh(obj)
 
     fresh = _get_or_404(db, obj.id)
@@ -180,3 +184,4 @@ def delete_record_type(db: Session, id: int, deleted_by_id: str) -> None:
     obj.updated_by = deleted_by_id
 
     db.commit()
+    notify_catalog_changed("record_types")
@@ -53,13 +53,3 @@ async def acquire_lock(transaction_id: str, ttl_seconds: int = 30) -> bool:
     result = await r.set(key, "1", ex=ttl_seconds, nx=True)
     return result is not None
 
-
-async def check_rate_limit(client_ip: str, limit: int = 20) -> bool:
-    """Retorna True si está dentro del límite, False si lo superó."""
-    r = await get_redis()
-    today = utc_now().strftime("%Y%m%d")
-    key = f"rate:{client_ip}:{today}"
-    count = await r.incr(key)
-    if count == 1:
-        await r.expire(key, 86400)
-    return count <= limit
@@ -0,0 +1,567 @@
+"""
+services/report_exports_service.py
+
+Exportación CSV/XLSX de los reportes de auditoría y de gestión.
+
+Las filas se leen con cursores del lado del servidor (`yield_per` +
+`stream_results`) y se escriben de forma incremental, de modo que una
+exportación de un año de auditoría corre en memoria constante. Hay dos
+modos de entrega:
+
+- stream: `StreamingResponse` directo en la request.
+- background: el archivo se genera fuera de la request, se sube a MinIO y
+  se descarga después por id (rangos grandes que no deben amarrar la
+  conexión del cliente). La meta vence a las 6 h y una regla de lifecycle
+  del bucket borra el archivo al día siguiente.
+"""
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import uuid
+import zipfile
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Iterator
+from xml.sax.saxutils import escape as xml_escape
+
+from fastapi import HTTPException
+from minio.error import S3Error
+from pydantic import BaseModel
+
+from core.authz import has_permission
+from core.datetime_utils import utc_now
+from core.exceptions import ForbiddenException
+from db.minio_client import get_minio_client
+from db.redis import get_redis
+from db.session import SessionLocal
+from schemas.audit_reports import AuditReportRow
+from schemas.auth import UserSession
+from schemas.management_commitment_reports import ManagementCommitmentReportRow
+from schemas.management_email_delivery_reports import ManagementEmailDeliveryReportRow
+from schemas.management_review_reports import ManagementReviewObservationRow
+
+logger = logging.getLogger(__name__)
+
+REPORT_EXPORT_BUCKET = "minuetaitor-exports"
+REPORT_EXPORT_META_PREFIX = "report:export:meta:"
+REPORT_EXPORT_TTL_SECONDS = 6 * 60 * 60
+# Lifecycle de MinIO trabaja en días: el objeto sobrevive a su meta a lo más un día.
+REPORT_EXPORT_LIFECYCLE_RULE_ID = "report-export-expiry"
+REPORT_EXPORT_OBJECT_DAYS = 1
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+_XML_ILLEGAL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_FORMULA_PREFIXES = ("=", "+", "@", "\t", "\r")
+
+_lifecycle_lock = threading.Lock()
+_lifecycle_ready = False
+
+
+# ---------------------------------------------------------------------------
+# Fuentes de datos
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ReportExportSource:
+    key: str
+    filename: str
+    sheet_name: str
+    row_model: type[BaseModel]
+    iter_rows: Callable[..., Iterable[Any]]
+    # Permiso del reporte de origen; también se exige al consultar y descargar.
+    permission: str = "records.read"
+
+
+def _iter_audit(db, session, payload):
+    from services.audit_reports_service import iter_audit_report_rows
+
+    return iter_audit_report_rows(db, session, payload, limit=payload.limit)
+
+
+def _iter_commitments(db, session, payload):
+    from services.management_commitment_reports_service import iter_management_commitment_items
+
+    rows = iter_management_commitment_items(db, session, payload)
+    return _take(rows, payload.limit)
+
+
+def _iter_email_deliveries(db, session, payload):
+    from services.management_email_delivery_reports_service import iter_management_email_deliveries
+
+    return iter_management_email_deliveries(db, session, payload, limit=payload.limit)
+
+
+def _iter_review_observations(db, session, payload):
+    from services.management_review_reports_service import iter_management_review_observations
+
+    return iter_management_review_observations(db, session, payload, limit=payload.limit)
+
+
+def _take(rows: Iterable[Any], limit: int | None) -> Iterator[Any]:
+    for index, row in enumerate(rows):
+        if limit and index >= limit:
+            return
+        yield row
+
+
+REPORT_EXPORT_SOURCES: dict[str, ReportExportSource] = {
+    source.key: source
+    for source in (
+        ReportExportSource(
+            "audit",
+            "reporte-auditoria",
+            "Auditoría",
+            AuditReportRow,
+            _iter_audit,
+            permission="audit.read",
+        ),
+        ReportExportSource(
+            "commitment-items",
+            "reporte-compromisos",
+            "Compromisos",
+            ManagementCommitmentReportRow,
+            _iter_commitments,
+        ),
+        ReportExportSource(
+            "email-deliveries",
+            "reporte-correos",
+            "Correos",
+            ManagementEmailDeliveryReportRow,
+            _iter_email_deliveries,
+        ),
+        ReportExportSource(
+            "review-observations",
+            "reporte-observaciones",
+            "Observaciones",
+            ManagementReviewObservationRow,
+            _iter_review_observations,
+        ),
+    )
+}
+
+
+def get_report_export_source(source_key: str) -> ReportExportSource:
+    source = REPORT_EXPORT_SOURCES.get(source_key)
+    if source is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"error": "report_export_source_not_found", "message": "El reporte solicitado no admite exportación."},
+        )
+    return source
+
+
+def _columns(row_model: type[BaseModel]) -> list[tuple[str, str]]:
+    """Pares (campo, encabezado); el encabezado respeta el alias del JSON."""
+    return [
+        (name, field.serialization_alias or name)
+        for name, field in row_model.model_fields.items()
+    ]
+
+
+def _row_values(row: Any, fields: list[str]) -> list[Any]:
+    if isinstance(row, BaseModel):
+        return [getattr(row, name, None) for name in fields]
+    return [row.get(name) for name in fields]
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "Sí" if value else "No"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set)):
+        return ", ".join(_cell_text(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return str(value)
+
+
+def _neutralize_formula(text: str) -> str:
+    # Evita inyección de fórmulas al abrir el archivo en una planilla.
+    if text.startswith(_FORMULA_PREFIXES) or (text.startswith("-") and len(text) > 1 and not text[1].isdigit()):
+        return f"'{text}"
+    return text
+
+
+def iter_report_export_rows(
+    source: ReportExportSource,
+    session: UserSession,
+    payload,
+) -> Iterator[Any]:
+    """Recorre las filas con una sesión de BD propia.
+
+    Las dependencias `yield` de FastAPI cierran la sesión de la request antes
+    de que corra el cuerpo de un `StreamingResponse`, así que el generador
+    abre y cierra la suya.
+    """
+    db = SessionLocal()
+    try:
+        yield from source.iter_rows(db, session, payload)
+    finally:
+        db.close()
+
+
+# ---------------------------------------------------------------------------
+# Escritores incrementales
+# ---------------------------------------------------------------------------
+
+def iter_csv_chunks(rows: Iterable[Any], row_model: type[BaseModel]) -> Iterator[bytes]:
+    columns = _columns(row_model)
+    fields = [name for name, _ in columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # BOM para que Excel detecte UTF-8 al abrir el CSV.
+    buffer.write("\ufeff")
+    writer.writerow([header for _, header in columns])
+    for row in rows:
+        writer.writerow([_neutralize_formula(_cell_text(value)) for value in _row_values(row, fields)])
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Destino no buscable para `zipfile`: acumula bytes hasta que se drenan."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        return len(chunk)
+
+    def pending(self) -> int:
+        return self._size
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        return data
+
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+
+
+def _xlsx_workbook(sheet_name: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets><sheet name="{xml_escape(sheet_name[:31], {chr(34): "&quot;"})}" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    )
+
+
+def _xlsx_column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _xlsx_row(row_number: int, values: list[str], letters: list[str]) -> str:
+    cells = []
+    for letter, value in zip(letters, values):
+        if not value:
+            continue
+        text = xml_escape(_XML_ILLEGAL_CHARS.sub("", value))
+        cells.append(f'<c r="{letter}{row_number}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return f'<row r="{row_number}">{"".join(cells)}</row>'
+
+
+def iter_xlsx_chunks(rows: Iterable[Any], row_model: type[BaseModel], sheet_name: str) -> Iterator[bytes]:
+    """Escribe un XLSX mínimo (una hoja, celdas inlineStr) a medida que llegan filas.
+
+    Se arma con `zipfile` sobre un destino no buscable: cada entrada usa
+    data descriptors, así que no hace falta conocer tamaños por adelantado
+    ni mantener el libro completo en memoria.
+    """
+    columns = _columns(row_model)
+    fields = [name for name, _ in columns]
+    letters = [_xlsx_column_letter(index) for index in range(len(columns))]
+    sink = _ChunkSink()
+
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        archive.writestr("xl/workbook.xml", _xlsx_workbook(sheet_name))
+        archive.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+
+        with archive.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            sheet.write(_xlsx_row(1, [header for _, header in columns], letters).encode("utf-8"))
+            for row_number, row in enumerate(rows, start=2):
+                values = [_cell_text(value) for value in _row_values(row, fields)]
+                sheet.write(_xlsx_row(row_number, values, letters).encode("utf-8"))
+                if sink.pending() >= EXPORT_CHUNK_BYTES:
+                    yield sink.drain()
+            sheet.write(b"</sheetData></worksheet>")
+
+    yield sink.drain()
+
+
+def iter_report_export_chunks(
+    source: ReportExportSource,
+    session: UserSession,
+    payload,
+) -> Iterator[bytes]:
+    rows = iter_report_export_rows(source, session, payload)
+    if payload.format == "xlsx":
+        return iter_xlsx_chunks(rows, source.row_model, source.sheet_name)
+    return iter_csv_chunks(rows, source.row_model)
+
+
+def report_export_filename(source: ReportExportSource, export_format: str) -> str:
+    stamp = utc_now().strftime("%Y%m%d-%H%M%S")
+    return f"{source.filename}-{stamp}.{export_format}"
+
+
+def report_export_media_type(export_format: str) -> str:
+    return XLSX_MEDIA_TYPE if export_format == "xlsx" else CSV_MEDIA_TYPE
+
+
+# ---------------------------------------------------------------------------
+# Generación en segundo plano hacia MinIO
+# ---------------------------------------------------------------------------
+
+def _report_export_meta_key(export_id: str) -> str:
+    return f"{REPORT_EXPORT_META_PREFIX}{export_id}"
+
+
+def _export_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail={"error": "report_export_not_found", "message": "La exportación ya expiró o no existe."},
+    )
+
+
+async def _save_export_meta(export_id: str, meta: dict[str, Any], *, keep_ttl: bool) -> None:
+    redis = get_redis()
+    if keep_ttl:
+        await redis.set(_report_export_meta_key(export_id), json.dumps(meta), keepttl=True)
+    else:
+        await redis.setex(_report_export_meta_key(export_id), REPORT_EXPORT_TTL_SECONDS, json.dumps(meta))
+
+
+def _ensure_lifecycle(client) -> None:
+    global _lifecycle_ready
+    if _lifecycle_ready:
+        return
+    from minio.commonconfig import ENABLED, Filter
+    from minio.lifecycleconfig import Expiration, LifecycleConfig, Rule
+
+    with _lifecycle_lock:
+        if _lifecycle_ready:
+            return
+        existing = client.get_bucket_lifecycle(REPORT_EXPORT_BUCKET)
+        rules = [rule for rule in (existing.rules if existing else []) if rule.rule_id != REPORT_EXPORT_LIFECYCLE_RULE_ID]
+        rules.append(
+            Rule(
+                ENABLED,
+                rule_filter=Filter(prefix=""),
+                rule_id=REPORT_EXPORT_LIFECYCLE_RULE_ID,
+                expiration=Expiration(days=REPORT_EXPORT_OBJECT_DAYS),
+            )
+        )
+        client.set_bucket_lifecycle(REPORT_EXPORT_BUCKET, LifecycleConfig(rules))
+        _lifecycle_ready = True
+
+
+def _write_export_object(
+    source: ReportExportSource,
+    session: UserSession,
+    payload,
+    object_key: str,
+) -> int:
+    fd, path = tempfile.mkstemp(prefix="report-export-", suffix=f".{payload.format}")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            for chunk in iter_report_export_chunks(source, session, payload):
+                handle.write(chunk)
+        size_bytes = os.path.getsize(path)
+        client = get_minio_client()
+        try:
+            _ensure_lifecycle(client)
+        except Exception as exc:
+            logger.warning("report_export: no se pudo fijar lifecycle en %s: %s", REPORT_EXPORT_BUCKET, exc)
+        client.fput_object(
+            REPORT_EXPORT_BUCKET,
+            object_key,
+            path,
+            content_type=report_export_media_type(payload.format),
+        )
+        return size_bytes
+    finally:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+async def start_report_export_job(session: UserSession, source_key: str, payload) -> dict[str, Any]:
+    source = get_report_export_source(source_key)
+    export_id = uuid.uuid4().hex
+    filename = report_export_filename(source, payload.format)
+    meta = {
+        "user_id": str(session.user_id),
+        "source": source.key,
+        "format": payload.format,
+        "filename": filename,
+        "object_key": f"{source.key}/{export_id}.{payload.format}",
+        "status": "queued",
+    }
+    try:
+        await _save_export_meta(export_id, meta, keep_ttl=False)
+    except Exception as exc:
+        raise HTTPException(
+            status_code=500,
+            detail={"error": "report_export_enqueue_error", "message": "No se pudo iniciar la exportación del reporte."},
+        ) from exc
+    return {
+        "export_id": export_id,
+        "status": "queued",
+        "filename": filename,
+        "expires_in": REPORT_EXPORT_TTL_SECONDS,
+    }
+
+
+async def run_report_export_job(export_id: str, session: UserSession, source_key: str, payload) -> None:
+    """Tarea de fondo: genera el archivo en disco temporal y lo sube a MinIO."""
+    source = get_report_export_source(source_key)
+    meta = await _load_export_meta(export_id)
+    if meta is None:
+        return
+
+    meta["status"] = "processing"
+    await _save_export_meta(export_id, meta, keep_ttl=True)
+    try:
+        size_bytes = await asyncio.to_thread(_write_export_object, source, session, payload, meta["object_key"])
+    except Exception as exc:
+        logger.error("report_export: fallo exportación %s (%s): %s", export_id, source.key, exc, exc_info=True)
+        meta["status"] = "failed"
+        await _save_export_meta(export_id, meta, keep_ttl=True)
+        return
+
+    meta["status"] = "ready"
+    meta["size_bytes"] = size_bytes
+    await _save_export_meta(export_id, meta, keep_ttl=True)
+
+
+async def _load_export_meta(export_id: str) -> dict[str, Any] | None:
+    raw_meta = await get_redis().get(_report_export_meta_key(export_id))
+    if not raw_meta:
+        return None
+    try:
+        return json.loads(raw_meta)
+    except (TypeError, ValueError):
+        return None
+
+
+async def _get_owned_export_meta(export_id: str, session: UserSession) -> dict[str, Any]:
+    meta = await _load_export_meta(export_id)
+    if meta is None or str(meta.get("user_id") or "") != str(session.user_id):
+        raise _export_not_found()
+    source = REPORT_EXPORT_SOURCES.get(str(meta.get("source") or ""))
+    if source is None:
+        raise _export_not_found()
+    if not has_permission(session, source.permission):
+        raise ForbiddenException("No tienes los permisos requeridos para esta operación")
+    return meta
+
+
+async def get_report_export_job_status(export_id: str, session: UserSession) -> dict[str, Any]:
+    meta = await _get_owned_export_meta(export_id, session)
+    ttl = await get_redis().ttl(_report_export_meta_key(export_id))
+    result = {
+        "export_id": export_id,
+        "status": meta.get("status") or "queued",
+        "filename": meta.get("filename"),
+        "expires_in": max(int(ttl or 0), 0),
+    }
+    if meta.get("size_bytes") is not None:
+        result["size_bytes"] = meta["size_bytes"]
+    return result
+
+
+async def open_report_export_job_result(export_id: str, session: UserSession) -> tuple[Iterator[bytes], dict[str, Any]]:
+    """Abre el objeto en MinIO y retorna un iterador de bloques para `StreamingResponse`."""
+    meta = await _get_owned_export_meta(export_id, session)
+    if meta.get("status") != "ready":
+        raise HTTPException(
+            status_code=409,
+            detail={"error": "report_export_not_ready", "message": "La exportación aún se está generando."},
+        )
+
+    try:
+        response = await asyncio.to_thread(get_minio_client().get_object, REPORT_EXPORT_BUCKET, meta["object_key"])
+    except S3Error as exc:
+        if exc.code in {"NoSuchKey", "NoSuchObject"}:
+            raise _export_not_found() from exc
+        raise
+
+    def _iter_object() -> Iterator[bytes]:
+        try:
+            yield from response.stream(EXPORT_CHUNK_BYTES)
+        finally:
+            response.close()
+            response.release_conn()
+
+    return _iter_object(), meta
@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Iterable
+
+from sqlalchemy import and_, case, func, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.datetime_utils import utc_now
+from models.record_status_transitions import RecordStatusTransition
+from models.record_version_agreements import RecordVersionAgreement
+from models.record_version_requirements import RecordVersionRequirement
+from models.record_versions import RecordVersion
+from models.records import Record
+from models.reporting_rollups import (
+    CommitmentDailyRollup,
+    RecordDailyRollup,
+    RecordTransitionDailyRollup,
+)
+
+logger = logging.getLogger(__name__)
+
+# Particiones que el listener no pudo recalcular: SET de "<tipo>:<valor>",
+# con tipo record|transition|activity (días ISO) o
+# transition_record|activity_record (ids de minuta por resolver).
+ROLLUPS_STALE_KEY = "reporting:rollups:stale"
+_RECONCILE_BATCH = 500
+
+
+def _day_start(value: date) -> datetime:
+    return datetime.combine(value, time.min)
+
+
+def _next_month(value: date) -> date:
+    return (value.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def _as_day(value) -> date:
+    # func.date() llega como date en MariaDB y como texto ISO en otros dialectos.
+    return value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+
+
+def _activity_date_expr():
+    return func.coalesce(Record.document_date, func.date(RecordVersion.published_at))
+
+
+def _activity_range_filter(start: date, end: date):
+    """Filtro sargable equivalente a `start <= activity_date < end`."""
+    return or_(
+        and_(Record.document_date >= start, Record.document_date < end),
+        and_(
+            Record.document_date.is_(None),
+            RecordVersion.published_at >= _day_start(start),
+            RecordVersion.published_at < _day_start(end),
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Recalculo por rango de días [start, end)
+# ---------------------------------------------------------------------------
+
+def _refresh_record_rollups(db: Session, start: date, end: date) -> None:
+    db.query(RecordDailyRollup).filter(
+        RecordDailyRollup.rollup_date >= start,
+        RecordDailyRollup.rollup_date < end,
+    ).delete(synchronize_session=False)
+
+    day = func.date(Record.created_at)
+    source = (
+        select(
+            day,
+            Record.prepared_by_user_id,
+            Record.client_id,
+            Record.project_id,
+            Record.status_id,
+            func.count(Record.id),
+        )
+        .where(
+            Record.deleted_at.is_(None),
+            Record.created_at >= _day_start(start),
+            Record.created_at < _day_start(end),
+        )
+        .group_by(day, Record.prepared_by_user_id, Record.client_id, Record.project_id, Record.status_id)
+    )
+    db.execute(
+        insert(RecordDailyRollup).from_select(
+            ["rollup_date", "prepared_by_user_id", "client_id", "project_id", "status_id", "record_count"],
+            source,
+        )
+    )
+
+
+def _refresh_transition_rollups(db: Session, start: date, end: date) -> None:
+    """Recalcula los meses completos que tocan [start, end).
+
+    `record_count` cuenta cada minuta una sola vez por mes y estado destino,
+    en el día de su primera transición del mes: sumar los días de un mes da
+    minutas distintas del mes. Por eso la partición es el mes, no el día.
+    """
+    month = start.replace(day=1)
+    while month < end:
+        _refresh_transition_month(db, month, _next_month(month))
+        month = _next_month(month)
+
+
+def _refresh_transition_month(db: Session, start: date, end: date) -> None:
+    db.query(RecordTransitionDailyRollup).filter(
+        RecordTransitionDailyRollup.rollup_date >= start,
+        RecordTransitionDailyRollup.rollup_date < end,
+    ).delete(synchronize_session=False)
+
+    first_changed_at = func.min(RecordStatusTransition.changed_at).over(
+        partition_by=(RecordStatusTransition.record_id, RecordStatusTransition.to_status_id)
+    )
+    transitions = (
+        select(
+            RecordStatusTransition.id.label("transition_id"),
+            RecordStatusTransition.record_id,
+            RecordStatusTransition.to_status_id,
+            func.date(RecordStatusTransition.changed_at).label("day"),
+            func.date(first_changed_at).label("first_day"),
+            Record.prepared_by_user_id,
+            Record.client_id,
+            Record.project_id,
+        )
+        .join(Record, Record.id == RecordStatusTransition.record_id)
+        .where(
+            Record.deleted_at.is_(None),
+            RecordStatusTransition.changed_at >= _day_start(start),
+            RecordStatusTransition.changed_at < _day_start(end),
+        )
+        .subquery()
+    )
+    source = (
+        select(
+            transitions.c.day,
+            transitions.c.prepared_by_user_id,
+            transitions.c.client_id,
+            transitions.c.project_id,
+            transitions.c.to_status_id,
+            func.count(transitions.c.transition_id),
+            func.count(
+                func.distinct(case((transitions.c.day == transitions.c.first_day, transitions.c.record_id)))
+            ),
+        )
+        .group_by(
+            transitions.c.day,
+            transitions.c.prepared_by_user_id,
+            transitions.c.client_id,
+            transitions.c.project_id,
+            transitions.c.to_status_id,
+        )
+    )
+    db.execute(
+        insert(RecordTransitionDailyRollup).from_select(
+            [
+                "rollup_date",
+                "prepared_by_user_id",
+                "client_id",
+                "project_id",
+                "to_status_id",
+                "transition_count",
+                "record_count",
+            ],
+            source,
+        )
+    )
+
+
+def _refresh_commitment_rollups(db: Session, start: date, end: date) -> None:
+    db.query(CommitmentDailyRollup).filter(
+        CommitmentDailyRollup.activity_date >= start,
+        CommitmentDailyRollup.activity_date < end,
+    ).delete(synchronize_session=False)
+
+    activity_date = _activity_date_expr()
+    columns = [
+        "activity_date",
+        "prepared_by_user_id",
+        "client_id",
+        "project_id",
+        "item_type",
+        "status",
+        "item_count",
+    ]
+    for item_model, item_type in (
+        (RecordVersionAgreement, "agreement"),
+        (RecordVersionRequirement, "requirement"),
+    ):
+        source = (
+            select(
+                activity_date,
+                Record.prepared_by_user_id,
+                Record.client_id,
+                Record.project_id,
+                literal(item_type),
+                item_model.status,
+                func.count(item_model.id),
+            )
+            .select_from(item_model)
+            .join(Record, Record.id == item_model.record_id)
+            .join(RecordVersion, RecordVersion.id == item_model.record_version_id)
+            .where(
+                Record.deleted_at.is_(None),
+                Record.active_version_id == item_model.record_version_id,
+                _activity_range_filter(start, end),
+            )
+            .group_by(
+                activity_date,
+                Record.prepared_by_user_id,
+                Record.client_id,
+                Record.project_id,
+                item_model.status,
+            )
+        )
+        db.execute(insert(CommitmentDailyRollup).from_select(columns, source))
+
+
+# ---------------------------------------------------------------------------
+# API pública
+# ---------------------------------------------------------------------------
+
+def refresh_reporting_rollup_days(
+    db: Session,
+    *,
+    record_days: Iterable[date] = (),
+    transition_days: Iterable[date] = (),
+    activity_days: Iterable[date] = (),
+) -> None:
+    """Recalcula las particiones diarias afectadas dentro de la transacción actual.
+
+    Cada día (cada mes, para las transiciones) se reconstruye completo desde
+    las tablas fuente, así que la operación es idempotente y su costo
+    depende del volumen de ese periodo, no del historial acumulado.
+    """
+    for day in sorted(set(record_days)):
+        _refresh_record_rollups(db, day, day + timedelta(days=1))
+    for month in sorted({day.replace(day=1) for day in transition_days}):
+        _refresh_transition_rollups(db, month, _next_month(month))
+    for day in sorted(set(activity_days)):
+        next_day = day + timedelta(days=1)
+        _refresh_commitment_rollups(db, day, next_day)
+
+
+def resolve_record_activity_days(db: Session, record_ids: Iterable[str]) -> set[date]:
+    ids = [record_id for record_id in set(record_ids) if record_id]
+    if not ids:
+        return set()
+    rows = (
+        db.query(func.distinct(_activity_date_expr()))
+        .select_from(RecordVersion)
+        .join(Record, Record.id == RecordVersion.record_id)
+        .filter(Record.id.in_(ids))
+        .all()
+    )
+    return {_as_day(row[0]) for row in rows if row[0] is not None}
+
+
+def resolve_record_transition_days(db: Session, record_ids: Iterable[str]) -> set[date]:
+    ids = [record_id for record_id in set(record_ids) if record_id]
+    if not ids:
+        return set()
+    rows = (
+        db.query(func.distinct(func.date(RecordStatusTransition.changed_at)))
+        .filter(RecordStatusTransition.record_id.in_(ids))
+        .all()
+    )
+    return {_as_day(row[0]) for row in rows if row[0] is not None}
+
+
+def _sync_redis():
+    import redis as redis_sync
+
+    return redis_sync.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=getattr(settings, "redis_db", 0),
+        decode_responses=True,
+        socket_connect_timeout=settings.redis_socket_connect_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+    )
+
+
+def mark_reporting_rollups_stale(
+    *,
+    record_days: Iterable[date] = (),
+    transition_days: Iterable[date] = (),
+    activity_days: Iterable[date] = (),
+    transition_record_ids: Iterable[str] = (),
+    activity_record_ids: Iterable[str] = (),
+) -> None:
+    """Anota particiones pendientes para `reconcile_reporting_rollups`."""
+    members = {
+        *(f"record:{day.isoformat()}" for day in record_days),
+        *(f"transition:{day.isoformat()}" for day in transition_days),
+        *(f"activity:{day.isoformat()}" for day in activity_days),
+        *(f"transition_record:{record_id}" for record_id in transition_record_ids if record_id),
+        *(f"activity_record:{record_id}" for record_id in activity_record_ids if record_id),
+    }
+    if not members:
+        return
+    client = _sync_redis()
+    try:
+        client.sadd(ROLLUPS_STALE_KEY, *members)
+    finally:
+        client.close()
+
+
+def reconcile_reporting_rollups(db: Session) -> dict[str, int]:
+    """
+    Recalcula las particiones anotadas por `mark_reporting_rollups_stale`.
+    Las extrae con SPOP (una marca nueva durante la corrida queda para la
+    siguiente) y las devuelve al SET si el recálculo falla.
+    """
+    client = _sync_redis()
+    processed = 0
+    try:
+        while True:
+            members = client.spop(ROLLUPS_STALE_KEY, _RECONCILE_BATCH) or []
+            if not members:
+                break
+            kinds: dict[str, set[str]] = {}
+            for member in members:
+                kind, _, value = member.partition(":")
+                kinds.setdefault(kind, set()).add(value)
+            try:
+                refresh_reporting_rollup_days(
+                    db,
+                    record_days={_as_day(value) for value in kinds.get("record", ())},
+                    transition_days={_as_day(value) for value in kinds.get("transition", ())}
+                    | resolve_record_transition_days(db, kinds.get("transition_record", ())),
+                    activity_days={_as_day(value) for value in kinds.get("activity", ())}
+                    | resolve_record_activity_days(db, kinds.get("activity_record", ())),
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+                client.sadd(ROLLUPS_STALE_KEY, *members)
+                raise
+            processed += len(members)
+    finally:
+        client.close()
+    if processed:
+        logger.info("reporting_rollups: reconciliación recalculó %s marcas pendientes", processed)
+    return {"processed": processed}
+
+
+def _history_bounds(db: Session) -> tuple[date, date] | None:
+    candidates = [
+        db.query(func.min(func.date(Record.created_at))).scalar(),
+        db.query(func.min(func.date(RecordStatusTransition.changed_at))).scalar(),
+        db.query(func.min(Record.document_date)).scalar(),
+        db.query(func.min(func.date(RecordVersion.published_at))).scalar(),
+    ]
+    candidates = [value for value in candidates if value is not None]
+    if not candidates:
+        return None
+    return min(candidates), utc_now().date() + timedelta(days=1)
+
+
+def rebuild_reporting_rollups(
+    db: Session,
+    *,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> int:
+    """Reconstruye todas las tablas de rollup en bloques mensuales.
+
+    Hace commit por bloque para no mantener una transacción larga sobre el
+    historial completo. Retorna la cantidad de días procesados.
+    """
+    bounds = _history_bounds(db)
+    if bounds is None:
+        return 0
+
+    start = date_from or bounds[0]
+    end = (date_to + timedelta(days=1)) if date_to else bounds[1]
+    processed = 0
+    cursor = start
+    while cursor < end:
+        # Bloques alineados a meses: las transiciones se recalculan por mes completo.
+        chunk_end = min(_next_month(cursor), end)
+        _refresh_record_rollups(db, cursor, chunk_end)
+        _refresh_transition_rollups(db, cursor, chunk_end)
+        _refresh_commitment_rollups(db, cursor, chunk_end)
+        db.commit()
+        processed += (chunk_end - cursor).days
+        logger.info("reporting_rollups: backfill %s → %s completado", cursor, chunk_end)
+        cursor = chunk_end
+    return processed
+
+
+def ensure_reporting_rollups_seeded(db: Session) -> None:
+    """Backfill inicial si las tablas de rollup están vacías y ya existe historial."""
+    has_rollups = db.query(RecordDailyRollup.id).limit(1).first() is not None
+    if has_rollups:
+        return
+    has_records = db.query(Record.id).limit(1).first() is not None
+    if not has_records:
+        return
+    days = rebuild_reporting_rollups(db)
+    logger.info("reporting_rollups: backfill inicial completado (%s días)", days)
@@ -0,0 +1,254 @@
+# services/schedule_registry_service.py
+"""
+Registro de programaciones del scheduler en Redis.
+
+En vez de que el scheduler golpee endpoints de tick cada minuto y cada
+servicio evalúe su cron, el backend calcula el próximo disparo de cada
+programación (core/cron.py) y lo deja en un ZSET:
+
+  scheduler:due           ZSET  clave → epoch del próximo disparo
+  scheduler:definitions   HASH  clave → "cron|zona" vigente
+  scheduler:changed       canal para despertar al scheduler si algo cambió
+
+- `sync_schedules` recalcula el registro completo desde la configuración
+  persistida. Se llama al arrancar, al guardar configuración de respaldos o
+  mantenimiento y desde el scheduler (arranque y resync periódico). Una
+  programación sin cambios conserva su disparo pendiente.
+- El scheduler duerme hasta el menor score, reclama lo vencido (ZREM
+  atómico) y llama a `/internal/v1/schedules/fire`; `fire_schedule`
+  ejecuta solo esa programación para el slot agendado y reprograma el
+  siguiente disparo. Si la ejecución falla, el scheduler devuelve el slot y
+  reintenta; tras `SCHEDULE_MAX_FIRE_ATTEMPTS` fallos (o un 4xx, que no se
+  arregla reintentando) el backend salta al siguiente disparo igual.
+
+Claves: `backups:<scope>`, `maintenance:<session_cleanup|temp_cleanup|queue_monitor>`,
+`notifications:<pending_publication_reminders|unread_reconcile>`,
+`reporting:rollups_reconcile`, `search:index_reconcile`.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.cron import parse_cron
+from core.datetime_utils import utc_now
+from db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_DUE_KEY = "scheduler:due"
+SCHEDULE_DEFINITIONS_KEY = "scheduler:definitions"
+SCHEDULE_CHANGED_CHANNEL = "scheduler:changed"
+SCHEDULER_TIMEZONE = "America/Santiago"
+SCHEDULE_ATTEMPTS_PREFIX = "scheduler:attempts:"
+SCHEDULE_ATTEMPTS_TTL_SECONDS = 24 * 60 * 60
+SCHEDULE_MAX_FIRE_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class ScheduleDefinition:
+    key: str
+    cron: str
+    timezone: str = SCHEDULER_TIMEZONE
+
+    @property
+    def fingerprint(self) -> str:
+        return f"{self.cron}|{self.timezone}"
+
+    def next_fire_after(self, after: datetime) -> datetime | None:
+        return parse_cron(self.cron).next_after(after, ZoneInfo(self.timezone))
+
+
+# Programaciones fijas (antes definidas en el contenedor scheduler)
+_STATIC_DEFINITIONS = (
+    # Resumen diario — lunes a viernes a las 8:00
+    ScheduleDefinition("notifications:pending_publication_reminders", "0 8 * * 1-5"),
+    # Reconciliación de contadores de no leídas — cada 15 minutos, segundo 30
+    ScheduleDefinition("notifications:unread_reconcile", "30 */15 * * * *"),
+    # Particiones de rollup que el listener no pudo recalcular — cada 10 minutos
+    ScheduleDefinition("reporting:rollups_reconcile", "0 */10 * * * *"),
+    # Documentos de búsqueda que el listener no pudo recalcular — cada 10 minutos, segundo 20
+    ScheduleDefinition("search:index_reconcile", "20 */10 * * * *"),
+)
+
+
+def _parse_definition(key: str, raw: str | None) -> ScheduleDefinition | None:
+    cron, _, timezone_name = str(raw or "").partition("|")
+    if not cron:
+        return None
+    return ScheduleDefinition(key, cron, timezone_name or SCHEDULER_TIMEZONE)
+
+
+def collect_schedule_definitions(db: Session) -> list[ScheduleDefinition]:
+    from services.system_backups_service import backup_schedule_definitions
+    from services.system_maintenance_service import maintenance_schedule_definitions
+
+    definitions = [*_STATIC_DEFINITIONS, *backup_schedule_definitions(db), *maintenance_schedule_definitions(db)]
+    valid: list[ScheduleDefinition] = []
+    for definition in definitions:
+        try:
+            parse_cron(definition.cron)
+        except ValueError as exc:
+            logger.warning("scheduler: programación %s ignorada, cron inválido: %s", definition.key, exc)
+            continue
+        valid.append(definition)
+    return valid
+
+
+def _sync_redis():
+    import redis as redis_sync
+
+    return redis_sync.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=getattr(settings, "redis_db", 0),
+        decode_responses=True,
+        socket_connect_timeout=settings.redis_socket_connect_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+    )
+
+
+def sync_schedules(db: Session) -> dict[str, Any]:
+    """Reconcilia ZSET + HASH con la configuración actual. Idempotente."""
+    definitions = {definition.key: definition for definition in collect_schedule_definitions(db)}
+    now = utc_now()
+    client = _sync_redis()
+    try:
+        stored = client.hgetall(SCHEDULE_DEFINITIONS_KEY) or {}
+        pending = dict(client.zrange(SCHEDULE_DUE_KEY, 0, -1, withscores=True) or [])
+
+        removed = sorted((set(stored) | set(pending)) - set(definitions))
+        scheduled: list[dict[str, Any]] = []
+        changed = bool(removed)
+        pipe = client.pipeline(transaction=True)
+        if removed:
+            pipe.zrem(SCHEDULE_DUE_KEY, *removed)
+            pipe.hdel(SCHEDULE_DEFINITIONS_KEY, *removed)
+        for key, definition in sorted(definitions.items()):
+            score = pending.get(key)
+            if score is None or stored.get(key) != definition.fingerprint:
+                next_fire = definition.next_fire_after(now)
+                if next_fire is None:
+                    pipe.zrem(SCHEDULE_DUE_KEY, key)
+                    pipe.hset(SCHEDULE_DEFINITIONS_KEY, key, definition.fingerprint)
+                    continue
+                score = next_fire.timestamp()
+                pipe.zadd(SCHEDULE_DUE_KEY, {key: score})
+                pipe.hset(SCHEDULE_DEFINITIONS_KEY, key, definition.fingerprint)
+                changed = True
+            scheduled.append({
+                "key": key,
+                "cron": definition.cron,
+                "timezone": definition.timezone,
+                "next_fire_at": datetime.fromtimestamp(score, UTC).isoformat(),
+            })
+        if changed:
+            pipe.publish(SCHEDULE_CHANGED_CHANNEL, "sync")
+        pipe.execute()
+    finally:
+        client.close()
+    return {"scheduled": scheduled, "removed": removed}
+
+
+def resync_schedules_quietly(db: Session) -> None:
+    """Para llamar después de guardar configuración: un fallo de Redis no rompe el guardado."""
+    try:
+        sync_schedules(db)
+    except Exception as exc:
+        logger.warning("scheduler: no se pudo recalcular programaciones: %s", exc)
+
+
+async def _reschedule(key: str, scheduled_for: datetime) -> datetime | None:
+    redis = get_redis()
+    definition = _parse_definition(key, await redis.hget(SCHEDULE_DEFINITIONS_KEY, key))
+    if definition is None:
+        return None
+    # Desde el máximo entre lo agendado y ahora: un disparo atrasado no genera ráfagas.
+    next_fire = definition.next_fire_after(max(scheduled_for, utc_now()))
+    if next_fire is None:
+        return None
+    await redis.zadd(SCHEDULE_DUE_KEY, {key: next_fire.timestamp()})
+    return next_fire
+
+
+async def _run_schedule(db: Session, key: str, scheduled_for: datetime) -> dict:
+    group, _, name = key.partition(":")
+    local_dt = scheduled_for.astimezone(ZoneInfo(SCHEDULER_TIMEZONE))
+    if group == "backups":
+        from services.system_backups_service import run_scheduled_system_backup
+
+        return await run_scheduled_system_backup(db, scope=name, scheduled_local_dt=local_dt)
+    if group == "maintenance":
+        from services.system_maintenance_service import run_scheduled_maintenance
+
+        return await run_scheduled_maintenance(db, schedule=name, scheduled_local_dt=local_dt)
+    if key == "notifications:pending_publication_reminders":
+        from services.notification_service import enqueue_pending_publication_reminders
+
+        return {"sent": await enqueue_pending_publication_reminders(db)}
+    if key == "notifications:unread_reconcile":
+        from services.notification_unread_counters_service import reconcile_unread_counters
+
+        return await reconcile_unread_counters(db)
+    if key == "reporting:rollups_reconcile":
+        from services.reporting_rollups_service import reconcile_reporting_rollups
+
+        return reconcile_reporting_rollups(db)
+    if key == "search:index_reconcile":
+        from services.search_index_service import reconcile_search_documents
+
+        return reconcile_search_documents(db)
+    raise HTTPException(status_code=404, detail="SCHEDULE_NOT_FOUND")
+
+
+def _attempts_key(key: str, scheduled_for: datetime) -> str:
+    return f"{SCHEDULE_ATTEMPTS_PREFIX}{key}:{int(scheduled_for.timestamp())}"
+
+
+async def _register_failed_attempt(key: str, scheduled_for: datetime) -> int:
+    redis = get_redis()
+    attempts_key = _attempts_key(key, scheduled_for)
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.incr(attempts_key)
+        pipe.expire(attempts_key, SCHEDULE_ATTEMPTS_TTL_SECONDS)
+        attempts, _ = await pipe.execute()
+    return int(attempts)
+
+
+async def fire_schedule(db: Session, *, key: str, scheduled_for: datetime) -> dict:
+    """Ejecuta la programación `key` para su disparo agendado y deja listo el siguiente."""
+    if scheduled_for.tzinfo is None:
+        scheduled_for = scheduled_for.replace(tzinfo=UTC)
+    try:
+        outcome = await _run_schedule(db, key, scheduled_for)
+    except Exception as exc:
+        # Sin reprogramar, el scheduler devuelve el slot y reintenta. Un 4xx
+        # o un slot que ya agotó sus intentos pasa al siguiente disparo.
+        client_error = isinstance(exc, HTTPException) and 400 <= exc.status_code < 500
+        attempts = SCHEDULE_MAX_FIRE_ATTEMPTS if client_error else await _register_failed_attempt(key, scheduled_for)
+        if attempts >= SCHEDULE_MAX_FIRE_ATTEMPTS:
+            next_fire = await _reschedule(key, scheduled_for)
+            await get_redis().delete(_attempts_key(key, scheduled_for))
+            logger.error(
+                "scheduler: %s falló %s veces para %s, siguiente disparo %s",
+                key,
+                attempts,
+                scheduled_for.isoformat(),
+                next_fire.isoformat() if next_fire else "-",
+            )
+        raise
+    await get_redis().delete(_attempts_key(key, scheduled_for))
+    next_fire = await _reschedule(key, scheduled_for)
+    return {
+        "key": key,
+        "scheduled_for": scheduled_for.astimezone(UTC).isoformat(),
+        "next_fire_at": next_fire.astimezone(UTC).isoformat() if next_fire else None,
+        "outcome": outcome,
+    }
@@ -0,0 +1,337 @@
+# services/search_index_service.py
+"""
+Índice de búsqueda de los listados (tabla `search_documents`).
+
+Cada entidad buscable tiene un documento con:
+  - sort_key:    nombre principal normalizado (autocompletar por prefijo).
+  - search_text: todos sus campos buscables normalizados (FULLTEXT).
+
+Normalizar = quitar tildes, pasar a minúsculas y dejar solo letras/dígitos
+separados por espacio: "José.Pérez@Acme.cl" → "jose perez acme cl". Así el
+texto indexado y el término buscado tokenizan igual y el término no puede
+inyectar operadores del modo booleano.
+
+Búsqueda (`search_match_clause`):
+  - Tokens ≥ `search_fulltext_min_token_chars`: `MATCH ... AGAINST
+    ('+tok1* +tok2*' IN BOOLEAN MODE)` → todas las palabras, por prefijo de
+    palabra. Los tokens más cortos se aplican como LIKE sobre las filas ya
+    acotadas por el FULLTEXT.
+  - Solo tokens cortos (autocompletar con 1-2 letras): prefijo de sort_key,
+    que resuelve por rango sobre (entity_type, sort_key).
+
+Los documentos se mantienen al escribir (events/search_index.py) y se
+reconstruyen con `rebuild_search_index`. Lo que el listener no pudo
+recalcular queda anotado en Redis para `reconcile_search_documents`.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import unicodedata
+from typing import Callable, Iterable
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.config import settings
+from core.datetime_utils import utc_now_db
+from models.clients import Client
+from models.participant import Participant
+from models.participant_email import ParticipantEmail
+from models.projects import Project
+from models.search_documents import SearchDocument
+from models.tags import Tag
+from models.user import User
+from models.user_profiles import UserProfile
+
+logger = logging.getLogger(__name__)
+
+SEARCH_ENTITY_TEAM_MEMBER = "team_member"
+SEARCH_ENTITY_TAG = "tag"
+SEARCH_ENTITY_CLIENT = "client"
+SEARCH_ENTITY_PROJECT = "project"
+SEARCH_ENTITY_PARTICIPANT = "participant"
+
+_SORT_KEY_MAX = 191
+_REFRESH_CHUNK = 500
+# Documentos pendientes: SET de "<entity_type>:<entity_id>".
+SEARCH_INDEX_STALE_KEY = "search:index:stale"
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# entity_id → (sort_key sin normalizar, campos buscables)
+_SourceRows = dict[str, tuple[str | None, list[str | None]]]
+
+
+def normalize_search_text(value: str | None) -> str:
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    without_marks = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", without_marks.lower()).strip()
+
+
+# ── Fuentes por entidad ──────────────────────────────────────────────────────
+
+def _team_member_rows(db: Session, ids: list[str]) -> _SourceRows:
+    stmt = (
+        select(User.id, User.full_name, User.username, User.email, UserProfile.position)
+        .outerjoin(UserProfile, UserProfile.user_id == User.id)
+        .where(User.id.in_(ids), User.deleted_at.is_(None))
+    )
+    return {
+        str(user_id): (full_name or username, [full_name, username, email, position])
+        for user_id, full_name, username, email, position in db.execute(stmt)
+    }
+
+
+def _tag_rows(db: Session, ids: list[str]) -> _SourceRows:
+    stmt = select(Tag.id, Tag.name).where(Tag.id.in_(ids), Tag.deleted_at.is_(None))
+    return {str(tag_id): (name, [name]) for tag_id, name in db.execute(stmt)}
+
+
+_CLIENT_SEARCH_COLUMNS = (
+    Client.name,
+    Client.legal_name,
+    Client.description,
+    Client.industry,
+    Client.email,
+    Client.phone,
+    Client.contact_name,
+    Client.contact_email,
+    Client.contact_phone,
+    Client.contact_position,
+    Client.contact_department,
+    Client.notes,
+    Client.tags,
+)
+
+
+def _client_rows(db: Session, ids: list[str]) -> _SourceRows:
+    stmt = select(Client.id, *_CLIENT_SEARCH_COLUMNS).where(Client.id.in_(ids), Client.deleted_at.is_(None))
+    return {str(row[0]): (row[1], list(row[1:])) for row in db.execute(stmt)}
+
+
+def _project_rows(db: Session, ids: list[str]) -> _SourceRows:
+    stmt = (
+        select(Project.id, Project.name, Project.code, Project.tags)
+        .where(Project.id.in_(ids), Project.deleted_at.is_(None))
+    )
+    return {str(project_id): (name, [name, code, tags]) for project_id, name, code, tags in db.execute(stmt)}
+
+
+def _participant_rows(db: Session, ids: list[str]) -> _SourceRows:
+    stmt = (
+        select(Participant.id, Participant.display_name, Participant.normalized_name, Participant.organization)
+        .where(Participant.id.in_(ids), Participant.deleted_at.is_(None))
+    )
+    rows: _SourceRows = {
+        str(participant_id): (display_name, [display_name, normalized_name, organization])
+        for participant_id, display_name, normalized_name, organization in db.execute(stmt)
+    }
+    if rows:
+        emails = select(ParticipantEmail.participant_id, ParticipantEmail.email).where(
+            ParticipantEmail.participant_id.in_(list(rows)),
+            ParticipantEmail.deleted_at.is_(None),
+        )
+        for participant_id, email in db.execute(emails):
+            rows[str(participant_id)][1].append(email)
+    return rows
+
+
+_SOURCES: dict[str, tuple[Callable[[Session, list[str]], _SourceRows], type]] = {
+    SEARCH_ENTITY_TEAM_MEMBER: (_team_member_rows, User),
+    SEARCH_ENTITY_TAG: (_tag_rows, Tag),
+    SEARCH_ENTITY_CLIENT: (_client_rows, Client),
+    SEARCH_ENTITY_PROJECT: (_project_rows, Project),
+    SEARCH_ENTITY_PARTICIPANT: (_participant_rows, Participant),
+}
+
+
+# ── Mantenimiento ────────────────────────────────────────────────────────────
+
+def refresh_search_documents(db: Session, entity_type: str, entity_ids: Iterable[str]) -> None:
+    """
+    Recalcula los documentos de `entity_ids` desde sus tablas de origen.
+    Las entidades borradas (o soft-deleted) salen del índice. Corre en la
+    transacción del llamador.
+    """
+    load_rows, _ = _SOURCES[entity_type]
+    ids = sorted({str(entity_id) for entity_id in entity_ids if entity_id})
+    now = utc_now_db()
+    for start in range(0, len(ids), _REFRESH_CHUNK):
+        chunk = ids[start:start + _REFRESH_CHUNK]
+        rows = load_rows(db, chunk)
+        if rows:
+            values = [
+                {
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "sort_key": normalize_search_text(sort_value)[:_SORT_KEY_MAX],
+                    "search_text": normalize_search_text(" ".join(str(field) for field in fields if field)),
+                    "updated_at": now,
+                }
+                for entity_id, (sort_value, fields) in rows.items()
+            ]
+            stmt = mysql_insert(SearchDocument.__table__).values(values)
+            db.execute(
+                stmt.on_duplicate_key_update(
+                    sort_key=stmt.inserted.sort_key,
+                    search_text=stmt.inserted.search_text,
+                    updated_at=stmt.inserted.updated_at,
+                )
+            )
+        gone = [entity_id for entity_id in chunk if entity_id not in rows]
+        if gone:
+            db.execute(
+                delete(SearchDocument).where(
+                    SearchDocument.entity_type == entity_type,
+                    SearchDocument.entity_id.in_(gone),
+                )
+            )
+
+
+def rebuild_search_index(db: Session, entity_types: Iterable[str] | None = None) -> int:
+    """
+    Reconstruye el índice completo (o de los tipos dados) recorriendo cada
+    tabla por id. Hace commit por bloque; al final elimina documentos que no
+    se tocaron (entidades que ya no existen). Retorna documentos procesados.
+    """
+    processed = 0
+    for entity_type in entity_types or _SOURCES:
+        _, model = _SOURCES[entity_type]
+        # DATETIME sin fracción: truncar para no borrar lo escrito en este mismo segundo.
+        started_at = utc_now_db().replace(microsecond=0)
+        last_id = ""
+        while True:
+            ids = [
+                str(row[0])
+                for row in db.execute(
+                    select(model.id)
+                    .where(model.deleted_at.is_(None), model.id > last_id)
+                    .order_by(model.id)
+                    .limit(_REFRESH_CHUNK)
+                )
+            ]
+            if not ids:
+                break
+            refresh_search_documents(db, entity_type, ids)
+            db.commit()
+            processed += len(ids)
+            last_id = ids[-1]
+        db.execute(
+            delete(SearchDocument).where(
+                SearchDocument.entity_type == entity_type,
+                SearchDocument.updated_at < started_at,
+            )
+        )
+        db.commit()
+        logger.info("search_index: %s reconstruido", entity_type)
+    return processed
+
+
+def _sync_redis():
+    import redis as redis_sync
+
+    return redis_sync.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=getattr(settings, "redis_db", 0),
+        decode_responses=True,
+        socket_connect_timeout=settings.redis_socket_connect_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+    )
+
+
+def mark_search_documents_stale(pending: dict[str, Iterable[str]]) -> None:
+    """Anota documentos `{entity_type: ids}` para `reconcile_search_documents`."""
+    members = {
+        f"{entity_type}:{entity_id}"
+        for entity_type, entity_ids in pending.items()
+        for entity_id in entity_ids
+        if entity_id
+    }
+    if not members:
+        return
+    client = _sync_redis()
+    try:
+        client.sadd(SEARCH_INDEX_STALE_KEY, *members)
+    finally:
+        client.close()
+
+
+def reconcile_search_documents(db: Session) -> dict[str, int]:
+    """
+    Recalcula los documentos anotados por `mark_search_documents_stale`.
+    Los extrae con SPOP y los devuelve al SET si el recálculo falla.
+    """
+    client = _sync_redis()
+    processed = 0
+    try:
+        while True:
+            members = client.spop(SEARCH_INDEX_STALE_KEY, _REFRESH_CHUNK) or []
+            if not members:
+                break
+            grouped: dict[str, set[str]] = {}
+            for member in members:
+                entity_type, _, entity_id = member.partition(":")
+                if entity_type in _SOURCES:
+                    grouped.setdefault(entity_type, set()).add(entity_id)
+            try:
+                for entity_type, entity_ids in grouped.items():
+                    refresh_search_documents(db, entity_type, entity_ids)
+                db.commit()
+            except Exception:
+                db.rollback()
+                client.sadd(SEARCH_INDEX_STALE_KEY, *members)
+                raise
+            processed += len(members)
+    finally:
+        client.close()
+    if processed:
+        logger.info("search_index: reconciliación recalculó %s documentos pendientes", processed)
+    return {"processed": processed}
+
+
+def ensure_search_index_seeded(db: Session) -> None:
+    """Construye el índice si la tabla está vacía (primer arranque tras crearla)."""
+    if db.query(SearchDocument.entity_id).limit(1).first() is not None:
+        return
+    processed = rebuild_search_index(db)
+    if processed:
+        logger.info("search_index: construcción inicial completada (%s documentos)", processed)
+
+
+# ── Consulta ─────────────────────────────────────────────────────────────────
+
+def search_match_clause(entity_type: str, term: str | None, id_column: ColumnElement) -> ColumnElement | None:
+    """
+    Filtro `id_column IN (SELECT entity_id FROM search_documents ...)` para
+    el término dado, o None si el término no tiene nada buscable.
+    """
+    normalized = normalize_search_text(term)
+    if not normalized:
+        return None
+
+    stmt = select(SearchDocument.entity_id).where(SearchDocument.entity_type == entity_type)
+    min_chars = max(1, int(settings.search_fulltext_min_token_chars))
+    tokens = normalized.split()
+    long_tokens = [token for token in tokens if len(token) >= min_chars]
+    if not long_tokens:
+        # Autocompletar: normalized solo tiene [0-9a-z ], sin comodines de LIKE que escapar.
+        stmt = stmt.where(SearchDocument.sort_key.like(f"{normalized}%"))
+    else:
+        stmt = stmt.where(SearchDocument.search_text.match(" ".join(f"+{token}*" for token in long_tokens)))
+        for token in tokens:
+            if len(token) < min_chars:
+                stmt = stmt.where(SearchDocument.search_text.like(f"%{token}%"))
+    return id_column.in_(stmt)
+
+
+def search_documents_count(db: Session, entity_type: str) -> int:
+    """Documentos indexados de un tipo (diagnóstico del script de reconstrucción)."""
+    return int(
+        db.query(func.count(SearchDocument.entity_id))
+        .filter(SearchDocument.entity_type == entity_type)
+        .scalar()
+        or 0
+    )
@@ -22,11 +22,13 @@ from schemas.sendmail import (
     SendMailRequest,
     SendMailResponse,
 )
+from services.email_blob_store import offload_base64_item
 from services.email_template_service import (
     get_inline_assets_for_html,
     list_email_templates,
     render_email_template,
 )
+from services.queue_telemetry import stamp_job_envelope
 
 logger = logging.getLogger(__name__)
 
@@ -77,13 +79,16 @@ async def enqueue_email(payload: SendMailRequest, redis: Redis) -> SendMailRespo
             "email_type": payload.email_type,
             "reply_to": payload.reply_to,
             "template_id": payload.template_id,
-            "inline_assets": inline_assets,
-            "attachments": [attachment.model_dump(by_alias=False) for attachment in (payload.attachments or [])],
+            "inline_assets": [offload_base64_item(asset) for asset in inline_assets],
+            "attachments": [
+                offload_base64_item(attachment.model_dump(by_alias=False))
+                for attachment in (payload.attachments or [])
+            ],
         },
     }
 
     _record_email_queued(job)
-    await redis.rpush(QUEUE_EMAIL, json.dumps(job))
+    await redis.rpush(QUEUE_EMAIL, json.dumps(stamp_job_envelope(job)))
     queue_length = await redis.llen(QUEUE_EMAIL)
 
     logger.info(
@@ -122,6 +127,7 @@ async def get_queue_status(redis: Redis) -> QueueStatusResponse:
                 template_id= payload.get("template_id"),
                 inline_assets=len(payload.get("inline_assets") or []),
                 attachments=len(payload.get("attachments") or []),
+                enqueued_at=job.get("enqueued_at"),
             ))
         except json.JSONDecodeError:
             jobs.append(QueueJobItem(
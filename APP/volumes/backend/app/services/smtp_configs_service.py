@@ -4,6 +4,7 @@ import base64
 import hashlib
 import hmac
 import json
+import logging
 import mimetypes
 import os
 import socket
@@ -34,7 +35,11 @@ from schemas.smtp_configs import (
     SmtpConfigUpdateRequest,
 )
 
+logger = logging.getLogger(__name__)
+
 TEST_TOKEN_TTL_SECONDS = 15 * 60
+# El worker de email cachea la config activa por esta versión (handlers/email_handler.py).
+SMTP_CONFIG_VERSION_KEY = "smtp:config:version"
 
 
 def _utcnow() -> datetime:
@@ -434,6 +439,26 @@ def _send_test_email(db: Session, config_values: dict[str, Any], test_email: str
                 pass
 
 
+def _notify_smtp_config_changed() -> None:
+    """Incrementa la versión de config SMTP para que el worker la recargue. Llamar después del commit."""
+    try:
+        import redis as redis_sync
+
+        client = redis_sync.Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=getattr(settings, "redis_db", 0),
+            socket_connect_timeout=settings.redis_socket_connect_timeout,
+            socket_timeout=settings.redis_socket_timeout,
+        )
+        try:
+            client.incr(SMTP_CONFIG_VERSION_KEY)
+        finally:
+            client.close()
+    except Exception as exc:
+        logger.warning("smtp: no se pudo publicar cambio de configuración: %s", exc)
+
+
 def _reload_with_relations(db: Session, config_id: str) -> SmtpConfig:
     return _get_or_404(db, config_id)
 
@@ -563,6 +588,7 @@ def create_smtp_config(db: Session, body: SmtpConfigCreateRequest, created_by_id
 
     db.add(obj)
     db.commit()
+    _notify_smtp_config_changed()
     db.refresh(obj)
     return _build_response_dict(_reload_with_relations(db, obj.id))
 
@@ -598,6 +624,7 @@ def update_smtp_config(db: Session, config_id: str, body: SmtpConfigUpdateReques
     obj.last_tested_by = updated_by_id
 
     db.commit()
+    _notify_smtp_config_changed()
     db.refresh(obj)
     return _build_response_dict(_reload_with_relations(db, obj.id))
 
@@ -609,6 +636,7 @@ def activate_smtp_config(db: Session, config_id: str, updated_by_id: str) -> dic
     obj.is_active = True
     obj.updated_by = updated_by_id
     db.commit()
+    _notify_smtp_config_changed()
     db.refresh(obj)
     return _build_response_dict(_reload_with_relations(db, obj.id))
 
@@ -639,6 +667,7 @@ def delete_smtp_config(db: Session, config_id: str, deleted_by_id: str) -> dict[
     obj.is_active = False
 
     db.commit()
+    _notify_smtp_config_changed()
     return {
         "ok": True,
         "replacement_id": str(replacement.id) if replacement else None,
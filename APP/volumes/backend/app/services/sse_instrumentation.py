@@ -6,6 +6,8 @@ import time
 import uuid
 from typing import Any
 
+from core.metrics import record_sse_event
+
 ALLOWED_CLOSE_REASONS = {
     "client_disconnect",
     "server_recycle",
@@ -54,6 +56,12 @@ def sse_log(logger: logging.Logger, event: str, *, level: str = "info", **fields
     for key, value in fields.items():
         if key not in payload and key not in {"authorization", "bearer", "jwt", "otp", "payload"}:
             payload[key] = value
+    record_sse_event(
+        event,
+        payload.get("endpoint"),
+        close_reason=payload.get("close_reason"),
+        duration_ms=payload.get("duration_ms"),
+    )
     message = f"{event} {json.dumps(payload, sort_keys=True, ensure_ascii=False)}"
     log_method = getattr(logger, level, logger.info)
     log_method(message)
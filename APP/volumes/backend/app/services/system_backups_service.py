@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import asyncio
 import json
+import logging
 import shutil
 import tarfile
 import uuid
@@ -17,6 +18,7 @@ from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 
 from core.config import settings
+from core.cron import cron_matches, cron_slot
 from core.datetime_utils import assume_utc, utc_isoformat_z, utc_now, utc_now_db
 from core.exceptions import BadRequestException, NotFoundException
 from db.redis import get_redis
@@ -35,6 +37,10 @@ from schemas.system_backups import (
     validate_cron_expression,
 )
 from services.system_backup_events_service import publish_backup_event
+from services.queue_telemetry import stamp_job_envelope
+from services.schedule_registry_service import ScheduleDefinition, resync_schedules_quietly
+
+logger = logging.getLogger(__name__)
 
 BACKUP_QUEUE = "queue:backups"
 BACKUP_DLQ_QUEUE = "queue:backups:dlq"
@@ -334,66 +340,6 @@ def _localnow() -> datetime:
     return datetime.now(ZoneInfo(SCHEDULER_TIMEZONE))
 
 
-def _current_slot(current_local_dt: datetime) -> str:
-    return current_local_dt.strftime("%Y%m%d%H%M")
-
-
-def _split_step_segment(segment: str) -> tuple[str, int | None]:
-    parts = str(segment or "").split("/")
-    base = parts[0]
-    step = int(parts[1]) if len(parts) == 2 else None
-    return base, step
-
-
-def _field_part_matches(part: str, current_value: int, min_value: int, max_value: int) -> bool:
-    base, step = _split_step_segment(part)
-
-    if base == "*":
-        if step is None:
-            return True
-        return (current_value - min_value) % step == 0
-
-    if "-" in base:
-        start_raw, end_raw = base.split("-", 1)
-        start = int(start_raw)
-        end = int(end_raw)
-        if current_value < start or current_value > end:
-            return False
-        if step is None:
-            return True
-        return (current_value - start) % step == 0
-
-    target = int(base)
-    if step is None:
-        return current_value == target
-    if current_value < target or current_value > max_value:
-        return False
-    return (current_value - target) % step == 0
-
-
-def _field_matches(expression: str, current_value: int, min_value: int, max_value: int) -> bool:
-    return any(
-        _field_part_matches(part.strip(), current_value, min_value, max_value)
-        for part in str(expression or "").split(",")
-        if part.strip()
-    )
-
-
-def _cron_matches(cron_expression: str, current_local_dt: datetime) -> bool:
-    normalized = validate_cron_expression(cron_expression)
-    minute, hour, day_of_month, month, day_of_week = normalized.split(" ")
-    weekday = (current_local_dt.weekday() + 1) % 7
-    return all(
-        (
-            _field_matches(minute, current_local_dt.minute, 0, 59),
-            _field_matches(hour, current_local_dt.hour, 0, 23),
-            _field_matches(day_of_month, current_local_dt.day, 1, 31),
-            _field_matches(month, current_local_dt.month, 1, 12),
-            _field_matches(day_of_week, weekday, 0, 6),
-        )
-    )
-
-
 async def _acquire_backup_tick_lock() -> str | None:
     redis = get_redis()
     token = str(uuid.uuid4())
@@ -773,6 +719,7 @@ def update_system_backups_config(
         details={"retentionDays": body.backup_retention_days, "historyVisible": body.backup_history_visible},
     )
     db.commit()
+    resync_schedules_quietly(db)
     return _build_config_response(obj)
 
 
@@ -1115,9 +1062,11 @@ def get_system_backup_artifact_download(db: Session, *, artifact_id: str) -> dic
     except ValueError:
         raise BadRequestException("La ruta del respaldo está fuera del directorio permitido.")
 
+    checksum = str(artifact.checksum_sha256 or "").strip().lower()
     return {
         "path": str(package_path),
         "filename": artifact.name or package_path.name,
+        "etag": f'"{checksum}"' if checksum else None,
     }
 
 
@@ -1335,7 +1284,7 @@ async def _enqueue_backup_job(action: str, payload: dict, *, job_id: str | None
         "payload": payload,
     }
     redis = get_redis()
-    await redis.rpush(BACKUP_QUEUE, json.dumps(job, ensure_ascii=False))
+    await redis.rpush(BACKUP_QUEUE, json.dumps(stamp_job_envelope(job), ensure_ascii=False))
     return job_id
 
 
@@ -1478,18 +1427,98 @@ async def run_system_backup_now(
     )
 
 
+def backup_schedule_definitions(db: Session) -> list[ScheduleDefinition]:
+    """Una programación por scope habilitado, para el registro del scheduler."""
+    try:
+        settings_obj = _get_settings_singleton(db)
+    except Exception as exc:
+        logger.warning("No se pudieron leer las políticas de respaldo para el scheduler: %s", exc)
+        return []
+    policies = _normalize_policies_config(_json_loads(settings_obj.policies_json, DEFAULT_POLICIES))
+    definitions: list[ScheduleDefinition] = []
+    for scope in BACKUP_SCOPES:
+        policy = policies.get(scope) if isinstance(policies, dict) else None
+        if not isinstance(policy, dict) or not bool(policy.get("enabled")):
+            continue
+        cron_expression = str(policy.get("cron") or "").strip()
+        if cron_expression:
+            definitions.append(ScheduleDefinition(f"backups:{scope}", cron_expression, SCHEDULER_TIMEZONE))
+    return definitions
+
+
+async def _run_backup_policy_slot(
+    db: Session,
+    *,
+    scope: str,
+    policies: dict,
+    local_dt: datetime,
+    slot: str,
+) -> tuple[bool, dict]:
+    """Evalúa y, si corresponde, encola el respaldo de `scope` para `slot`. Retorna (encolado, item)."""
+    policy = policies.get(scope) if isinstance(policies, dict) else None
+    if not isinstance(policy, dict):
+        return False, {"scope": scope, "action": None, "reason": "missing_policy", "job_id": None}
+
+    if not bool(policy.get("enabled")):
+        return False, {"scope": scope, "action": None, "reason": "disabled", "job_id": None}
+
+    cron_expression = str(policy.get("cron") or "").strip()
+    if not cron_matches(validate_cron_expression(cron_expression), local_dt):
+        return False, {"scope": scope, "action": None, "reason": "not_due", "job_id": None}
+
+    if not await _claim_backup_schedule_slot(scope, slot):
+        return False, {"scope": scope, "action": None, "reason": "already_enqueued", "job_id": None}
+
+    result = await _enqueue_backup_operation(
+        db,
+        scope=scope,
+        trigger_source="scheduled",
+        actor_snapshot=None,
+        requested_by_id=None,
+        scheduled_slot=slot,
+    )
+    return True, {
+        "scope": result["scope"],
+        "action": result["action"],
+        "reason": "cron_match",
+        "job_id": result["job_id"],
+    }
+
+
+def _tick_response(local_dt: datetime, slot: str, enqueued: list[dict], skipped: list[dict]) -> dict:
+    return {
+        "current_slot": slot,
+        "current_time": local_dt.isoformat(),
+        "timezone": SCHEDULER_TIMEZONE,
+        "enqueued": enqueued,
+        "skipped": skipped,
+    }
+
+
+async def run_scheduled_system_backup(db: Session, *, scope: str, scheduled_local_dt: datetime) -> dict:
+    """Disparo del scheduler para un scope; el slot sale de la hora agendada, no de la de llegada."""
+    if scope not in BACKUP_SCOPES:
+        raise NotFoundException("Scope de respaldo no encontrado")
+    slot = cron_slot(scheduled_local_dt)
+    settings_obj = _get_settings_singleton(db)
+    policies = _normalize_policies_config(_json_loads(settings_obj.policies_json, DEFAULT_POLICIES))
+    was_enqueued, item = await _run_backup_policy_slot(
+        db, scope=scope, policies=policies, local_dt=scheduled_local_dt, slot=slot
+    )
+    return _tick_response(scheduled_local_dt, slot, [item] if was_enqueued else [], [] if was_enqueued else [item])
+
+
 async def run_system_backups_tick(db: Session) -> dict:
     current_local_dt = _localnow()
-    current_slot = _current_slot(current_local_dt)
+    current_slot = cron_slot(current_local_dt)
     lock_token = await _acquire_backup_tick_lock()
 
     if not lock_token:
-        return {
-            "current_slot": current_slot,
-            "current_time": current_local_dt.isoformat(),
-            "timezone": SCHEDULER_TIMEZONE,
-            "enqueued": [],
-            "skipped": [
+        return _tick_response(
+            current_local_dt,
+            current_slot,
+            [],
+            [
                 {
                     "scope": "all",
                     "action": "backup_tick",
@@ -1497,7 +1526,7 @@ async def run_system_backups_tick(db: Session) -> dict:
                     "job_id": None,
                 }
             ],
-        }
+        )
 
     try:
         settings_obj = _get_settings_singleton(db)
@@ -1506,46 +1535,12 @@ async def run_system_backups_tick(db: Session) -> dict:
         skipped: list[dict] = []
 
         for scope in BACKUP_SCOPES:
-            policy = policies.get(scope) if isinstance(policies, dict) else None
-            if not isinstance(policy, dict):
-                skipped.append({"scope": scope, "action": None, "reason": "missing_policy", "job_id": None})
-                continue
-
-            if not bool(policy.get("enabled")):
-                skipped.append({"scope": scope, "action": None, "reason": "disabled", "job_id": None})
-                continue
-
-            cron_expression = str(policy.get("cron") or "").strip()
-            if not _cron_matches(cron_expression, current_local_dt):
-                skipped.append({"scope": scope, "action": None, "reason": "not_due", "job_id": None})
-                continue
-
-            if not await _claim_backup_schedule_slot(scope, current_slot):
-                skipped.append({"scope": scope, "action": None, "reason": "already_enqueued", "job_id": None})
-                continue
-
-            result = await _enqueue_backup_operation(
-                db,
-                scope=scope,
-                trigger_source="scheduled",
-                actor_snapshot=None,
-                requested_by_id=None,
-                scheduled_slot=current_slot,
+            was_enqueued, item = await _run_backup_policy_slot(
+                db, scope=scope, policies=policies, local_dt=current_local_dt, slot=current_slot
             )
-            enqueued.append({
-                "scope": result["scope"],
-                "action": result["action"],
-                "reason": "cron_match",
-                "job_id": result["job_id"],
-            })
+            (enqueued if was_enqueued else skipped).append(item)
 
-        return {
-            "current_slot": current_slot,
-            "current_time": current_local_dt.isoformat(),
-            "timezone": SCHEDULER_TIMEZONE,
-            "enqueued": enqueued,
-            "skipped": skipped,
-        }
+        return _tick_response(current_local_dt, current_slot, enqueued, skipped)
     finally:
         await _release_backup_tick_lock(lock_token)
 
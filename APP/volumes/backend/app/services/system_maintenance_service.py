@@ -14,6 +14,7 @@ from sqlalchemy import func, inspect
 from sqlalchemy.orm import Session, joinedload
 
 from core.config import settings
+from core.cron import cron_matches, cron_slot
 from core.datetime_utils import utc_now
 from core.datetime_utils import utc_now_db
 from core.exceptions import BadRequestException
@@ -32,6 +33,13 @@ from services.email_queue import queue_templated_email
 from services.email_branding_service import build_email_branding_bundle
 from services.notification_center_service import create_in_app_notification
 from services.public_url_service import build_public_url
+from services.queue_telemetry import (
+    ALERT_WINDOW_MINUTES,
+    read_queue_observability,
+    stamp_job_envelope,
+    wait_threshold_exceeded,
+)
+from services.schedule_registry_service import ScheduleDefinition, resync_schedules_quietly
 from services.system_maintenance_events_service import publish_maintenance_event
 from services.system_queue_catalog import QUEUE_DEFINITIONS
 from repositories.audit_repository import write_audit
@@ -701,7 +709,31 @@ def _alert_level_for_queue(queue_key: str) -> str:
     return "error" if queue_key == "dlq" else "warning"
 
 
-def _build_queue_alert_copy(definition: dict, *, size: int, warning_threshold: int) -> tuple[str, str]:
+def _format_wait_ms(value: int | None) -> str:
+    if value is None:
+        return "-"
+    seconds = int(value) // 1000
+    if seconds < 60:
+        return f"{seconds}s"
+    return f"{seconds // 60}m {seconds % 60:02d}s"
+
+
+def _build_queue_alert_copy(
+    definition: dict,
+    *,
+    size: int,
+    warning_threshold: int,
+    wait_p95_ms: int | None = None,
+    reason: str = "size",
+) -> tuple[str, str]:
+    if reason == "wait":
+        return (
+            f"Espera alta en cola {definition['label']}",
+            f"Los jobs de {definition['queue']} esperan hasta {_format_wait_ms(wait_p95_ms)} antes de ejecutarse, "
+            f"sobre el umbral de {_format_wait_ms(int(definition['wait_warning_seconds']) * 1000)}. "
+            f"Jobs en cola: {size}.",
+        )
+
     if definition["key"] == "dlq":
         return (
             f"DLQ con jobs pendientes de revisión",
@@ -721,8 +753,10 @@ def _build_queue_alert_mail_context(
     warning_threshold: int,
     detected_at: datetime,
     db: Session | None = None,
+    wait_p95_ms: int | None = None,
 ) -> dict:
     branding = build_email_branding_bundle(db, include_organization_logo=True, include_client_logo=False)
+    wait_warning_seconds = definition.get("wait_warning_seconds")
     return {
         **branding.context,
         "QUEUE_LABEL": definition["label"],
@@ -731,6 +765,8 @@ def _build_queue_alert_mail_context(
         "QUEUE_CONSUMER": definition["consumer"],
         "CURRENT_SIZE": size,
         "WARNING_THRESHOLD": warning_threshold,
+        "WAIT_P95": _format_wait_ms(wait_p95_ms),
+        "WAIT_WARNING": _format_wait_ms(int(wait_warning_seconds) * 1000) if wait_warning_seconds else "-",
         "DETECTED_AT": detected_at.astimezone(ZoneInfo(SCHEDULER_TIMEZONE)).strftime("%d/%m/%Y %H:%M"),
         "SYSTEM_MODULE_URL": _queue_dashboard_url(db),
         "_inline_assets": branding.inline_assets,
@@ -787,11 +823,15 @@ async def _notify_queue_threshold_exceeded(
     size: int,
     warning_threshold: int,
     detected_at: datetime,
+    wait_p95_ms: int | None = None,
+    reason: str = "size",
 ) -> bool:
     title, message = _build_queue_alert_copy(
         definition,
         size=size,
         warning_threshold=warning_threshold,
+        wait_p95_ms=wait_p95_ms,
+        reason=reason,
     )
     await create_in_app_notification(
         db,
@@ -816,6 +856,9 @@ async def _notify_queue_threshold_exceeded(
             "queue_key": definition["key"],
             "size": int(size),
             "warning_threshold": int(warning_threshold),
+            "reason": reason,
+            "wait_p95_ms": wait_p95_ms,
+            "wait_warning_seconds": definition.get("wait_warning_seconds"),
         },
     )
 
@@ -830,13 +873,18 @@ async def _notify_queue_threshold_exceeded(
             warning_threshold=warning_threshold,
             detected_at=detected_at,
             db=db,
+            wait_p95_ms=wait_p95_ms,
         )
         inline_assets = template_context.pop("_inline_assets", None)
         await queue_templated_email(
             to=admin_emails,
             template_id="system_queue_alert",
             template_context=template_context,
-            subject=f"Alerta operativa · {definition['label']} superó umbral",
+            subject=(
+                f"Alerta operativa · {definition['label']} con espera alta"
+                if reason == "wait"
+                else f"Alerta operativa · {definition['label']} superó umbral"
+            ),
             inline_assets=inline_assets,
         )
         return True
@@ -926,6 +974,11 @@ async def _process_queue_observability(db: Session, obj: SystemMaintenanceSettin
     redis = get_redis()
     state = _load_queue_monitor_state(obj)
     triggered: list[dict] = []
+    telemetry_by_queue = await read_queue_observability(
+        redis,
+        [definition["queue"] for definition in QUEUE_DEFINITIONS],
+        window_minutes=ALERT_WINDOW_MINUTES,
+    )
 
     for definition in QUEUE_DEFINITIONS:
         monitor_attr = definition["monitor_attr"]
@@ -937,7 +990,16 @@ async def _process_queue_observability(db: Session, obj: SystemMaintenanceSettin
         size = int(await redis.llen(queue_name))
         queue_state = state.get(queue_key, {}) if isinstance(state.get(queue_key), dict) else {}
         was_alert_active = bool(queue_state.get("alert_active"))
-        is_alert_active = bool(monitoring_enabled) and size >= warning_threshold
+        telemetry = telemetry_by_queue.get(queue_name, {})
+        # La espera se mide desde enqueued_at: p95 de jobs recientes o el job más antiguo aún en cola.
+        wait_p95_ms = max(
+            (value for value in (telemetry.get("wait_p95_ms"), telemetry.get("head_job_age_ms")) if value is not None),
+            default=None,
+        )
+        size_exceeded = size >= warning_threshold
+        wait_exceeded = wait_threshold_exceeded(telemetry, definition.get("wait_warning_seconds"))
+        is_alert_active = bool(monitoring_enabled) and (size_exceeded or wait_exceeded)
+        alert_reason = "size" if size_exceeded else "wait"
 
         if is_alert_active and not was_alert_active:
             alert_mail_sent = await _notify_queue_threshold_exceeded(
@@ -946,17 +1008,23 @@ async def _process_queue_observability(db: Session, obj: SystemMaintenanceSettin
                 size=size,
                 warning_threshold=warning_threshold,
                 detected_at=current_utc_dt,
+                wait_p95_ms=wait_p95_ms,
+                reason=alert_reason,
             )
             triggered.append({
                 "queue": queue_name,
                 "size": size,
                 "warning_threshold": warning_threshold,
+                "reason": alert_reason,
+                "wait_p95_ms": wait_p95_ms,
             })
 
         queue_state["alert_active"] = is_alert_active
         if is_alert_active and not was_alert_active:
             queue_state["last_alert_at"] = current_utc_dt.isoformat()
             queue_state["last_alert_size"] = int(size)
+            queue_state["last_alert_reason"] = alert_reason
+            queue_state["last_alert_wait_p95_ms"] = wait_p95_ms
             if alert_mail_sent:
                 queue_state["last_alert_mail_sent_at"] = current_utc_dt.isoformat()
         elif not is_alert_active and was_alert_active:
@@ -1123,7 +1191,7 @@ async def _dispatch_maintenance_run(
     redis = get_redis()
     job = _build_maintenance_job(run, action, payload)
     try:
-        await redis.rpush(MAINTENANCE_QUEUE, json.dumps(job))
+        await redis.rpush(MAINTENANCE_QUEUE, json.dumps(stamp_job_envelope(job, trace_id=run.correlation_id)))
     except Exception as exc:
         fresh = db.query(SystemMaintenanceRun).filter(SystemMaintenanceRun.id == run.id).first()
         if fresh:
@@ -1174,66 +1242,6 @@ async def _dispatch_maintenance_run(
     return True
 
 
-def _split_step_segment(segment: str) -> tuple[str, int | None]:
-    parts = str(segment or "").split("/")
-    base = parts[0]
-    step = int(parts[1]) if len(parts) == 2 else None
-    return base, step
-
-
-def _field_part_matches(part: str, current_value: int, min_value: int, max_value: int) -> bool:
-    base, step = _split_step_segment(part)
-
-    if base == "*":
-        if step is None:
-            return True
-        return (current_value - min_value) % step == 0
-
-    if "-" in base:
-        start_raw, end_raw = base.split("-", 1)
-        start = int(start_raw)
-        end = int(end_raw)
-        if current_value < start or current_value > end:
-            return False
-        if step is None:
-            return True
-        return (current_value - start) % step == 0
-
-    target = int(base)
-    if step is None:
-        return current_value == target
-    if current_value < target or current_value > max_value:
-        return False
-    return (current_value - target) % step == 0
-
-
-def _field_matches(expression: str, current_value: int, min_value: int, max_value: int) -> bool:
-    return any(
-        _field_part_matches(part.strip(), current_value, min_value, max_value)
-        for part in str(expression or "").split(",")
-        if part.strip()
-    )
-
-
-def _cron_matches(cron_expression: str, current_local_dt: datetime) -> bool:
-    normalized = validate_cron_expression(cron_expression)
-    minute, hour, day_of_month, month, day_of_week = normalized.split(" ")
-    weekday = (current_local_dt.weekday() + 1) % 7
-    return all(
-        (
-            _field_matches(minute, current_local_dt.minute, 0, 59),
-            _field_matches(hour, current_local_dt.hour, 0, 23),
-            _field_matches(day_of_month, current_local_dt.day, 1, 31),
-            _field_matches(month, current_local_dt.month, 1, 12),
-            _field_matches(day_of_week, weekday, 0, 6),
-        )
-    )
-
-
-def _current_slot(current_local_dt: datetime) -> str:
-    return current_local_dt.strftime("%Y%m%d%H%M")
-
-
 async def _enqueue_manual_action(
     db: Session,
     obj: SystemMaintenanceSetting,
@@ -1246,7 +1254,7 @@ async def _enqueue_manual_action(
 
     action_meta = MANUAL_ACTIONS[action_key]
     current_local_dt = _localnow()
-    current_slot = _current_slot(current_local_dt)
+    current_slot = cron_slot(current_local_dt)
     current_utc_dt = _utcnow()
 
     if action_key == "session_cleanup":
@@ -1377,6 +1385,7 @@ def update_system_maintenance_settings(
 
     db.commit()
     db.refresh(obj)
+    resync_schedules_quietly(db)
     obj = _base_query(db).filter(SystemMaintenanceSetting.id == SYSTEM_MAINTENANCE_SINGLETON_ID).first()
     return _build_config_response(obj)
 
@@ -1428,27 +1437,205 @@ async def get_system_maintenance_status(db: Session) -> dict:
     }
 
 
+# prefijo de runtime → (acción del worker, mensaje)
+_SCHEDULED_CLEANUPS = {
+    "session_cleanup": ("cleanup_sessions", "Limpieza de sesiones encolada por programación."),
+    "temp_cleanup": ("cleanup_temp_files", "Limpieza de temporales encolada por programación."),
+}
+QUEUE_MONITOR_CRON = "* * * * *"
+
+
+def _scheduled_cleanup_payload(obj: SystemMaintenanceSetting, prefix: str) -> dict:
+    if prefix == "session_cleanup":
+        return {"mode": obj.session_cleanup_mode}
+    return {"max_age_days": int(obj.temp_cleanup_max_age_days)}
+
+
+def maintenance_schedule_definitions(db: Session) -> list[ScheduleDefinition]:
+    """Limpiezas habilitadas y monitoreo de colas, para el registro del scheduler."""
+    try:
+        obj = _get_singleton(db)
+    except Exception as exc:
+        logger.warning("No se pudo leer la configuración de mantenimiento para el scheduler: %s", exc)
+        return []
+    definitions = [
+        ScheduleDefinition(f"maintenance:{prefix}", getattr(obj, f"{prefix}_cron"), SCHEDULER_TIMEZONE)
+        for prefix in _SCHEDULED_CLEANUPS
+        if bool(getattr(obj, f"{prefix}_enabled")) and getattr(obj, f"{prefix}_cron")
+    ]
+    # Se sigue evaluando mientras quede una alerta activa, para emitir su recuperación.
+    state = _load_queue_monitor_state(obj)
+    if any(bool(getattr(obj, definition["monitor_attr"])) for definition in QUEUE_DEFINITIONS) or any(
+        isinstance(item, dict) and item.get("alert_active") for item in state.values()
+    ):
+        definitions.append(ScheduleDefinition("maintenance:queue_monitor", QUEUE_MONITOR_CRON, SCHEDULER_TIMEZONE))
+    return definitions
+
+
+async def _run_scheduled_cleanup(
+    db: Session,
+    obj: SystemMaintenanceSetting,
+    prefix: str,
+    *,
+    local_dt: datetime,
+    slot: str,
+    current_utc_dt: datetime,
+    enqueued: list[dict],
+    skipped: list[dict],
+    events_to_publish: list[dict],
+) -> None:
+    action, message = _SCHEDULED_CLEANUPS[prefix]
+    enabled = bool(getattr(obj, f"{prefix}_enabled"))
+    last_slot = getattr(obj, f"last_{prefix}_enqueued_slot")
+    due = enabled and cron_matches(validate_cron_expression(getattr(obj, f"{prefix}_cron")), local_dt)
+    if not due or last_slot == slot:
+        skipped.append({
+            "action": action,
+            "reason": "disabled" if not enabled else "already_enqueued" if last_slot == slot else "not_due",
+            "job_id": None,
+        })
+        return
+
+    run, _created = _create_maintenance_run(
+        db,
+        action=action,
+        scheduled_slot=slot,
+        trigger_type="cron",
+        requested_by_id=None,
+        message=message,
+        current_utc_dt=current_utc_dt,
+    )
+    if str(run.status or "") not in DISPATCHABLE_RUN_STATUSES:
+        _sync_runtime_from_run(obj, run, prefix, slot=slot, fallback_message=message)
+        skipped.append({
+            "action": action,
+            "reason": "already_enqueued",
+            "job_id": run.job_id,
+        })
+        return
+
+    try:
+        await _dispatch_maintenance_run(
+            db,
+            run,
+            action=action,
+            payload={
+                **_scheduled_cleanup_payload(obj, prefix),
+                "scheduled_slot": slot,
+                "trigger_source": "cron",
+            },
+            current_utc_dt=current_utc_dt,
+        )
+        if str(run.status or "") == "queued":
+            _mark_runtime_enqueued(obj, prefix, slot=slot, enqueued_at=current_utc_dt, message=message)
+        else:
+            _sync_runtime_from_run(obj, run, prefix, slot=slot, fallback_message=message)
+        enqueued.append({
+            "action": action,
+            "reason": "cron_match",
+            "job_id": run.job_id,
+        })
+        events_to_publish.append({
+            "status": "queued",
+            "scope": prefix,
+            "action": action,
+            "message": message,
+            "trigger": "cron",
+            "job_id": run.job_id,
+            "scheduled_slot": slot,
+            "metadata": {
+                "runId": run.id,
+                "correlationId": run.correlation_id,
+            },
+        })
+    except Exception as exc:
+        _mark_runtime_dispatch_error(obj, prefix, slot=slot, error=exc, current_utc_dt=current_utc_dt)
+        skipped.append({
+            "action": action,
+            "reason": "dispatch_error",
+            "job_id": run.job_id,
+        })
+
+
+def _tick_response(
+    local_dt: datetime,
+    slot: str,
+    enqueued: list[dict],
+    skipped: list[dict],
+    queue_alerts: list[dict],
+) -> dict:
+    return {
+        "current_slot": slot,
+        "current_time": local_dt.isoformat(),
+        "timezone": SCHEDULER_TIMEZONE,
+        "enqueued": enqueued,
+        "skipped": skipped,
+        "queue_alerts": queue_alerts,
+    }
+
+
+async def run_scheduled_maintenance(db: Session, *, schedule: str, scheduled_local_dt: datetime) -> dict:
+    """
+    Disparo del scheduler para una sola programación (`session_cleanup`,
+    `temp_cleanup` o `queue_monitor`); el slot sale de la hora agendada y no
+    de la hora de llegada, así un disparo atrasado no se pierde.
+    """
+    if schedule not in _SCHEDULED_CLEANUPS and schedule != "queue_monitor":
+        raise BadRequestException("La programación de mantenimiento solicitada no existe.")
+    slot = cron_slot(scheduled_local_dt)
+    current_utc_dt = _utcnow()
+    obj = _get_singleton(db)
+    enqueued: list[dict] = []
+    skipped: list[dict] = []
+    events_to_publish: list[dict] = []
+    queue_alerts: list[dict] = []
+
+    if schedule == "queue_monitor":
+        queue_alerts = await _process_queue_observability(
+            db,
+            obj,
+            current_utc_dt=current_utc_dt,
+        )
+    else:
+        await _run_scheduled_cleanup(
+            db,
+            obj,
+            schedule,
+            local_dt=scheduled_local_dt,
+            slot=slot,
+            current_utc_dt=current_utc_dt,
+            enqueued=enqueued,
+            skipped=skipped,
+            events_to_publish=events_to_publish,
+        )
+    db.commit()
+
+    for event_payload in events_to_publish:
+        await publish_maintenance_event(**event_payload)
+
+    return _tick_response(scheduled_local_dt, slot, enqueued, skipped, queue_alerts)
+
+
 async def run_system_maintenance_tick(db: Session) -> dict:
     current_local_dt = _localnow()
-    current_slot = _current_slot(current_local_dt)
+    current_slot = cron_slot(current_local_dt)
     current_utc_dt = _utcnow()
     lock_token = await _acquire_tick_lock()
 
     if not lock_token:
-        return {
-            "current_slot": current_slot,
-            "current_time": current_local_dt.isoformat(),
-            "timezone": SCHEDULER_TIMEZONE,
-            "enqueued": [],
-            "skipped": [
+        return _tick_response(
+            current_local_dt,
+            current_slot,
+            [],
+            [
                 {
                     "action": "maintenance_tick",
                     "reason": "tick_locked",
                     "job_id": None,
                 }
             ],
-            "queue_alerts": [],
-        }
+            [],
+        )
 
     try:
         obj = _get_singleton(db)
@@ -1456,191 +1643,18 @@ async def run_system_maintenance_tick(db: Session) -> dict:
         skipped: list[dict] = []
         events_to_publish: list[dict] = []
 
-        session_due = bool(obj.session_cleanup_enabled) and _cron_matches(obj.session_cleanup_cron, current_local_dt)
-        if session_due and obj.last_session_cleanup_enqueued_slot != current_slot:
-            message = "Limpieza de sesiones encolada por programación."
-            run, _created = _create_maintenance_run(
+        for prefix in _SCHEDULED_CLEANUPS:
+            await _run_scheduled_cleanup(
                 db,
-                action="cleanup_sessions",
-                scheduled_slot=current_slot,
-                trigger_type="cron",
-                requested_by_id=None,
-                message=message,
-                current_utc_dt=current_utc_dt,
-            )
-            should_dispatch = str(run.status or "") in DISPATCHABLE_RUN_STATUSES
-            if should_dispatch:
-                try:
-                    await _dispatch_maintenance_run(
-                        db,
-                        run,
-                        action="cleanup_sessions",
-                        payload={
-                            "mode": obj.session_cleanup_mode,
-                            "scheduled_slot": current_slot,
-                            "trigger_source": "cron",
-                        },
-                        current_utc_dt=current_utc_dt,
-                    )
-                    if str(run.status or "") == "queued":
-                        _mark_runtime_enqueued(
-                            obj,
-                            "session_cleanup",
-                            slot=current_slot,
-                            enqueued_at=current_utc_dt,
-                            message=message,
-                        )
-                    else:
-                        _sync_runtime_from_run(
-                            obj,
-                            run,
-                            "session_cleanup",
-                            slot=current_slot,
-                            fallback_message=message,
-                        )
-                    enqueued.append({
-                        "action": "cleanup_sessions",
-                        "reason": "cron_match",
-                        "job_id": run.job_id,
-                    })
-                    events_to_publish.append({
-                        "status": "queued",
-                        "scope": "session_cleanup",
-                        "action": "cleanup_sessions",
-                        "message": message,
-                        "trigger": "cron",
-                        "job_id": run.job_id,
-                        "scheduled_slot": current_slot,
-                        "metadata": {
-                            "runId": run.id,
-                            "correlationId": run.correlation_id,
-                        },
-                    })
-                except Exception as exc:
-                    _mark_runtime_dispatch_error(
-                        obj,
-                        "session_cleanup",
-                        slot=current_slot,
-                        error=exc,
-                        current_utc_dt=current_utc_dt,
-                    )
-                    skipped.append({
-                        "action": "cleanup_sessions",
-                        "reason": "dispatch_error",
-                        "job_id": run.job_id,
-                    })
-            else:
-                _sync_runtime_from_run(
-                    obj,
-                    run,
-                    "session_cleanup",
-                    slot=current_slot,
-                    fallback_message=message,
-                )
-                skipped.append({
-                    "action": "cleanup_sessions",
-                    "reason": "already_enqueued",
-                    "job_id": run.job_id,
-                })
-        else:
-            skipped.append({
-                "action": "cleanup_sessions",
-                "reason": "disabled" if not obj.session_cleanup_enabled else "already_enqueued" if obj.last_session_cleanup_enqueued_slot == current_slot else "not_due",
-                "job_id": None,
-            })
-
-        temp_due = bool(obj.temp_cleanup_enabled) and _cron_matches(obj.temp_cleanup_cron, current_local_dt)
-        if temp_due and obj.last_temp_cleanup_enqueued_slot != current_slot:
-            message = "Limpieza de temporales encolada por programación."
-            run, _created = _create_maintenance_run(
-                db,
-                action="cleanup_temp_files",
-                scheduled_slot=current_slot,
-                trigger_type="cron",
-                requested_by_id=None,
-                message=message,
+                obj,
+                prefix,
+                local_dt=current_local_dt,
+                slot=current_slot,
                 current_utc_dt=current_utc_dt,
+                enqueued=enqueued,
+                skipped=skipped,
+                events_to_publish=events_to_publish,
             )
-            should_dispatch = str(run.status or "") in DISPATCHABLE_RUN_STATUSES
-            if should_dispatch:
-                try:
-                    await _dispatch_maintenance_run(
-                        db,
-                        run,
-                        action="cleanup_temp_files",
-                        payload={
-                            "max_age_days": int(obj.temp_cleanup_max_age_days),
-                            "scheduled_slot": current_slot,
-                            "trigger_source": "cron",
-                        },
-                        current_utc_dt=current_utc_dt,
-                    )
-                    if str(run.status or "") == "queued":
-                        _mark_runtime_enqueued(
-                            obj,
-                            "temp_cleanup",
-                            slot=current_slot,
-                            enqueued_at=current_utc_dt,
-                            message=message,
-                        )
-                    else:
-                        _sync_runtime_from_run(
-                            obj,
-                            run,
-                            "temp_cleanup",
-                            slot=current_slot,
-                            fallback_message=message,
-                        )
-                    enqueued.append({
-                        "action": "cleanup_temp_files",
-                        "reason": "cron_match",
-                        "job_id": run.job_id,
-                    })
-                    events_to_publish.append({
-                        "status": "queued",
-                        "scope": "temp_cleanup",
-                        "action": "cleanup_temp_files",
-                        "message": message,
-                        "trigger": "cron",
-                        "job_id": run.job_id,
-                        "scheduled_slot": current_slot,
-                        "metadata": {
-                            "runId": run.id,
-                            "correlationId": run.correlation_id,
-                        },
-                    })
-                except Exception as exc:
-                    _mark_runtime_dispatch_error(
-                        obj,
-                        "temp_cleanup",
-                        slot=current_slot,
-                        error=exc,
-                        current_utc_dt=current_utc_dt,
-                    )
-                    skipped.append({
-                        "action": "cleanup_temp_files",
-                        "reason": "dispatch_error",
-                        "job_id": run.job_id,
-                    })
-            else:
-                _sync_runtime_from_run(
-                    obj,
-                    run,
-                    "temp_cleanup",
-                    slot=current_slot,
-                    fallback_message=message,
-                )
-                skipped.append({
-                    "action": "cleanup_temp_files",
-                    "reason": "already_enqueued",
-                    "job_id": run.job_id,
-                })
-        else:
-            skipped.append({
-                "action": "cleanup_temp_files",
-                "reason": "disabled" if not obj.temp_cleanup_enabled else "already_enqueued" if obj.last_temp_cleanup_enqueued_slot == current_slot else "not_due",
-                "job_id": None,
-            })
 
         queue_alerts = await _process_queue_observability(
             db,
@@ -1652,14 +1666,7 @@ async def run_system_maintenance_tick(db: Session) -> dict:
         for event_payload in events_to_publish:
             await publish_maintenance_event(**event_payload)
 
-        return {
-            "current_slot": current_slot,
-            "current_time": current_local_dt.isoformat(),
-            "timezone": SCHEDULER_TIMEZONE,
-            "enqueued": enqueued,
-            "skipped": skipped,
-            "queue_alerts": queue_alerts,
-        }
+        return _tick_response(current_local_dt, current_slot, enqueued, skipped, queue_alerts)
     finally:
         await _release_tick_lock(lock_token)
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+# wait_warning_seconds: umbral de espera p95 (desde enqueued_at) que dispara la
+# alerta aunque el largo de la cola siga bajo su umbral. None = solo por largo.
 QUEUE_DEFINITIONS = [
     {
         "key": "minutes",
@@ -10,6 +12,7 @@ QUEUE_DEFINITIONS = [
         "priority": "Alta",
         "threshold_attr": "minutes_queue_warning_threshold",
         "monitor_attr": "monitor_minutes_queue_enabled",
+        "wait_warning_seconds": 600,
         "job_types": ["generate_minute"],
         "tag": "queue.minutes",
     },
@@ -22,6 +25,7 @@ QUEUE_DEFINITIONS = [
         "priority": "Media",
         "threshold_attr": "email_queue_warning_threshold",
         "monitor_attr": "monitor_email_queue_enabled",
+        "wait_warning_seconds": 120,
         "job_types": ["email"],
         "tag": "queue.email",
     },
@@ -34,6 +38,7 @@ QUEUE_DEFINITIONS = [
         "priority": "Baja",
         "threshold_attr": "maintenance_queue_warning_threshold",
         "monitor_attr": "monitor_maintenance_queue_enabled",
+        "wait_warning_seconds": 1800,
         "job_types": ["cleanup_sessions", "cleanup_temp_files"],
         "tag": "queue.maintenance",
     },
@@ -46,6 +51,7 @@ QUEUE_DEFINITIONS = [
         "priority": "Alta",
         "threshold_attr": "pdf_queue_warning_threshold",
         "monitor_attr": "monitor_pdf_queue_enabled",
+        "wait_warning_seconds": 300,
         "job_types": ["pdf_job"],
         "tag": "queue.pdf",
     },
@@ -58,6 +64,7 @@ QUEUE_DEFINITIONS = [
         "priority": "Crítica",
         "threshold_attr": "dlq_warning_threshold",
         "monitor_attr": "monitor_dlq_enabled",
+        "wait_warning_seconds": None,
         "job_types": ["failed_jobs"],
         "tag": "queue.dlq",
     },
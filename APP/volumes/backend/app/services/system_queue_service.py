@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from core.datetime_utils import utc_isoformat_z, utc_now
 from db.redis import get_redis
+from services.queue_telemetry import read_queue_observability, wait_threshold_exceeded
 from services.system_queue_catalog import QUEUE_DEFINITIONS
 from services.system_maintenance_service import get_system_maintenance_singleton
 
@@ -16,7 +17,13 @@ def _utcnow_iso() -> str:
     return utc_isoformat_z(utc_now())
 
 
-def _build_status(queue_name: str, size: int, warning_threshold: int) -> tuple[str, str, str, bool]:
+def _build_status(
+    queue_name: str,
+    size: int,
+    warning_threshold: int,
+    *,
+    wait_exceeded: bool = False,
+) -> tuple[str, str, str, bool]:
     if queue_name == "queue:dlq":
         if size <= 0:
             return "idle", "Sin fallos pendientes", "active", False
@@ -24,10 +31,12 @@ def _build_status(queue_name: str, size: int, warning_threshold: int) -> tuple[s
             return "critical", "Requiere revisión", "danger", True
         return "warning", "Con fallos registrados", "warning", True
 
-    if size <= 0:
-        return "idle", "Sin carga", "inactive", False
     if size >= warning_threshold:
         return "warning", "Acumulación alta", "warning", True
+    if wait_exceeded:
+        return "warning", "Espera alta", "warning", True
+    if size <= 0:
+        return "idle", "Sin carga", "inactive", False
     return "active", "Procesando / con carga", "info", False
 
 
@@ -47,6 +56,7 @@ async def get_system_queues_status(db: Session) -> dict:
     settings_obj = get_system_maintenance_singleton(db)
     monitor_state = _load_queue_monitor_state(getattr(settings_obj, "queue_monitor_state_json", None))
     activity_state = await redis.hgetall(QUEUE_ACTIVITY_HASH)
+    telemetry_by_queue = await read_queue_observability(redis, [d["queue"] for d in QUEUE_DEFINITIONS])
     items: list[dict] = []
 
     for definition in QUEUE_DEFINITIONS:
@@ -54,10 +64,13 @@ async def get_system_queues_status(db: Session) -> dict:
         warning_threshold = int(getattr(settings_obj, definition["threshold_attr"]))
         monitoring_enabled = bool(getattr(settings_obj, definition["monitor_attr"]))
         queue_state = monitor_state.get(definition["key"], {}) if isinstance(monitor_state.get(definition["key"]), dict) else {}
+        telemetry = telemetry_by_queue.get(definition["queue"], {})
+        wait_warning_seconds = definition.get("wait_warning_seconds")
         status, status_label, status_tone, is_warning = _build_status(
             definition["queue"],
             size,
             warning_threshold,
+            wait_exceeded=wait_threshold_exceeded(telemetry, wait_warning_seconds),
         )
         effective_warning = bool(monitoring_enabled) and is_warning
         load_percent = round((size / warning_threshold) * 100, 1) if warning_threshold > 0 else 0.0
@@ -77,10 +90,14 @@ async def get_system_queues_status(db: Session) -> dict:
             "status_tone": status_tone,
             "is_warning": effective_warning,
             "job_types": list(definition["job_types"]),
+            "wait_warning_seconds": wait_warning_seconds,
+            "telemetry": telemetry,
             "alert_state": {
                 "alert_active": bool(queue_state.get("alert_active")) or effective_warning,
                 "last_alert_at": queue_state.get("last_alert_at"),
                 "last_alert_size": queue_state.get("last_alert_size"),
+                "last_alert_reason": queue_state.get("last_alert_reason"),
+                "last_alert_wait_p95_ms": queue_state.get("last_alert_wait_p95_ms"),
                 "last_alert_mail_sent_at": queue_state.get("last_alert_mail_sent_at"),
                 "last_recovered_at": queue_state.get("last_recovered_at"),
                 "last_recovered_size": queue_state.get("last_recovered_size"),
@@ -7,8 +7,10 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
+from core.pagination import cached_total, keyset_page, total_cache_key
 from models.tags import Tag
 from schemas.tags import TagCreateRequest, TagFilterRequest, TagUpdateRequest
+from services.search_index_service import SEARCH_ENTITY_TAG, search_match_clause
 
 
 def _user_ref(u) -> dict | None:
@@ -91,28 +93,37 @@ def list_tags(db: Session, filters: TagFilterRequest) -> dict:
         q = q.filter(Tag.status == filters.status)
 
     if filters.name:
-        q = q.filter(Tag.name.ilike(f"%{filters.name}%"))
-
-    total = q.with_entities(func.count(Tag.id)).scalar() or 0
+        match = search_match_clause(SEARCH_ENTITY_TAG, filters.name, Tag.id)
+        if match is not None:
+            q = q.filter(match)
+
+    total = cached_total(
+        total_cache_key("tags", filters),
+        lambda: q.with_entities(func.count(Tag.id)).scalar(),
+        cursor=filters.cursor,
+        include_total=filters.include_total,
+    )
 
-    items = (
+    items, next_cursor = keyset_page(
         q.options(
             joinedload(Tag.created_by_user),
             joinedload(Tag.updated_by_user),
             joinedload(Tag.deleted_by_user),
             joinedload(Tag.category),
-        )
-        .order_by(Tag.name.asc())
-        .offset(filters.skip)
-        .limit(filters.limit)
-        .all()
+        ),
+        [(Tag.name, False), (Tag.id, False)],
+        cursor=filters.cursor,
+        skip=filters.skip,
+        limit=filters.limit,
+        key=lambda it: (it.name, it.id),
     )
 
     return {
         "items": [_build_response_dict(it) for it in items],
-        "total": int(total),
+        "total": total,
         "skip": int(filters.skip),
         "limit": int(filters.limit),
+        "next_cursor": next_cursor,
     }
 
 
@@ -0,0 +1,290 @@
+# services/team_acl_service.py
+"""
+Motor set-based de asignaciones usuario↔cliente (user_clients) y
+usuario↔proyecto (user_project_acl).
+
+Estrategia DIFF, igual que la sync por usuario de teams_service, pero en
+sentencias por lote:
+  1. Un SELECT de los pares (usuario, entidad) afectados, activos o no.
+  2. Altas y reactivaciones en un solo `INSERT ... ON DUPLICATE KEY UPDATE`
+     (la reactivación no toca `permission`: se preserva el permiso previo).
+  3. Bajas en un solo `UPDATE ... WHERE (user_id, entity_id) IN (...)`
+     como soft-delete.
+
+Nunca se borra físicamente. Las sentencias corren en la transacción del
+llamador: el commit (y los efectos posteriores) quedan a su cargo.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import Table, select, tuple_, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from models.user_clients import UserClient
+from models.user_project_acl import UserProjectACL, UserProjectPermission
+
+# Pares por sentencia: acota el tamaño del SQL y del IN de tuplas.
+ACL_STATEMENT_CHUNK = 1000
+
+
+@dataclass
+class AclDiff:
+    added: int = 0
+    reactivated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    affected_user_ids: set[str] = field(default_factory=set)
+
+    def merge(self, other: "AclDiff") -> None:
+        self.added += other.added
+        self.reactivated += other.reactivated
+        self.removed += other.removed
+        self.unchanged += other.unchanged
+        self.affected_user_ids |= other.affected_user_ids
+
+    def as_dict(self) -> dict:
+        return {
+            "added": self.added,
+            "reactivated": self.reactivated,
+            "removed": self.removed,
+            "unchanged": self.unchanged,
+        }
+
+
+@dataclass(frozen=True)
+class _AclTable:
+    table: Table
+    entity_column: str
+
+
+_CLIENTS = _AclTable(UserClient.__table__, "client_id")
+_PROJECTS = _AclTable(UserProjectACL.__table__, "project_id")
+
+
+def _chunks(items: list, size: int = ACL_STATEMENT_CHUNK) -> Iterable[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _load_pairs(
+    db: Session,
+    spec: _AclTable,
+    user_ids: Iterable[str],
+    entity_ids: Iterable[str] | None,
+) -> dict[tuple[str, str], bool]:
+    """{(user_id, entity_id): activo} para los usuarios dados (y entidades, si se acotan)."""
+    table = spec.table
+    entity_col = table.c[spec.entity_column]
+    active_expr = table.c.is_active.is_(True) & table.c.deleted_at.is_(None)
+    pairs: dict[tuple[str, str], bool] = {}
+    for user_chunk in _chunks(sorted(set(user_ids))):
+        stmt = select(table.c.user_id, entity_col, active_expr.label("active")).where(table.c.user_id.in_(user_chunk))
+        if entity_ids is not None:
+            entity_list = sorted(set(entity_ids))
+            if not entity_list:
+                return pairs
+            stmt = stmt.where(entity_col.in_(entity_list))
+        for user_id, entity_id, active in db.execute(stmt):
+            pairs[(str(user_id), str(entity_id))] = bool(active)
+    return pairs
+
+
+def _upsert_active(
+    db: Session,
+    spec: _AclTable,
+    pairs: list[tuple[str, str]],
+    actor_id: str | None,
+    now: datetime,
+    *,
+    permission: UserProjectPermission | None,
+) -> None:
+    table = spec.table
+    for chunk in _chunks(pairs):
+        rows = []
+        for user_id, entity_id in chunk:
+            row = {
+                "user_id": user_id,
+                spec.entity_column: entity_id,
+                "is_active": True,
+                "created_at": now,
+                "created_by": actor_id,
+                "updated_at": now,
+                "updated_by": actor_id,
+            }
+            if permission is not None:
+                row["permission"] = permission
+            rows.append(row)
+        stmt = mysql_insert(table).values(rows)
+        db.execute(
+            stmt.on_duplicate_key_update(
+                is_active=True,
+                deleted_at=None,
+                deleted_by=None,
+                updated_at=now,
+                updated_by=actor_id,
+            )
+        )
+
+
+def _soft_delete(
+    db: Session,
+    spec: _AclTable,
+    pairs: list[tuple[str, str]],
+    actor_id: str | None,
+    now: datetime,
+) -> None:
+    table = spec.table
+    entity_col = table.c[spec.entity_column]
+    for chunk in _chunks(pairs):
+        db.execute(
+            update(table)
+            .where(tuple_(table.c.user_id, entity_col).in_(chunk))
+            .values(
+                is_active=False,
+                deleted_at=now,
+                deleted_by=actor_id,
+                updated_at=now,
+                updated_by=actor_id,
+            )
+        )
+
+
+def _apply(
+    db: Session,
+    spec: _AclTable,
+    existing: dict[tuple[str, str], bool],
+    *,
+    grant: set[tuple[str, str]],
+    revoke: set[tuple[str, str]],
+    actor_id: str | None,
+    now: datetime,
+    permission: UserProjectPermission | None = None,
+) -> AclDiff:
+    diff = AclDiff()
+    to_upsert: list[tuple[str, str]] = []
+    for pair in sorted(grant):
+        state = existing.get(pair)
+        if state is True:
+            diff.unchanged += 1
+            continue
+        if state is None:
+            diff.added += 1
+        else:
+            diff.reactivated += 1
+        to_upsert.append(pair)
+        diff.affected_user_ids.add(pair[0])
+
+    to_remove = sorted(pair for pair in revoke if existing.get(pair) is True)
+    diff.removed = len(to_remove)
+    diff.affected_user_ids.update(user_id for user_id, _ in to_remove)
+
+    if to_upsert:
+        _upsert_active(db, spec, to_upsert, actor_id, now, permission=permission)
+    if to_remove:
+        _soft_delete(db, spec, to_remove, actor_id, now)
+    return diff
+
+
+def _sync_user_entities(
+    db: Session,
+    spec: _AclTable,
+    user_id: str,
+    entity_ids: Iterable[str],
+    actor_id: str | None,
+    now: datetime,
+    permission: UserProjectPermission | None = None,
+) -> AclDiff:
+    existing = _load_pairs(db, spec, [user_id], None)
+    target = {(user_id, str(entity_id)) for entity_id in entity_ids}
+    active = {pair for pair, is_active in existing.items() if is_active}
+    return _apply(
+        db,
+        spec,
+        existing,
+        grant=target,
+        revoke=active - target,
+        actor_id=actor_id,
+        now=now,
+        permission=permission,
+    )
+
+
+def sync_user_client_ids(
+    db: Session, user_id: str, client_ids: Iterable[str], actor_id: str | None, now: datetime
+) -> AclDiff:
+    """Deja activos exactamente `client_ids` para el usuario."""
+    return _sync_user_entities(db, _CLIENTS, user_id, client_ids, actor_id, now)
+
+
+def sync_user_project_ids(
+    db: Session, user_id: str, project_ids: Iterable[str], actor_id: str | None, now: datetime
+) -> AclDiff:
+    """Deja activos exactamente `project_ids`; los nuevos entran con permiso `read`."""
+    return _sync_user_entities(
+        db, _PROJECTS, user_id, project_ids, actor_id, now, permission=UserProjectPermission.read
+    )
+
+
+def _grant_revoke(
+    db: Session,
+    spec: _AclTable,
+    user_ids: list[str],
+    add_ids: Iterable[str],
+    remove_ids: Iterable[str],
+    actor_id: str | None,
+    now: datetime,
+    permission: UserProjectPermission | None = None,
+) -> AclDiff:
+    add_set = {str(entity_id) for entity_id in add_ids}
+    remove_set = {str(entity_id) for entity_id in remove_ids} - add_set
+    if not user_ids or not (add_set or remove_set):
+        return AclDiff()
+    existing = _load_pairs(db, spec, user_ids, add_set | remove_set)
+    return _apply(
+        db,
+        spec,
+        existing,
+        grant={(user_id, entity_id) for user_id in user_ids for entity_id in add_set},
+        revoke={(user_id, entity_id) for user_id in user_ids for entity_id in remove_set},
+        actor_id=actor_id,
+        now=now,
+        permission=permission,
+    )
+
+
+def grant_revoke_clients(
+    db: Session,
+    user_ids: list[str],
+    *,
+    add_client_ids: Iterable[str] = (),
+    remove_client_ids: Iterable[str] = (),
+    actor_id: str | None,
+    now: datetime,
+) -> AclDiff:
+    """Agrega/quita los mismos clientes a todos los usuarios (si un id está en ambos, gana agregar)."""
+    return _grant_revoke(db, _CLIENTS, user_ids, add_client_ids, remove_client_ids, actor_id, now)
+
+
+def grant_revoke_projects(
+    db: Session,
+    user_ids: list[str],
+    *,
+    add_project_ids: Iterable[str] = (),
+    remove_project_ids: Iterable[str] = (),
+    permission: UserProjectPermission = UserProjectPermission.read,
+    actor_id: str | None,
+    now: datetime,
+) -> AclDiff:
+    """
+    Agrega/quita los mismos proyectos a todos los usuarios.
+
+    `permission` aplica solo a filas nuevas; una reactivación conserva el
+    permiso que tenía.
+    """
+    return _grant_revoke(
+        db, _PROJECTS, user_ids, add_project_ids, remove_project_ids, actor_id, now, permission=permission
+    )
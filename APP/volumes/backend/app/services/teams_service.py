@@ -7,18 +7,23 @@ from datetime import datetime
 
 import bcrypt
 from fastapi import HTTPException, status
-from sqlalchemy import or_
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
+from core.pagination import cached_total, keyset_page, total_cache_key
 from models.user           import User
 from models.user_profiles  import UserProfile, AssignmentModeEnum
 from models.user_roles     import UserRole
 from models.user_clients   import UserClient
 from models.user_client_acl import UserClientAcl
-from models.user_project_acl import UserProjectACL, UserProjectPermission
+from models.user_project_acl import UserProjectACL
 from models.roles          import Role
+from models.clients        import Client
+from models.projects       import Project
+from models.user_project_acl import UserProjectPermission
 from schemas.teams import (
+    TeamAclBatchRequest,
     TeamCreateRequest,
     TeamFilterRequest,
     TeamStatus,
@@ -26,6 +31,14 @@ from schemas.teams import (
     TeamUpdateRequest,
 )
 from services.avatar_service import get_avatar_url_if_exists
+from services.search_index_service import SEARCH_ENTITY_TEAM_MEMBER, search_match_clause
+from services.team_acl_service import (
+    AclDiff,
+    grant_revoke_clients,
+    grant_revoke_projects,
+    sync_user_client_ids,
+    sync_user_project_ids,
+)
 
 
 # ── Helpers privados ──────────────────────────────────────────────────────────
@@ -106,49 +119,67 @@ def _build_temp_password_hash() -> str:
 
 # ── Lectura de relaciones reales del usuario ──────────────────────────────────
 
-def _get_user_client_ids(db: Session, user_id: str) -> list[str]:
-    """IDs de clientes activos asignados al usuario (tabla user_clients)."""
+def _get_users_client_ids(db: Session, user_ids: list[str]) -> dict[str, list[str]]:
+    """IDs de clientes activos por usuario (tabla user_clients), una consulta para todos."""
+    grouped: dict[str, list[str]] = {user_id: [] for user_id in user_ids}
+    if not user_ids:
+        return grouped
     rows = (
-        db.query(UserClient.client_id)
+        db.query(UserClient.user_id, UserClient.client_id)
         .filter(
-            UserClient.user_id   == user_id,
+            UserClient.user_id.in_(user_ids),
             UserClient.deleted_at.is_(None),
             UserClient.is_active == True,
         )
         .all()
     )
-    return [r.client_id for r in rows]
+    for r in rows:
+        grouped[r.user_id].append(r.client_id)
+    return grouped
 
 
-def _get_user_project_ids(db: Session, user_id: str) -> list[str]:
-    """IDs de proyectos activos asignados al usuario (tabla user_project_acl)."""
+def _get_users_project_ids(db: Session, user_ids: list[str]) -> dict[str, list[str]]:
+    """IDs de proyectos activos por usuario (tabla user_project_acl), una consulta para todos."""
+    grouped: dict[str, list[str]] = {user_id: [] for user_id in user_ids}
+    if not user_ids:
+        return grouped
     rows = (
-        db.query(UserProjectACL.project_id)
+        db.query(UserProjectACL.user_id, UserProjectACL.project_id)
         .filter(
-            UserProjectACL.user_id    == user_id,
+            UserProjectACL.user_id.in_(user_ids),
             UserProjectACL.deleted_at.is_(None),
             UserProjectACL.is_active  == True,
         )
         .all()
     )
-    return [r.project_id for r in rows]
+    for r in rows:
+        grouped[r.user_id].append(r.project_id)
+    return grouped
+
 
+def _users_to_dicts(db: Session, users: list[User]) -> list[dict]:
+    """Serializa varios usuarios con sus relaciones: dos consultas para toda la página."""
+    user_ids = [u.id for u in users]
+    clients  = _get_users_client_ids(db, user_ids)
+    projects = _get_users_project_ids(db, user_ids)
+    return [_user_to_dict(u, clients=clients[u.id], projects=projects[u.id]) for u in users]
 
-def _user_to_dict(user: User, db: Session | None = None) -> dict:
+
+def _user_to_dict(
+    user: User,
+    *,
+    clients: list[str] | None = None,
+    projects: list[str] | None = None,
+) -> dict:
     """
     Serializa User + UserProfile + Role al shape del frontend.
-    Si se pasa db, incluye las relaciones reales de clientes y proyectos.
+    Las relaciones de clientes y proyectos vienen precargadas
+    (ver `_users_to_dicts`).
     """
     profile         = user.profile
     role_code       = _get_current_role_code(user)
     assignment_mode = _get_assignment_mode(user)
 
-    clients  = []
-    projects = []
-    if db is not None:
-        clients  = _get_user_client_ids(db, user.id)
-        projects = _get_user_project_ids(db, user.id)
-
     return {
         "id":              user.id,
         "name":            user.full_name or "",
@@ -163,21 +194,20 @@ def _user_to_dict(user: User, db: Session | None = None) -> dict:
         "initials":        profile.initials   if profile else None,
         "color":           profile.color      if profile else None,
         "assignment_mode": assignment_mode,
-        "clients":         clients,
-        "projects":        projects,
+        "clients":         clients or [],
+        "projects":        projects or [],
         "notes":           profile.notes      if profile else None,
         "created_at":      str(user.created_at.date()) if user.created_at else "",
         "last_activity":   user.last_login_at if hasattr(user, "last_login_at") else None,
     }
 
 
-# ── Sync de relaciones user↔client ───────────────────────────────────────────
+# ── Sync de relaciones user↔client / user↔project ─────────────────────────────
 #
-# Estrategia DIFF:
-#   1. Obtener IDs actuales activos en la tabla.
+# Estrategia DIFF (services/team_acl_service.py, sentencias set-based):
+#   1. Obtener IDs actuales (activos e inactivos) en la tabla.
 #   2. IDs que ya no están en el nuevo set → soft-delete (deleted_at, is_active=False).
-#   3. IDs nuevos que no existían → INSERT.
-#   4. IDs que ya existían pero estaban soft-deleted → reactivar.
+#   3. IDs nuevos → INSERT; los que existían soft-deleted → reactivar (ON DUPLICATE KEY).
 #
 # NUNCA borramos físicamente ni hacemos DELETE+INSERT masivo.
 
@@ -187,49 +217,9 @@ def _sync_user_clients(
     new_client_ids: list[str],
     updated_by_id: str | None,
     now: datetime,
-) -> None:
+) -> AclDiff:
     """Sincroniza user_clients con el nuevo set de IDs."""
-    new_set = set(new_client_ids)
-
-    # Obtener todos los registros (activos e inactivos, sin physically deleted)
-    existing: list[UserClient] = (
-        db.query(UserClient)
-        .filter(UserClient.user_id == user_id)
-        .all()
-    )
-    existing_map = {r.client_id: r for r in existing}
-    existing_active_set = {r.client_id for r in existing if r.deleted_at is None and r.is_active}
-
-    # Soft-delete los que ya no van
-    to_remove = existing_active_set - new_set
-    for client_id in to_remove:
-        rec = existing_map[client_id]
-        rec.deleted_at = now
-        rec.deleted_by = updated_by_id
-        rec.is_active  = False
-        rec.updated_at = now
-        rec.updated_by = updated_by_id
-
-    # Agregar o reactivar los nuevos
-    to_add = new_set - existing_active_set
-    for client_id in to_add:
-        if client_id in existing_map:
-            # Existía pero estaba inactivo/eliminado → reactivar
-            rec = existing_map[client_id]
-            rec.deleted_at = None
-            rec.deleted_by = None
-            rec.is_active  = True
-            rec.updated_at = now
-            rec.updated_by = updated_by_id
-        else:
-            # Nuevo registro
-            db.add(UserClient(
-                user_id    = user_id,
-                client_id  = client_id,
-                is_active  = True,
-                created_at = now,
-                created_by = updated_by_id,
-            ))
+    return sync_user_client_ids(db, user_id, new_client_ids, updated_by_id, now)
 
 
 def _sync_user_projects(
@@ -238,51 +228,16 @@ def _sync_user_projects(
     new_project_ids: list[str],
     updated_by_id: str | None,
     now: datetime,
-) -> None:
-    """Sincroniza user_project_acl con el nuevo set de IDs."""
-    new_set = set(new_project_ids)
-
-    existing: list[UserProjectACL] = (
-        db.query(UserProjectACL)
-        .filter(UserProjectACL.user_id == user_id)
-        .all()
-    )
-    existing_map = {r.project_id: r for r in existing}
-    existing_active_set = {r.project_id for r in existing if r.deleted_at is None and r.is_active}
-
-    # Soft-delete los que ya no van
-    to_remove = existing_active_set - new_set
-    for project_id in to_remove:
-        rec = existing_map[project_id]
-        rec.deleted_at = now
-        rec.deleted_by = updated_by_id
-        rec.is_active  = False
-        rec.updated_by = updated_by_id
-
-    # Agregar o reactivar los nuevos
-    to_add = new_set - existing_active_set
-    for project_id in to_add:
-        if project_id in existing_map:
-            rec = existing_map[project_id]
-            rec.deleted_at = None
-            rec.deleted_by = None
-            rec.is_active  = True
-            rec.updated_by = updated_by_id
-        else:
-            db.add(UserProjectACL(
-                user_id    = user_id,
-                project_id = project_id,
-                permission = UserProjectPermission.read,  # permiso base por defecto
-                is_active  = True,
-                created_by = updated_by_id,
-            ))
+) -> AclDiff:
+    """Sincroniza user_project_acl con el nuevo set de IDs (preserva permisos existentes)."""
+    return sync_user_project_ids(db, user_id, new_project_ids, updated_by_id, now)
 
 
 # ── CRUD ──────────────────────────────────────────────────────────────────────
 
 def get_team_member(db: Session, user_id: str) -> dict:
     user = _get_user_or_404(db, user_id)
-    return _user_to_dict(user, db=db)
+    return _users_to_dicts(db, [user])[0]
 
 
 def list_team_members(db: Session, filters: TeamFilterRequest) -> dict:
@@ -312,28 +267,32 @@ def list_team_members(db: Session, filters: TeamFilterRequest) -> dict:
         )
 
     if filters.search:
-        term = f"%{filters.search}%"
-        if not filters.department:
-            q = q.outerjoin(UserProfile, UserProfile.user_id == User.id)
-        q = q.filter(
-            or_(
-                User.full_name.ilike(term),
-                User.email.ilike(term),
-                User.username.ilike(term),
-                UserProfile.position.ilike(term),
-            )
-        )
-
-    total = q.count()
-    users = q.order_by(User.full_name).offset(filters.skip).limit(filters.limit).all()
+        match = search_match_clause(SEARCH_ENTITY_TEAM_MEMBER, filters.search, User.id)
+        if match is not None:
+            q = q.filter(match)
+
+    total = cached_total(
+        total_cache_key("teams", filters),
+        q.count,
+        cursor=filters.cursor,
+        include_total=filters.include_total,
+    )
+    users, next_cursor = keyset_page(
+        q,
+        [(func.coalesce(User.full_name, ""), False), (User.id, False)],
+        cursor=filters.cursor,
+        skip=filters.skip,
+        limit=filters.limit,
+        key=lambda u: (u.full_name or "", u.id),
+    )
 
-    # NOTA: en el listado NO incluimos relaciones (es costoso para N usuarios).
-    # El detalle completo se obtiene con get_team_member().
+    # Relaciones de toda la página en dos consultas agrupadas, no dos por usuario.
     return {
-        "teams": [_user_to_dict(u) for u in users],
+        "teams": _users_to_dicts(db, users),
         "total": total,
         "skip":  filters.skip,
         "limit": filters.limit,
+        "next_cursor": next_cursor,
     }
 
 
@@ -390,7 +349,7 @@ def create_team_member(
 
     db.commit()
     db.refresh(user)
-    return _user_to_dict(_get_user_or_404(db, user.id), db=db)
+    return _users_to_dicts(db, [_get_user_or_404(db, user.id)])[0]
 
 
 def update_team_member(
@@ -518,7 +477,7 @@ def update_team_member(
             _sync_user_projects(db, user_id, new_projects, updated_by_id, now)
 
     db.commit()
-    return _user_to_dict(_get_user_or_404(db, user_id), db=db)
+    return _users_to_dicts(db, [_get_user_or_404(db, user_id)])[0]
 
 
 def change_team_status(
@@ -531,7 +490,7 @@ def change_team_status(
     user.is_active  = new_status == TeamStatus.active
     user.updated_by = updated_by_id
     db.commit()
-    return _user_to_dict(_get_user_or_404(db, user_id), db=db)
+    return _users_to_dicts(db, [_get_user_or_404(db, user_id)])[0]
 
 
 def delete_team_member(
@@ -551,3 +510,93 @@ def delete_team_member(
     user.is_active  = False
 
     db.commit()
+
+
+# ── Asignación masiva de alcance ──────────────────────────────────────────────
+
+def _require_existing_ids(db: Session, model, ids: set[str], label: str) -> None:
+    if not ids:
+        return
+    found = {
+        row[0]
+        for row in db.query(model.id).filter(model.id.in_(ids), model.deleted_at.is_(None)).all()
+    }
+    missing = sorted(ids - found)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{label} no encontrados: {', '.join(missing[:10])}",
+        )
+
+
+def bulk_update_team_acl(
+    db: Session,
+    payload: TeamAclBatchRequest,
+    updated_by_id: str | None = None,
+) -> dict:
+    """
+    Aplica el mismo alta/baja de clientes y proyectos a muchos usuarios en una
+    sola transacción y retorna el diff. Usuarios con assignmentMode = "all" se
+    omiten (su acceso no depende de relaciones).
+    """
+    user_ids = sorted({str(user_id) for user_id in payload.user_ids})
+    rows = (
+        db.query(User.id, UserProfile.assignment_mode)
+        .outerjoin(UserProfile, UserProfile.user_id == User.id)
+        .filter(User.id.in_(user_ids), User.deleted_at.is_(None))
+        .all()
+    )
+    found = {row[0]: row[1] for row in rows}
+    missing = [user_id for user_id in user_ids if user_id not in found]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Team members no encontrados: {', '.join(missing[:10])}",
+        )
+    skipped = [user_id for user_id, mode in found.items() if mode == AssignmentModeEnum.all]
+    target_users = [user_id for user_id in user_ids if user_id not in set(skipped)]
+
+    add_client_ids = set(payload.add_client_ids)
+    remove_client_ids = set(payload.remove_client_ids)
+    add_project_ids = set(payload.add_project_ids)
+    remove_project_ids = set(payload.remove_project_ids)
+    _require_existing_ids(db, Client, add_client_ids | set(payload.add_projects_of_client_ids), "Clientes")
+    _require_existing_ids(db, Project, add_project_ids, "Proyectos")
+    if payload.add_projects_of_client_ids:
+        add_project_ids |= {
+            row[0]
+            for row in db.query(Project.id).filter(
+                Project.client_id.in_(payload.add_projects_of_client_ids),
+                Project.deleted_at.is_(None),
+                Project.is_active.is_(True),
+            )
+        }
+
+    now = utc_now_db()
+    client_diff = grant_revoke_clients(
+        db,
+        target_users,
+        add_client_ids=add_client_ids,
+        remove_client_ids=remove_client_ids,
+        actor_id=updated_by_id,
+        now=now,
+    )
+    project_diff = grant_revoke_projects(
+        db,
+        target_users,
+        add_project_ids=add_project_ids,
+        remove_project_ids=remove_project_ids,
+        permission=UserProjectPermission(payload.project_permission.value),
+        actor_id=updated_by_id,
+        now=now,
+    )
+    db.commit()
+
+    affected = client_diff.affected_user_ids | project_diff.affected_user_ids
+    return {
+        "users": len(user_ids),
+        "clients": client_diff.as_dict(),
+        "projects": project_diff.as_dict(),
+        "affected_user_ids": sorted(affected),
+        "skipped_user_ids": sorted(skipped),
+    }
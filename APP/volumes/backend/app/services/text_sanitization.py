@@ -0,0 +1,96 @@
+"""
+services/text_sanitization.py
+
+Motor de sanitización de texto compartido por adjuntos y contenido del editor.
+
+- Los controles se eliminan con `bytes.translate` (un solo recorrido en C)
+  en vez de generadores por carácter; `str.translate` con tabla de borrado
+  es lento para texto no ASCII, por eso el texto se limpia como bytes.
+- `collapse_text` usa un único patrón precompilado que combina controles y
+  espacios, más un atajo que devuelve el texto tal cual si ya está limpio.
+- `sanitize_text_bytes` trabaja directo sobre bytes UTF-8: los controles
+  C0 son siempre bytes sueltos (< 0x20), así que no hace falta decodificar;
+  si no hay BOM, `\\r` ni controles, retorna el mismo objeto.
+- `sanitize_fields` recorre un árbol de contenido con copy-on-write: solo se
+  copian los dicts/listas en la ruta de un campo que cambió.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Mapping
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# Controles C0 salvo \t y \n (se eliminan del texto de adjuntos).
+_TEXT_CONTROL_CHARS = "".join(chr(code) for code in range(32) if chr(code) not in "\t\n")
+_TEXT_CONTROL_BYTES = _TEXT_CONTROL_CHARS.encode("ascii")
+
+# Controles + espacios: cualquier tramo colapsa a un espacio.
+_COLLAPSE_RE = re.compile(r"[\s\x00-\x1f\x7f]+")
+
+
+def strip_control_bytes(data: bytes) -> bytes:
+    """Elimina controles C0 excepto tabulación y salto de línea de bytes UTF-8."""
+    cleaned = data.translate(None, _TEXT_CONTROL_BYTES)
+    return data if len(cleaned) == len(data) else cleaned
+
+
+def sanitize_text_bytes(content: bytes) -> bytes:
+    """
+    Equivalente a decodificar con utf-8-sig, normalizar saltos de línea a `\\n`
+    y eliminar controles, pero sin salir de bytes. Asume UTF-8 ya validado.
+    """
+    if content.startswith(_UTF8_BOM):
+        content = content[len(_UTF8_BOM):]
+    if b"\r" in content:
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return strip_control_bytes(content)
+
+
+def _is_collapsed(text: str) -> bool:
+    # isprintable() descarta controles y todo espacio distinto de " ".
+    return text.isprintable() and "  " not in text and not text.startswith(" ") and not text.endswith(" ")
+
+
+def collapse_text(value: Any, *, limit: int | None = None) -> str:
+    """Reemplaza controles y tramos de espacios por un espacio y recorta."""
+    text = value if isinstance(value, str) else str(value or "")
+    if not _is_collapsed(text):
+        text = _COLLAPSE_RE.sub(" ", text).strip()
+    if limit is not None:
+        return text[:limit]
+    return text
+
+
+def clean_optional_text(value: Any, *, limit: int | None = None) -> str | None:
+    text = collapse_text(value, limit=limit)
+    return text or None
+
+
+def sanitize_fields(node: Mapping[str, Any], limits: Mapping[str, int]) -> Mapping[str, Any]:
+    """
+    Aplica `clean_optional_text` a los campos presentes en `limits`.
+
+    Retorna el mismo dict si ningún valor cambió; si alguno cambia, una copia
+    superficial con los valores nuevos (copy-on-write).
+    """
+    changed: dict[str, Any] | None = None
+    for field, limit in limits.items():
+        if field not in node:
+            continue
+        current = node[field]
+        cleaned = clean_optional_text(current, limit=limit)
+        if cleaned != current or type(cleaned) is not type(current):
+            if changed is None:
+                changed = dict(node)
+            changed[field] = cleaned
+    return node if changed is None else changed
+
+
+def sanitize_dict_list(items: Any, limits: Mapping[str, int]) -> list:
+    """Filtra elementos que no son dict y sanitiza cada uno con copy-on-write."""
+    result: list = []
+    for item in items:
+        if isinstance(item, dict):
+            result.append(sanitize_fields(item, limits))
+    return result
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from core.datetime_utils import utc_now_db
 from models.version_statuses import VersionStatus
+from services.catalog_registry import notify_catalog_changed
 
 
 def _user_ref(u) -> dict | None:
@@ -118,6 +119,7 @@ def create_version_status(db: Session, body, created_by_id: str | None) -> dict:
 
     db.add(obj)
     db.commit()
+    notify_catalog_changed("version_statuses")
     db.refresh(obj)
 
     obj = _get_or_404(db, int(obj.id))
@@ -144,6 +146,7 @@ def update_version_status(db: Session, id: int, body, updated_by_id: str | None)
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("version_statuses")
     db.refresh(obj)
 
     obj = _get_or_404(db, id)
@@ -157,6 +160,7 @@ def change_version_status_status(db: Session, id: int, is_active: bool, updated_
     obj.updated_by = updated_by_id
 
     db.commit()
+    notify_catalog_changed("version_statuses")
     db.refresh(obj)
 
     obj = _get_or_404(db, id)
@@ -171,3 +175,4 @@ def delete_version_status(db: Session, id: int, deleted_by_id: str | None) -> No
     obj.is_active = False
 
     db.commit()
+    notify_catalog_changed("version_statuses")
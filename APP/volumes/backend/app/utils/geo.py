@@ -1,9 +1,22 @@
 # utils/geo.py
+"""
+Lookups GeoIP sobre la base MaxMind/DB-IP.
+
+- El reader abre la base con `MODE_MMAP`: las páginas se comparten entre
+  workers y el SO decide qué mantener en memoria.
+- Cada resultado (incluido "no encontrado") se guarda en un LRU acotado por
+  IP con TTL, así GeoBlockMiddleware y la geo de sesiones no vuelven a
+  recorrer el árbol de la base por cada request del mismo visitante.
+"""
 import ipaddress
+import threading
+import time
+from collections import OrderedDict
 from functools import lru_cache
 
 import geoip2.database
 import geoip2.errors
+from maxminddb import MODE_MMAP
 
 from core.config import settings
 
@@ -17,7 +30,103 @@ def _is_private_ip(ip: str) -> bool:
 
 @lru_cache(maxsize=1)
 def _get_reader() -> geoip2.database.Reader:
-    return geoip2.database.Reader(settings.geo_db_path)
+    return geoip2.database.Reader(settings.geo_db_path, mode=MODE_MMAP)
+
+
+class _GeoCache:
+    """LRU por (tipo de lookup, IP) con expiración; seguro entre threads."""
+
+    def __init__(self, max_entries: int, ttl_sec: float) -> None:
+        self.max_entries = max(0, max_entries)
+        self.ttl_sec = ttl_sec
+        self._items: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> dict | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[str, str], value: dict) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl_sec, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_geo_cache = _GeoCache(settings.geo_cache_max_entries, float(settings.geo_cache_ttl_sec))
+
+
+def _local_geo() -> dict:
+    return {
+        "country_code": None,
+        "country_name": None,
+        "city":         None,
+        "location":     "Local",
+    }
+
+
+def _unknown_geo() -> dict:
+    return {
+        "country_code": None,
+        "country_name": None,
+        "city":         None,
+        "location":     None,
+    }
+
+
+def _lookup_city(ip: str) -> dict:
+    try:
+        response = _get_reader().city(ip)
+    except geoip2.errors.AddressNotFoundError:
+        return _unknown_geo()
+    country_code = response.country.iso_code
+    city         = response.city.name
+    return {
+        "country_code": country_code,
+        "country_name": response.country.name,
+        "city":         city,
+        "location":     f"{city}, {country_code}" if city and country_code else country_code,
+    }
+
+
+def _lookup_country(ip: str) -> dict:
+    try:
+        response = _get_reader().country(ip)
+    except geoip2.errors.AddressNotFoundError:
+        return _unknown_geo()
+    return {
+        "country_code": response.country.iso_code,
+        "country_name": response.country.name,
+        "city":         None,                 # Country DB no tiene ciudad
+        "location":     response.country.iso_code,
+    }
+
+
+def _cached_lookup(kind: str, ip: str, lookup) -> dict:
+    if _is_private_ip(ip):
+        return _local_geo()
+    key = (kind, ip)
+    cached = _geo_cache.get(key)
+    if cached is None:
+        cached = lookup(ip)
+        _geo_cache.put(key, cached)
+    # Copia: los llamadores pueden modificar el dict sin tocar la caché.
+    return dict(cached)
 
 
 def get_geo_city(ip: str) -> dict:
@@ -25,64 +134,12 @@ def get_geo_city(ip: str) -> dict:
     Retorna dict con country_code, country_name, city, location.
     Para IPs privadas retorna valores vacíos sin consultar la DB.
     """
-    if _is_private_ip(ip):
-        return {
-            "country_code": None,
-            "country_name": None,
-            "city":         None,
-            "location":     "Local",
-        }
+    return _cached_lookup("city", ip, _lookup_city)
 
-    try:
-        reader   = _get_reader()
-        response = reader.city(ip)
-        country_code = response.country.iso_code
-        country_name = response.country.name
-        city         = response.city.name
-        location     = f"{city}, {country_code}" if city and country_code else country_code
-
-        return {
-            "country_code": country_code,
-            "country_name": country_name,
-            "city":         city,
-            "location":     location,
-        }
-    except geoip2.errors.AddressNotFoundError:
-        return {
-            "country_code": None,
-            "country_name": None,
-            "city":         None,
-            "location":     None,
-        }
-    
 
 def get_geo(ip: str) -> dict:
-    if _is_private_ip(ip):
-        return {
-            "country_code": None,
-            "country_name": None,
-            "city":         None,
-            "location":     "Local",
-        }
+    return _cached_lookup("country", ip, _lookup_country)
 
-    try:
-        reader       = _get_reader()
-        response     = reader.country(ip)   # <-- country() en vez de city()
-        country_code = response.country.iso_code
-        country_name = response.country.name
-        city         = None                 # Country DB no tiene ciudad
-        location     = country_code
-
-        return {
-            "country_code": country_code,
-            "country_name": country_name,
-            "city":         city,
-            "location":     location,
-        }
-    except geoip2.errors.AddressNotFoundError:
-        return {
-            "country_code": None,
-            "country_name": None,
-            "city":         None,
-            "location":     None,
-        }
\ No newline at end of file
+
+def clear_geo_cache() -> None:
+    _geo_cache.clear()
@@ -0,0 +1,306 @@
+"""
+Compresión y hash en una sola pasada para los paquetes de respaldo.
+
+- La compresión corre en un proceso externo multihilo (`pigz -p N`; si no
+  está instalado, `gzip`). El formato sigue siendo gzip: el backend
+  inventaría, importa, descarga y restaura `*.tar.gz` / `*.sql.gz`.
+- La salida comprimida pasa por un tee que la escribe a disco y calcula el
+  sha256 y el tamaño mientras se genera: no se relee el archivo terminado.
+- Los miembros del tar se hashean mientras se leen para escribirlos, y el
+  índice (ruta, tamaño, sha256, offset) queda en un sidecar JSON junto al
+  paquete (`<paquete>.sidecar.json`).
+- La lectura usa `pigz -dc` alimentado por un hilo que hashea el archivo
+  comprimido: validar y extraer un paquete es un solo recorrido.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tarfile
+import threading
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Iterable
+
+from core.config import settings
+
+SIDECAR_SUFFIX = ".sidecar.json"
+SIDECAR_FORMAT = "backup_sidecar_v1"
+_COPY_CHUNK_BYTES = 1024 * 1024
+
+
+def compression_threads() -> int:
+    configured = settings.backup_compression_threads
+    return configured if configured > 0 else max(1, os.cpu_count() or 1)
+
+
+def compressor_name() -> str:
+    return "pigz" if shutil.which("pigz") else "gzip"
+
+
+def compressor_command() -> list[str]:
+    level = f"-{min(max(settings.backup_compression_level, 1), 9)}"
+    if compressor_name() == "pigz":
+        return ["pigz", "-p", str(compression_threads()), level, "-n", "-c"]
+    return ["gzip", level, "-n", "-c"]
+
+
+def decompressor_command(path: Path | None = None) -> list[str]:
+    command = ["pigz", "-p", str(compression_threads()), "-dc"] if shutil.which("pigz") else ["gzip", "-dc"]
+    return [*command, str(path)] if path is not None else command
+
+
+def sidecar_path(package_path: Path) -> Path:
+    return package_path.with_name(package_path.name + SIDECAR_SUFFIX)
+
+
+def _stderr_tail(raw: bytes | None) -> str:
+    return (raw or b"").decode("utf-8", errors="replace").strip()[-4000:]
+
+
+class _HashingReader:
+    """Envuelve un archivo de lectura; acumula sha256 y bytes leídos."""
+
+    def __init__(self, fh: IO[bytes]) -> None:
+        self._fh = fh
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        block = self._fh.read(size)
+        self.digest.update(block)
+        self.size += len(block)
+        return block
+
+
+@dataclass
+class StreamResult:
+    sha256: str = ""
+    size: int = 0
+    # ruta relativa → {sha256, sizeBytes, offset}; offset = cabecera en el tar sin comprimir
+    members: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+class CompressedStreamWriter:
+    """
+    Archivo de escritura que comprime con `compressor_command()` y escribe a
+    `output_path` calculando el sha256 de lo comprimido. Escribe a un temporal
+    y lo mueve al destino solo si el compresor terminó bien.
+    """
+
+    def __init__(self, output_path: Path, *, stdin: IO[bytes] | None = None) -> None:
+        self.output_path = output_path
+        self.result = StreamResult()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+        self._process = subprocess.Popen(
+            compressor_command(),
+            stdin=stdin if stdin is not None else subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self._error: BaseException | None = None
+        self._tee = threading.Thread(target=self._drain, name="compress-tee", daemon=True)
+        self._tee.start()
+
+    def _drain(self) -> None:
+        digest = hashlib.sha256()
+        size = 0
+        assert self._process.stdout is not None
+        try:
+            with self._tmp_path.open("wb") as fh:
+                for block in iter(lambda: self._process.stdout.read(_COPY_CHUNK_BYTES), b""):
+                    digest.update(block)
+                    size += len(block)
+                    fh.write(block)
+        except BaseException as exc:  # se relanza en close()
+            self._error = exc
+            self._process.kill()
+            return
+        self.result.sha256 = digest.hexdigest()
+        self.result.size = size
+
+    def write(self, data: bytes) -> int:
+        assert self._process.stdin is not None
+        self._process.stdin.write(data)
+        return len(data)
+
+    def close(self) -> StreamResult:
+        if self._process.stdin is not None and not self._process.stdin.closed:
+            self._process.stdin.close()
+        self._tee.join()
+        stderr = self._process.stderr.read() if self._process.stderr else b""
+        self._process.wait()
+        try:
+            if self._error is not None:
+                raise self._error
+            if self._process.returncode != 0:
+                raise RuntimeError(f"Compresión fallida ({self._process.returncode}): {_stderr_tail(stderr)}")
+            os.replace(self._tmp_path, self.output_path)
+        finally:
+            self._tmp_path.unlink(missing_ok=True)
+        return self.result
+
+    def abort(self) -> None:
+        self._process.kill()
+        if self._process.stdin is not None and not self._process.stdin.closed:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+        self._tee.join()
+        self._process.wait()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+def compress_command_output(command: list[str], output_path: Path, *, env: dict[str, str] | None = None) -> StreamResult:
+    """`command | pigz > output_path` por pipes del sistema; retorna sha256/tamaño de lo comprimido."""
+    source = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    assert source.stdout is not None
+    try:
+        writer = CompressedStreamWriter(output_path, stdin=source.stdout)
+    except BaseException:
+        source.kill()
+        source.wait()
+        raise
+    source.stdout.close()
+    source_stderr = source.stderr.read() if source.stderr else b""
+    source.wait()
+    if source.returncode != 0:
+        writer.abort()
+        raise RuntimeError(_stderr_tail(source_stderr))
+    return writer.close()
+
+
+def write_tar_stream(files: Iterable[tuple[Path, str]], output_path: Path) -> StreamResult:
+    """Escribe (ruta, arcname) como tar.gz en un solo recorrido, hasheando cada miembro."""
+    writer = CompressedStreamWriter(output_path)
+    members: dict[str, dict[str, Any]] = {}
+    try:
+        with tarfile.open(fileobj=writer, mode="w|") as archive:
+            for path, arcname in files:
+                tarinfo = archive.gettarinfo(str(path), arcname=arcname)
+                offset = archive.offset
+                with path.open("rb") as fh:
+                    reader = _HashingReader(fh)
+                    archive.addfile(tarinfo, fileobj=reader)
+                members[arcname] = {"sha256": reader.digest.hexdigest(), "sizeBytes": reader.size, "offset": offset}
+    except BaseException:
+        writer.abort()
+        raise
+    result = writer.close()
+    result.members = members
+    return result
+
+
+def tree_files(source_dir: Path) -> list[tuple[Path, str]]:
+    return [
+        (child, child.relative_to(source_dir).as_posix())
+        for child in sorted(source_dir.rglob("*"))
+        if child.is_file()
+    ]
+
+
+def write_sidecar(package_path: Path, result: StreamResult, **extra: Any) -> Path:
+    path = sidecar_path(package_path)
+    payload = {
+        "format": SIDECAR_FORMAT,
+        "package": package_path.name,
+        "compression": compressor_name(),
+        "archiveSha256": result.sha256,
+        "archiveBytes": result.size,
+        "members": [{"path": name, **entry} for name, entry in result.members.items()],
+        **extra,
+    }
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+def extract_tar_stream(archive_path: Path, destination: Path, *, label: str = "paquete") -> StreamResult:
+    """
+    Descomprime con `pigz -dc` y extrae en streaming a `destination`, hasheando
+    el archivo comprimido y cada miembro en la misma pasada. Solo acepta
+    archivos y directorios dentro de `destination`.
+    """
+    destination.mkdir(parents=True, exist_ok=True)
+    root = destination.resolve()
+    process = subprocess.Popen(
+        decompressor_command(),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdin is not None and process.stdout is not None
+    result = StreamResult()
+    feed_error: list[BaseException] = []
+
+    def feed() -> None:
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with archive_path.open("rb") as fh:
+                for block in iter(lambda: fh.read(_COPY_CHUNK_BYTES), b""):
+                    digest.update(block)
+                    size += len(block)
+                    process.stdin.write(block)
+        except BrokenPipeError:
+            pass
+        except BaseException as exc:
+            feed_error.append(exc)
+        finally:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        result.sha256 = digest.hexdigest()
+        result.size = size
+
+    feeder = threading.Thread(target=feed, name="decompress-feed", daemon=True)
+    feeder.start()
+    try:
+        with tarfile.open(fileobj=process.stdout, mode="r|") as archive:
+            for member in archive:
+                target = (destination / member.name).resolve(strict=False)
+                if target == root and member.isdir():
+                    continue
+                if root not in target.parents:
+                    raise ValueError(f"Ruta insegura dentro del {label}: {member.name}")
+                if member.isdir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                if not member.isfile():
+                    raise ValueError(f"Tipo de miembro no permitido dentro del {label}: {member.name}")
+                extracted = archive.extractfile(member)
+                if extracted is None:
+                    raise ValueError(f"No se pudo leer miembro interno: {member.name}")
+                target.parent.mkdir(parents=True, exist_ok=True)
+                reader = _HashingReader(extracted)
+                with target.open("wb") as fh:
+                    shutil.copyfileobj(reader, fh, _COPY_CHUNK_BYTES)
+                result.members[target.relative_to(root).as_posix()] = {
+                    "sha256": reader.digest.hexdigest(),
+                    "sizeBytes": reader.size,
+                    "offset": member.offset,
+                }
+        # Relleno final del tar que tarfile no consume.
+        for _ in iter(lambda: process.stdout.read(_COPY_CHUNK_BYTES), b""):
+            pass
+    except BaseException:
+        process.kill()
+        feeder.join()
+        process.wait()
+        raise
+    feeder.join()
+    stderr = process.stderr.read() if process.stderr else b""
+    process.wait()
+    if feed_error:
+        raise feed_error[0]
+    if process.returncode != 0:
+        raise ValueError(f"No se pudo descomprimir el {label} {archive_path.name}: {_stderr_tail(stderr)}")
+    return result
@@ -52,8 +52,17 @@ class Settings:
     max_concurrent_jobs: int = _int_env("BACKUP_MAX_CONCURRENT", 1)
     max_retries: int = _int_env("BACKUP_MAX_RETRIES", 3)
     retry_backoff_base: float = _float_env("BACKUP_RETRY_BACKOFF", 2.0)
+    metrics_port: int = _int_env("METRICS_PORT", 9100)
 
     backup_storage_root: str = os.environ.get("BACKUP_STORAGE_ROOT", "/app/remote_data/backups")
+    # archive: mirror + tar.gz por bucket (paquete autocontenido, por defecto)
+    # incremental: almacén direccionado por contenido (object_store.py); el paquete solo
+    # se restaura en el host que tiene el almacén
+    backup_objects_mode: str = os.environ.get("BACKUP_OBJECTS_MODE", "archive")
+    backup_object_workers: int = _int_env("BACKUP_OBJECT_WORKERS", 4)
+    # pigz -p N (0 = todos los núcleos) y nivel gzip para paquetes y dumps
+    backup_compression_threads: int = _int_env("BACKUP_COMPRESSION_THREADS", 0)
+    backup_compression_level: int = _int_env("BACKUP_COMPRESSION_LEVEL", 6)
     maintenance_state_file: str = os.environ.get("MAINTENANCE_STATE_FILE", "/app/backend_app/maintenance_state.json")
 
     mariadb_host: str = os.environ.get("MARIADB_HOST", "mariadb")
@@ -4,6 +4,7 @@ import json
 import re
 import uuid
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
 
 MAX_ATTEMPT = 20
@@ -33,6 +34,21 @@ def _clean_attempt(value: Any) -> int:
     return attempt
 
 
+def _clean_trace_id(value: Any) -> str | None:
+    trace_id = str(value or "").strip()
+    return trace_id if SAFE_TOKEN_RE.fullmatch(trace_id) else None
+
+
+def _parse_enqueued_at(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
 @dataclass(frozen=True)
 class JobEnvelope:
     job_id: str
@@ -40,6 +56,8 @@ class JobEnvelope:
     queue: str
     payload: dict[str, Any]
     attempt: int = 1
+    enqueued_at: datetime | None = None
+    trace_id: str | None = None
 
     @classmethod
     def from_raw(cls, raw: str, queue: str) -> "JobEnvelope":
@@ -54,6 +72,8 @@ class JobEnvelope:
                 type=_clean_type(job_type),
                 queue=queue_name,
                 attempt=_clean_attempt(data.pop("attempt", 1)),
+                enqueued_at=_parse_enqueued_at(data.pop("enqueued_at", None)),
+                trace_id=_clean_trace_id(data.pop("trace_id", None)),
                 payload=data,
             )
 
@@ -65,20 +85,24 @@ class JobEnvelope:
             type=_clean_type(data["type"]),
             queue=queue_name,
             attempt=_clean_attempt(data.get("attempt") or 1),
+            enqueued_at=_parse_enqueued_at(data.get("enqueued_at")),
+            trace_id=_clean_trace_id(data.get("trace_id")),
             payload=payload,
         )
 
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "job_id": self.job_id,
-                "type": self.type,
-                "queue": self.queue,
-                "attempt": self.attempt,
-                "payload": self.payload,
-            },
-            ensure_ascii=False,
-        )
+        data: dict[str, Any] = {
+            "job_id": self.job_id,
+            "type": self.type,
+            "queue": self.queue,
+            "attempt": self.attempt,
+            "payload": self.payload,
+        }
+        if self.enqueued_at is not None:
+            data["enqueued_at"] = self.enqueued_at.isoformat().replace("+00:00", "Z")
+        if self.trace_id:
+            data["trace_id"] = self.trace_id
+        return json.dumps(data, ensure_ascii=False)
 
     def next_attempt(self) -> "JobEnvelope":
         return JobEnvelope(
@@ -87,4 +111,12 @@ class JobEnvelope:
             queue=self.queue,
             payload=self.payload,
             attempt=self.attempt + 1,
+            enqueued_at=datetime.now(timezone.utc),
+            trace_id=self.trace_id,
         )
+
+    def wait_seconds(self, now: datetime | None = None) -> float | None:
+        if self.enqueued_at is None:
+            return None
+        current = now or datetime.now(timezone.utc)
+        return max(0.0, (current - self.enqueued_at).total_seconds())
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import logging
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+logger = logging.getLogger("backup-worker.metrics")
+
+JOBS_TOTAL = Counter(
+    "minuetaitor_backup_worker_jobs_total",
+    "Jobs de backup/restore procesados por resultado (completed | failed)",
+    ["type", "outcome"],
+)
+JOB_RUN_SECONDS = Histogram(
+    "minuetaitor_backup_worker_job_run_seconds",
+    "Duración de ejecución de jobs de backup/restore",
+    ["type"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200),
+)
+JOB_WAIT_SECONDS = Histogram(
+    "minuetaitor_backup_worker_job_wait_seconds",
+    "Espera desde enqueued_at hasta el inicio de ejecución (desde el BLPOP en envelopes legados)",
+    ["type"],
+    buckets=(0.01, 0.1, 1, 5, 15, 60, 300, 900, 3600),
+)
+JOB_RETRIES_TOTAL = Counter(
+    "minuetaitor_backup_worker_job_retries_total",
+    "Jobs reencolados para reintento",
+    ["type"],
+)
+DLQ_TOTAL = Counter(
+    "minuetaitor_backup_worker_dlq_total",
+    "Jobs enviados a la DLQ de backups",
+    ["type"],
+)
+JOBS_IN_PROGRESS = Gauge(
+    "minuetaitor_backup_worker_jobs_in_progress",
+    "Jobs ejecutándose en este momento",
+)
+
+
+def start_metrics_server(port: int) -> bool:
+    if port <= 0:
+        return False
+    try:
+        start_http_server(port)
+    except OSError as exc:
+        logger.warning("No se pudo exponer métricas en :%d (%s)", port, exc)
+        return False
+    logger.info("Métricas Prometheus en :%d/metrics", port)
+    return True
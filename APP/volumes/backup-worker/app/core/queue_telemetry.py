@@ -0,0 +1,54 @@
+"""
+Registro de espera y servicio por job en buckets de Redis por minuto.
+
+Contrato definido en el backend (`services/queue_telemetry.py`):
+hash `telemetry:queue:<cola>:<minuto epoch>` con campos `<tipo>|count`,
+`<tipo>|failed`, `<tipo>|wait|<bucket>` y `<tipo>|run|<bucket>`.
+Los límites de bucket deben coincidir con los del backend.
+"""
+from __future__ import annotations
+
+import bisect
+import logging
+import time
+
+import redis.asyncio as aioredis
+
+from core.job import JobEnvelope
+
+logger = logging.getLogger("backup-worker.queue_telemetry")
+
+TELEMETRY_KEY_PREFIX = "telemetry:queue"
+TELEMETRY_TTL_SECONDS = 2 * 60 * 60
+LATENCY_BUCKETS_MS: tuple[int, ...] = (
+    50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000,
+    60_000, 120_000, 300_000, 600_000, 1_800_000, 3_600_000,
+)
+
+
+def _bucket_index(seconds: float) -> int:
+    return bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+
+
+async def record_job_telemetry(
+    redis:        aioredis.Redis,
+    job:          JobEnvelope,
+    *,
+    wait_seconds: float | None,
+    run_seconds:  float,
+    failed:       bool,
+) -> None:
+    """Un solo pipeline por job; nunca propaga errores (la telemetría no bloquea jobs)."""
+    key = f"{TELEMETRY_KEY_PREFIX}:{job.queue}:{int(time.time() // 60)}"
+    try:
+        pipe = redis.pipeline(transaction=False)
+        pipe.hincrby(key, f"{job.type}|count", 1)
+        if failed:
+            pipe.hincrby(key, f"{job.type}|failed", 1)
+        if wait_seconds is not None:
+            pipe.hincrby(key, f"{job.type}|wait|{_bucket_index(wait_seconds)}", 1)
+        pipe.hincrby(key, f"{job.type}|run|{_bucket_index(run_seconds)}", 1)
+        pipe.expire(key, TELEMETRY_TTL_SECONDS)
+        await pipe.execute()
+    except Exception as exc:
+        logger.warning("No se pudo registrar telemetría | job_id=%s error=%s", job.job_id, exc)
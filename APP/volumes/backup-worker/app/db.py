@@ -6,6 +6,7 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from archive_stream import decompressor_command
 from core.config import settings
 
 
@@ -124,7 +125,7 @@ def import_gzip_sql_file(path: Path) -> None:
         settings.mariadb_database,
     ]
     gzip_process = subprocess.Popen(
-        ["gzip", "-dc", str(path)],
+        decompressor_command(path),
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
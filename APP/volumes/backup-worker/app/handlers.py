@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import json
 import logging
 import shutil
-import tarfile
 from pathlib import Path
 
+from archive_stream import extract_tar_stream, sidecar_path
 from core.backend_client import post_internal_json
 from core.config import settings
 from core.job import JobEnvelope
@@ -33,8 +32,8 @@ from package_builder import (
     build_full_backup_package,
     build_objects_backup_package,
     restore_minio_bucket_archive,
-    sha256_file,
 )
+from object_store import MANIFEST_FORMAT, collect_unreferenced_chunks, restore_bucket_from_manifest
 from tools import missing_tool_names
 
 
@@ -840,17 +839,6 @@ def _safe_restore_member_path(restore_root: Path, raw_path: str | None) -> Path:
     return resolved
 
 
-def _sha256_tar_member(archive: tarfile.TarFile, member_name: str) -> str:
-    member = archive.getmember(member_name)
-    extracted = archive.extractfile(member)
-    if extracted is None:
-        raise ValueError(f"No se pudo leer miembro interno: {member_name}")
-    digest = hashlib.sha256()
-    for chunk in iter(lambda: extracted.read(1024 * 1024), b""):
-        digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _parse_checksums(value: str) -> dict[str, str]:
     checksums: dict[str, str] = {}
     for line in str(value or "").splitlines():
@@ -863,65 +851,49 @@ def _parse_checksums(value: str) -> dict[str, str]:
     return checksums
 
 
-def _read_tar_json(archive: tarfile.TarFile, member_name: str) -> dict:
-    extracted = archive.extractfile(archive.getmember(member_name))
-    if extracted is None:
-        raise ValueError(f"No se pudo leer {member_name}.")
-    data = json.loads(extracted.read().decode("utf-8"))
+def _read_extracted_json(restore_root: Path, member_name: str) -> dict:
+    data = json.loads((restore_root / member_name).read_text(encoding="utf-8"))
     if not isinstance(data, dict):
         raise ValueError(f"{member_name} no contiene un objeto JSON.")
     return data
 
 
-def _read_tar_text(archive: tarfile.TarFile, member_name: str) -> str:
-    extracted = archive.extractfile(archive.getmember(member_name))
-    if extracted is None:
-        raise ValueError(f"No se pudo leer {member_name}.")
-    return extracted.read().decode("utf-8")
-
-
-def _validate_restore_package(package_path: Path, expected_checksum: str | None) -> tuple[dict, dict, dict[str, str]]:
+def _extract_restore_package(
+    package_path: Path,
+    expected_checksum: str | None,
+    restore_root: Path,
+) -> tuple[dict, dict, dict[str, str], str]:
+    """
+    Descomprime y extrae el paquete en una sola pasada (archive_stream),
+    validando el SHA-256 del paquete y de cada archivo interno con los hashes
+    calculados durante la extracción.
+    """
     if not package_path.is_file():
         raise FileNotFoundError(f"No existe el paquete de respaldo: {package_path}")
-    if expected_checksum:
-        actual_package_checksum = sha256_file(package_path)
-        if actual_package_checksum != expected_checksum:
-            raise ValueError("El SHA-256 del paquete no coincide con el catálogo.")
-
-    with tarfile.open(package_path, "r:gz") as archive:
-        member_names = set(archive.getnames())
-        for required_member in ("metadata.json", "manifest.json", "checksums.sha256"):
-            if required_member not in member_names:
-                raise ValueError(f"Miembro requerido faltante: {required_member}")
-
-        metadata = _read_tar_json(archive, "metadata.json")
-        manifest = _read_tar_json(archive, "manifest.json")
-        checksums = _parse_checksums(_read_tar_text(archive, "checksums.sha256"))
-        if not checksums:
-            raise ValueError("checksums.sha256 no contiene entradas válidas.")
-
-        for relative_path, expected_sha in checksums.items():
-            if relative_path not in member_names:
-                raise ValueError(f"Archivo interno faltante: {relative_path}")
-            actual_sha = _sha256_tar_member(archive, relative_path)
-            if actual_sha != expected_sha:
-                raise ValueError(f"Checksum interno no coincide: {relative_path}")
-    return metadata, manifest, checksums
-
-
-def _safe_extract_package(package_path: Path, destination: Path) -> None:
-    if destination.exists():
-        shutil.rmtree(destination)
-    destination.mkdir(parents=True, exist_ok=True)
-    root = destination.resolve()
-    with tarfile.open(package_path, "r:gz") as archive:
-        for member in archive.getmembers():
-            target = (destination / member.name).resolve(strict=False)
-            if target != root and root not in target.parents:
-                raise ValueError(f"Ruta insegura dentro del paquete: {member.name}")
-            if member.issym() or member.islnk() or member.isdev():
-                raise ValueError(f"Tipo de miembro no permitido dentro del paquete: {member.name}")
-        archive.extractall(destination)
+    if restore_root.exists():
+        shutil.rmtree(restore_root)
+
+    extracted = extract_tar_stream(package_path, restore_root)
+    if expected_checksum and extracted.sha256 != expected_checksum:
+        raise ValueError("El SHA-256 del paquete no coincide con el catálogo.")
+
+    members = extracted.members
+    for required_member in ("metadata.json", "manifest.json", "checksums.sha256"):
+        if required_member not in members:
+            raise ValueError(f"Miembro requerido faltante: {required_member}")
+
+    metadata = _read_extracted_json(restore_root, "metadata.json")
+    manifest = _read_extracted_json(restore_root, "manifest.json")
+    checksums = _parse_checksums((restore_root / "checksums.sha256").read_text(encoding="utf-8"))
+    if not checksums:
+        raise ValueError("checksums.sha256 no contiene entradas válidas.")
+
+    for relative_path, expected_sha in checksums.items():
+        if relative_path not in members:
+            raise ValueError(f"Archivo interno faltante: {relative_path}")
+        if members[relative_path]["sha256"] != expected_sha:
+            raise ValueError(f"Checksum interno no coincide: {relative_path}")
+    return metadata, manifest, checksums, extracted.sha256
 
 
 def _write_maintenance_marker(job: JobEnvelope, *, scope: str, artifact_id: str, actor_snapshot: dict | None) -> None:
@@ -970,7 +942,13 @@ def _build_pre_restore_backup(job: JobEnvelope, backup_root: Path, *, scope: str
     return build_full_backup_package(**common)
 
 
-def _upsert_package_artifact_from_payload(job: JobEnvelope, metadata: dict, manifest: dict, package_path: Path) -> None:
+def _upsert_package_artifact_from_payload(
+    job: JobEnvelope,
+    metadata: dict,
+    manifest: dict,
+    package_path: Path,
+    package_checksum: str,
+) -> None:
     actor_snapshot = metadata.get("actor") if isinstance(metadata.get("actor"), dict) else None
     upsert_artifact(
         artifact_id=str(metadata.get("artifactId") or job.payload.get("artifact_id")),
@@ -981,7 +959,7 @@ def _upsert_package_artifact_from_payload(job: JobEnvelope, metadata: dict, mani
         storage_path=str(job.payload.get("storage_path") or package_path),
         file_path=str(job.payload.get("file_path") or package_path),
         size_bytes=int(job.payload.get("artifact_size_bytes") or package_path.stat().st_size),
-        checksum_sha256=str(job.payload.get("artifact_checksum_sha256") or sha256_file(package_path)),
+        checksum_sha256=str(job.payload.get("artifact_checksum_sha256") or package_checksum),
         db_schema_version=metadata.get("dbSchemaVersion"),
         app_version=metadata.get("appVersion"),
         metadata=metadata,
@@ -1065,9 +1043,11 @@ async def _handle_restore_backup(job: JobEnvelope, backup_root: Path) -> None:
     pre_restore_package: dict | None = None
     result: dict = {}
     try:
-        metadata, manifest, checksums = _validate_restore_package(
+        restore_root = backup_root / ".work" / job.job_id / "restore"
+        metadata, manifest, checksums, package_checksum = _extract_restore_package(
             package_path,
             str(job.payload.get("artifact_checksum_sha256") or "").strip() or None,
+            restore_root,
         )
         package_scope = str(metadata.get("scope") or scope)
         if package_scope != scope:
@@ -1113,8 +1093,6 @@ async def _handle_restore_backup(job: JobEnvelope, backup_root: Path) -> None:
             },
         )
 
-        restore_root = backup_root / ".work" / job.job_id / "restore"
-        _safe_extract_package(package_path, restore_root)
         sections = manifest.get("sections") if isinstance(manifest.get("sections"), dict) else {}
         database_section = sections.get("database") if isinstance(sections.get("database"), dict) else {}
         objects_section = sections.get("objects") if isinstance(sections.get("objects"), dict) else {}
@@ -1159,6 +1137,11 @@ async def _handle_restore_backup(job: JobEnvelope, backup_root: Path) -> None:
                 if bucket_name not in SYSTEM_MINIO_BUCKETS:
                     raise ValueError(f"Bucket no permitido en manifest de restore: {bucket_name}")
                 bucket_archive_path = _safe_restore_member_path(restore_root, bucket_path)
+                if bucket_entry.get("format") == MANIFEST_FORMAT:
+                    restored_buckets.append(
+                        restore_bucket_from_manifest(bucket_name, bucket_archive_path, backup_root)
+                    )
+                    continue
                 restored_buckets.append(
                     restore_minio_bucket_archive(bucket_name, bucket_archive_path, restore_root)
                 )
@@ -1171,7 +1154,7 @@ async def _handle_restore_backup(job: JobEnvelope, backup_root: Path) -> None:
             phase="registering_results",
             message="Registrando resultado de restauración y auditoría.",
         )
-        _upsert_package_artifact_from_payload(job, metadata, manifest, package_path)
+        _upsert_package_artifact_from_payload(job, metadata, manifest, package_path, package_checksum)
         if pre_restore_package:
             upsert_artifact(
                 artifact_id=pre_restore_package["artifactId"],
@@ -1386,6 +1369,7 @@ async def _handle_backup_purge(job: JobEnvelope, backup_root: Path) -> None:
                     else:
                         file_missing = True
                         missing_files.append({"id": artifact_id, "filePath": str(file_path)})
+                    sidecar_path(file_path).unlink(missing_ok=True)
 
                 mark_artifact_purged(
                     artifact_id=artifact_id,
@@ -1405,9 +1389,16 @@ async def _handle_backup_purge(job: JobEnvelope, backup_root: Path) -> None:
             except Exception as exc:
                 errors.append({"id": artifact_id, "name": candidate.get("name"), "error": str(exc)})
 
+        try:
+            object_store_gc = collect_unreferenced_chunks(backup_root)
+        except Exception as exc:
+            logger.warning("No se pudo limpiar el almacén de objetos | err=%s", exc)
+            object_store_gc = {"error": str(exc)}
+
         result = {
             "candidateCount": len(candidates),
             "purgedCount": len(purged),
+            "objectStore": object_store_gc,
             "missingFileCount": len(missing_files),
             "errorCount": len(errors),
             "purged": purged,
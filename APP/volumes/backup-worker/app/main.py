@@ -3,11 +3,14 @@ from __future__ import annotations
 import asyncio
 import logging
 import signal
+import time
 import traceback
 from datetime import datetime, timezone
 
+from core import metrics
 from core.config import settings
 from core.job import JobEnvelope
+from core.queue_telemetry import record_job_telemetry
 from core.redis_client import close_redis, get_redis
 from handlers import handle_backup_job
 from tools import REQUIRED_TOOLS_BY_JOB_TYPE, check_tool
@@ -44,21 +47,52 @@ async def _send_to_dlq(job: JobEnvelope, error_trace: str) -> None:
         queue=settings.dlq_queue,
         attempt=job.attempt,
         payload=payload,
+        trace_id=job.trace_id,
     ).to_json())
+    metrics.DLQ_TOTAL.labels(job.type).inc()
 
 
-async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore) -> None:
+async def _record_job_finished(job: JobEnvelope, wait_seconds: float, run_seconds: float, *, failed: bool) -> None:
+    metrics.JOB_RUN_SECONDS.labels(job.type).observe(run_seconds)
+    metrics.JOBS_TOTAL.labels(job.type, "failed" if failed else "completed").inc()
+    # La telemetría nunca cambia el resultado del job: un fallo de Redis acá
+    # no debe reintentar ni mandar a DLQ un job que ya terminó.
+    try:
+        redis = await get_redis()
+    except Exception as exc:
+        logger.warning("No se pudo registrar telemetría | job_id=%s error=%s", job.job_id, exc)
+        return
+    await record_job_telemetry(
+        redis,
+        job,
+        wait_seconds=wait_seconds,
+        run_seconds=run_seconds,
+        failed=failed,
+    )
+
+
+async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore, dequeued_at: float) -> None:
     async with sem:
+        wait_seconds = job.wait_seconds()
+        if wait_seconds is None:
+            wait_seconds = time.monotonic() - dequeued_at
+        metrics.JOB_WAIT_SECONDS.labels(job.type).observe(wait_seconds)
+        metrics.JOBS_IN_PROGRESS.inc()
+        started = time.perf_counter()
         try:
             logger.info(
-                "Iniciando job | job_id=%s type=%s attempt=%d",
+                "Iniciando job | job_id=%s type=%s attempt=%d trace_id=%s wait=%.3fs",
                 job.job_id,
                 job.type,
                 job.attempt,
+                job.trace_id,
+                wait_seconds,
             )
             await handle_backup_job(job)
+            await _record_job_finished(job, wait_seconds, time.perf_counter() - started, failed=False)
             logger.info("Job completado | job_id=%s type=%s", job.job_id, job.type)
         except Exception as exc:
+            await _record_job_finished(job, wait_seconds, time.perf_counter() - started, failed=True)
             error_trace = traceback.format_exc()
             logger.error(
                 "Job fallido | job_id=%s type=%s attempt=%d/%d error=%s",
@@ -72,12 +106,15 @@ async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore) -> None:
             if job.attempt < settings.max_retries:
                 delay = settings.retry_backoff_base ** job.attempt
                 logger.info("Reintentando job en %.1fs | job_id=%s", delay, job.job_id)
+                metrics.JOB_RETRIES_TOTAL.labels(job.type).inc()
                 await asyncio.sleep(delay)
                 await redis.rpush(settings.backup_queue, job.next_attempt().to_json())
                 return
 
             logger.error("Enviando job a DLQ | job_id=%s dlq=%s", job.job_id, settings.dlq_queue)
             await _send_to_dlq(job, error_trace)
+        finally:
+            metrics.JOBS_IN_PROGRESS.dec()
 
 
 async def _main_loop(stop_event: asyncio.Event) -> None:
@@ -106,7 +143,7 @@ async def _main_loop(stop_event: asyncio.Event) -> None:
                 continue
 
             await redis.hset(QUEUE_ACTIVITY_HASH, queue_key, _utcnow_iso())
-            task = asyncio.create_task(_execute_job(job, sem), name=f"backup-job-{job.job_id}")
+            task = asyncio.create_task(_execute_job(job, sem, time.monotonic()), name=f"backup-job-{job.job_id}")
             active_tasks.add(task)
             task.add_done_callback(active_tasks.discard)
         except asyncio.CancelledError:
@@ -144,6 +181,7 @@ async def main() -> None:
     logger.info("Maintenance marker: %s", settings.maintenance_state_file)
     logger.info("=" * 60)
     _log_tool_status()
+    metrics.start_metrics_server(settings.metrics_port)
 
     try:
         await _main_loop(stop_event)
@@ -0,0 +1,386 @@
+"""
+Respaldo incremental de MinIO con almacén direccionado por contenido.
+
+Estructura bajo `<BACKUP_STORAGE_ROOT>/.objects-store/`:
+
+  chunks/<aa>/<sha256>      contenido de cada objeto, una vez por sha256 (dedup)
+  index/<bucket>.json       última foto del bucket: key → etag, tamaño, sha256
+  manifests/<artifact>.json sha256 referenciados por cada paquete vigente (GC)
+
+Cada ejecución lista el bucket (`mc ls --json`), compara etag/tamaño contra
+el índice anterior y solo descarga (`mc cat`) lo nuevo o modificado; el
+paquete lleva un manifest por bucket (key → sha256) en vez de un tar con
+todos los objetos. Restaurar = subir cada key desde su chunk verificando el
+sha256 en el mismo paso. El purge elimina los chunks que ya no referencia
+ningún paquete existente; antes registra los paquetes sin referencia propia
+(importados o copiados) leyendo sus manifests.
+
+Estos paquetes NO son autocontenidos: solo se restauran en el host que tiene
+el almacén. Por eso el modo es opcional (BACKUP_OBJECTS_MODE=incremental);
+el modo por defecto sigue siendo `archive`.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import tarfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from core.config import settings
+
+logger = logging.getLogger("backup-worker.object_store")
+
+STORE_DIRNAME = ".objects-store"
+MANIFEST_FORMAT = "content_addressed"
+_COPY_CHUNK_BYTES = 1024 * 1024
+# Un chunk recién escrito puede pertenecer a un respaldo aún en curso.
+_GC_GRACE_SECONDS = 6 * 3600
+
+
+def store_root(backup_root: Path) -> Path:
+    return backup_root / STORE_DIRNAME
+
+
+def chunk_path(store: Path, sha256: str) -> Path:
+    return store / "chunks" / sha256[:2] / sha256
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _mc_target(bucket: str, key: str = "") -> str:
+    from package_builder import minio_alias_name
+
+    return f"{minio_alias_name()}/{bucket}/{key}" if key else f"{minio_alias_name()}/{bucket}"
+
+
+def list_bucket_objects(bucket: str) -> dict[str, dict[str, Any]]:
+    """key → {etag, size} de todos los objetos del bucket."""
+    process = subprocess.Popen(
+        ["mc", "ls", "--recursive", "--json", _mc_target(bucket)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stdout is not None
+    objects: dict[str, dict[str, Any]] = {}
+    for line in process.stdout:
+        line = line.strip()
+        if not line:
+            continue
+        entry = json.loads(line)
+        if entry.get("status") == "error":
+            raise RuntimeError(f"mc ls falló en {bucket}: {entry.get('error')}")
+        if entry.get("type") != "file" or not entry.get("key"):
+            continue
+        objects[str(entry["key"])] = {
+            "etag": str(entry.get("etag") or ""),
+            "size": int(entry.get("size") or 0),
+        }
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(f"mc ls falló en {bucket}: {stderr.strip()[-2000:]}")
+    return objects
+
+
+def _fetch_object(store: Path, bucket: str, key: str) -> tuple[str, int, bool]:
+    """Descarga un objeto al almacén; retorna (sha256, tamaño, chunk_nuevo)."""
+    tmp_dir = store / "tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = tmp_dir / uuid.uuid4().hex
+    digest = hashlib.sha256()
+    size = 0
+    process = subprocess.Popen(
+        ["mc", "cat", _mc_target(bucket, key)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdout is not None
+    try:
+        with tmp_path.open("wb") as fh:
+            for block in iter(lambda: process.stdout.read(_COPY_CHUNK_BYTES), b""):
+                digest.update(block)
+                size += len(block)
+                fh.write(block)
+        _, stderr = process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"mc cat falló en {bucket}/{key}: {stderr.decode('utf-8', errors='replace').strip()[-2000:]}"
+            )
+        sha256 = digest.hexdigest()
+        target = chunk_path(store, sha256)
+        if target.exists():
+            # Dedup: renovar mtime para que el GC no lo tome como huérfano mientras se registra el paquete.
+            os.utime(target)
+            return sha256, size, False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, target)
+        return sha256, size, True
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def snapshot_bucket(bucket: str, backup_root: Path) -> tuple[dict[str, dict[str, Any]], dict[str, Any]]:
+    """
+    Foto incremental del bucket. Retorna (objetos key → {sha256, size, etag},
+    estadísticas) y deja el índice actualizado para la próxima ejecución.
+    """
+    store = store_root(backup_root)
+    index_path = store / "index" / f"{bucket}.json"
+    previous = _read_json(index_path).get("objects") or {}
+    listed = list_bucket_objects(bucket)
+
+    objects: dict[str, dict[str, Any]] = {}
+    to_fetch: list[str] = []
+    for key, current in listed.items():
+        known = previous.get(key)
+        if (
+            isinstance(known, dict)
+            and current["etag"]
+            and known.get("etag") == current["etag"]
+            and known.get("size") is not None
+            and int(known["size"]) == current["size"]
+            and chunk_path(store, str(known.get("sha256") or "x" * 64)).is_file()
+        ):
+            objects[key] = {"sha256": known["sha256"], "size": current["size"], "etag": current["etag"]}
+        else:
+            to_fetch.append(key)
+
+    new_chunks = 0
+    new_chunk_bytes = 0
+    fetched_bytes = 0
+    workers = max(1, settings.backup_object_workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"fetch-{bucket}") as pool:
+        for key, (sha256, size, created) in zip(
+            to_fetch, pool.map(lambda item: _fetch_object(store, bucket, item), to_fetch)
+        ):
+            objects[key] = {"sha256": sha256, "size": size, "etag": listed[key]["etag"]}
+            fetched_bytes += size
+            if created:
+                new_chunks += 1
+                new_chunk_bytes += size
+
+    _write_json_atomic(index_path, {"bucket": bucket, "objects": objects})
+    stats = {
+        "objectCount": len(objects),
+        "sourceBytes": sum(int(item["size"]) for item in objects.values()),
+        "changedObjectCount": len(to_fetch),
+        "changedBytes": fetched_bytes,
+        "reusedObjectCount": len(objects) - len(to_fetch),
+        "newChunkCount": new_chunks,
+        "storedBytes": new_chunk_bytes,
+    }
+    return objects, stats
+
+
+def write_bucket_manifest(path: Path, bucket: str, objects: dict[str, dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "format": MANIFEST_FORMAT,
+                "bucket": bucket,
+                "objects": {key: {"sha256": item["sha256"], "size": item["size"]} for key, item in objects.items()},
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+
+def register_package_references(
+    backup_root: Path,
+    *,
+    artifact_id: str,
+    package_path: Path,
+    bucket_manifest_paths: list[Path],
+) -> None:
+    """Anota qué chunks usa un paquete; el GC los conserva mientras el paquete exista."""
+    referenced: set[str] = set()
+    for manifest_path in bucket_manifest_paths:
+        for item in (_read_json(manifest_path).get("objects") or {}).values():
+            referenced.add(str(item["sha256"]))
+    _write_json_atomic(
+        store_root(backup_root) / "manifests" / f"{artifact_id}.json",
+        {"artifactId": artifact_id, "packagePath": str(package_path), "chunks": sorted(referenced)},
+    )
+
+
+def _pipe_chunk_to_object(store: Path, bucket: str, key: str, sha256: str) -> int:
+    source = chunk_path(store, sha256)
+    digest = hashlib.sha256()
+    size = 0
+    process = subprocess.Popen(
+        ["mc", "pipe", _mc_target(bucket, key)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdin is not None
+    try:
+        with source.open("rb") as fh:
+            for block in iter(lambda: fh.read(_COPY_CHUNK_BYTES), b""):
+                digest.update(block)
+                size += len(block)
+                process.stdin.write(block)
+    finally:
+        process.stdin.close()
+    stderr = process.stderr.read() if process.stderr else b""
+    process.wait()
+    if process.returncode != 0:
+        raise RuntimeError(
+            f"mc pipe falló en {bucket}/{key}: {stderr.decode('utf-8', errors='replace').strip()[-2000:]}"
+        )
+    if digest.hexdigest() != sha256:
+        raise ValueError(f"Chunk corrupto para {bucket}/{key}: sha256 no coincide")
+    return size
+
+
+def restore_bucket_from_manifest(bucket: str, manifest_path: Path, backup_root: Path) -> dict[str, Any]:
+    from package_builder import clear_minio_bucket, ensure_minio_bucket
+
+    manifest = _read_json(manifest_path)
+    if manifest.get("format") != MANIFEST_FORMAT or manifest.get("bucket") != bucket:
+        raise ValueError(f"Manifest de objetos inválido para {bucket}: {manifest_path.name}")
+    objects = manifest.get("objects") or {}
+    store = store_root(backup_root)
+    # Antes de vaciar el bucket: todos los chunks deben existir con su tamaño.
+    for key, item in objects.items():
+        path = chunk_path(store, str(item["sha256"]))
+        if not path.is_file() or path.stat().st_size != int(item["size"]):
+            raise FileNotFoundError(f"Falta el chunk de {bucket}/{key} en el almacén de objetos")
+
+    ensure_minio_bucket(bucket)
+    clear_minio_bucket(bucket)
+    workers = max(1, settings.backup_object_workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"restore-{bucket}") as pool:
+        restored_bytes = sum(
+            pool.map(
+                lambda entry: _pipe_chunk_to_object(store, bucket, entry[0], str(entry[1]["sha256"])),
+                objects.items(),
+            )
+        )
+    return {
+        "bucket": bucket,
+        "objectCount": len(objects),
+        "sourceBytes": restored_bytes,
+    }
+
+
+def _package_chunk_references(package_path: Path) -> set[str]:
+    """sha256 de los manifests direccionados por contenido dentro de un paquete."""
+    referenced: set[str] = set()
+    with tarfile.open(package_path, "r|gz") as archive:
+        for member in archive:
+            if not member.isfile() or not (
+                member.name.startswith("minio/") and member.name.endswith("/objects.manifest.json")
+            ):
+                continue
+            extracted = archive.extractfile(member)
+            manifest = json.loads(extracted.read().decode("utf-8")) if extracted else {}
+            if isinstance(manifest, dict) and manifest.get("format") == MANIFEST_FORMAT:
+                referenced.update(str(item["sha256"]) for item in (manifest.get("objects") or {}).values())
+    return referenced
+
+
+def register_untracked_packages(backup_root: Path) -> tuple[int, int]:
+    """
+    Registra referencias para paquetes sin registro propio (p. ej. importados
+    por el backend o copiados a mano), así el GC no borra sus chunks.
+    Retorna (registrados, ilegibles).
+    """
+    store = store_root(backup_root)
+    tracked = {
+        str(_read_json(path).get("packagePath") or "")
+        for path in (store / "manifests").glob("*.json")
+    }
+    registered = unreadable = 0
+    for package_path in sorted(backup_root.rglob("backup-*.tar.gz")):
+        if STORE_DIRNAME in package_path.parts or ".work" in package_path.parts or str(package_path) in tracked:
+            continue
+        try:
+            referenced = _package_chunk_references(package_path)
+        except (OSError, tarfile.TarError, ValueError, KeyError) as exc:
+            logger.warning("No se pudo inspeccionar %s para el GC de objetos: %s", package_path, exc)
+            unreadable += 1
+            continue
+        reference_id = "untracked-" + hashlib.sha256(str(package_path).encode("utf-8")).hexdigest()[:32]
+        _write_json_atomic(
+            store / "manifests" / f"{reference_id}.json",
+            {"artifactId": reference_id, "packagePath": str(package_path), "chunks": sorted(referenced)},
+        )
+        registered += 1
+    return registered, unreadable
+
+
+def collect_unreferenced_chunks(backup_root: Path) -> dict[str, int]:
+    """Elimina referencias de paquetes que ya no existen y los chunks que quedaron huérfanos."""
+    store = store_root(backup_root)
+    if not store.is_dir():
+        return {"removedReferences": 0, "removedChunks": 0, "reclaimedBytes": 0}
+
+    registered_packages, unreadable_packages = register_untracked_packages(backup_root)
+    if unreadable_packages:
+        # Un paquete que no se pudo leer podría referenciar chunks: no se borra nada.
+        return {
+            "removedReferences": 0,
+            "removedChunks": 0,
+            "reclaimedBytes": 0,
+            "registeredPackages": registered_packages,
+            "unreadablePackages": unreadable_packages,
+        }
+
+    removed_references = 0
+    referenced: set[str] = set()
+    for reference_path in (store / "manifests").glob("*.json"):
+        reference = _read_json(reference_path)
+        if not Path(str(reference.get("packagePath") or "")).is_file():
+            reference_path.unlink(missing_ok=True)
+            removed_references += 1
+            continue
+        referenced.update(str(sha) for sha in reference.get("chunks") or [])
+
+    removed_chunks = 0
+    reclaimed_bytes = 0
+    grace_cutoff = time.time() - _GC_GRACE_SECONDS
+    chunks_root = store / "chunks"
+    if chunks_root.is_dir():
+        for prefix_entry in os.scandir(chunks_root):
+            if not prefix_entry.is_dir(follow_symlinks=False):
+                continue
+            for entry in os.scandir(prefix_entry.path):
+                if entry.name in referenced or not entry.is_file(follow_symlinks=False):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                if stat.st_mtime >= grace_cutoff:
+                    continue
+                os.unlink(entry.path)
+                removed_chunks += 1
+                reclaimed_bytes += stat.st_size
+    return {
+        "removedReferences": removed_references,
+        "removedChunks": removed_chunks,
+        "reclaimedBytes": reclaimed_bytes,
+        "registeredPackages": registered_packages,
+    }
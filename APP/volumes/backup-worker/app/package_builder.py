@@ -1,18 +1,25 @@
 from __future__ import annotations
 
-import gzip
 import hashlib
 import json
 import os
 import shutil
 import subprocess
-import tarfile
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from archive_stream import (
+    StreamResult,
+    compress_command_output,
+    extract_tar_stream,
+    tree_files,
+    write_sidecar,
+    write_tar_stream,
+)
 from core.config import settings
+from object_store import MANIFEST_FORMAT, register_package_references, snapshot_bucket, write_bucket_manifest
 
 
 PACKAGE_FORMAT_VERSION = "1.0"
@@ -120,25 +127,13 @@ def clear_minio_bucket(bucket: str) -> None:
     run_command(["mc", "rm", "--recursive", "--force", f"{minio_alias_name()}/{bucket}"])
 
 
-def _safe_extract_tar(archive_path: Path, destination: Path) -> None:
-    destination.mkdir(parents=True, exist_ok=True)
-    root = destination.resolve()
-    with tarfile.open(archive_path, "r:gz") as archive:
-        for member in archive.getmembers():
-            target = (destination / member.name).resolve(strict=False)
-            if target != root and root not in target.parents:
-                raise ValueError(f"Ruta insegura dentro del archivo MinIO: {member.name}")
-            if member.issym() or member.islnk() or member.isdev():
-                raise ValueError(f"Tipo de miembro no permitido dentro del archivo MinIO: {member.name}")
-        archive.extractall(destination)
-
-
 def restore_minio_bucket_archive(bucket: str, archive_path: Path, work_dir: Path) -> dict[str, Any]:
     restore_dir = work_dir / "minio-restore" / bucket
     if restore_dir.exists():
         shutil.rmtree(restore_dir)
-    _safe_extract_tar(archive_path, restore_dir)
-    object_count, object_bytes = count_tree_files(restore_dir)
+    extracted = extract_tar_stream(archive_path, restore_dir, label="archivo MinIO")
+    object_count = len(extracted.members)
+    object_bytes = sum(int(item["sizeBytes"]) for item in extracted.members.values())
     ensure_minio_bucket(bucket)
     clear_minio_bucket(bucket)
     run_command(["mc", "mirror", "--overwrite", str(restore_dir), f"{minio_alias_name()}/{bucket}"])
@@ -149,12 +144,8 @@ def restore_minio_bucket_archive(bucket: str, archive_path: Path, work_dir: Path
     }
 
 
-def make_bucket_archive(source_dir: Path, output_path: Path) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with tarfile.open(output_path, "w:gz", compresslevel=6) as archive:
-        for child in sorted(source_dir.rglob("*")):
-            if child.is_file():
-                archive.add(child, arcname=child.relative_to(source_dir))
+def make_bucket_archive(source_dir: Path, output_path: Path) -> StreamResult:
+    return write_tar_stream(tree_files(source_dir), output_path)
 
 
 def count_tree_files(path: Path) -> tuple[int, int]:
@@ -167,7 +158,7 @@ def count_tree_files(path: Path) -> tuple[int, int]:
     return count, size
 
 
-def dump_mariadb_data(output_path: Path) -> None:
+def dump_mariadb_data(output_path: Path) -> StreamResult:
     command = [
         "mariadb-dump",
         "--host",
@@ -186,29 +177,23 @@ def dump_mariadb_data(output_path: Path) -> None:
         "--default-character-set=utf8mb4",
         settings.mariadb_database,
     ]
-    with output_path.open("wb") as raw_fh:
-        with gzip.GzipFile(fileobj=raw_fh, mode="wb", mtime=0) as gzip_fh:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=_mariadb_env(),
-            )
-            assert process.stdout is not None
-            shutil.copyfileobj(process.stdout, gzip_fh)
-            _, stderr = process.communicate()
-            if process.returncode != 0:
-                raise RuntimeError(stderr.decode("utf-8", errors="replace")[-4000:])
-
-
-def build_checksums(package_dir: Path, relative_paths: list[str]) -> list[dict[str, Any]]:
+    # mariadb-dump → pigz por pipe del sistema; el sha256 del .sql.gz sale del mismo paso.
+    return compress_command_output(command, output_path, env=_mariadb_env())
+
+
+def build_checksums(
+    package_dir: Path,
+    relative_paths: list[str],
+    known_digests: dict[str, str] | None = None,
+) -> list[dict[str, Any]]:
+    """`known_digests` (ruta → sha256) evita releer archivos hasheados al escribirlos."""
     entries: list[dict[str, Any]] = []
     for relative_path in relative_paths:
         path = package_dir / relative_path
         entries.append(
             {
                 "path": relative_path,
-                "sha256": sha256_file(path),
+                "sha256": (known_digests or {}).get(relative_path) or sha256_file(path),
                 "sizeBytes": path.stat().st_size,
             }
         )
@@ -220,11 +205,12 @@ def write_checksums(path: Path, checksums: list[dict[str, Any]]) -> None:
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
-def make_package_archive(package_dir: Path, output_path: Path) -> None:
-    with tarfile.open(output_path, "w:gz", compresslevel=6) as archive:
-        for child in sorted(package_dir.rglob("*")):
-            if child.is_file():
-                archive.add(child, arcname=child.relative_to(package_dir))
+def make_package_archive(package_dir: Path, output_path: Path) -> StreamResult:
+    return write_tar_stream(tree_files(package_dir), output_path)
+
+
+def bucket_archive_digests(bucket_entries: list[dict[str, Any]]) -> dict[str, str]:
+    return {entry["path"]: entry["archiveSha256"] for entry in bucket_entries if entry.get("archiveSha256")}
 
 
 def prepare_package_dirs(backup_root: Path, job_id: str, scope: str) -> tuple[Path, Path, Path]:
@@ -238,12 +224,72 @@ def prepare_package_dirs(backup_root: Path, job_id: str, scope: str) -> tuple[Pa
     return work_root, package_dir, output_dir
 
 
+def objects_backup_mode(policy: dict[str, Any] | None) -> str:
+    """`archive` (mirror + tar.gz, por defecto) o `incremental` (almacén direccionado por contenido, opcional)."""
+    value = (policy or {}).get("objectsMode") or (policy or {}).get("objects_mode") or settings.backup_objects_mode
+    return "incremental" if str(value).strip().lower() == "incremental" else "archive"
+
+
+def snapshot_minio_buckets(
+    *,
+    package_dir: Path,
+    backup_root: Path,
+    buckets: tuple[str, ...] = SYSTEM_MINIO_BUCKETS,
+) -> tuple[list[dict[str, Any]], list[str]]:
+    ensure_minio_alias()
+
+    bucket_entries: list[dict[str, Any]] = []
+    data_relative_paths: list[str] = []
+    for bucket in buckets:
+        ensure_minio_bucket(bucket)
+        objects, stats = snapshot_bucket(bucket, backup_root)
+        relative_path = f"minio/{bucket}/objects.manifest.json"
+        manifest_path = package_dir / relative_path
+        write_bucket_manifest(manifest_path, bucket, objects)
+        bucket_entries.append(
+            {
+                "name": bucket,
+                "path": relative_path,
+                "format": MANIFEST_FORMAT,
+                **stats,
+                "archiveBytes": manifest_path.stat().st_size,
+            }
+        )
+        data_relative_paths.append(relative_path)
+    return bucket_entries, data_relative_paths
+
+
+def register_object_references(
+    *,
+    backup_root: Path,
+    artifact_id: str,
+    output_path: Path,
+    package_dir: Path,
+    bucket_entries: list[dict[str, Any]],
+) -> None:
+    manifest_paths = [
+        package_dir / entry["path"] for entry in bucket_entries if entry.get("format") == MANIFEST_FORMAT
+    ]
+    if manifest_paths:
+        register_package_references(
+            backup_root,
+            artifact_id=artifact_id,
+            package_path=output_path,
+            bucket_manifest_paths=manifest_paths,
+        )
+
+
 def archive_minio_buckets(
     *,
     work_root: Path,
     package_dir: Path,
     buckets: tuple[str, ...] = SYSTEM_MINIO_BUCKETS,
+    backup_root: Path | None = None,
+    mode: str = "archive",
 ) -> tuple[list[dict[str, Any]], list[str]]:
+    if mode == "incremental" and backup_root is not None:
+        return snapshot_minio_buckets(package_dir=package_dir, backup_root=backup_root, buckets=buckets)
+
     mirror_root = work_root / "minio-mirror"
     mirror_root.mkdir(parents=True, exist_ok=True)
     ensure_minio_alias()
@@ -257,7 +303,7 @@ def archive_minio_buckets(
         object_count, object_bytes = count_tree_files(bucket_mirror_dir)
         relative_path = f"minio/{bucket}/data.bucket.tar.gz"
         archive_path = package_dir / relative_path
-        make_bucket_archive(bucket_mirror_dir, archive_path)
+        archived = make_bucket_archive(bucket_mirror_dir, archive_path)
         bucket_entries.append(
             {
                 "name": bucket,
@@ -265,7 +311,8 @@ def archive_minio_buckets(
                 "format": "tar_gzip",
                 "objectCount": object_count,
                 "sourceBytes": object_bytes,
-                "archiveBytes": archive_path.stat().st_size,
+                "archiveBytes": archived.size,
+                "archiveSha256": archived.sha256,
             }
         )
         data_relative_paths.append(relative_path)
@@ -279,18 +326,26 @@ def finalize_package(
     metadata: dict[str, Any],
     manifest: dict[str, Any],
     data_relative_paths: list[str],
+    known_digests: dict[str, str] | None = None,
 ) -> tuple[str, int]:
     write_json(package_dir / "metadata.json", metadata)
     write_json(package_dir / "manifest.json", manifest)
-    checksums = build_checksums(package_dir, ["metadata.json", "manifest.json", *data_relative_paths])
+    checksums = build_checksums(package_dir, ["metadata.json", "manifest.json", *data_relative_paths], known_digests)
     write_checksums(package_dir / "checksums.sha256", checksums)
     manifest["files"] = checksums
     write_json(package_dir / "manifest.json", manifest)
-    checksums = build_checksums(package_dir, ["metadata.json", "manifest.json", *data_relative_paths])
+    checksums = build_checksums(package_dir, ["metadata.json", "manifest.json", *data_relative_paths], known_digests)
     write_checksums(package_dir / "checksums.sha256", checksums)
 
-    make_package_archive(package_dir, output_path)
-    return sha256_file(output_path), output_path.stat().st_size
+    archived = make_package_archive(package_dir, output_path)
+    write_sidecar(
+        output_path,
+        archived,
+        artifactId=metadata.get("artifactId"),
+        scope=metadata.get("scope"),
+        checksums={entry["path"]: entry["sha256"] for entry in checksums},
+    )
+    return archived.sha256, archived.size
 
 
 def build_database_backup_package(
@@ -313,9 +368,10 @@ def build_database_backup_package(
     (package_dir / "mariadb").mkdir(parents=True, exist_ok=True)
 
     data_path = package_dir / "mariadb" / "data.sql.gz"
-    dump_mariadb_data(data_path)
+    dumped = dump_mariadb_data(data_path)
+    known_digests = {"mariadb/data.sql.gz": dumped.sha256}
 
-    files = build_checksums(package_dir, ["mariadb/data.sql.gz"])
+    files = build_checksums(package_dir, ["mariadb/data.sql.gz"], known_digests)
     metadata = {
         "formatVersion": PACKAGE_FORMAT_VERSION,
         "artifactId": artifact_id,
@@ -358,6 +414,7 @@ def build_database_backup_package(
         metadata=metadata,
         manifest=manifest,
         data_relative_paths=["mariadb/data.sql.gz"],
+        known_digests=known_digests,
     )
 
     shutil.rmtree(work_root, ignore_errors=True)
@@ -392,11 +449,15 @@ def build_objects_backup_package(
     package_name = f"backup-{scope}-{timestamp}.tar.gz"
     work_root, package_dir, output_dir = prepare_package_dirs(backup_root, job_id, scope)
     output_path = output_dir / package_name
+    objects_mode = objects_backup_mode(policy)
     bucket_entries, data_relative_paths = archive_minio_buckets(
         work_root=work_root,
         package_dir=package_dir,
         buckets=buckets,
+        backup_root=backup_root,
+        mode=objects_mode,
     )
+    known_digests = bucket_archive_digests(bucket_entries)
 
     metadata = {
         "formatVersion": PACKAGE_FORMAT_VERSION,
@@ -413,6 +474,7 @@ def build_objects_backup_package(
             "engine": "minio",
             "endpoint": f"{settings.minio_host}:{settings.minio_port}",
             "buckets": list(buckets),
+            "mode": objects_mode,
         },
         "actor": actor_snapshot,
         "policy": policy,
@@ -432,7 +494,7 @@ def build_objects_backup_package(
                 "buckets": bucket_entries,
             },
         },
-        "files": build_checksums(package_dir, data_relative_paths),
+        "files": build_checksums(package_dir, data_relative_paths, known_digests),
     }
     package_checksum, package_size = finalize_package(
         package_dir=package_dir,
@@ -440,6 +502,14 @@ def build_objects_backup_package(
         metadata=metadata,
         manifest=manifest,
         data_relative_paths=data_relative_paths,
+        known_digests=known_digests,
+    )
+    register_object_references(
+        backup_root=backup_root,
+        artifact_id=artifact_id,
+        output_path=output_path,
+        package_dir=package_dir,
+        bucket_entries=bucket_entries,
     )
 
     shutil.rmtree(work_root, ignore_errors=True)
@@ -477,13 +547,17 @@ def build_full_backup_package(
     (package_dir / "mariadb").mkdir(parents=True, exist_ok=True)
 
     database_relative_path = "mariadb/data.sql.gz"
-    dump_mariadb_data(package_dir / database_relative_path)
+    dumped = dump_mariadb_data(package_dir / database_relative_path)
+    objects_mode = objects_backup_mode(policy)
     bucket_entries, object_relative_paths = archive_minio_buckets(
         work_root=work_root,
         package_dir=package_dir,
         buckets=buckets,
+        backup_root=backup_root,
+        mode=objects_mode,
     )
     data_relative_paths = [database_relative_path, *object_relative_paths]
+    known_digests = {database_relative_path: dumped.sha256, **bucket_archive_digests(bucket_entries)}
 
     metadata = {
         "formatVersion": PACKAGE_FORMAT_VERSION,
@@ -504,6 +578,7 @@ def build_full_backup_package(
             "engine": "minio",
             "endpoint": f"{settings.minio_host}:{settings.minio_port}",
             "buckets": list(buckets),
+            "mode": objects_mode,
         },
         "actor": actor_snapshot,
         "policy": policy,
@@ -523,7 +598,7 @@ def build_full_backup_package(
                 "buckets": bucket_entries,
             },
         },
-        "files": build_checksums(package_dir, data_relative_paths),
+        "files": build_checksums(package_dir, data_relative_paths, known_digests),
     }
     package_checksum, package_size = finalize_package(
         package_dir=package_dir,
@@ -531,6 +606,14 @@ def build_full_backup_package(
         metadata=metadata,
         manifest=manifest,
         data_relative_paths=data_relative_paths,
+        known_digests=known_digests,
+    )
+    register_object_references(
+        backup_root=backup_root,
+        artifact_id=artifact_id,
+        output_path=output_path,
+        package_dir=package_dir,
+        bucket_entries=bucket_entries,
     )
 
     shutil.rmtree(work_root, ignore_errors=True)
@@ -94,6 +94,24 @@ const getLoadSignal = (percent, monitoringEnabled) => {
 
 const formatPercent = (value) => `${Math.round(Number(value || 0))}%`;
 
+const formatWaitMs = (value) => {
+  if (value === null || value === undefined) return "—";
+  const ms = Math.max(0, Number(value));
+  if (ms < 1000) return `${Math.round(ms)} ms`;
+  const totalSeconds = Math.round(ms / 1000);
+  if (totalSeconds < 60) return `${totalSeconds}s`;
+  return `${Math.floor(totalSeconds / 60)}m ${String(totalSeconds % 60).padStart(2, "0")}s`;
+};
+
+const isWaitOverThreshold = (item) => {
+  const limitMs = Number(item?.waitWarningSeconds ?? 0) * 1000;
+  if (!limitMs) return false;
+  const telemetry = item?.telemetry || {};
+  return [telemetry.waitP95Ms, telemetry.headJobAgeMs].some(
+    (value) => value !== null && value !== undefined && Number(value) >= limitMs,
+  );
+};
+
 const buildAlertTooltip = (item) => {
   const alertState = item?.alertState || {};
   const lines = [];
@@ -107,7 +125,8 @@ const buildAlertTooltip = (item) => {
   }
 
   if (alertState?.lastAlertAt) {
-    lines.push(`Última saturación: ${formatDateTime(alertState.lastAlertAt)}`);
+    const reason = alertState?.lastAlertReason === "wait" ? " (espera alta)" : "";
+    lines.push(`Última saturación: ${formatDateTime(alertState.lastAlertAt)}${reason}`);
   }
   if (alertState?.lastAlertMailSentAt) {
     lines.push(`Correo de alerta enviado: ${formatDateTime(alertState.lastAlertMailSentAt)}`);
@@ -190,6 +209,32 @@ const QueueDetailsModal = ({ item }) => {
             />
           </div>
 
+          <div>
+            <p className={`text-xs font-semibold uppercase tracking-wide ${TXT_META}`}>
+              Espera y throughput · últimos {item?.telemetry?.windowMinutes ?? 0} min
+            </p>
+            <div className="mt-3 grid grid-cols-2 gap-3 sm:grid-cols-3">
+              {[
+                ["Espera p50", formatWaitMs(item?.telemetry?.waitP50Ms)],
+                ["Espera p95", formatWaitMs(item?.telemetry?.waitP95Ms)],
+                ["Job más antiguo", formatWaitMs(item?.telemetry?.headJobAgeMs)],
+                ["Servicio p50", formatWaitMs(item?.telemetry?.runP50Ms)],
+                ["Servicio p95", formatWaitMs(item?.telemetry?.runP95Ms)],
+                ["Jobs/min", Number(item?.telemetry?.jobsPerMinute ?? 0)],
+              ].map(([label, value]) => (
+                <div key={`${item?.queue}-${label}`}>
+                  <p className={`text-xs ${TXT_META}`}>{label}</p>
+                  <p className={`mt-1 text-sm ${TXT_TITLE}`}>{value}</p>
+                </div>
+              ))}
+            </div>
+            <p className={`mt-2 text-xs ${isWaitOverThreshold(item) ? "font-semibold text-amber-600 dark:text-amber-400" : TXT_META}`}>
+              Umbral de espera: {item?.waitWarningSeconds ? formatWaitMs(Number(item.waitWarningSeconds) * 1000) : "sin umbral"}
+              {" · "}
+              {Number(item?.telemetry?.jobs ?? 0)} jobs procesados, {Number(item?.telemetry?.failed ?? 0)} fallidos
+            </p>
+          </div>
+
           <div className="grid grid-cols-1 gap-4 sm:grid-cols-2">
             <div>
               <p className={`text-xs font-semibold uppercase tracking-wide ${TXT_META}`}>Última actividad</p>
@@ -293,6 +338,12 @@ const QueueRow = ({ item }) => {
             barClass={loadSignal.barClass}
           />
         </div>
+        <p
+          className={`mt-2 text-xs ${isWaitOverThreshold(item) ? "font-semibold text-amber-600 dark:text-amber-400" : TXT_META}`}
+          title={`Últimos ${item?.telemetry?.windowMinutes ?? 0} min`}
+        >
+          Espera p50 {formatWaitMs(item?.telemetry?.waitP50Ms)} · p95 {formatWaitMs(item?.telemetry?.waitP95Ms)} · {Number(item?.telemetry?.jobsPerMinute ?? 0)} jobs/min
+        </p>
       </div>
 
       <div>
@@ -28,6 +28,7 @@ class Settings(BaseSettings):
     RETRY_BACKOFF_BASE: float = 2.0
     BLPOP_TIMEOUT:    int   = 5
     LOG_LEVEL:        str   = "INFO"
+    METRICS_PORT:     int   = 9100   # 0 = sin endpoint de métricas
 
     def model_post_init(self, __context) -> None:
         if self.MINIO_SECRET_KEY_FILE:
@@ -0,0 +1,59 @@
+# core/metrics.py
+"""
+Métricas Prometheus del pdf-worker (cola queue:pdf).
+
+Se exponen con el servidor HTTP de `prometheus_client` en un thread daemon
+(`METRICS_PORT`, 0 lo deshabilita).
+"""
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+from core.logging_config import get_logger
+
+logger = get_logger("pdf-worker.metrics")
+
+JOBS_TOTAL = Counter(
+    "minuetaitor_pdf_worker_jobs_total",
+    "Jobs procesados por resultado (completed | failed | unhandled)",
+    ["type", "outcome"],
+)
+JOB_RUN_SECONDS = Histogram(
+    "minuetaitor_pdf_worker_job_run_seconds",
+    "Duración de render + subida del PDF",
+    ["type"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+JOB_WAIT_SECONDS = Histogram(
+    "minuetaitor_pdf_worker_job_wait_seconds",
+    "Espera desde enqueued_at hasta el inicio de ejecución (desde el BLPOP en envelopes legados)",
+    ["type"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1, 5, 15, 60, 300),
+)
+JOB_RETRIES_TOTAL = Counter(
+    "minuetaitor_pdf_worker_job_retries_total",
+    "Jobs reencolados para reintento",
+    ["type"],
+)
+DLQ_TOTAL = Counter(
+    "minuetaitor_pdf_worker_dlq_total",
+    "Jobs enviados a la Dead Letter Queue",
+    ["type"],
+)
+JOBS_IN_PROGRESS = Gauge(
+    "minuetaitor_pdf_worker_jobs_in_progress",
+    "Jobs ejecutándose en este momento",
+)
+
+
+def start_metrics_server(port: int) -> bool:
+    """Levanta el endpoint /metrics; retorna False si está deshabilitado o falla."""
+    if port <= 0:
+        return False
+    try:
+        start_http_server(port)
+    except OSError as exc:
+        logger.warning("No se pudo exponer métricas en :%d (%s)", port, exc)
+        return False
+    logger.info("Métricas Prometheus en :%d/metrics", port)
+    return True
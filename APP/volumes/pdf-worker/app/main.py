@@ -9,12 +9,15 @@ Dispatcher:     type='minute_pdf' → handlers/minute_pdf.py
 from __future__ import annotations
 
 import asyncio
+import time
 import traceback
 from datetime import datetime, timezone
 
 from core.config         import settings
 from core.job            import JobEnvelope
 from core.logging_config import get_logger, setup_logging
+from core                import metrics
+from core.queue_telemetry import record_job_telemetry
 from core.redis_client   import close_redis, get_redis
 from handlers.minute_pdf import handle_minute_pdf
 from handlers.report_pdf import handle_report_pdf
@@ -34,20 +37,43 @@ HANDLERS = {
 }
 
 
-async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore) -> None:
+async def _record_job_finished(job: JobEnvelope, wait_seconds: float, run_seconds: float, *, failed: bool) -> None:
+    metrics.JOB_RUN_SECONDS.labels(job.type).observe(run_seconds)
+    metrics.JOBS_TOTAL.labels(job.type, "failed" if failed else "completed").inc()
+    # La telemetría nunca cambia el resultado del job: un fallo de Redis acá
+    # no debe reintentar ni mandar a DLQ un job que ya terminó.
+    try:
+        redis = await get_redis()
+    except Exception as exc:
+        logger.warning("No se pudo registrar telemetría | job_id=%s error=%s", job.job_id, exc)
+        return
+    await record_job_telemetry(redis, job,
+                               wait_seconds=wait_seconds, run_seconds=run_seconds, failed=failed)
+
+
+async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore, dequeued_at: float) -> None:
     async with sem:
+        wait_seconds = job.wait_seconds()
+        if wait_seconds is None:
+            wait_seconds = time.monotonic() - dequeued_at
+        metrics.JOB_WAIT_SECONDS.labels(job.type).observe(wait_seconds)
         handler = HANDLERS.get(job.type)
         if handler is None:
             logger.warning("Sin handler | type=%s — descartado", job.type)
+            metrics.JOBS_TOTAL.labels(job.type, "unhandled").inc()
             return
 
+        metrics.JOBS_IN_PROGRESS.inc()
+        started = time.perf_counter()
         try:
-            logger.info("Iniciando | job_id=%s type=%s attempt=%d",
-                        job.job_id, job.type, job.attempt)
+            logger.info("Iniciando | job_id=%s type=%s attempt=%d trace_id=%s wait=%.3fs",
+                        job.job_id, job.type, job.attempt, job.trace_id, wait_seconds)
             await handler(job)
+            await _record_job_finished(job, wait_seconds, time.perf_counter() - started, failed=False)
             logger.info("Completado | job_id=%s", job.job_id)
 
         except Exception as exc:
+            await _record_job_finished(job, wait_seconds, time.perf_counter() - started, failed=True)
             error_trace = traceback.format_exc()
             logger.error("Fallido | job_id=%s attempt=%d/%d | %s\n%s",
              job.job_id, job.attempt, settings.MAX_RETRIES, exc,
@@ -58,6 +84,7 @@ async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore) -> None:
             if job.attempt < settings.MAX_RETRIES:
                 delay = settings.RETRY_BACKOFF_BASE ** job.attempt
                 logger.info("Reintentando en %.1fs | job_id=%s", delay, job.job_id)
+                metrics.JOB_RETRIES_TOTAL.labels(job.type).inc()
                 await asyncio.sleep(delay)
                 await redis.rpush(job.queue, job.next_attempt().to_json())
             else:
@@ -72,8 +99,12 @@ async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore) -> None:
                     "error":     error_trace[:2000],
                 }
                 await redis.rpush("queue:dlq", json.dumps(dlq_record))
+                metrics.DLQ_TOTAL.labels(job.type).inc()
                 logger.error("Job enviado a DLQ | job_id=%s", job.job_id)
 
+        finally:
+            metrics.JOBS_IN_PROGRESS.dec()
+
 
 async def main_loop() -> None:
     sem = asyncio.Semaphore(settings.MAX_CONCURRENT_JOBS)
@@ -100,7 +131,7 @@ async def main_loop() -> None:
 
             await redis.hset(QUEUE_ACTIVITY_HASH, queue_key, _utcnow_iso())
 
-            task = asyncio.create_task(_execute_job(job, sem), name=f"job-{job.job_id}")
+            task = asyncio.create_task(_execute_job(job, sem, time.monotonic()), name=f"job-{job.job_id}")
             active_tasks.add(task)
             task.add_done_callback(active_tasks.discard)
 
@@ -116,6 +147,7 @@ async def main_loop() -> None:
 
 async def main() -> None:
     setup_logging()
+    metrics.start_metrics_server(settings.METRICS_PORT)
     try:
         await main_loop()
     finally:
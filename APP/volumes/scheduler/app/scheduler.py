@@ -7,8 +7,7 @@ import urllib.error
 import urllib.request
 from pathlib import Path
 
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
+import redis
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,9 +30,21 @@ def _env_or_file(name: str, default: str = "") -> str:
 
 BACKEND_INTERNAL_URL = os.environ.get("BACKEND_INTERNAL_URL", "http://backend:8000")
 INTERNAL_API_SECRET = _env_or_file("INTERNAL_API_SECRET", "-")
+REDIS_HOST = os.environ.get("REDIS_HOST", "redis")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", "6379"))
+REDIS_DB = int(os.environ.get("REDIS_DB", "0"))
+# Resync completo periódico: red de seguridad si se perdió una notificación de cambio.
+RESYNC_INTERVAL_SEC = int(os.environ.get("SCHEDULER_RESYNC_SEC", "3600"))
+MAX_SLEEP_SEC = 300
+FIRE_RETRY_SEC = 30
+SYNC_RETRY_SEC = 10
 
+# Claves mantenidas por el backend (services/schedule_registry_service.py)
+SCHEDULE_DUE_KEY = "scheduler:due"
+SCHEDULE_CHANGED_CHANNEL = "scheduler:changed"
 
-# ── Definición de jobs ────────────────────────────────────────────────────────
+
+# ── Backend interno ───────────────────────────────────────────────────────────
 
 def _post_internal(path: str, body: dict | None = None) -> dict:
     payload = json.dumps(body or {}, ensure_ascii=False).encode("utf-8")
@@ -58,86 +69,141 @@ def _unwrap_contract(result: dict | None) -> dict:
     return result
 
 
-def job_pending_publication_reminders():
-    """Dispara recordatorios de minutas pendientes desde el backend."""
-    try:
-        result = _unwrap_contract(_post_internal("/internal/v1/notifications/reminders/pending-publication"))
-        logger.info("Reminder batch OK | sent=%s", result.get("sent", 0))
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
-        logger.error("Reminder batch HTTP error | status=%s body=%s", exc.code, body[:300])
-    except Exception as exc:
-        logger.error("Reminder batch failed | err=%s", exc)
+# ── Programaciones en Redis ───────────────────────────────────────────────────
+#
+# El backend calcula el próximo disparo de cada programación y lo guarda en el
+# ZSET `scheduler:due` (clave → epoch). Este proceso solo duerme hasta el menor
+# score, reclama lo vencido y pide al backend que lo ejecute; el backend
+# reprograma el siguiente disparo. Sin ticks por minuto.
+
+# ZRANGEBYSCORE + ZREM atómicos: con más de una réplica cada disparo se reclama una vez.
+_CLAIM_DUE_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, tonumber(ARGV[2]))
+for i = 1, #due, 2 do
+    redis.call('ZREM', KEYS[1], due[i])
+end
+return due
+"""
+
+
+def _redis_client() -> redis.Redis:
+    return redis.Redis(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=REDIS_DB,
+        decode_responses=True,
+        socket_connect_timeout=5,
+        socket_timeout=MAX_SLEEP_SEC + 30,
+        health_check_interval=30,
+    )
 
 
-def job_maintenance_tick():
-    """Delegación de mantenimiento dinámico según configuración persistida."""
+def sync_schedules() -> bool:
+    """Pide al backend recalcular el registro completo de programaciones."""
     try:
-        result = _unwrap_contract(_post_internal("/internal/v1/maintenance/tick"))
+        result = _unwrap_contract(_post_internal("/internal/v1/schedules/sync"))
         logger.info(
-            "Maintenance tick OK | slot=%s | enqueued=%s | queue_alerts=%s",
-            result.get("currentSlot") or result.get("current_slot"),
-            ",".join(item.get("action", "?") for item in result.get("enqueued", [])) or "-",
-            len(result.get("queueAlerts", []) or result.get("queue_alerts", []) or []),
+            "Schedules sync OK | scheduled=%s | removed=%s",
+            ",".join(item.get("key", "?") for item in result.get("scheduled", [])) or "-",
+            ",".join(result.get("removed", [])) or "-",
         )
+        return True
     except urllib.error.HTTPError as exc:
         body = exc.read().decode("utf-8", errors="replace")
-        logger.error("Maintenance tick HTTP error | status=%s body=%s", exc.code, body[:300])
+        logger.error("Schedules sync HTTP error | status=%s body=%s", exc.code, body[:300])
     except Exception as exc:
-        logger.error("Maintenance tick failed | err=%s", exc)
+        logger.error("Schedules sync failed | err=%s", exc)
+    return False
 
 
-def job_system_backups_tick():
-    """Delegación de respaldos programados según configuración persistida."""
+def fire_schedule(key: str, scheduled_for: float) -> bool:
+    """Ejecuta en el backend una programación reclamada; él agenda el siguiente disparo."""
     try:
-        result = _unwrap_contract(_post_internal("/internal/v1/system/backups/tick"))
+        result = _unwrap_contract(
+            _post_internal("/internal/v1/schedules/fire", {"key": key, "scheduledFor": scheduled_for})
+        )
         logger.info(
-            "System backups tick OK | slot=%s | enqueued=%s",
-            result.get("currentSlot") or result.get("current_slot"),
-            ",".join(
-                f"{item.get('scope', '?')}:{item.get('action', '-')}"
-                for item in result.get("enqueued", [])
-            ) or "-",
+            "Schedule fired | key=%s | next=%s",
+            key,
+            result.get("nextFireAt") or result.get("next_fire_at") or "-",
         )
+        return True
     except urllib.error.HTTPError as exc:
         body = exc.read().decode("utf-8", errors="replace")
-        logger.error("System backups tick HTTP error | status=%s body=%s", exc.code, body[:300])
+        logger.error("Schedule fire HTTP error | key=%s status=%s body=%s", key, exc.code, body[:300])
+        # 4xx: la programación ya no existe o es inválida; reintentar no sirve.
+        return 400 <= exc.code < 500
     except Exception as exc:
-        logger.error("System backups tick failed | err=%s", exc)
+        logger.error("Schedule fire failed | key=%s err=%s", key, exc)
+    return False
 
 
-# ── Configuración del scheduler ───────────────────────────────────────────────
+def _claim_due(client: redis.Redis, claim_due, now: float, limit: int = 50) -> list[tuple[str, float]]:
+    flat = claim_due(keys=[SCHEDULE_DUE_KEY], args=[now, limit], client=client) or []
+    return [(flat[i], float(flat[i + 1])) for i in range(0, len(flat), 2)]
 
-def main():
-    scheduler = BlockingScheduler(timezone="America/Santiago")
-
-    # Resumen diario — lunes a viernes a las 8:00am
-    scheduler.add_job(
-        job_pending_publication_reminders,
-        CronTrigger(day_of_week="mon-fri", hour=8, minute=0),
-        id="pending_publication_reminders",
-        name="Reminder minutas pendientes",
-    )
 
-    # Respaldos programados — delegados al backend para evaluar políticas
-    scheduler.add_job(
-        job_system_backups_tick,
-        CronTrigger(second=0),
-        id="system_backups_tick",
-        name="Tick respaldos programados",
-    )
+def _seconds_until_next(client: redis.Redis) -> float:
+    head = client.zrange(SCHEDULE_DUE_KEY, 0, 0, withscores=True)
+    if not head:
+        return MAX_SLEEP_SEC
+    return max(0.0, min(MAX_SLEEP_SEC, head[0][1] - time.time()))
 
-    # Tick de mantenimiento dinámico — cada minuto
-    scheduler.add_job(
-        job_maintenance_tick,
-        CronTrigger(second=0),
-        id="maintenance_tick",
-        name="Tick mantenimiento dinámico",
-    )
 
-    logger.info("Scheduler iniciado | jobs=%d", len(scheduler.get_jobs()))   
-    
-    scheduler.start()
+def _wait(pubsub, timeout: float) -> bool:
+    """Duerme hasta `timeout` o hasta un aviso de cambio; True si hubo aviso."""
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        message = pubsub.get_message(ignore_subscribe_messages=True, timeout=min(remaining, MAX_SLEEP_SEC))
+        if message is not None:
+            return True
+
+
+def run_loop(client: redis.Redis) -> None:
+    claim_due = client.register_script(_CLAIM_DUE_LUA)
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(SCHEDULE_CHANGED_CHANNEL)
+    try:
+        while not sync_schedules():
+            time.sleep(SYNC_RETRY_SEC)
+        last_sync = time.monotonic()
+
+        while True:
+            # ZSET vacío = Redis reiniciado o vaciado: reconstruir sin esperar el intervalo.
+            if time.monotonic() - last_sync >= RESYNC_INTERVAL_SEC or not client.zcard(SCHEDULE_DUE_KEY):
+                if sync_schedules():
+                    last_sync = time.monotonic()
+
+            failed = False
+            for key, score in _claim_due(client, claim_due, time.time()):
+                if not fire_schedule(key, score):
+                    # Devolver el disparo con su hora original (el backend ya lo
+                    # movió al siguiente slot si agotó sus intentos) y seguir con
+                    # el resto del lote: nada queda reclamado durante la espera.
+                    client.zadd(SCHEDULE_DUE_KEY, {key: score}, nx=True)
+                    failed = True
+
+            _wait(pubsub, FIRE_RETRY_SEC if failed else _seconds_until_next(client))
+    finally:
+        pubsub.close()
+
+
+# ── Arranque ──────────────────────────────────────────────────────────────────
+
+def main():
+    logger.info("Scheduler iniciado | redis=%s:%s/%s", REDIS_HOST, REDIS_PORT, REDIS_DB)
+    while True:
+        client = _redis_client()
+        try:
+            run_loop(client)
+        except redis.RedisError as exc:
+            logger.error("Scheduler Redis error | err=%s", exc)
+            time.sleep(SYNC_RETRY_SEC)
+        finally:
+            client.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,79 @@
+# core/ai_output_validation.py
+"""
+Validación del output IA antes de enviarlo al backend (commit_tx2).
+
+Reutiliza el motor `services/json_schema_engine.py` del backend, que se monta
+en solo lectura en `BACKEND_APP_PATH`. Se carga por ruta de archivo para no
+mezclar los paquetes `core`/`schemas` del worker con los del backend.
+
+Si el motor o `jsonschema` no están disponibles, la validación se omite con
+un warning: el chequeo mínimo de claves del handler sigue aplicando.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from core.config import settings
+from core.logging_config import get_logger
+
+logger = get_logger("worker.ai_output_validation")
+
+OUTPUT_SCHEMA_NAME = "AI_output_Schema"
+_ENGINE_MODULE_NAME = "backend_json_schema_engine"
+
+
+@lru_cache(maxsize=1)
+def _load_engine() -> tuple[ModuleType, Any] | None:
+    engine_path = Path(settings.BACKEND_APP_PATH) / "services" / "json_schema_engine.py"
+    if not engine_path.is_file():
+        logger.warning("Motor de schemas no encontrado en %s; validación de output IA deshabilitada", engine_path)
+        return None
+    try:
+        spec = importlib.util.spec_from_file_location(_ENGINE_MODULE_NAME, engine_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_ENGINE_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+        registry = module.SchemaRegistry()
+        names = registry.load_all()
+    except Exception as exc:
+        logger.warning("No se pudo cargar el motor de schemas (%s); validación de output IA deshabilitada", exc)
+        return None
+    logger.info("Schemas JSON compilados para el worker: %s", ", ".join(names))
+    return module, registry
+
+
+def validation_mode() -> str:
+    mode = settings.AI_OUTPUT_SCHEMA_VALIDATION
+    return mode if mode in {"off", "warn", "enforce"} else "warn"
+
+
+def warm_up() -> bool:
+    """Compila los schemas al arrancar el worker; retorna si quedó disponible."""
+    if validation_mode() == "off":
+        return False
+    return _load_engine() is not None
+
+
+def find_ai_output_problems(parsed: dict[str, Any]) -> list[str]:
+    """Retorna los problemas encontrados (inyección y/o schema); lista vacía si es válido."""
+    if validation_mode() == "off":
+        return []
+    loaded = _load_engine()
+    if loaded is None:
+        return []
+    engine, registry = loaded
+
+    problems: list[str] = []
+    pattern = engine.find_injection(parsed)
+    if pattern:
+        problems.append(f"Posible inyección detectada en output: '{pattern}'")
+    error = registry.first_error(OUTPUT_SCHEMA_NAME, parsed)
+    if error is not None:
+        path = engine.format_error_path(error) or "(raíz)"
+        problems.append(f"Output no cumple el schema: {error.message} (ruta: {path})")
+    return problems
@@ -34,6 +34,9 @@ class WorkerConfig:
     RETRY_BACKOFF_BASE:  float = float(os.environ.get("WORKER_RETRY_BACKOFF", "2.0"))
     BLPOP_TIMEOUT:       int   = int(os.environ.get("WORKER_BLPOP_TIMEOUT",   "5"))
 
+    # ── Métricas Prometheus (0 = deshabilitado) ───────────────────────────────
+    METRICS_PORT: int = int(os.environ.get("METRICS_PORT", "9100"))
+
     # ── Backend interno ───────────────────────────────────────────────────────
     BACKEND_INTERNAL_URL: str  = os.environ.get("BACKEND_INTERNAL_URL", "http://minuetaitor-backend:8000")
     INTERNAL_API_SECRET:  str  = _env_or_file("INTERNAL_API_SECRET",  "-")
@@ -56,16 +59,34 @@ class WorkerConfig:
     MAINTENANCE_TEMP_CLEANUP_ALLOW_TMP_ROOT: bool = (
         os.environ.get("MAINTENANCE_TEMP_CLEANUP_ALLOW_TMP_ROOT", "false").lower() == "true"
     )
+    # Presupuesto de tamaño por subdirectorio permitido (MB, 0 = sin tope);
+    # MAINTENANCE_TEMP_CLEANUP_SIZE_BUDGETS="traces/tmp=2048,render/tmp=512" fija uno por raíz.
+    MAINTENANCE_TEMP_CLEANUP_SIZE_BUDGET_MB: int = int(
+        os.environ.get("MAINTENANCE_TEMP_CLEANUP_SIZE_BUDGET_MB", "0")
+    )
+    MAINTENANCE_TEMP_CLEANUP_SIZE_BUDGETS: str = os.environ.get("MAINTENANCE_TEMP_CLEANUP_SIZE_BUDGETS", "")
+    MAINTENANCE_TEMP_CLEANUP_WORKERS: int = int(os.environ.get("MAINTENANCE_TEMP_CLEANUP_WORKERS", "8"))
     MAINTENANCE_SESSION_CLEANUP_GRACE_MINUTES: int = int(
         os.environ.get("MAINTENANCE_SESSION_CLEANUP_GRACE_MINUTES", "240")
     )
     MAINTENANCE_SESSION_CLEANUP_BATCH_SIZE: int = int(
-        os.environ.get("MAINTENANCE_SESSION_CLEANUP_BATCH_SIZE", "500")
+        os.environ.get("MAINTENANCE_SESSION_CLEANUP_BATCH_SIZE", "2000")
     )
     MAINTENANCE_SESSION_CLEANUP_MAX_AFFECTED: int = int(
-        os.environ.get("MAINTENANCE_SESSION_CLEANUP_MAX_AFFECTED", "100")
+        os.environ.get("MAINTENANCE_SESSION_CLEANUP_MAX_AFFECTED", "50000")
     )
 
+    # ── Email: pool SMTP y envío por lotes (core/smtp_pool.py) ───────────────
+    SMTP_POOL_MAX_IDLE: int = int(os.environ.get("SMTP_POOL_MAX_IDLE", "2"))
+    SMTP_POOL_MAX_MESSAGES_PER_CONNECTION: int = int(
+        os.environ.get("SMTP_POOL_MAX_MESSAGES_PER_CONNECTION", "100")
+    )
+    SMTP_POOL_NOOP_AFTER_SECONDS: float = float(os.environ.get("SMTP_POOL_NOOP_AFTER_SECONDS", "15"))
+    SMTP_POOL_IDLE_TIMEOUT_SECONDS: float = float(os.environ.get("SMTP_POOL_IDLE_TIMEOUT_SECONDS", "120"))
+    # Jobs de queue:email que se sacan juntos y comparten una conexión SMTP
+    EMAIL_BATCH_SIZE: int = int(os.environ.get("EMAIL_BATCH_SIZE", "10"))
+    EMAIL_BATCH_LINGER_MS: int = int(os.environ.get("EMAIL_BATCH_LINGER_MS", "50"))
+
     EMAIL_INLINE_LOGO_PATH: str = os.environ.get(
         "EMAIL_INLINE_LOGO_PATH",
         "/app/assets/images/chinchinAItor_64.jpg",
@@ -103,6 +124,11 @@ class WorkerConfig:
     AI_PROVIDER_TIMEOUT_FALLBACK: int = 120
     OPENAI_SYSTEM_PROMPT: str = os.environ.get("OPENAI_SYSTEM_PROMPT", "system_prompt_v08.txt")
 
+    # Validación del output IA con el motor JSON-schema del backend (montado ro).
+    # off | warn (registra y continúa) | enforce (marca llm-failed)
+    BACKEND_APP_PATH: str = os.environ.get("BACKEND_APP_PATH", "/app/backend_app")
+    AI_OUTPUT_SCHEMA_VALIDATION: str = os.environ.get("AI_OUTPUT_SCHEMA_VALIDATION", "warn").strip().lower()
+
     # MIMEs aceptados para archivos de transcripción
     MINUTES_SUPPORTED_MIMES: dict[str, str] = {
         "text/plain":       "text",
@@ -30,6 +30,7 @@ import redis.asyncio as aioredis
 
 from core.job import JobEnvelope
 from core.logging_config import get_logger
+from core.metrics import DLQ_TOTAL
 
 logger = get_logger("worker.dlq")
 
@@ -62,6 +63,7 @@ async def send_to_dlq(
     await redis.rpush(DLQ_KEY, json.dumps(record))
     await redis.ltrim(DLQ_KEY, -DLQ_MAX_SIZE, -1)  # conserva solo los últimos N
     await redis.hset(QUEUE_ACTIVITY_HASH, DLQ_KEY, failed_at)
+    DLQ_TOTAL.labels(job.queue, job.type).inc()
 
     logger.error(
         "Job enviado a DLQ | job_id=%s type=%s queue=%s attempt=%d",
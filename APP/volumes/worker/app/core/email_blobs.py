@@ -0,0 +1,115 @@
+# core/email_blobs.py
+"""
+Lectura de adjuntos e inline assets de email referenciados en MinIO.
+
+Contrato definido en el backend (`services/email_blob_store.py`): el job trae
+`{bucket, object_key, sha256, size_bytes}` y el blob vive en
+`minuetaitor-attach/email/sha256/<aa>/<sha256>`. Solo se aceptan referencias
+a ese prefijo, y el contenido se verifica contra su sha256 antes de
+adjuntarlo.
+
+Como la clave es el hash, un blob nunca cambia: los chicos (logos) quedan en
+un LRU local acotado por bytes y no se vuelven a pedir a MinIO.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from minio import Minio
+
+from core.config import settings
+
+EMAIL_BLOB_BUCKET = "minuetaitor-attach"
+EMAIL_BLOB_PREFIX = "email/sha256/"
+_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_CACHE_MAX_ITEM_BYTES = 512 * 1024
+
+_minio_client: Minio | None = None
+
+
+class EmailBlobError(RuntimeError):
+    pass
+
+
+def _get_minio() -> Minio:
+    global _minio_client
+    if _minio_client is None:
+        _minio_client = Minio(
+            endpoint=settings.MINIO_ENDPOINT,
+            access_key=settings.MINIO_USER,
+            secret_key=settings.MINIO_PASSWORD,
+            secure=settings.MINIO_SECURE,
+        )
+    return _minio_client
+
+
+class _BlobCache:
+    """LRU por sha256 acotado por bytes totales; seguro entre threads."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, sha256: str) -> bytes | None:
+        with self._lock:
+            content = self._items.get(sha256)
+            if content is not None:
+                self._items.move_to_end(sha256)
+            return content
+
+    def put(self, sha256: str, content: bytes) -> None:
+        if len(content) > _CACHE_MAX_ITEM_BYTES:
+            return
+        with self._lock:
+            if sha256 in self._items:
+                return
+            self._items[sha256] = content
+            self._size += len(content)
+            while self._size > self.max_bytes and self._items:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+
+_blob_cache = _BlobCache(_CACHE_MAX_BYTES)
+
+
+def is_email_blob_reference(item: dict[str, Any]) -> bool:
+    return bool(str(item.get("object_key") or "").strip())
+
+
+def read_email_blob(item: dict[str, Any], *, max_bytes: int) -> bytes:
+    """Descarga (o toma del LRU) el blob referenciado y valida prefijo, tamaño y hash."""
+    bucket = str(item.get("bucket") or "").strip()
+    object_key = str(item.get("object_key") or "").strip()
+    sha256 = str(item.get("sha256") or "").strip().lower()
+    if (
+        bucket != EMAIL_BLOB_BUCKET
+        or len(sha256) != 64
+        or object_key != f"{EMAIL_BLOB_PREFIX}{sha256[:2]}/{sha256}"
+    ):
+        raise EmailBlobError(f"Referencia de blob no permitida: {bucket}/{object_key}")
+    if int(item.get("size_bytes") or 0) > max_bytes:
+        raise EmailBlobError(f"Blob excede el tamaño permitido: {object_key}")
+
+    cached = _blob_cache.get(sha256)
+    if cached is not None:
+        return cached
+
+    response = _get_minio().get_object(bucket, object_key)
+    try:
+        content = response.read(max_bytes + 1)
+    finally:
+        response.close()
+        response.release_conn()
+
+    if len(content) > max_bytes:
+        raise EmailBlobError(f"Blob excede el tamaño permitido: {object_key}")
+    if hashlib.sha256(content).hexdigest() != sha256:
+        raise EmailBlobError(f"sha256 no coincide para {object_key}")
+    _blob_cache.put(sha256, content)
+    return content
@@ -11,7 +11,9 @@ Formato mínimo en Redis (JSON):
     "type":     "email",            ← discriminador para el dispatcher
     "queue":    "queue:email",      ← cola de origen (informativo)
     "attempt":  1,                  ← incrementado en cada reintento
-    "payload":  { ... }             ← datos específicos del job type
+    "payload":  { ... },            ← datos específicos del job type
+    "enqueued_at": "...Z",          ← ISO UTC del RPUSH (opcional, telemetría)
+    "trace_id": "hex"               ← se conserva entre reintentos (opcional)
 }
 """
 from __future__ import annotations
@@ -20,6 +22,7 @@ import json
 import re
 import uuid
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
 
 MAX_ATTEMPT = 20
@@ -49,6 +52,21 @@ def _clean_attempt(value: Any) -> int:
     return attempt
 
 
+def _clean_trace_id(value: Any) -> str | None:
+    trace_id = str(value or "").strip()
+    return trace_id if SAFE_TOKEN_RE.fullmatch(trace_id) else None
+
+
+def _parse_enqueued_at(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
 @dataclass
 class JobEnvelope:
     job_id:  str
@@ -56,17 +74,24 @@ class JobEnvelope:
     queue:   str
     payload: dict[str, Any]
     attempt: int = 1
+    enqueued_at: datetime | None = None
+    trace_id:    str | None = None
 
     # ── Serialización ─────────────────────────────────────────────────────────
 
     def to_json(self) -> str:
-        return json.dumps({
+        data: dict[str, Any] = {
             "job_id":  self.job_id,
             "type":    self.type,
             "queue":   self.queue,
             "attempt": self.attempt,
             "payload": self.payload,
-        })
+        }
+        if self.enqueued_at is not None:
+            data["enqueued_at"] = self.enqueued_at.isoformat().replace("+00:00", "Z")
+        if self.trace_id:
+            data["trace_id"] = self.trace_id
+        return json.dumps(data)
 
     @classmethod
     def from_raw(cls, raw: str, queue: str) -> "JobEnvelope":
@@ -92,6 +117,8 @@ class JobEnvelope:
                 type    = _clean_type(job_type),
                 queue   = queue_name,
                 attempt = _clean_attempt(data.pop("attempt", 1)),
+                enqueued_at = _parse_enqueued_at(data.pop("enqueued_at", None)),
+                trace_id    = _clean_trace_id(data.pop("trace_id", None)),
                 payload = data,   # lo que queda son los campos del job
             )
         else:
@@ -103,23 +130,34 @@ class JobEnvelope:
                 type    = _clean_type(data["type"]),
                 queue   = queue_name,
                 attempt = _clean_attempt(data.get("attempt", 1)),
+                enqueued_at = _parse_enqueued_at(data.get("enqueued_at")),
+                trace_id    = _clean_trace_id(data.get("trace_id")),
                 payload = payload,
             )
 
         return envelope
 
     def next_attempt(self) -> "JobEnvelope":
-        """Devuelve una copia con attempt+1 para reencolar en reintento."""
+        """Devuelve una copia con attempt+1 (y nuevo enqueued_at) para reencolar en reintento."""
         return JobEnvelope(
             job_id  = self.job_id,
             type    = self.type,
             queue   = self.queue,
             attempt = self.attempt + 1,
             payload = self.payload,
+            enqueued_at = datetime.now(timezone.utc),
+            trace_id    = self.trace_id,
         )
 
+    def wait_seconds(self, now: datetime | None = None) -> float | None:
+        """Segundos desde el RPUSH del productor; None si el envelope no trae enqueued_at."""
+        if self.enqueued_at is None:
+            return None
+        current = now or datetime.now(timezone.utc)
+        return max(0.0, (current - self.enqueued_at).total_seconds())
+
     def __repr__(self) -> str:
         return (
             f"JobEnvelope(job_id={self.job_id!r}, type={self.type!r}, "
-            f"queue={self.queue!r}, attempt={self.attempt})"
+            f"queue={self.queue!r}, attempt={self.attempt}, trace_id={self.trace_id!r})"
         )
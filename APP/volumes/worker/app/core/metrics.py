@@ -0,0 +1,106 @@
+# core/metrics.py
+"""
+Métricas Prometheus del worker (colas minutes/email/pdf/maintenance).
+
+- Jobs por cola, tipo y resultado; duración de ejecución y espera en cola
+  (desde `enqueued_at` del envelope).
+- Reintentos y envíos a DLQ.
+- Etapas de TX2 (descarga MinIO, llamada LLM, commit al backend) para ver
+  dónde se va el tiempo de una minuta.
+- Limpieza de temporales: archivos recorridos, eliminados y bytes liberados.
+
+Se exponen con el servidor HTTP de `prometheus_client` en un thread daemon
+(`METRICS_PORT`, 0 lo deshabilita).
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+from core.logging_config import get_logger
+
+logger = get_logger("worker.metrics")
+
+JOBS_TOTAL = Counter(
+    "minuetaitor_worker_jobs_total",
+    "Jobs procesados por resultado (completed | failed | unhandled)",
+    ["queue", "type", "outcome"],
+)
+JOB_RUN_SECONDS = Histogram(
+    "minuetaitor_worker_job_run_seconds",
+    "Duración de ejecución del handler",
+    ["queue", "type"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+JOB_WAIT_SECONDS = Histogram(
+    "minuetaitor_worker_job_wait_seconds",
+    "Espera desde enqueued_at hasta el inicio de ejecución (desde el BLPOP en envelopes legados)",
+    ["queue", "type"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1, 5, 15, 60, 300),
+)
+JOB_RETRIES_TOTAL = Counter(
+    "minuetaitor_worker_job_retries_total",
+    "Jobs reencolados para reintento",
+    ["queue", "type"],
+)
+DLQ_TOTAL = Counter(
+    "minuetaitor_worker_dlq_total",
+    "Jobs enviados a la Dead Letter Queue",
+    ["queue", "type"],
+)
+JOBS_IN_PROGRESS = Gauge(
+    "minuetaitor_worker_jobs_in_progress",
+    "Jobs ejecutándose en este momento",
+    ["queue"],
+)
+TX2_STAGE_SECONDS = Histogram(
+    "minuetaitor_worker_tx2_stage_seconds",
+    "Duración de cada etapa de TX2 de minutas",
+    ["stage"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+TEMP_CLEANUP_SCANNED_FILES_TOTAL = Counter(
+    "minuetaitor_worker_temp_cleanup_scanned_files_total",
+    "Archivos recorridos por la limpieza de temporales",
+    ["root"],
+)
+TEMP_CLEANUP_DELETED_FILES_TOTAL = Counter(
+    "minuetaitor_worker_temp_cleanup_deleted_files_total",
+    "Archivos temporales eliminados (age = retención vencida | budget = presupuesto de tamaño)",
+    ["root", "reason"],
+)
+TEMP_CLEANUP_RECLAIMED_BYTES_TOTAL = Counter(
+    "minuetaitor_worker_temp_cleanup_reclaimed_bytes_total",
+    "Bytes liberados por la limpieza de temporales",
+    ["root", "reason"],
+)
+TEMP_CLEANUP_REMAINING_BYTES = Gauge(
+    "minuetaitor_worker_temp_cleanup_remaining_bytes",
+    "Bytes que quedaron en cada raíz tras la última limpieza",
+    ["root"],
+)
+
+
+@contextmanager
+def observe_stage(stage: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        TX2_STAGE_SECONDS.labels(stage).observe(time.perf_counter() - started)
+
+
+def start_metrics_server(port: int) -> bool:
+    """Levanta el endpoint /metrics; retorna False si está deshabilitado o falla."""
+    if port <= 0:
+        return False
+    try:
+        start_http_server(port)
+    except OSError as exc:
+        logger.warning("No se pudo exponer métricas en :%d (%s)", port, exc)
+        return False
+    logger.info("Métricas Prometheus en :%d/metrics", port)
+    return True
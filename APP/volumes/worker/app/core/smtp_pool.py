@@ -0,0 +1,282 @@
+# core/smtp_pool.py
+"""
+Pool de sesiones SMTP reutilizables para el handler de email.
+
+- Las sesiones se agrupan por huella de la configuración SMTP (host, puerto,
+  usuario, password, TLS/SSL, timeout): si el admin cambia la config activa,
+  las sesiones de la huella anterior se cierran en el siguiente checkout.
+- Una sesión ociosa más de `SMTP_POOL_NOOP_AFTER_SECONDS` se valida con NOOP
+  antes de usarla; ociosa más de `SMTP_POOL_IDLE_TIMEOUT_SECONDS` se descarta
+  (los MTA suelen cortar a los 60-300 s sin aviso).
+- Cada conexión envía como máximo `SMTP_POOL_MAX_MESSAGES_PER_CONNECTION`
+  mensajes y luego se cierra con QUIT, para no chocar con límites por sesión.
+- `send` reintenta una vez con conexión nueva solo si la sesión estaba
+  cortada antes de que el servidor aceptara `MAIL FROM` (sesión del pool
+  vencida). Un corte posterior (p. ej. timeout leyendo la respuesta a DATA)
+  puede ser un mensaje ya aceptado: se propaga y decide el reintento del job.
+
+Los métodos son síncronos y seguros entre threads: se usan desde el executor.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+from typing import Any, Iterator
+
+from core.config import settings
+from core.logging_config import get_logger
+
+logger = get_logger("worker.smtp_pool")
+
+_FINGERPRINT_FIELDS = ("host", "port", "username", "password", "use_tls", "use_ssl", "timeout_seconds")
+
+
+def smtp_config_fingerprint(smtp_config: dict[str, Any]) -> str:
+    raw = json.dumps({name: smtp_config.get(name) for name in _FINGERPRINT_FIELDS}, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def open_smtp_client(smtp_config: dict[str, Any]) -> smtplib.SMTP:
+    """Conecta, negocia TLS y autentica según la config."""
+    if smtp_config.get("use_ssl"):
+        client: smtplib.SMTP = smtplib.SMTP_SSL(
+            host=smtp_config["host"],
+            port=smtp_config["port"],
+            timeout=smtp_config["timeout_seconds"],
+        )
+    else:
+        client = smtplib.SMTP(
+            host=smtp_config["host"],
+            port=smtp_config["port"],
+            timeout=smtp_config["timeout_seconds"],
+        )
+        if smtp_config.get("use_tls"):
+            client.starttls()
+
+    # Mailpit en dev no requiere autenticacion aunque dejemos un password
+    # explicito para validadores de entorno.
+    if (
+        smtp_config.get("username")
+        and smtp_config.get("password")
+        and str(smtp_config["host"]).lower() != "mailpit"
+    ):
+        try:
+            client.login(smtp_config["username"], smtp_config["password"])
+        except Exception:
+            _close_quietly(client)
+            raise
+    return client
+
+
+def _close_quietly(client: smtplib.SMTP, *, quit_first: bool = True) -> None:
+    if quit_first:
+        try:
+            client.quit()
+            return
+        except (smtplib.SMTPException, OSError):
+            pass
+    try:
+        client.close()
+    except Exception:
+        pass
+
+
+class _StaleSession(Exception):
+    """La conexión falló antes de que el servidor aceptara MAIL FROM: reenviar es seguro."""
+
+
+def _send_message(client: smtplib.SMTP, msg: EmailMessage, recipients: list[str]) -> None:
+    # `SMTPException` hereda de OSError: separar los errores de protocolo del corte de red.
+    mail_accepted = False
+    original_mail = client.mail
+
+    def mail(sender: str, options: tuple = ()) -> tuple[int, bytes]:
+        nonlocal mail_accepted
+        reply = original_mail(sender, options)
+        mail_accepted = True
+        return reply
+
+    client.mail = mail
+    try:
+        client.send_message(msg, to_addrs=recipients)
+    except smtplib.SMTPServerDisconnected as exc:
+        if mail_accepted:
+            raise
+        raise _StaleSession(str(exc)) from exc
+    except smtplib.SMTPException:
+        raise
+    except OSError as exc:
+        if mail_accepted:
+            raise
+        raise _StaleSession(str(exc)) from exc
+    finally:
+        del client.mail
+
+
+@dataclass
+class _PooledConnection:
+    client: smtplib.SMTP
+    fingerprint: str
+    opened_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    messages_sent: int = 0
+
+
+class SmtpSession:
+    """Conexión tomada del pool; `send` repone la conexión si estaba cortada antes de MAIL FROM."""
+
+    def __init__(self, pool: "SmtpConnectionPool", smtp_config: dict[str, Any], connection: _PooledConnection) -> None:
+        self._pool = pool
+        self._config = smtp_config
+        self._connection: _PooledConnection | None = connection
+
+    def send(self, msg: EmailMessage, recipients: list[str]) -> None:
+        connection = self._ensure_connection()
+        try:
+            _send_message(connection.client, msg, recipients)
+        except _StaleSession as exc:
+            logger.info("Sesión SMTP cortada antes de MAIL FROM, reconectando | err=%s", exc)
+            self._discard()
+            connection = self._ensure_connection()
+            connection.client.send_message(msg, to_addrs=recipients)
+        except smtplib.SMTPResponseException as exc:
+            # 421 = el servidor cierra el canal; el resto deja la sesión usable.
+            if exc.smtp_code == 421:
+                self._discard()
+            raise
+        connection.messages_sent += 1
+        connection.last_used_at = time.monotonic()
+        self._pool._count("sent")
+        if connection.messages_sent >= self._pool.max_messages_per_connection:
+            self._retire()
+
+    def _ensure_connection(self) -> _PooledConnection:
+        if self._connection is None:
+            self._connection = self._pool._open(self._config)
+        return self._connection
+
+    def _discard(self) -> None:
+        if self._connection is not None:
+            _close_quietly(self._connection.client, quit_first=False)
+            self._connection = None
+
+    def _retire(self) -> None:
+        if self._connection is not None:
+            _close_quietly(self._connection.client)
+            self._connection = None
+
+    def _release(self) -> None:
+        if self._connection is not None:
+            self._pool._checkin(self._connection)
+            self._connection = None
+
+
+class SmtpConnectionPool:
+    def __init__(
+        self,
+        *,
+        max_idle_per_config: int,
+        max_messages_per_connection: int,
+        noop_after_seconds: float,
+        idle_timeout_seconds: float,
+    ) -> None:
+        self.max_idle_per_config = max(0, max_idle_per_config)
+        self.max_messages_per_connection = max(1, max_messages_per_connection)
+        self.noop_after_seconds = noop_after_seconds
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._idle: dict[str, list[_PooledConnection]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"opened": 0, "reused": 0, "sent": 0}
+
+    @contextmanager
+    def session(self, smtp_config: dict[str, Any]) -> Iterator[SmtpSession]:
+        """
+        Toma una conexión para `smtp_config` y la devuelve al pool al salir.
+
+        Si el bloque termina con excepción de red la conexión se descarta en
+        vez de volver al pool.
+        """
+        session = SmtpSession(self, smtp_config, self._checkout(smtp_config))
+        try:
+            yield session
+        except (smtplib.SMTPServerDisconnected, OSError):
+            session._discard()
+            raise
+        finally:
+            session._release()
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections = [conn for bucket in self._idle.values() for conn in bucket]
+            self._idle.clear()
+        for connection in connections:
+            _close_quietly(connection.client)
+
+    def _checkout(self, smtp_config: dict[str, Any]) -> _PooledConnection:
+        fingerprint = smtp_config_fingerprint(smtp_config)
+        stale: list[_PooledConnection] = []
+        candidate: _PooledConnection | None = None
+        with self._lock:
+            for other in [key for key in self._idle if key != fingerprint]:
+                stale.extend(self._idle.pop(other))
+            bucket = self._idle.get(fingerprint) or []
+            now = time.monotonic()
+            while bucket:
+                connection = bucket.pop()
+                if now - connection.last_used_at >= self.idle_timeout_seconds:
+                    stale.append(connection)
+                    continue
+                candidate = connection
+                break
+
+        for connection in stale:
+            _close_quietly(connection.client)
+
+        if candidate is not None and self._is_alive(candidate):
+            self._count("reused")
+            return candidate
+        return self._open(smtp_config)
+
+    def _is_alive(self, connection: _PooledConnection) -> bool:
+        if time.monotonic() - connection.last_used_at < self.noop_after_seconds:
+            return True
+        try:
+            code, _ = connection.client.noop()
+        except (smtplib.SMTPException, OSError):
+            code = 0
+        if code == 250:
+            connection.last_used_at = time.monotonic()
+            return True
+        _close_quietly(connection.client, quit_first=False)
+        return False
+
+    def _open(self, smtp_config: dict[str, Any]) -> _PooledConnection:
+        client = open_smtp_client(smtp_config)
+        self._count("opened")
+        return _PooledConnection(client=client, fingerprint=smtp_config_fingerprint(smtp_config))
+
+    def _checkin(self, connection: _PooledConnection) -> None:
+        with self._lock:
+            bucket = self._idle.setdefault(connection.fingerprint, [])
+            if len(bucket) < self.max_idle_per_config:
+                bucket.append(connection)
+                return
+        _close_quietly(connection.client)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+
+smtp_pool = SmtpConnectionPool(
+    max_idle_per_config=settings.SMTP_POOL_MAX_IDLE,
+    max_messages_per_connection=settings.SMTP_POOL_MAX_MESSAGES_PER_CONNECTION,
+    noop_after_seconds=settings.SMTP_POOL_NOOP_AFTER_SECONDS,
+    idle_timeout_seconds=settings.SMTP_POOL_IDLE_TIMEOUT_SECONDS,
+)
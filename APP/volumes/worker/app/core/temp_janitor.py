@@ -0,0 +1,224 @@
+# core/temp_janitor.py
+"""
+Recorrido y limpieza de directorios temporales (trazas LLM, scratch de PDF).
+
+- Cada directorio se lista con `os.scandir` y el tamaño/mtime salen del
+  `DirEntry.stat(follow_symlinks=False)` cacheado: un solo stat por archivo.
+- Los subdirectorios se recorren en paralelo en un pool acotado de threads;
+  los archivos vencidos se eliminan en lotes dentro del mismo pool.
+- Nunca se siguen symlinks, así el recorrido no puede salir de la raíz
+  permitida sin resolver cada ruta.
+- Presupuesto de tamaño por raíz: si lo que queda tras la limpieza por edad
+  lo supera, se eliminan los archivos más antiguos (fuera de la gracia de
+  seguridad) hasta volver bajo el presupuesto.
+
+El llamador (handlers/maintenance_handler.py) valida raíz y allowlist.
+"""
+from __future__ import annotations
+
+import heapq
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from core import metrics
+
+DELETE_BATCH_SIZE = 500
+_MAX_WARNINGS = 20
+
+
+@dataclass
+class JanitorResult:
+    scanned_files: int = 0
+    scanned_dirs: int = 0
+    deleted_files: int = 0
+    evicted_files: int = 0
+    reclaimed_bytes: int = 0
+    deleted_dirs: int = 0
+    skipped: int = 0
+    failed: int = 0
+    remaining_bytes: int = 0
+    warnings: list[str] = field(default_factory=list)
+
+    def warn(self, message: str) -> None:
+        if len(self.warnings) < _MAX_WARNINGS:
+            self.warnings.append(message)
+
+
+@dataclass
+class _DirScan:
+    path: str
+    subdirs: list[str]
+    expired: list[tuple[str, int]]
+    # (mtime, tamaño, ruta) de archivos conservados; solo si hay presupuesto
+    retained: list[tuple[float, int, str]]
+    retained_bytes: int
+    files: int
+    skipped: int
+    error: str | None = None
+
+
+def _scan_dir(path: str, expire_before: float, keep_retained: bool) -> _DirScan:
+    scan = _DirScan(path, [], [], [], 0, 0, 0)
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_symlink():
+                        scan.skipped += 1
+                    elif entry.is_dir(follow_symlinks=False):
+                        scan.subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        scan.files += 1
+                        if stat.st_mtime < expire_before:
+                            scan.expired.append((entry.path, stat.st_size))
+                        else:
+                            scan.retained_bytes += stat.st_size
+                            if keep_retained:
+                                scan.retained.append((stat.st_mtime, stat.st_size, entry.path))
+                    else:
+                        scan.skipped += 1
+                except FileNotFoundError:
+                    scan.skipped += 1
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        scan.error = f"No se pudo listar {path}: {exc}"
+    return scan
+
+
+def _unlink_batch(batch: list[tuple[str, int]], dry_run: bool) -> tuple[int, int, int, list[str]]:
+    deleted = reclaimed = missing = 0
+    errors: list[str] = []
+    for path, size in batch:
+        try:
+            if not dry_run:
+                os.unlink(path)
+            deleted += 1
+            reclaimed += size
+        except FileNotFoundError:
+            missing += 1
+        except OSError as exc:
+            errors.append(f"No se pudo eliminar archivo {path}: {exc}")
+    return deleted, reclaimed, missing, errors
+
+
+def _remove_empty_dirs(root: str, dirs: list[str], dry_run: bool, result: JanitorResult) -> None:
+    # Más profundos primero; la raíz permitida se conserva.
+    for path in sorted(dirs, key=lambda item: item.count(os.sep), reverse=True):
+        if path == root:
+            continue
+        try:
+            if dry_run:
+                with os.scandir(path) as entries:
+                    if next(entries, None) is None:
+                        result.deleted_dirs += 1
+                continue
+            os.rmdir(path)
+            result.deleted_dirs += 1
+        except OSError:
+            # No vacío, en uso o ya eliminado: se reintenta en la próxima ejecución.
+            continue
+
+
+def clean_tree(
+    root: str,
+    *,
+    label: str,
+    expire_before: float,
+    protect_after: float,
+    size_budget_bytes: int = 0,
+    dry_run: bool = False,
+    max_workers: int = 8,
+) -> JanitorResult:
+    """
+    Limpia `root` (sin seguir symlinks): elimina archivos con mtime anterior a
+    `expire_before` y, si `size_budget_bytes` > 0, desaloja los más antiguos
+    hasta quedar bajo el presupuesto sin tocar los modificados desde
+    `protect_after`. `label` identifica la raíz en las métricas.
+    """
+    result = JanitorResult()
+    keep_retained = size_budget_bytes > 0
+    retained: list[tuple[float, int, str]] = []
+    retained_bytes = 0
+    all_dirs: list[str] = []
+    pending_delete: list[tuple[str, int]] = []
+
+    def absorb_unlink(outcome: tuple[int, int, int, list[str]], *, reason: str) -> None:
+        deleted, reclaimed, missing, errors = outcome
+        if reason == "budget":
+            result.evicted_files += deleted
+        else:
+            result.deleted_files += deleted
+        result.reclaimed_bytes += reclaimed
+        result.skipped += missing
+        result.failed += len(errors)
+        for message in errors:
+            result.warn(message)
+        if not dry_run and deleted:
+            metrics.TEMP_CLEANUP_DELETED_FILES_TOTAL.labels(label, reason).inc(deleted)
+            metrics.TEMP_CLEANUP_RECLAIMED_BYTES_TOTAL.labels(label, reason).inc(reclaimed)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="temp-janitor") as pool:
+        scans: set[Future] = {pool.submit(_scan_dir, root, expire_before, keep_retained)}
+        deletes: set[Future] = set()
+
+        def flush(force: bool = False) -> None:
+            while len(pending_delete) >= DELETE_BATCH_SIZE or (force and pending_delete):
+                batch = pending_delete[:DELETE_BATCH_SIZE]
+                del pending_delete[:DELETE_BATCH_SIZE]
+                deletes.add(pool.submit(_unlink_batch, batch, dry_run))
+
+        while scans or deletes:
+            done, _ = wait(scans | deletes, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in deletes:
+                    deletes.discard(future)
+                    absorb_unlink(future.result(), reason="age")
+                    continue
+                scans.discard(future)
+                scan: _DirScan = future.result()
+                all_dirs.append(scan.path)
+                result.scanned_dirs += 1
+                result.scanned_files += scan.files
+                result.skipped += scan.skipped
+                if scan.error:
+                    result.failed += 1
+                    result.warn(scan.error)
+                retained_bytes += scan.retained_bytes
+                retained.extend(scan.retained)
+                pending_delete.extend(scan.expired)
+                for subdir in scan.subdirs:
+                    scans.add(pool.submit(_scan_dir, subdir, expire_before, keep_retained))
+                flush(force=not scans)
+
+        if size_budget_bytes > 0 and retained_bytes > size_budget_bytes:
+            heapq.heapify(retained)
+            evict: list[tuple[str, int]] = []
+            excess = retained_bytes - size_budget_bytes
+            while retained and excess > 0:
+                mtime, size, path = heapq.heappop(retained)
+                if mtime >= protect_after:
+                    break
+                evict.append((path, size))
+                excess -= size
+            futures = [
+                pool.submit(_unlink_batch, evict[start:start + DELETE_BATCH_SIZE], dry_run)
+                for start in range(0, len(evict), DELETE_BATCH_SIZE)
+            ]
+            for future in futures:
+                outcome = future.result()
+                absorb_unlink(outcome, reason="budget")
+                retained_bytes -= outcome[1]
+            if retained_bytes > size_budget_bytes:
+                result.warn(
+                    f"{label}: presupuesto de {size_budget_bytes} bytes excedido solo por archivos "
+                    "dentro de la gracia de seguridad"
+                )
+
+    result.remaining_bytes = retained_bytes
+    metrics.TEMP_CLEANUP_SCANNED_FILES_TOTAL.labels(label).inc(result.scanned_files)
+    metrics.TEMP_CLEANUP_REMAINING_BYTES.labels(label).set(retained_bytes)
+    _remove_empty_dirs(root, all_dirs, dry_run, result)
+    return result
@@ -6,10 +6,10 @@ import html
 import json
 import mimetypes
 import re
-import smtplib
 import threading
 import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.message import EmailMessage
 from pathlib import Path
@@ -21,14 +21,20 @@ from sqlalchemy.orm import sessionmaker
 
 from core.backend_client import ingest_notification
 from core.config import settings
+from core.email_blobs import is_email_blob_reference, read_email_blob
 from core.job import JobEnvelope
 from core.logging_config import get_logger
+from core.redis_client import get_redis
+from core.smtp_pool import smtp_pool
 
 logger = get_logger("worker.handler.email")
 
 TAG_RE = re.compile(r"<[^>]+>")
 LINE_BREAK_TAGS = ("<br>", "<br/>", "<br />", "</p>", "</div>", "</li>", "</tr>")
-SMTP_CACHE_TTL_SECONDS = 30
+# El backend incrementa esta clave al cambiar smtp_configs; el TTL solo acota
+# la ventana si Redis no responde.
+SMTP_CONFIG_VERSION_KEY = "smtp:config:version"
+SMTP_CACHE_TTL_SECONDS = 300
 INLINE_ASSET_MAX_BYTES = 2 * 1024 * 1024
 EMAIL_ATTACHMENT_MAX_BYTES = 15 * 1024 * 1024
 INLINE_ASSET_ALLOWED_ROOTS = (
@@ -39,6 +45,7 @@ INLINE_ASSET_ALLOWED_ROOTS = (
 _SMTP_CACHE_LOCK = threading.Lock()
 _SMTP_CACHE_EXPIRES_AT = 0.0
 _SMTP_CACHE_DATA: dict[str, Any] | None = None
+_SMTP_CACHE_VERSION: str | None = None
 _SessionLocal: sessionmaker | None = None
 
 
@@ -71,18 +78,18 @@ async def handle_email_job(job: JobEnvelope) -> None:
             payload.get("template_id"),
         )
 
-        await loop.run_in_executor(
-            None,
-            _send_email_sync,
-            to,
-            cc,
-            bcc,
-            subject,
-            body,
-            email_type,
-            reply_to,
-            inline_assets,
-            attachments,
+        await _email_batcher.send(
+            OutgoingEmail(
+                to=to,
+                cc=cc,
+                bcc=bcc,
+                subject=subject,
+                body=body,
+                email_type=email_type,
+                reply_to=reply_to,
+                inline_assets=inline_assets,
+                attachments=attachments,
+            )
         )
     except Exception as exc:
         _safe_record_email_delivery_status(
@@ -485,63 +492,135 @@ def _summarize_delivery_items(items: list[dict[str, str]], *, max_items: int = 4
     return ", ".join(labels)
 
 
-def _send_email_sync(
-    to: list[str],
-    cc: list[str],
-    bcc: list[str],
-    subject: str,
-    body: str,
-    email_type: str,
-    reply_to: str | None,
-    inline_assets: list[dict[str, Any]],
-    attachments: list[dict[str, Any]],
-) -> None:
-    smtp_config = _get_runtime_smtp_config()
+@dataclass(frozen=True)
+class OutgoingEmail:
+    to: list[str]
+    cc: list[str]
+    bcc: list[str]
+    subject: str
+    body: str
+    email_type: str
+    reply_to: str | None
+    inline_assets: list[dict[str, Any]]
+    attachments: list[dict[str, Any]]
+
+    @property
+    def recipients(self) -> list[str]:
+        return self.to + self.cc + self.bcc
+
+
+class _EmailBatcher:
+    """
+    Junta los envíos concurrentes del worker y los despacha en lote.
+
+    Cada lote resuelve la config SMTP una vez y usa una sola sesión del pool;
+    el error de un mensaje solo falla su propio job.
+    """
+
+    def __init__(self, *, max_batch: int, linger_seconds: float) -> None:
+        self.max_batch = max(1, max_batch)
+        self.linger_seconds = max(0.0, linger_seconds)
+        self._pending: list[tuple[OutgoingEmail, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def send(self, email: OutgoingEmail) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((email, future))
+        if len(self._pending) >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger_seconds, self._start_flush)
+        await future
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._flush(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, batch: list[tuple[OutgoingEmail, asyncio.Future]]) -> None:
+        config_version = await _read_smtp_config_version()
+        loop = asyncio.get_running_loop()
+        try:
+            errors = await loop.run_in_executor(
+                None,
+                _send_email_batch_sync,
+                [email for email, _ in batch],
+                config_version,
+            )
+        except Exception as exc:
+            errors = [exc] * len(batch)
+
+        for (_, future), error in zip(batch, errors):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+
+_email_batcher = _EmailBatcher(
+    max_batch=settings.EMAIL_BATCH_SIZE,
+    linger_seconds=settings.EMAIL_BATCH_LINGER_MS / 1000,
+)
+
+
+async def _read_smtp_config_version() -> str | None:
+    try:
+        redis = await get_redis()
+        return await redis.get(SMTP_CONFIG_VERSION_KEY)
+    except Exception as exc:
+        logger.debug("No se pudo leer versión de config SMTP | err=%s", exc)
+        return None
+
+
+def _send_email_batch_sync(emails: list[OutgoingEmail], config_version: str | None) -> list[Exception | None]:
+    """Envía los mensajes por una sesión SMTP; retorna el error de cada uno (None = enviado)."""
+    smtp_config = _get_runtime_smtp_config(config_version)
+    errors: list[Exception | None] = []
+    with smtp_pool.session(smtp_config) as session:
+        for email in emails:
+            try:
+                session.send(_build_email_message(smtp_config, email), email.recipients)
+                errors.append(None)
+                logger.debug("Email enviado sincronamente | recipients=%s", email.recipients)
+            except Exception as exc:
+                errors.append(exc)
+    return errors
 
+
+def _build_email_message(smtp_config: dict[str, Any], email: OutgoingEmail) -> EmailMessage:
     msg = EmailMessage()
-    msg["Subject"] = subject
+    msg["Subject"] = email.subject
     msg["From"] = f'{smtp_config["from_name"]} <{smtp_config["from_email"]}>'
-    msg["To"] = ", ".join(to)
-    if cc:
-        msg["Cc"] = ", ".join(cc)
-    if reply_to:
-        msg["Reply-To"] = str(reply_to)
-
-    if email_type == "html":
-        text_body = _html_to_text(body)
+    msg["To"] = ", ".join(email.to)
+    if email.cc:
+        msg["Cc"] = ", ".join(email.cc)
+    if email.reply_to:
+        msg["Reply-To"] = str(email.reply_to)
+
+    if email.email_type == "html":
+        text_body = _html_to_text(email.body)
         msg.set_content(text_body or "Este correo requiere un cliente compatible con HTML.")
-        msg.add_alternative(body, subtype="html")
-        if inline_assets:
-            _attach_inline_assets(msg, inline_assets)
+        msg.add_alternative(email.body, subtype="html")
+        if email.inline_assets:
+            _attach_inline_assets(msg, email.inline_assets)
         else:
-            _attach_inline_logo_if_needed(msg, body)
+            _attach_inline_logo_if_needed(msg, email.body)
     else:
-        msg.set_content(body)
+        msg.set_content(email.body)
 
-    if attachments:
-        _attach_attachments(msg, attachments)
-
-    recipients = to + cc + bcc
-    server = _open_smtp_client(smtp_config)
-    try:
-        # Mailpit en dev no requiere autenticacion aunque dejemos un password
-        # explicito para validadores de entorno.
-        if (
-            smtp_config.get("username")
-            and smtp_config.get("password")
-            and str(smtp_config["host"]).lower() != "mailpit"
-        ):
-            server.login(smtp_config["username"], smtp_config["password"])
-        server.send_message(msg, to_addrs=recipients)
-        logger.debug("Email enviado sincronamente | recipients=%s", recipients)
-    finally:
-        try:
-            server.quit()
-        except (smtplib.SMTPServerDisconnected, OSError):
-            try:
-                server.close()
-            except Exception:
-                pass
+    if email.attachments:
+        _attach_attachments(msg, email.attachments)
+    return msg
 
 
 def _get_db_session() -> sessionmaker:
@@ -618,12 +697,16 @@ def _load_active_smtp_config_from_db() -> dict[str, Any] | None:
     }
 
 
-def _get_runtime_smtp_config() -> dict[str, Any]:
-    global _SMTP_CACHE_DATA, _SMTP_CACHE_EXPIRES_AT
+def _get_runtime_smtp_config(config_version: str | None = None) -> dict[str, Any]:
+    global _SMTP_CACHE_DATA, _SMTP_CACHE_EXPIRES_AT, _SMTP_CACHE_VERSION
 
     now = time.monotonic()
     with _SMTP_CACHE_LOCK:
-        if _SMTP_CACHE_DATA is not None and now < _SMTP_CACHE_EXPIRES_AT:
+        if (
+            _SMTP_CACHE_DATA is not None
+            and now < _SMTP_CACHE_EXPIRES_AT
+            and config_version == _SMTP_CACHE_VERSION
+        ):
             return dict(_SMTP_CACHE_DATA)
 
     config = _load_active_smtp_config_from_db()
@@ -635,34 +718,18 @@ def _get_runtime_smtp_config() -> dict[str, Any]:
     with _SMTP_CACHE_LOCK:
         _SMTP_CACHE_DATA = dict(config)
         _SMTP_CACHE_EXPIRES_AT = time.monotonic() + SMTP_CACHE_TTL_SECONDS
+        _SMTP_CACHE_VERSION = config_version
 
     logger.debug(
-        "Configuracion SMTP resuelta | source=%s host=%s port=%s",
+        "Configuracion SMTP resuelta | source=%s host=%s port=%s version=%s",
         config.get("source"),
         config.get("host"),
         config.get("port"),
+        config_version,
     )
     return dict(config)
 
 
-def _open_smtp_client(smtp_config: dict[str, Any]) -> smtplib.SMTP:
-    if smtp_config.get("use_ssl"):
-        return smtplib.SMTP_SSL(
-            host=smtp_config["host"],
-            port=smtp_config["port"],
-            timeout=smtp_config["timeout_seconds"],
-        )
-
-    client = smtplib.SMTP(
-        host=smtp_config["host"],
-        port=smtp_config["port"],
-        timeout=smtp_config["timeout_seconds"],
-    )
-    if smtp_config.get("use_tls"):
-        client.starttls()
-    return client
-
-
 def _normalize_recipients(value: Any) -> list[str]:
     if value is None:
         return []
@@ -706,6 +773,16 @@ def _attach_inline_assets(msg: EmailMessage, inline_assets: list[dict[str, Any]]
         content_base64 = str(asset.get("content_base64") or "").strip()
         mime_type = str(asset.get("mime_type") or "").strip()
 
+        if cid and is_email_blob_reference(asset):
+            try:
+                asset_content = read_email_blob(asset, max_bytes=INLINE_ASSET_MAX_BYTES)
+            except Exception as exc:
+                logger.warning("Inline asset ignorado por error leyendo blob | cid=%s err=%s", cid, exc)
+                continue
+            maintype, subtype = mime_type.split("/", 1) if "/" in mime_type else ("application", "octet-stream")
+            html_part.add_related(asset_content, maintype=maintype, subtype=subtype, cid=f"<{cid}>")
+            continue
+
         if not cid or (not path_value and not content_base64):
             logger.warning("Inline asset ignorado por datos incompletos | asset=%s", asset)
             continue
@@ -776,6 +853,13 @@ def _attach_attachments(msg: EmailMessage, attachments: list[dict[str, Any]]) ->
         content_base64 = str(attachment.get("content_base64") or "").strip()
         mime_type = str(attachment.get("mime_type") or "").strip() or "application/octet-stream"
 
+        if filename and is_email_blob_reference(attachment):
+            # Sin el adjunto el correo no sirve: un error de MinIO falla el job para reintentarlo.
+            content = read_email_blob(attachment, max_bytes=EMAIL_ATTACHMENT_MAX_BYTES)
+            maintype, subtype = mime_type.split("/", 1) if "/" in mime_type else ("application", "octet-stream")
+            msg.add_attachment(content, maintype=maintype, subtype=subtype, filename=filename)
+            continue
+
         if not filename or not content_base64:
             logger.warning("Adjunto ignorado por datos incompletos | attachment=%s", attachment)
             continue
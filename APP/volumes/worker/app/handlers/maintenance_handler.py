@@ -15,7 +15,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import bindparam, create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
 from core.backend_client import ingest_notification
@@ -23,6 +23,7 @@ from core.config import settings
 from core.job import JobEnvelope
 from core.logging_config import get_logger
 from core.redis_client import get_redis
+from core.temp_janitor import JanitorResult, clean_tree
 
 logger = get_logger("worker.handler.maintenance")
 
@@ -327,7 +328,97 @@ async def _notify_admins(
         logger.warning("No se pudo emitir notificación admin de maintenance | action=%s err=%s", action, exc)
 
 
+_SESSION_CLEANUP_CHECKPOINT_KEY = "maintenance:session_cleanup:checkpoint"
+_SESSION_CLEANUP_CHECKPOINT_TTL_SEC = 6 * 3600
+
+_SESSION_BATCH_QUERY = """
+    SELECT id, user_id, jti, created_at
+    FROM user_sessions
+    WHERE logged_out_at IS NULL
+      AND created_at < :cutoff_dt
+      {keyset}
+    ORDER BY created_at ASC, id ASC
+    LIMIT :batch_size
+"""
+_SESSION_KEYSET_CLAUSE = (
+    "AND (created_at > :after_created_at OR (created_at = :after_created_at AND id > :after_id))"
+)
+
+
+def _fetch_session_batch(
+    cutoff_dt: datetime,
+    batch_size: int,
+    after: tuple[datetime, str] | None,
+) -> list[dict[str, Any]]:
+    """Siguiente bloque de sesiones abiertas antiguas, en orden (created_at, id)."""
+    params: dict[str, Any] = {"cutoff_dt": cutoff_dt, "batch_size": batch_size}
+    if after is not None:
+        params["after_created_at"], params["after_id"] = after
+    query = text(_SESSION_BATCH_QUERY.format(keyset=_SESSION_KEYSET_CLAUSE if after is not None else ""))
+    with _get_db_session()() as db:
+        return [dict(row) for row in db.execute(query, params).mappings().all()]
+
+
+def _count_recent_sessions(cutoff_dt: datetime) -> int:
+    query = text(
+        """
+        SELECT COUNT(*) AS recent_count
+        FROM user_sessions
+        WHERE logged_out_at IS NULL
+          AND created_at >= :cutoff_dt
+        """
+    )
+    with _get_db_session()() as db:
+        row = db.execute(query, {"cutoff_dt": cutoff_dt}).mappings().first()
+    return int((row or {}).get("recent_count") or 0)
+
+
+def _close_sessions(session_ids: list[str], logged_out_at: datetime) -> int:
+    """Logout técnico de un bloque completo en un solo UPDATE; commit por bloque."""
+    query = text(
+        """
+        UPDATE user_sessions
+        SET logged_out_at = :logged_out_at
+        WHERE id IN :ids
+          AND logged_out_at IS NULL
+        """
+    ).bindparams(bindparam("ids", expanding=True))
+    with _get_db_session()() as db:
+        result = db.execute(query, {"logged_out_at": logged_out_at, "ids": session_ids})
+        db.commit()
+    return int(result.rowcount or 0)
+
+
+async def _load_session_cleanup_checkpoint(redis, mode: str) -> dict[str, Any] | None:
+    try:
+        raw = await redis.get(_SESSION_CLEANUP_CHECKPOINT_KEY)
+        checkpoint = json.loads(raw) if raw else None
+    except Exception as exc:
+        logger.warning("No se pudo leer checkpoint de limpieza de sesiones | err=%s", exc)
+        return None
+    if not isinstance(checkpoint, dict) or checkpoint.get("mode") != mode:
+        return None
+    return checkpoint
+
+
+async def _save_session_cleanup_checkpoint(redis, checkpoint: dict[str, Any]) -> None:
+    try:
+        await redis.set(
+            _SESSION_CLEANUP_CHECKPOINT_KEY,
+            json.dumps(checkpoint),
+            ex=_SESSION_CLEANUP_CHECKPOINT_TTL_SEC,
+        )
+    except Exception as exc:
+        logger.warning("No se pudo guardar checkpoint de limpieza de sesiones | err=%s", exc)
+
+
 async def _handle_cleanup_sessions(payload: dict[str, Any]) -> tuple[int, str, str]:
+    """
+    Recorre las sesiones abiertas más antiguas que la gracia en bloques por
+    (created_at, id): un pipeline EXISTS a Redis y un solo UPDATE por bloque,
+    con commit y checkpoint en Redis tras cada uno. Si el job se interrumpe,
+    el reintento retoma desde el último bloque confirmado con el mismo corte.
+    """
     mode = str(payload.get("mode") or "soft_logout").strip() or "soft_logout"
     if mode not in {"archive_only", "soft_logout", "revoke_idle"}:
         raise ValueError(f"Modo de limpieza de sesiones no soportado: {mode}")
@@ -342,88 +433,112 @@ async def _handle_cleanup_sessions(payload: dict[str, Any]) -> tuple[int, str, s
     batch_size = int(
         payload.get(
             "batch_size",
-            getattr(settings, "MAINTENANCE_SESSION_CLEANUP_BATCH_SIZE", 500),
+            getattr(settings, "MAINTENANCE_SESSION_CLEANUP_BATCH_SIZE", 2000),
         )
-        or 500
+        or 2000
     )
     max_affected = int(
         payload.get(
             "max_affected",
-            getattr(settings, "MAINTENANCE_SESSION_CLEANUP_MAX_AFFECTED", 100),
+            getattr(settings, "MAINTENANCE_SESSION_CLEANUP_MAX_AFFECTED", 50000),
         )
-        or 100
+        or 50000
     )
     grace_minutes = max(5, min(grace_minutes, 10080))
     batch_size = max(1, min(batch_size, 5000))
-    max_affected = max(0, min(max_affected, batch_size))
-    cutoff_dt = _utcnow() - timedelta(minutes=grace_minutes)
-    SessionLocal = _get_db_session()
-    query = text(
-        """
-        SELECT id, user_id, jti, created_at
-        FROM user_sessions
-        WHERE logged_out_at IS NULL
-          AND created_at < :cutoff_dt
-        ORDER BY created_at ASC
-        LIMIT :batch_size
-        """
-    )
-    recent_count_query = text(
-        """
-        SELECT COUNT(*) AS recent_count
-        FROM user_sessions
-        WHERE logged_out_at IS NULL
-          AND created_at >= :cutoff_dt
-        """
-    )
+    max_affected = max(0, min(max_affected, 1_000_000))
+    apply_logout = mode == "soft_logout"
 
-    with SessionLocal() as db:
-        rows = db.execute(
-            query,
-            {
-                "cutoff_dt": cutoff_dt,
-                "batch_size": batch_size,
-            },
-        ).mappings().all()
-        recent_row = db.execute(recent_count_query, {"cutoff_dt": cutoff_dt}).mappings().first()
-
-    skipped_recent_count = int((recent_row or {}).get("recent_count") or 0)
-    if not rows:
-        return (
-            0,
-            "No había sesiones antiguas pendientes de conciliación. "
-            f"scanned=0 candidate=0 affected=0 skipped_recent={skipped_recent_count} grace_minutes={grace_minutes}.",
-            "success",
+    redis = await get_redis()
+    checkpoint = await _load_session_cleanup_checkpoint(redis, mode)
+    resumed = checkpoint is not None
+    if checkpoint is None:
+        checkpoint = {
+            "mode": mode,
+            "cutoff": (_utcnow() - timedelta(minutes=grace_minutes)).isoformat(),
+            "after_created_at": None,
+            "after_id": None,
+            "batches": 0,
+            "scanned": 0,
+            "candidate": 0,
+            "affected": 0,
+        }
+    cutoff_dt = datetime.fromisoformat(checkpoint["cutoff"])
+    skipped_recent_count = await asyncio.to_thread(_count_recent_sessions, cutoff_dt)
+    skipped_grace_count = 0
+
+    while True:
+        after = (
+            (datetime.fromisoformat(checkpoint["after_created_at"]), checkpoint["after_id"])
+            if checkpoint["after_id"]
+            else None
+        )
+        rows = await asyncio.to_thread(_fetch_session_batch, cutoff_dt, batch_size, after)
+        if not rows:
+            break
+
+        pipeline = redis.pipeline(transaction=False)
+        for row in rows:
+            pipeline.exists(f"session:{row['user_id']}:{row['jti']}")
+        try:
+            exists_results = await pipeline.execute()
+        except Exception as exc:
+            raise RuntimeError(
+                "Redis no respondió durante limpieza de sesiones; "
+                f"se conservan los bloques ya confirmados: {exc}"
+            ) from exc
+
+        stale_session_ids = [
+            row["id"]
+            for row, exists_flag in zip(rows, exists_results)
+            if not bool(exists_flag)
+        ]
+        remaining = max_affected - checkpoint["affected"]
+        to_close = stale_session_ids[:remaining] if apply_logout else []
+        if to_close:
+            checkpoint["affected"] += await asyncio.to_thread(_close_sessions, to_close, _utcnow())
+
+        checkpoint["batches"] += 1
+        checkpoint["scanned"] += len(rows)
+        checkpoint["candidate"] += len(stale_session_ids)
+        last_created_at = rows[-1]["created_at"]
+        checkpoint["after_created_at"] = (
+            last_created_at.isoformat() if isinstance(last_created_at, datetime) else str(last_created_at)
         )
+        checkpoint["after_id"] = rows[-1]["id"]
+
+        if apply_logout and len(stale_session_ids) > len(to_close):
+            # Tope por ejecución alcanzado: lo restante queda para la próxima.
+            skipped_grace_count = len(stale_session_ids) - len(to_close)
+            break
+        await _save_session_cleanup_checkpoint(redis, checkpoint)
+        if len(rows) < batch_size:
+            break
 
-    redis = await get_redis()
-    pipeline = redis.pipeline()
-    for row in rows:
-        pipeline.exists(f"session:{row['user_id']}:{row['jti']}")
     try:
-        exists_results = await pipeline.execute()
+        await redis.delete(_SESSION_CLEANUP_CHECKPOINT_KEY)
     except Exception as exc:
-        raise RuntimeError(f"Redis no respondió durante limpieza de sesiones; no se cerró ninguna sesión: {exc}") from exc
+        logger.warning("No se pudo limpiar checkpoint de limpieza de sesiones | err=%s", exc)
 
-    stale_session_ids = [
-        row["id"]
-        for row, exists_flag in zip(rows, exists_results)
-        if not bool(exists_flag)
-    ]
+    affected_count = int(checkpoint["affected"])
+    counters = (
+        f"scanned={checkpoint['scanned']} candidate={checkpoint['candidate']} affected={affected_count} "
+        f"skipped_recent={skipped_recent_count} skipped_grace={skipped_grace_count} "
+        f"grace_minutes={grace_minutes} batches={checkpoint['batches']} batch_size={batch_size} "
+        f"resumed={str(resumed).lower()}"
+    )
 
-    scanned_count = len(rows)
-    stale_count = len(stale_session_ids)
-    affected_limit_count = min(stale_count, max_affected)
-    limited_session_ids = stale_session_ids[:affected_limit_count]
-    skipped_grace_count = max(0, stale_count - affected_limit_count)
+    if not checkpoint["scanned"]:
+        return (
+            0,
+            f"No había sesiones antiguas pendientes de conciliación. {counters}.",
+            "success",
+        )
 
     if mode == "archive_only":
         return (
             0,
-            "Se ejecutó limpieza de sesiones en modo observación. "
-            f"scanned={scanned_count} candidate={stale_count} affected=0 "
-            f"skipped_recent={skipped_recent_count} skipped_grace={skipped_grace_count} "
-            f"grace_minutes={grace_minutes}.",
+            f"Se ejecutó limpieza de sesiones en modo observación. {counters}.",
             "success",
         )
 
@@ -431,43 +546,21 @@ async def _handle_cleanup_sessions(payload: dict[str, Any]) -> tuple[int, str, s
         return (
             0,
             "Modo revoke_idle no modificó sesiones: no existe soporte de last_seen/actividad confiable "
-            "para aplicar revocación estricta segura. "
-            f"scanned={scanned_count} candidate={stale_count} affected=0 "
-            f"skipped_recent={skipped_recent_count} skipped_grace={skipped_grace_count} "
-            f"grace_minutes={grace_minutes}.",
+            f"para aplicar revocación estricta segura. {counters}.",
             "warning",
         )
 
-    if not limited_session_ids:
+    if not affected_count:
         return (
             0,
-            "No se encontraron sesiones antiguas elegibles para cierre técnico. "
-            f"scanned={scanned_count} candidate={stale_count} affected=0 "
-            f"skipped_recent={skipped_recent_count} skipped_grace={skipped_grace_count} "
-            f"grace_minutes={grace_minutes}.",
+            f"No se encontraron sesiones antiguas elegibles para cierre técnico. {counters}.",
             "success",
         )
 
-    now = _utcnow()
-    update_query = text(
-        """
-        UPDATE user_sessions
-        SET logged_out_at = :logged_out_at
-        WHERE id = :id
-          AND logged_out_at IS NULL
-        """
-    )
-    with SessionLocal() as db:
-        for session_id in limited_session_ids:
-            db.execute(update_query, {"logged_out_at": now, "id": session_id})
-        db.commit()
-
     return (
-        affected_limit_count,
+        affected_count,
         "Se marcó logout técnico sobre sesiones antiguas sin presencia activa en Redis. "
-        f"scanned={scanned_count} candidate={stale_count} affected={affected_limit_count} "
-        f"skipped_recent={skipped_recent_count} skipped_grace={skipped_grace_count} "
-        f"grace_minutes={grace_minutes} max_affected={max_affected}.",
+        f"{counters} max_affected={max_affected}.",
         "success",
     )
 
@@ -485,6 +578,30 @@ def _parse_allowed_cleanup_subdirs() -> list[Path]:
     return allowed
 
 
+def _parse_cleanup_size_budgets(payload: dict[str, Any]) -> dict[str, int]:
+    """
+    Presupuesto en MB por subdirectorio permitido; "*" aplica a los que no
+    tienen uno propio y 0 lo deshabilita. El payload puede fijar
+    `size_budget_mb` (global) o `size_budgets_mb` ({subdir: mb}).
+    """
+    budgets: dict[str, int] = {"*": int(getattr(settings, "MAINTENANCE_TEMP_CLEANUP_SIZE_BUDGET_MB", 0) or 0)}
+    raw_value = str(getattr(settings, "MAINTENANCE_TEMP_CLEANUP_SIZE_BUDGETS", "") or "")
+    for item in raw_value.split(","):
+        subdir, _, megabytes = item.partition("=")
+        subdir = subdir.strip().strip("/")
+        if not subdir or not megabytes.strip():
+            continue
+        try:
+            budgets[subdir] = int(megabytes)
+        except ValueError:
+            logger.warning("Presupuesto de limpieza ignorado | value=%s", item)
+    if payload.get("size_budget_mb") is not None:
+        budgets["*"] = int(payload["size_budget_mb"])
+    if isinstance(payload.get("size_budgets_mb"), dict):
+        budgets.update({str(key).strip("/"): int(value) for key, value in payload["size_budgets_mb"].items()})
+    return {key: max(0, value) for key, value in budgets.items()}
+
+
 def _resolve_cleanup_root() -> Path:
     raw_root = str(settings.TRACE_BASE_DIR or "").strip()
     if not raw_root:
@@ -561,70 +678,64 @@ async def _handle_cleanup_temp_files(payload: dict[str, Any]) -> tuple[int, str,
         logger.warning(message)
         return 0, message, "warning"
 
+    # Una raíz anidada en otra ya se recorre con la exterior.
+    allowed_roots = [
+        allowed_root
+        for allowed_root in dict.fromkeys(allowed_roots)
+        if not any(other != allowed_root and _is_relative_to(allowed_root, other) for other in allowed_roots)
+    ]
+    size_budgets = _parse_cleanup_size_budgets(payload)
+    max_workers = max(1, min(int(getattr(settings, "MAINTENANCE_TEMP_CLEANUP_WORKERS", 8) or 8), 64))
+
     now = time.time()
     retention_cutoff = now - (max_age_days * 86400)
     grace_cutoff = now - (safety_grace_minutes * 60)
     cutoff_timestamp = min(retention_cutoff, grace_cutoff)
-    scanned_count = 0
-    deleted_files = 0
-    deleted_dirs = 0
-    skipped_count = 0
-    failed_count = 0
+    totals = JanitorResult()
 
     for allowed_root in allowed_roots:
-        for path in allowed_root.rglob("*"):
-            scanned_count += 1
-            try:
-                if path.is_symlink():
-                    skipped_count += 1
-                    continue
-                resolved_path = path.resolve(strict=False)
-                if not _is_relative_to(resolved_path, root) or not any(
-                    _is_relative_to(resolved_path, allowed_root) for allowed_root in allowed_roots
-                ):
-                    skipped_count += 1
-                    warnings.append(f"Ruta fuera de allowlist omitida: {path}")
-                    continue
-                if not path.is_file():
-                    continue
-                stat = path.stat()
-                if stat.st_mtime >= cutoff_timestamp:
-                    skipped_count += 1
-                    continue
-                if not dry_run:
-                    path.unlink()
-                deleted_files += 1
-            except FileNotFoundError:
-                skipped_count += 1
-            except OSError as exc:
-                failed_count += 1
-                warnings.append(f"No se pudo eliminar archivo {path}: {exc}")
-
-    for allowed_root in sorted(allowed_roots, key=lambda item: len(item.parts), reverse=True):
-        for dir_path in sorted((path for path in allowed_root.rglob("*") if path.is_dir()), reverse=True):
-            try:
-                if dir_path.is_symlink():
-                    skipped_count += 1
-                    continue
-                resolved_dir = dir_path.resolve(strict=False)
-                if not _is_relative_to(resolved_dir, allowed_root):
-                    skipped_count += 1
-                    continue
-                if dry_run:
-                    if not any(dir_path.iterdir()):
-                        deleted_dirs += 1
-                    continue
-                dir_path.rmdir()
-                deleted_dirs += 1
-            except OSError:
-                skipped_count += 1
-
-    status = "warning" if failed_count or warnings else "success"
+        label = str(allowed_root.relative_to(root))
+        budget_mb = size_budgets.get(label, size_budgets.get("*", 0))
+        result = await asyncio.to_thread(
+            clean_tree,
+            str(allowed_root),
+            label=label,
+            expire_before=cutoff_timestamp,
+            protect_after=grace_cutoff,
+            size_budget_bytes=budget_mb * 1024 * 1024,
+            dry_run=dry_run,
+            max_workers=max_workers,
+        )
+        logger.info(
+            "Limpieza de temporales | root=%s scanned_files=%d scanned_dirs=%d deleted=%d evicted=%d "
+            "reclaimed_bytes=%d remaining_bytes=%d budget_mb=%d",
+            label,
+            result.scanned_files,
+            result.scanned_dirs,
+            result.deleted_files,
+            result.evicted_files,
+            result.reclaimed_bytes,
+            result.remaining_bytes,
+            budget_mb,
+        )
+        totals.scanned_files += result.scanned_files
+        totals.scanned_dirs += result.scanned_dirs
+        totals.deleted_files += result.deleted_files
+        totals.evicted_files += result.evicted_files
+        totals.reclaimed_bytes += result.reclaimed_bytes
+        totals.deleted_dirs += result.deleted_dirs
+        totals.skipped += result.skipped
+        totals.failed += result.failed
+        warnings.extend(result.warnings)
+
+    deleted_files = totals.deleted_files + totals.evicted_files
+    status = "warning" if totals.failed or warnings else "success"
     summary = (
         f"Limpieza de temporales {'simulada' if dry_run else 'ejecutada'} | "
-        f"scanned={scanned_count} deleted_files={deleted_files} deleted_dirs={deleted_dirs} "
-        f"skipped={skipped_count} failed={failed_count} retention_days={max_age_days} "
-        f"safety_grace_minutes={safety_grace_minutes} TRACE_BASE_DIR={root} "
+        f"scanned={totals.scanned_files} scanned_dirs={totals.scanned_dirs} deleted_files={totals.deleted_files} "
+        f"evicted_files={totals.evicted_files} reclaimed_bytes={totals.reclaimed_bytes} "
+        f"deleted_dirs={totals.deleted_dirs} skipped={totals.skipped} failed={totals.failed} "
+        f"retention_days={max_age_days} safety_grace_minutes={safety_grace_minutes} TRACE_BASE_DIR={root} "
         f"allowed_roots={len(allowed_roots)} allowed_roots_paths=[{', '.join(str(item) for item in allowed_roots)}]."
     )
     if warnings:
@@ -45,9 +45,11 @@ from core.backend_client import (
     get_active_ai_provider_config,
     report_minute_failure,
 )
+from core.ai_output_validation import find_ai_output_problems, validation_mode
 from core.config import settings
 from core.job import JobEnvelope
 from core.logging_config import get_logger
+from core.metrics import observe_stage
 from core.redis_client import get_redis
 
 logger = get_logger("worker.handler.minutes")
@@ -541,6 +543,14 @@ def _validate_llm_payload(parsed: dict[str, Any]) -> None:
             record_status="llm-failed",
         )
 
+    problems = find_ai_output_problems(parsed)
+    if not problems:
+        return
+    if validation_mode() == "enforce":
+        raise NonRetryableMinuteError("; ".join(problems), record_status="llm-failed")
+    for problem in problems:
+        logger.warning("Output IA con observaciones (modo warn): %s", problem)
+
 
 def _parse_ai_json_output(raw_text: str) -> dict[str, Any]:
     try:
@@ -734,7 +744,8 @@ def _execute_tx2_sync(payload: dict) -> tuple[str, str, int, int, str, str]:
     try:
         # 1. Descargar archivos
         logger.info("Descargando %d archivos | record=%s", len(file_metadata), rec_id)
-        files = _download_files_from_minio(minio, rec_id, file_metadata)
+        with observe_stage("download"):
+            files = _download_files_from_minio(minio, rec_id, file_metadata)
         if not files:
             raise ValueError("No se pudieron descargar archivos desde MinIO")
 
@@ -758,7 +769,8 @@ def _execute_tx2_sync(payload: dict) -> tuple[str, str, int, int, str, str]:
         started_at_utc = _now_utc()
         usage_context["started_at"] = _datetime_to_iso(started_at_utc)
         try:
-            ai_output, run_id, tokens_in, tokens_out = _call_ai_provider_sync(provider_config, prompt, files, ai_input)
+            with observe_stage("llm"):
+                ai_output, run_id, tokens_in, tokens_out = _call_ai_provider_sync(provider_config, prompt, files, ai_input)
         except Exception as exc:
             finished_at_utc = _now_utc()
             usage_context["finished_at"] = _datetime_to_iso(finished_at_utc)
@@ -799,28 +811,29 @@ def _execute_tx2_sync(payload: dict) -> tuple[str, str, int, int, str, str]:
             derived_fields["actual_end_time"] = inferred_actual_end_time
 
         # 5. Enviar al backend para persistencia (TX2)
-        result = commit_tx2(
-            transaction_id=tx_id,
-            record_id=rec_id,
-            requested_by_id=by_id,
-            ai_output=ai_output,
-            ai_input_schema=ai_input,
-            derived_fields=derived_fields,
-            ai_provider=provider_config["provider_type"],
-            ai_model=provider_config["model_name"],
-            ai_provider_config_id=provider_config.get("ai_provider_config_id"),
-            ai_provider_name=provider_config.get("ai_provider_name"),
-            ai_provider_family=provider_config.get("provider_family"),
-            ai_execution_adapter=provider_config.get("execution_adapter"),
-            openai_run_id=run_id,
-            tokens_input=tokens_in,
-            tokens_output=tokens_out,
-            started_at=usage_context.get("started_at"),
-            finished_at=usage_context.get("finished_at"),
-            latency_ms=usage_context.get("latency_ms"),
-            input_objects_meta=ometa,   # [{ obj_id, art_type_id, fname }] — tal cual del backend
-            catalog_ids=cat,
-        )
+        with observe_stage("commit"):
+            result = commit_tx2(
+                transaction_id=tx_id,
+                record_id=rec_id,
+                requested_by_id=by_id,
+                ai_output=ai_output,
+                ai_input_schema=ai_input,
+                derived_fields=derived_fields,
+                ai_provider=provider_config["provider_type"],
+                ai_model=provider_config["model_name"],
+                ai_provider_config_id=provider_config.get("ai_provider_config_id"),
+                ai_provider_name=provider_config.get("ai_provider_name"),
+                ai_provider_family=provider_config.get("provider_family"),
+                ai_execution_adapter=provider_config.get("execution_adapter"),
+                openai_run_id=run_id,
+                tokens_input=tokens_in,
+                tokens_output=tokens_out,
+                started_at=usage_context.get("started_at"),
+                finished_at=usage_context.get("finished_at"),
+                latency_ms=usage_context.get("latency_ms"),
+                input_objects_meta=ometa,   # [{ obj_id, art_type_id, fname }] — tal cual del backend
+                catalog_ids=cat,
+            )
 
         version_id = result.get("version_id", "unknown")
         logger.info("Backend confirmo TX2 | version=%s", version_id)
@@ -20,21 +20,28 @@ Flujo por job:
 from __future__ import annotations
 
 import asyncio
+import time
 import traceback
 from datetime import datetime, timezone
 
 
 from pathlib import Path
 from core.config       import settings
+from core import ai_output_validation
 from core.dlq          import send_to_dlq
 from core.job          import JobEnvelope
 from core.logging_config import get_logger, setup_logging
+from core import metrics
+from core.queue_telemetry import record_job_telemetry
 from core.redis_client import close_redis, get_redis
 from core import registry
 from queues import register_all, QUEUE_PRIORITY
 
 logger = get_logger("worker.main")
 QUEUE_ACTIVITY_HASH = "system:queue:last_activity"
+# Colas cuyo handler agrupa jobs concurrentes (email comparte la sesión SMTP):
+# tras el BLPOP se sacan hasta N-1 jobs más de la misma cola en un round-trip.
+QUEUE_DRAIN_SIZES: dict[str, int] = {"queue:email": settings.EMAIL_BATCH_SIZE}
 
 
 def _utcnow_iso() -> str:
@@ -43,12 +50,36 @@ def _utcnow_iso() -> str:
 
 # ── Procesamiento de un job ───────────────────────────────────────────────────
 
-async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore) -> None:
+async def _record_job_finished(job: JobEnvelope, wait_seconds: float, run_seconds: float, *, failed: bool) -> None:
+    metrics.JOB_RUN_SECONDS.labels(job.queue, job.type).observe(run_seconds)
+    metrics.JOBS_TOTAL.labels(job.queue, job.type, "failed" if failed else "completed").inc()
+    # La telemetría nunca cambia el resultado del job: un fallo de Redis acá
+    # no debe reintentar ni mandar a DLQ un job que ya terminó.
+    try:
+        redis = await get_redis()
+    except Exception as exc:
+        logger.warning("No se pudo registrar telemetría | job_id=%s error=%s", job.job_id, exc)
+        return
+    await record_job_telemetry(
+        redis,
+        job,
+        wait_seconds=wait_seconds,
+        run_seconds=run_seconds,
+        failed=failed,
+    )
+
+
+async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore, dequeued_at: float) -> None:
     """
     Ejecuta un job dentro del semáforo de concurrencia.
     Maneja reintentos y DLQ internamente.
     """
     async with sem:
+        # Espera real desde el RPUSH del productor; envelopes legados solo miden la espera local.
+        wait_seconds = job.wait_seconds()
+        if wait_seconds is None:
+            wait_seconds = time.monotonic() - dequeued_at
+        metrics.JOB_WAIT_SECONDS.labels(job.queue, job.type).observe(wait_seconds)
         handler = registry.get(job.queue, job.type)
 
         if handler is None:
@@ -56,21 +87,27 @@ async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore) -> None:
                 "Sin handler | job_id=%s type=%s queue=%s — descartado",
                 job.job_id, job.type, job.queue,
             )
+            metrics.JOBS_TOTAL.labels(job.queue, job.type, "unhandled").inc()
             return
 
+        in_progress = metrics.JOBS_IN_PROGRESS.labels(job.queue)
+        in_progress.inc()
+        started = time.perf_counter()
         try:
             logger.info(
-                "Iniciando job | job_id=%s type=%s queue=%s attempt=%d",
-                job.job_id, job.type, job.queue, job.attempt,
+                "Iniciando job | job_id=%s type=%s queue=%s attempt=%d trace_id=%s wait=%.3fs",
+                job.job_id, job.type, job.queue, job.attempt, job.trace_id, wait_seconds,
             )
             # PASAMOS EL JOB COMPLETO, NO SOLO EL PAYLOAD
             await handler(job)
+            await _record_job_finished(job, wait_seconds, time.perf_counter() - started, failed=False)
             logger.info(
                 "Job completado | job_id=%s type=%s attempt=%d",
                 job.job_id, job.type, job.attempt,
             )
 
         except Exception as exc:
+            await _record_job_finished(job, wait_seconds, time.perf_counter() - started, failed=True)
             error_trace = traceback.format_exc()
             logger.error(
                 "Job fallido | job_id=%s type=%s attempt=%d/%d | error=%s",
@@ -86,6 +123,7 @@ async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore) -> None:
                     "Reintentando en %.1fs | job_id=%s attempt=%d→%d",
                     delay, job.job_id, job.attempt, job.attempt + 1,
                 )
+                metrics.JOB_RETRIES_TOTAL.labels(job.queue, job.type).inc()
                 await asyncio.sleep(delay)
                 next_job = job.next_attempt()
                 await redis.rpush(job.queue, next_job.to_json())
@@ -94,9 +132,25 @@ async def _execute_job(job: JobEnvelope, sem: asyncio.Semaphore) -> None:
                 # ── DLQ: agotó reintentos ─────────────────────────────────
                 await send_to_dlq(redis, job, error_trace)
 
+        finally:
+            in_progress.dec()
+
 
 # ── Loop principal ────────────────────────────────────────────────────────────
 
+async def _drain_queue(redis, queue_key: str) -> list[str]:
+    """Jobs adicionales de una cola agrupable (LPOP con count); vacío si no aplica."""
+    extra = QUEUE_DRAIN_SIZES.get(queue_key, 1) - 1
+    if extra <= 0:
+        return []
+    try:
+        drained = await redis.lpop(queue_key, extra)
+    except Exception as exc:
+        logger.warning("No se pudo drenar la cola | queue=%s error=%s", queue_key, exc)
+        return []
+    return list(drained or [])
+
+
 # worker.py - Actualizar el main_loop
 async def main_loop() -> None:
     """
@@ -127,25 +181,26 @@ async def main_loop() -> None:
                 continue
 
             queue_key, raw = result
-
-            try:
-                job = JobEnvelope.from_raw(raw, queue_key)
-            except Exception as parse_err:
-                logger.error(
-                    "Job inválido descartado | queue=%s error=%s raw=%.200s",
-                    queue_key, parse_err, raw,
-                )
-                continue
-
+            raws = [raw] + await _drain_queue(redis, queue_key)
             await redis.hset(QUEUE_ACTIVITY_HASH, queue_key, _utcnow_iso())
 
-            # Lanzar como Task independiente para no bloquear el BLPOP
-            task = asyncio.create_task(
-                _execute_job(job, sem),
-                name=f"job-{job.job_id}",
-            )
-            active_tasks.add(task)
-            task.add_done_callback(active_tasks.discard)
+            for raw in raws:
+                try:
+                    job = JobEnvelope.from_raw(raw, queue_key)
+                except Exception as parse_err:
+                    logger.error(
+                        "Job inválido descartado | queue=%s error=%s raw=%.200s",
+                        queue_key, parse_err, raw,
+                    )
+                    continue
+
+                # Lanzar como Task independiente para no bloquear el BLPOP
+                task = asyncio.create_task(
+                    _execute_job(job, sem, time.monotonic()),
+                    name=f"job-{job.job_id}",
+                )
+                active_tasks.add(task)
+                task.add_done_callback(active_tasks.discard)
 
         except asyncio.CancelledError:
             logger.info("Worker cancelado — esperando tasks activas...")
@@ -195,7 +250,12 @@ async def main() -> None:
             logger.info(f"✓ Directorio temp creado: {temp_path}")
         except Exception as e:
             logger.error(f"✗ No se pudo crear temp: {e}")
-            
+
+    metrics.start_metrics_server(settings.METRICS_PORT)
+
+    if ai_output_validation.warm_up():
+        logger.info("✓ Validación de output IA: %s", ai_output_validation.validation_mode())
+
     logger.info("=" * 60)
     logger.info("MinuetAItor Worker arrancando")
     logger.info("Redis:  %s:%s", settings.REDIS_HOST, settings.REDIS_PORT)